@@ -1,8 +1,8 @@
 #------------------------------------------------------------------------------------------------------
 # IMPORTS
 #------------------------------------------------------------------------------------------------------
-import unittest
 from conditions import preconditions, PreconditionError
+import os
 import sys
 from board import Board
 from game_command import GameCommand
@@ -11,25 +11,57 @@ from panel import Panel
 #------------------------------------------------------------------------------------------------------
 # IMPLEMENTATION
 #------------------------------------------------------------------------------------------------------
+# A game started from the command line records every command it executes in a game log (see game_log.py)
+# when this environment variable gives the path of the log
+GAME_LOG_ENVIRONMENT_VARIABLE = "TICTAC_GAME_LOG"
+
 class TicTacApplication:
     """ A Tic Tac Toe Game """
 
-    def __init__(self):
-        self._panel = Panel()
-        self._board = Board()
+    def __init__(self, boardSize=Board.BOARD_SIZE, winLength=None, scriptSource=None, gameLogFileName=None):
+        self._panel = Panel(boardSize, scriptSource)
+        self._board = Board(boardSize, winLength)
+        self._gameLogWriter = None
+        if gameLogFileName is not None:
+            # Imported only here, so a game which is not logged does not load the module
+            from game_log import GameLogWriter
+            self._gameLogWriter = GameLogWriter(gameLogFileName, boardSize, self._board.getWinLength())
     #END
 
 
+    def _executeCommand(self, gameCommand):
+        gameCommand.executeCommandOnBoard(self._board)
+        if self._gameLogWriter is not None:
+            self._gameLogWriter.recordCommand(gameCommand, self._board)
+    #END
+
     def _runGameLoop(self):
         currentUserCommand = self._panel.getCommandFromUser()
-        currentUserCommand.executeCommandOnBoard(self._board)
+        self._executeCommand(currentUserCommand)
         currentUserCommand = GameCommand(GameCommand.PRINT_COMMAND)
-        currentUserCommand.executeCommandOnBoard(self._board)
+        self._executeCommand(currentUserCommand)
+    #END
+
+    def _printGameResult(self):
+        winningPlayerNumber = self._board.winner()
+        if winningPlayerNumber is None:
+            print("The Game Is A Draw!")
+        else:
+            print("Player {} Wins!".format(winningPlayerNumber))
     #END
 
     def runApplication(self):
-        while(True):
-            self._runGameLoop()
+        try:
+            while(not self._board.isGameOver()):
+                try:
+                    self._runGameLoop()
+                except EOFError:
+                    print("The Input Ended Before The Game Was Over!")
+                    return
+            self._printGameResult()
+        finally:
+            if self._gameLogWriter is not None:
+                self._gameLogWriter.close()
     #END
 
 #------------------------------------------------------------------------------------------------------
@@ -37,20 +69,32 @@ class TicTacApplication:
 #------------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
 
-    # Check corret length of command line arguement string
-    if not (len(sys.argv) == 2):
+    # Check corret length of command line arguement string (a game may be given a board size and win length,
+    # and a scripted game is given the path of its script, or '-' for standard input, first)
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) <= 4) and (sys.argv[1] == '-run')) or ((len(sys.argv) >= 3) and (len(sys.argv) <= 5) and (sys.argv[1] == '-script'))):
         print "Test Bench: Not Correct Number Testing Arguements\n"
         sys.exit(0)
 
     # Check valid command line arguements entered
-    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation')) and (not (sys.argv[1] == '-run')) ):
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation')) and (not (sys.argv[1] == '-run')) and (not (sys.argv[1] == '-script')) ):
         print "Test Bench: Not Correct Testing Arguements\n"
         sys.exit(0)
 
     # Set the testing flag for the testing level for the module
     testFlag = ((sys.argv[1]) + '.')[:-1]
     del sys.argv[1]
+    gameLogFileName = os.environ.get(GAME_LOG_ENVIRONMENT_VARIABLE)
 
     if(testFlag == '-run'):
-        app = TicTacApplication()
+        gameArguements = [int(gameArguement) for gameArguement in sys.argv[1:]]
+        boardSize = gameArguements[0] if len(gameArguements) >= 1 else Board.BOARD_SIZE
+        winLength = gameArguements[1] if len(gameArguements) == 2 else None
+        app = TicTacApplication(boardSize, winLength, None, gameLogFileName)
+        app.runApplication()
+
+    if(testFlag == '-script'):
+        scriptSource = sys.stdin if sys.argv[1] == '-' else sys.argv[1]
+        boardSize = int(sys.argv[2]) if len(sys.argv) >= 3 else Board.BOARD_SIZE
+        winLength = int(sys.argv[3]) if len(sys.argv) == 4 else None
+        app = TicTacApplication(boardSize, winLength, scriptSource, gameLogFileName)
         app.runApplication()
\ No newline at end of file
@@ -0,0 +1,480 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import random
+import time
+from conditions import preconditions, PreconditionError
+from board import Board
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class _SearchTimeout(Exception):
+    '''
+    This exception is given inside a search when its time limit has run out
+    '''
+
+class _SearchTables:
+    """ The tables an alpha-beta search uses for one board size, win length and neighbourhood radius """
+
+    _ZOBRIST_SEED = 2018
+
+    def __init__(self, boardSize, winLength, neighbourhoodRadius):
+        # Board positions are numbered (x * boardSize + y)
+        winningLines, lineIndicesForEachPosition = Board._get_line_tables(boardSize, winLength)
+        self.numberOfPositions = boardSize * boardSize
+        self.winningLines = tuple( tuple(boardXPosition * boardSize + boardYPosition for boardXPosition, boardYPosition in winningLine)
+                                   for winningLine in winningLines )
+        self.lineIndicesForEachPosition = tuple( lineIndicesForEachPosition[boardXPosition][boardYPosition]
+                                                 for boardXPosition in range(boardSize)
+                                                 for boardYPosition in range(boardSize) )
+        self.neighbours = []
+        for boardXPosition in range(boardSize):
+            for boardYPosition in range(boardSize):
+                self.neighbours += [tuple( neighbourXPosition * boardSize + neighbourYPosition
+                                           for neighbourXPosition in range(max(0, boardXPosition - neighbourhoodRadius), min(boardSize, boardXPosition + neighbourhoodRadius + 1))
+                                           for neighbourYPosition in range(max(0, boardYPosition - neighbourhoodRadius), min(boardSize, boardYPosition + neighbourhoodRadius + 1))
+                                           if (neighbourXPosition, neighbourYPosition) != (boardXPosition, boardYPosition) )]
+        self.neighbours = tuple(self.neighbours)
+
+        # A line holding only one player's markers is worth more the more markers it holds
+        self.lineWeights = tuple( ((4 ** numberOfMarkers) if numberOfMarkers > 0 else 0) for numberOfMarkers in range(winLength + 1) )
+
+        randomGenerator = random.Random(_SearchTables._ZOBRIST_SEED)
+        self.zobristKeys = ( tuple(randomGenerator.getrandbits(64) for position in range(self.numberOfPositions)),
+                             tuple(randomGenerator.getrandbits(64) for position in range(self.numberOfPositions)) )
+        self.playerToMoveKeys = (0, randomGenerator.getrandbits(64))
+    #END
+
+def _get_entry_score(score, ply):
+    # A win score counts plies from the root of the search, but the transposition table is kept between
+    # searches from different roots, so a win is stored counting plies from the position itself
+    if score >= AlphaBetaEngine._DECIDED_SCORE:
+        return score + ply
+    if score <= -AlphaBetaEngine._DECIDED_SCORE:
+        return score - ply
+    return score
+
+def _get_score_from_entry(entryScore, ply):
+    if entryScore >= AlphaBetaEngine._DECIDED_SCORE:
+        return entryScore - ply
+    if entryScore <= -AlphaBetaEngine._DECIDED_SCORE:
+        return entryScore + ply
+    return entryScore
+
+class AlphaBetaEngine:
+    """ A Tic Tac Toe Move Engine For Any Board Size And Win Length """
+
+    DEFAULT_TIME_LIMIT = 0.5
+    WIN_SCORE = 1000000000
+    MAXIMUM_TRANSPOSITION_TABLE_SIZE = 1000000
+
+    _DECIDED_SCORE = WIN_SCORE - 10000
+    _UNBOUNDED_SCORE = 2 * WIN_SCORE
+    _EXACT_BOUND = 0
+    _LOWER_BOUND = 1
+    _UPPER_BOUND = 2
+    _NODES_BETWEEN_TIME_CHECKS = 1024
+    _LARGEST_FULL_WIDTH_BOARD_SIZE = 4
+    _DEFAULT_NEIGHBOURHOOD_RADIUS = 2
+
+    # Shared by every engine, keyed by (board size, win length, neighbourhood radius)
+    _searchTables = {}
+
+    @preconditions( (lambda self: True),
+                    (lambda timeLimit: ((isinstance(timeLimit, (int, float)))) and (timeLimit > 0)),
+                    (lambda maximumDepth: ((isinstance(maximumDepth, int))) and (maximumDepth >= 1)),
+                    (lambda neighbourhoodRadius: ((isinstance(neighbourhoodRadius, int))) and (neighbourhoodRadius >= 1)),
+                    (lambda tablebase: hasattr(tablebase, "probePlayerMasks") and hasattr(tablebase, "coversBoard")) )
+    def __init__(self, timeLimit=DEFAULT_TIME_LIMIT, maximumDepth=None, neighbourhoodRadius=None, tablebase=None):
+        '''
+        DESCRIPTION:
+            Constructs an alpha-beta search engine, which searches deeper and deeper until its time
+            limit runs out, ordering moves by its transposition table and by a history of moves which
+            caused cutoffs. Its transposition table is kept between moves
+
+        PARAMETERS:
+            timeLimit: (optional) the number of seconds a move may take, which defaults to
+                       AlphaBetaEngine.DEFAULT_TIME_LIMIT
+            maximumDepth: (optional) the deepest search made, which defaults to the number of empty positions
+            neighbourhoodRadius: (optional) only positions within this distance of a marker are searched.
+                                 Defaults to searching every position on boards up to 4x4, and to a
+                                 distance of 2 on larger boards
+            tablebase: (optional) a Tablebase, which is probed instead of searching any position of its
+                       board size and win length with few enough empty positions
+
+        RETURNS:
+            (valid arguement)
+                An AlphaBetaEngine Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        self._timeLimit = timeLimit
+        self._maximumDepth = maximumDepth
+        self._neighbourhoodRadius = neighbourhoodRadius
+        self._tablebase = tablebase
+        self._transpositionTables = {}
+        self._lastSearchStatistics = None
+    #END
+
+    @staticmethod
+    def _get_search_tables(boardSize, winLength, neighbourhoodRadius):
+        searchTablesKey = (boardSize, winLength, neighbourhoodRadius)
+        searchTables = AlphaBetaEngine._searchTables.get(searchTablesKey)
+        if searchTables is None:
+            searchTables = _SearchTables(boardSize, winLength, neighbourhoodRadius)
+            AlphaBetaEngine._searchTables[searchTablesKey] = searchTables
+        return searchTables
+    #END
+
+    #------------------------------------------------------------------------------------------------------
+    # SEARCH STATE
+    #------------------------------------------------------------------------------------------------------
+    def _set_up_search_state(self, board):
+        boardSize = board.getBoardSize()
+        winLength = board.getWinLength()
+        neighbourhoodRadius = self._neighbourhoodRadius
+        if neighbourhoodRadius is None:
+            neighbourhoodRadius = boardSize
+            if boardSize > AlphaBetaEngine._LARGEST_FULL_WIDTH_BOARD_SIZE:
+                neighbourhoodRadius = AlphaBetaEngine._DEFAULT_NEIGHBOURHOOD_RADIUS
+        tables = AlphaBetaEngine._get_search_tables(boardSize, winLength, neighbourhoodRadius)
+        transpositionTableKey = (boardSize, winLength, neighbourhoodRadius)
+        if transpositionTableKey not in self._transpositionTables:
+            self._transpositionTables[transpositionTableKey] = {}
+        self._transpositionTable = self._transpositionTables[transpositionTableKey]
+        if len(self._transpositionTable) > AlphaBetaEngine.MAXIMUM_TRANSPOSITION_TABLE_SIZE:
+            self._transpositionTable.clear()
+
+        self._boardSize = boardSize
+        self._winLength = winLength
+        self._tables = tables
+        self._positions = [Board.EMPTY_VALUE] * tables.numberOfPositions
+        self._lineMarkerCounts = ([0] * len(tables.winningLines), [0] * len(tables.winningLines))
+        self._numberOfNeighbouringMarkers = [0] * tables.numberOfPositions
+        self._numberOfEmptyPositions = tables.numberOfPositions
+        self._numberOfThreats = [0, 0]
+        self._score = 0
+        self._hash = 0
+        self._history = [len(tables.lineIndicesForEachPosition[position]) for position in range(tables.numberOfPositions)]
+        self._activeTablebase = None
+        self._tablebaseEmptyPositions = -1
+        self._numberOfTablebaseHits = 0
+        if (self._tablebase is not None) and self._tablebase.coversBoard(board):
+            self._activeTablebase = self._tablebase
+            self._tablebaseEmptyPositions = self._tablebase.getMaximumEmptyPositions()
+
+        # The threats are recounted once the board is copied, rather than kept while markers are placed
+        for boardXPosition in range(boardSize):
+            for boardYPosition in range(boardSize):
+                markerValue = board.getMarkerAtBoardPosition(boardXPosition, boardYPosition)
+                if markerValue != Board.EMPTY_VALUE:
+                    self._make_move(boardXPosition * boardSize + boardYPosition, Board.PLAYER_TOKEN_VALUE.index(markerValue) + 1)
+        self._numberOfThreats = [0, 0]
+        for lineIndex in range(len(tables.winningLines)):
+            for playerIndex in (0, 1):
+                if (self._lineMarkerCounts[playerIndex][lineIndex] == winLength - 1) and (self._lineMarkerCounts[1 - playerIndex][lineIndex] == 0):
+                    self._numberOfThreats[playerIndex] += 1
+    #END
+
+    def _make_move(self, position, playerNumber):
+        # Returns True if the move completes a winning line. A threat is a line which one more marker would win
+        tables = self._tables
+        playerIndex = playerNumber - 1
+        opponentIndex = 1 - playerIndex
+        playerLineMarkerCounts = self._lineMarkerCounts[playerIndex]
+        opponentLineMarkerCounts = self._lineMarkerCounts[opponentIndex]
+        lineWeights = tables.lineWeights
+        threatCount = self._winLength - 1
+        numberOfThreats = self._numberOfThreats
+        scoreChange = 0
+        isWinningMove = False
+        for lineIndex in tables.lineIndicesForEachPosition[position]:
+            playerMarkers = playerLineMarkerCounts[lineIndex]
+            opponentMarkers = opponentLineMarkerCounts[lineIndex]
+            if opponentMarkers == 0:
+                scoreChange += lineWeights[playerMarkers + 1] - lineWeights[playerMarkers]
+                if playerMarkers == threatCount:
+                    numberOfThreats[playerIndex] -= 1
+                if playerMarkers + 1 == threatCount:
+                    numberOfThreats[playerIndex] += 1
+            elif playerMarkers == 0:
+                scoreChange += lineWeights[opponentMarkers]
+            if (playerMarkers == 0) and (opponentMarkers == threatCount):
+                numberOfThreats[opponentIndex] -= 1
+            playerLineMarkerCounts[lineIndex] = playerMarkers + 1
+            if playerMarkers + 1 == self._winLength:
+                isWinningMove = True
+
+        if playerNumber == 1:
+            self._score += scoreChange
+        else:
+            self._score -= scoreChange
+        self._positions[position] = playerNumber
+        self._hash ^= tables.zobristKeys[playerIndex][position]
+        self._numberOfEmptyPositions -= 1
+        numberOfNeighbouringMarkers = self._numberOfNeighbouringMarkers
+        for neighbour in tables.neighbours[position]:
+            numberOfNeighbouringMarkers[neighbour] += 1
+        return isWinningMove
+    #END
+
+    def _unmake_move(self, position, playerNumber, previousScore):
+        tables = self._tables
+        playerIndex = playerNumber - 1
+        opponentIndex = 1 - playerIndex
+        playerLineMarkerCounts = self._lineMarkerCounts[playerIndex]
+        opponentLineMarkerCounts = self._lineMarkerCounts[opponentIndex]
+        threatCount = self._winLength - 1
+        numberOfThreats = self._numberOfThreats
+        for lineIndex in tables.lineIndicesForEachPosition[position]:
+            playerMarkers = playerLineMarkerCounts[lineIndex] - 1
+            opponentMarkers = opponentLineMarkerCounts[lineIndex]
+            if opponentMarkers == 0:
+                if playerMarkers + 1 == threatCount:
+                    numberOfThreats[playerIndex] -= 1
+                if playerMarkers == threatCount:
+                    numberOfThreats[playerIndex] += 1
+            if (playerMarkers == 0) and (opponentMarkers == threatCount):
+                numberOfThreats[opponentIndex] += 1
+            playerLineMarkerCounts[lineIndex] = playerMarkers
+
+        self._score = previousScore
+        self._positions[position] = Board.EMPTY_VALUE
+        self._hash ^= tables.zobristKeys[playerIndex][position]
+        self._numberOfEmptyPositions += 1
+        numberOfNeighbouringMarkers = self._numberOfNeighbouringMarkers
+        for neighbour in tables.neighbours[position]:
+            numberOfNeighbouringMarkers[neighbour] -= 1
+    #END
+
+    def _completes_threat(self, position, threatPlayerIndex):
+        threatCount = self._winLength - 1
+        for lineIndex in self._tables.lineIndicesForEachPosition[position]:
+            if (self._lineMarkerCounts[threatPlayerIndex][lineIndex] == threatCount) and (self._lineMarkerCounts[1 - threatPlayerIndex][lineIndex] == 0):
+                return True
+        return False
+    #END
+
+    def _generate_moves(self, playerNumber, transpositionMove):
+        positions = self._positions
+        numberOfNeighbouringMarkers = self._numberOfNeighbouringMarkers
+        moves = [ position for position in range(self._tables.numberOfPositions)
+                  if (positions[position] == Board.EMPTY_VALUE) and (numberOfNeighbouringMarkers[position] > 0) ]
+        if not moves:
+            moves = [position for position in range(self._tables.numberOfPositions) if positions[position] == Board.EMPTY_VALUE]
+
+        # A winning move is always played, and otherwise a move which does not block a line the opponent
+        # is about to win loses at once
+        if self._numberOfThreats[playerNumber - 1] > 0:
+            return [position for position in moves if self._completes_threat(position, playerNumber - 1)][:1]
+        if self._numberOfThreats[2 - playerNumber] > 0:
+            moves = [position for position in moves if self._completes_threat(position, 2 - playerNumber)]
+
+        moves.sort(key=self._history.__getitem__, reverse=True)
+        if (transpositionMove is not None) and (transpositionMove in moves):
+            moves.remove(transpositionMove)
+            moves.insert(0, transpositionMove)
+        return moves
+    #END
+
+    def _probe_tablebase(self, playerNumber, ply):
+        # A position won in (moves left) moves is won by the move at ply (ply + moves left - 1), which
+        # scores the same as a win found by the search
+        playerMasks = [0, 0, 0]
+        for position, positionPlayerNumber in enumerate(self._positions):
+            playerMasks[positionPlayerNumber] |= 1 << position
+        positionValue = self._activeTablebase.probePlayerMasks(playerMasks[1], playerMasks[2], playerNumber)
+        if positionValue is None:
+            return None
+        self._numberOfTablebaseHits += 1
+        gameValue, movesLeft = positionValue
+        winScore = AlphaBetaEngine.WIN_SCORE - (ply + movesLeft - 1)
+        if gameValue > 0:
+            return winScore
+        if gameValue < 0:
+            return -winScore
+        return 0
+    #END
+
+    #------------------------------------------------------------------------------------------------------
+    # SEARCH
+    #------------------------------------------------------------------------------------------------------
+    def _search(self, depth, alpha, beta, playerNumber, ply):
+        # Returns the score of the position for the player to move (a negamax search)
+        self._numberOfNodes += 1
+        if (self._numberOfNodes % AlphaBetaEngine._NODES_BETWEEN_TIME_CHECKS == 0) and (time.time() > self._deadline):
+            raise _SearchTimeout()
+
+        if self._numberOfThreats[playerNumber - 1] > 0:
+            return AlphaBetaEngine.WIN_SCORE - ply - 1
+        if self._numberOfEmptyPositions == 0:
+            return 0
+        if self._numberOfEmptyPositions <= self._tablebaseEmptyPositions:
+            tablebaseScore = self._probe_tablebase(playerNumber, ply)
+            if tablebaseScore is not None:
+                return tablebaseScore
+        if depth <= 0:
+            if playerNumber == 1:
+                return self._score
+            return -self._score
+
+        tables = self._tables
+        positionKey = self._hash ^ tables.playerToMoveKeys[playerNumber - 1]
+        transpositionEntry = self._transpositionTable.get(positionKey)
+        transpositionMove = None
+        if transpositionEntry is not None:
+            entryDepth, entryBound, entryScore, transpositionMove = transpositionEntry
+            entryScore = _get_score_from_entry(entryScore, ply)
+            if entryDepth >= depth:
+                if entryBound == AlphaBetaEngine._EXACT_BOUND:
+                    return entryScore
+                if (entryBound == AlphaBetaEngine._LOWER_BOUND) and (entryScore >= beta):
+                    return entryScore
+                if (entryBound == AlphaBetaEngine._UPPER_BOUND) and (entryScore <= alpha):
+                    return entryScore
+
+        originalAlpha = alpha
+        bestScore = -AlphaBetaEngine._UNBOUNDED_SCORE
+        bestMove = None
+        for move in self._generate_moves(playerNumber, transpositionMove):
+            previousScore = self._score
+            if self._make_move(move, playerNumber):
+                moveScore = AlphaBetaEngine.WIN_SCORE - ply
+            else:
+                moveScore = -self._search(depth - 1, -beta, -alpha, 3 - playerNumber, ply + 1)
+            self._unmake_move(move, playerNumber, previousScore)
+            if moveScore > bestScore:
+                bestScore = moveScore
+                bestMove = move
+            if bestScore > alpha:
+                alpha = bestScore
+            if alpha >= beta:
+                self._history[move] += depth * depth
+                break
+
+        entryBound = AlphaBetaEngine._EXACT_BOUND
+        if bestScore <= originalAlpha:
+            entryBound = AlphaBetaEngine._UPPER_BOUND
+        elif bestScore >= beta:
+            entryBound = AlphaBetaEngine._LOWER_BOUND
+        self._transpositionTable[positionKey] = (depth, entryBound, _get_entry_score(bestScore, ply), bestMove)
+        return bestScore
+    #END
+
+    def _search_root(self, depth, playerNumber, rootMoves):
+        alpha = -AlphaBetaEngine._UNBOUNDED_SCORE
+        beta = AlphaBetaEngine._UNBOUNDED_SCORE
+        bestScore = -AlphaBetaEngine._UNBOUNDED_SCORE
+        bestMove = None
+        for move in rootMoves:
+            previousScore = self._score
+            if self._make_move(move, playerNumber):
+                moveScore = AlphaBetaEngine.WIN_SCORE
+            else:
+                moveScore = -self._search(depth - 1, -beta, -alpha, 3 - playerNumber, 1)
+            self._unmake_move(move, playerNumber, previousScore)
+            if moveScore > bestScore:
+                bestScore = moveScore
+                bestMove = move
+            if bestScore > alpha:
+                alpha = bestScore
+        return bestScore, bestMove
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: hasattr(board, "getMarkerAtBoardPosition") and hasattr(board, "getBoardSize") and hasattr(board, "getWinLength")),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Searches for the best move in a board position for the player whose turn it is
+
+        PARAMETERS:
+            board: a Board of any board size and win length
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                An (x, y) board position tuple, or None if the game is already over
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        startTime = time.time()
+        self._deadline = startTime + self._timeLimit
+        self._numberOfNodes = 0
+        self._set_up_search_state(board)
+        boardSize = self._boardSize
+        self._lastSearchStatistics = {"nodes": 0, "depth": 0, "score": 0, "seconds": 0.0, "nodesPerSecond": 0.0, "tablebaseHits": 0}
+
+        winningLineCount = self._winLength
+        for playerLineMarkerCounts in self._lineMarkerCounts:
+            if winningLineCount in playerLineMarkerCounts:
+                return None
+        if self._numberOfEmptyPositions == 0:
+            return None
+        if self._numberOfEmptyPositions <= self._tablebaseEmptyPositions:
+            tablebaseMove = self._activeTablebase.getBestMove(board, playerNumber)
+            if tablebaseMove is not None:
+                self._lastSearchStatistics["tablebaseHits"] = 1
+                return tablebaseMove
+
+        maximumDepth = self._numberOfEmptyPositions
+        if (self._maximumDepth is not None) and (self._maximumDepth < maximumDepth):
+            maximumDepth = self._maximumDepth
+
+        rootMoves = self._generate_moves(playerNumber, None)
+        bestMove = rootMoves[0]
+        bestScore = 0
+        completedDepth = 0
+        for depth in range(1, maximumDepth + 1):
+            try:
+                depthScore, depthMove = self._search_root(depth, playerNumber, rootMoves)
+            except _SearchTimeout:
+                break
+            bestScore, bestMove = depthScore, depthMove
+            completedDepth = depth
+            rootMoves.remove(bestMove)
+            rootMoves.insert(0, bestMove)
+            if abs(bestScore) >= AlphaBetaEngine._DECIDED_SCORE:
+                break
+            # The first iteration always completes, so that a move is always found
+            if time.time() > self._deadline:
+                break
+
+        searchSeconds = time.time() - startTime
+        self._lastSearchStatistics = { "nodes": self._numberOfNodes,
+                                       "depth": completedDepth,
+                                       "score": bestScore,
+                                       "seconds": searchSeconds,
+                                       "nodesPerSecond": self._numberOfNodes / max(searchSeconds, 1e-9),
+                                       "tablebaseHits": self._numberOfTablebaseHits }
+        return divmod(bestMove, boardSize)
+    #END
+
+    def getLastSearchStatistics(self):
+        '''
+        DESCRIPTION:
+            Retrieves statistics of the last search made by getBestMove
+
+        RETURNS:
+            A dictionary with the number of "nodes" searched, the "depth" of the last completed
+            iteration, its "score", the "seconds" taken, the "nodesPerSecond", and the number of
+            "tablebaseHits" (positions found in the tablebase), or None if no search has been made
+        '''
+        return self._lastSearchStatistics
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # The tests of this module are in test_alpha_beta.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_alpha_beta.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
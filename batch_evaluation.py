@@ -0,0 +1,301 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import random
+from conditions import preconditions, PreconditionError
+from board import Board
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# Boards with at most this many positions are checked for wins with a table holding every bitmask of markers
+_LARGEST_WIN_TABLE_NUMBER_OF_POSITIONS = 16
+
+# The winning line and win tables of each board size and win length, built when first used
+_lineTables = {}
+
+def _check_numpy_is_installed():
+    if numpy is None:
+        raise ImportError("Batch evaluation needs numpy to be installed")
+
+def _get_line_tables(boardSize, winLength):
+    lineTables = _lineTables.get((boardSize, winLength))
+    if lineTables is None:
+        winningLines, lineIndicesForEachPosition = Board._get_line_tables(boardSize, winLength)
+        flatWinningLines = numpy.array( [ [boardXPosition * boardSize + boardYPosition for boardXPosition, boardYPosition in winningLine]
+                                          for winningLine in winningLines ], dtype=numpy.intp )
+        winTable = None
+        if boardSize * boardSize <= _LARGEST_WIN_TABLE_NUMBER_OF_POSITIONS:
+            winningLineBitmasks = (numpy.left_shift(1, flatWinningLines)).sum(axis=1)
+            allBitmasks = numpy.arange(1 << (boardSize * boardSize))
+            winTable = numpy.zeros(len(allBitmasks), dtype=bool)
+            for winningLineBitmask in winningLineBitmasks:
+                winTable |= (allBitmasks & winningLineBitmask) == winningLineBitmask
+        lineTables = (flatWinningLines, winTable)
+        _lineTables[(boardSize, winLength)] = lineTables
+    return lineTables
+
+def _get_board_size_of_positions(positions):
+    # Positions are either (N, boardSize, boardSize) or (N, boardSize * boardSize)
+    if positions.ndim == 3 and positions.shape[1] == positions.shape[2]:
+        return positions.shape[1]
+    if positions.ndim == 2:
+        boardSize = int(round(positions.shape[1] ** 0.5))
+        if boardSize * boardSize == positions.shape[1]:
+            return boardSize
+    raise PreconditionError()
+
+def _has_winning_line(playerMarkers, boardSize, winLength):
+    flatWinningLines, winTable = _get_line_tables(boardSize, winLength)
+    if winTable is not None:
+        positionBits = numpy.left_shift(1, numpy.arange(boardSize * boardSize))
+        return winTable[playerMarkers.dot(positionBits)]
+    return playerMarkers[:, flatWinningLines].all(axis=2).any(axis=1)
+
+@preconditions( (lambda positions: True),
+                (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)) )
+def evaluatePositions(positions, winLength=None):
+    '''
+    DESCRIPTION:
+        Classifies many board positions at once. Each position is encoded with Board.EMPTY_VALUE and
+        Board.PLAYER_TOKEN_VALUE, and is legal when it can be reached by the players taking turns,
+        player 1 first, until one of them wins
+
+    PARAMETERS:
+        positions: an integer array of shape (N, boardSize, boardSize) or (N, boardSize * boardSize),
+                   where (x, y) is at [n, x, y] or [n, x * boardSize + y]
+        winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+
+    RETURNS:
+        (valid arguement)
+            A dictionary of arrays of length N:
+                "legal": True for legal positions
+                "winner": 1 or 2 for the player with a winning line, or 0 if neither (or both) have one
+                "draw": True for full boards without a winning line
+                "movesPlayed": the number of marked positions
+                "emptyPositions": the number of empty positions
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    _check_numpy_is_installed()
+    positions = numpy.asarray(positions)
+    boardSize = _get_board_size_of_positions(positions)
+    if winLength is None:
+        winLength = boardSize
+    if winLength > boardSize:
+        raise PreconditionError()
+    numberOfPositions = boardSize * boardSize
+    positions = positions.reshape(len(positions), numberOfPositions)
+
+    playerOneMarkers = (positions == Board.PLAYER_TOKEN_VALUE[0])
+    playerTwoMarkers = (positions == Board.PLAYER_TOKEN_VALUE[1])
+    emptyMarkers = (positions == Board.EMPTY_VALUE)
+    numberOfPlayerOneMarkers = playerOneMarkers.sum(axis=1)
+    numberOfPlayerTwoMarkers = playerTwoMarkers.sum(axis=1)
+    emptyPositions = emptyMarkers.sum(axis=1)
+    playerOneWins = _has_winning_line(playerOneMarkers, boardSize, winLength)
+    playerTwoWins = _has_winning_line(playerTwoMarkers, boardSize, winLength)
+
+    markerDifference = numberOfPlayerOneMarkers - numberOfPlayerTwoMarkers
+    legal = ( (emptyPositions + numberOfPlayerOneMarkers + numberOfPlayerTwoMarkers == numberOfPositions) &
+              ((markerDifference == 0) | (markerDifference == 1)) &
+              ~(playerOneWins & playerTwoWins) &
+              ~(playerOneWins & (markerDifference != 1)) &
+              ~(playerTwoWins & (markerDifference != 0)) )
+    winner = numpy.zeros(len(positions), dtype=numpy.int8)
+    winner[playerOneWins & ~playerTwoWins] = 1
+    winner[playerTwoWins & ~playerOneWins] = 2
+    return { "legal": legal,
+             "winner": winner,
+             "draw": (emptyPositions == 0) & ~playerOneWins & ~playerTwoWins,
+             "movesPlayed": numberOfPositions - emptyPositions,
+             "emptyPositions": emptyPositions }
+#END
+
+def boardsToArray(boards):
+    '''
+    DESCRIPTION:
+        Converts boards, which must all be the same size, into an array of positions
+
+    PARAMETERS:
+        boards: a sequence of Board objects (or boards with the same interface)
+
+    RETURNS:
+        (valid arguement)
+            An int8 array of shape (N, boardSize, boardSize), where (x, y) of board n is at [n, x, y]
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    _check_numpy_is_installed()
+    boards = list(boards)
+    if not boards:
+        return numpy.zeros((0, Board.BOARD_SIZE, Board.BOARD_SIZE), dtype=numpy.int8)
+    boardSize = boards[0].getBoardSize()
+    if all(hasattr(board, "_boardGrid") for board in boards):
+        positions = numpy.array([board._boardGrid for board in boards], dtype=numpy.int8)
+    else:
+        positions = numpy.array( [ [ [ board.getMarkerAtBoardPosition(boardXPosition, boardYPosition) for boardYPosition in range(boardSize) ]
+                                     for boardXPosition in range(boardSize) ]
+                                   for board in boards ], dtype=numpy.int8 )
+    if positions.shape != (len(boards), boardSize, boardSize):
+        raise PreconditionError()
+    return positions
+#END
+
+@preconditions( (lambda positions: True),
+                (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)) )
+def arrayToBoards(positions, winLength=None):
+    '''
+    DESCRIPTION:
+        Converts an array of positions into boards
+
+    PARAMETERS:
+        positions: an integer array of shape (N, boardSize, boardSize) or (N, boardSize * boardSize)
+        winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+
+    RETURNS:
+        (valid arguement)
+            A list of N Board objects
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    _check_numpy_is_installed()
+    positions = numpy.asarray(positions)
+    boardSize = _get_board_size_of_positions(positions)
+    positions = positions.reshape(len(positions), boardSize * boardSize)
+    boards = []
+    for position in positions.tolist():
+        board = Board(boardSize, winLength)
+        for positionIndex in range(len(position)):
+            if position[positionIndex] != Board.EMPTY_VALUE:
+                board.placePlayerMarkerOnBoardAtPosition(Board.PLAYER_TOKEN_VALUE.index(position[positionIndex]) + 1,
+                                                         positionIndex // boardSize, positionIndex % boardSize)
+        boards += [board]
+    return boards
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestEvaluatePositions(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _known_positions = [ ([0, 0, 0, 0, 0, 0, 0, 0, 0], True, 0, 0),
+                         ([1, 1, 1, 2, 2, 0, 0, 0, 0], True, 1, 5),
+                         ([1, 1, 0, 2, 2, 2, 1, 0, 0], True, 2, 6),
+                         ([1, 2, 1, 1, 2, 2, 2, 1, 1], True, 0, 9),
+                         ([2, 0, 0, 0, 0, 0, 0, 0, 0], False, 0, 1),
+                         ([1, 1, 1, 2, 2, 2, 0, 0, 0], False, 0, 6),
+                         ([1, 1, 1, 2, 2, 0, 2, 0, 0], False, 1, 6),
+                         ([1, 1, 0, 2, 2, 2, 1, 1, 0], False, 2, 7),
+                         ([3, 0, 0, 0, 0, 0, 0, 0, 0], False, 0, 1) ]
+
+    def _create_random_boards(self, numberOfBoards, boardSize, winLength):
+        randomGenerator = random.Random(2018)
+        boards = []
+        for boardNumber in range(numberOfBoards):
+            board = Board(boardSize, winLength)
+            playerNumber = 1
+            for moveNumber in range(randomGenerator.randint(0, boardSize * boardSize)):
+                if board.isGameOver():
+                    break
+                emptyPositions = [ (boardXPosition, boardYPosition) for boardXPosition in range(boardSize) for boardYPosition in range(boardSize)
+                                   if board.getMarkerAtBoardPosition(boardXPosition, boardYPosition) == Board.EMPTY_VALUE ]
+                board.placePlayerMarkerOnBoardAtPosition(playerNumber, *randomGenerator.choice(emptyPositions))
+                playerNumber = 3 - playerNumber
+            boards += [board]
+        return boards
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_known_positions(self):
+        evaluation = evaluatePositions(numpy.array([knownPosition[0] for knownPosition in self._known_positions]))
+        for positionIndex in range(len(self._known_positions)):
+            position, legal, winner, movesPlayed = self._known_positions[positionIndex]
+            self.assertEqual(bool(evaluation["legal"][positionIndex]), legal)
+            self.assertEqual(evaluation["winner"][positionIndex], winner)
+            self.assertEqual(evaluation["movesPlayed"][positionIndex], movesPlayed)
+            self.assertEqual(evaluation["emptyPositions"][positionIndex], 9 - movesPlayed)
+        self.assertEqual(evaluation["draw"].tolist(), [False, False, False, True, False, False, False, False, False])
+
+    def test_square_and_flat_positions_agree(self):
+        flatPositions = numpy.array([knownPosition[0] for knownPosition in self._known_positions])
+        flatEvaluation = evaluatePositions(flatPositions)
+        squareEvaluation = evaluatePositions(flatPositions.reshape(-1, 3, 3))
+        for resultName in flatEvaluation:
+            self.assertEqual(flatEvaluation[resultName].tolist(), squareEvaluation[resultName].tolist())
+
+    def test_agrees_with_boards(self):
+        for boardSize, winLength in [(3, 3), (4, 3), (5, 4)]:
+            boards = self._create_random_boards(200, boardSize, winLength)
+            evaluation = evaluatePositions(boardsToArray(boards), winLength)
+            for boardIndex in range(len(boards)):
+                self.assertTrue(evaluation["legal"][boardIndex])
+                self.assertEqual(evaluation["winner"][boardIndex], boards[boardIndex].winner() or 0)
+                self.assertEqual(bool(evaluation["draw"][boardIndex]), boards[boardIndex].isDraw())
+
+    def test_boards_and_arrays_convert_both_ways(self):
+        boards = self._create_random_boards(50, 3, 3)
+        positions = boardsToArray(boards)
+        convertedBoards = arrayToBoards(positions)
+        for boardIndex in range(len(boards)):
+            self.assertEqual(convertedBoards[boardIndex].getBoardAsString(), boards[boardIndex].getBoardAsString())
+            self.assertEqual(convertedBoards[boardIndex].winner(), boards[boardIndex].winner())
+        self.assertEqual(boardsToArray(convertedBoards).tolist(), positions.tolist())
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_position_shapes(self):
+        for invalidPositions in (numpy.zeros((2, 8)), numpy.zeros((2, 3, 4)), numpy.zeros(9), numpy.zeros((1, 1, 3, 3))):
+            self.assertRaises(PreconditionError, evaluatePositions, invalidPositions)
+            self.assertRaises(PreconditionError, arrayToBoards, invalidPositions)
+
+    def test_invalid_win_length(self):
+        for invalidWinLength in (0, 4, 3.0):
+            self.assertRaises(PreconditionError, evaluatePositions, numpy.zeros((2, 9)), invalidWinLength)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
@@ -0,0 +1,590 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import itertools
+import timeit
+import subprocess
+import platform
+import tempfile
+import shutil
+import json
+import gc
+import os
+import sys
+from conditions import PRECONDITION_MODES, PRECONDITIONS_DISABLED, PRECONDITION_MODE_ENVIRONMENT_VARIABLE
+from conditions import _wrap_function_in_preconditions, getPreconditionMode
+from board import Board
+from game_command import GameCommand
+from policies import RandomPolicy, GreedyPolicy
+from simulator import playGame
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+NANOSECONDS_PER_SECOND = 1000000000.0
+DEFAULT_NUMBER_OF_CALLS = 200000
+DEFAULT_NUMBER_OF_REPEATS = 5
+
+# The same preconditions as Board.placePlayerMarkerOnBoardAtPosition
+_BOARD_PLACEMENT_PRECONDITIONS = ( (lambda self: True),
+                                   (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))),
+                                   (lambda boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < 3)),
+                                   (lambda boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < 3)) )
+
+_BOARD_PLACEMENT_TIMING_SOURCE = ( "import benchmark\n"
+                                   "from board import Board\n"
+                                   "board = Board()\n"
+                                   "print(benchmark.measureSecondsPerCall(board.placePlayerMarkerOnBoardAtPosition, (1, 1, 2)))\n" )
+
+def _undecorated_placement(self, playerNumber, boardXPosition, boardYPosition):
+    return None
+
+def measureSecondsPerCall(function, arguements, numberOfCalls=DEFAULT_NUMBER_OF_CALLS, numberOfRepeats=DEFAULT_NUMBER_OF_REPEATS):
+    '''
+    DESCRIPTION:
+        Times repeated calls of a function, and keeps the fastest of a number of repeats
+
+    PARAMETERS:
+        function: the function to call
+        arguements: a tuple of the arguements to call the function with
+        numberOfCalls: the number of calls made in each repeat
+        numberOfRepeats: the number of times the calls are repeated
+
+    RETURNS:
+        The fastest time taken for a single call in seconds, as a float
+    '''
+    fastestSecondsPerCall = None
+    for repeatNumber in range(numberOfRepeats):
+        startTime = timeit.default_timer()
+        for _ in itertools.repeat(None, numberOfCalls):
+            function(*arguements)
+        secondsPerCall = (timeit.default_timer() - startTime) / numberOfCalls
+        if (fastestSecondsPerCall is None) or (secondsPerCall < fastestSecondsPerCall):
+            fastestSecondsPerCall = secondsPerCall
+    return fastestSecondsPerCall
+#END
+
+def measurePreconditionOverheads(numberOfCalls=DEFAULT_NUMBER_OF_CALLS):
+    '''
+    DESCRIPTION:
+        Measures the cost which each precondition mode adds to a single call of a function with the
+        same preconditions as Board.placePlayerMarkerOnBoardAtPosition
+
+    PARAMETERS:
+        numberOfCalls: the number of calls timed for each mode
+
+    RETURNS:
+        A dictionary from each precondition mode to its overhead per call in nanoseconds
+    '''
+    arguements = (None, 1, 1, 2)
+    undecoratedSecondsPerCall = measureSecondsPerCall(_undecorated_placement, arguements, numberOfCalls)
+    preconditionOverheads = {}
+    for mode in PRECONDITION_MODES:
+        wrappedFunction = _wrap_function_in_preconditions(_undecorated_placement, _BOARD_PLACEMENT_PRECONDITIONS, mode)
+        secondsPerCall = measureSecondsPerCall(wrappedFunction, arguements, numberOfCalls)
+        preconditionOverheads[mode] = max(0.0, secondsPerCall - undecoratedSecondsPerCall) * NANOSECONDS_PER_SECOND
+    return preconditionOverheads
+#END
+
+def measureBoardPlacementCosts():
+    '''
+    DESCRIPTION:
+        Measures a call of Board.placePlayerMarkerOnBoardAtPosition under each precondition mode. The
+        mode is applied when the board module is imported, so each mode is measured in a new process
+
+    RETURNS:
+        A dictionary from each precondition mode to its time per call in nanoseconds
+    '''
+    boardPlacementCosts = {}
+    for mode in PRECONDITION_MODES:
+        environment = dict(os.environ)
+        environment[PRECONDITION_MODE_ENVIRONMENT_VARIABLE] = mode
+        timingOutput = subprocess.check_output( [sys.executable, "-c", _BOARD_PLACEMENT_TIMING_SOURCE], env=environment,
+                                                cwd=os.path.dirname(os.path.abspath(__file__)) )
+        boardPlacementCosts[mode] = float(timingOutput.strip()) * NANOSECONDS_PER_SECOND
+    return boardPlacementCosts
+#END
+
+def printPreconditionBenchmark():
+    print("Precondition overhead per call (same preconditions as Board.placePlayerMarkerOnBoardAtPosition):")
+    preconditionOverheads = measurePreconditionOverheads()
+    for mode in PRECONDITION_MODES:
+        print("    {:<12} {:>8.1f} ns".format(mode, preconditionOverheads[mode]))
+    print("Board.placePlayerMarkerOnBoardAtPosition per call:")
+    boardPlacementCosts = measureBoardPlacementCosts()
+    for mode in PRECONDITION_MODES:
+        print("    {:<12} {:>8.1f} ns".format(mode, boardPlacementCosts[mode]))
+#END
+
+#------------------------------------------------------------------------------------------------------
+# MEMORY REPORT
+#------------------------------------------------------------------------------------------------------
+DEFAULT_NUMBER_OF_MEASURED_OBJECTS = 200000
+
+# Each measured object is a name and the source of an expression creating one object
+_MEMORY_MEASUREMENTS = [ ("board", "Board()"),
+                         ("board_7x7", "Board(7, 5)"),
+                         ("print_command", "GameCommand(GameCommand.PRINT_COMMAND)"),
+                         ("move_command", "GameCommand(GameCommand.MOVE_COMMAND, 1, 2, 0)"),
+                         ("ai_move_command", "GameCommand(GameCommand.AI_MOVE_COMMAND, 2)") ]
+
+_MEMORY_MEASUREMENT_SOURCE = ( "import benchmark\n"
+                               "from board import Board\n"
+                               "from game_command import GameCommand\n"
+                               "print(benchmark._measure_bytes_per_object(lambda: {}, {}))\n" )
+
+def _get_resident_bytes():
+    try:
+        with open("/proc/self/statm", "r") as statmFile:
+            return int(statmFile.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (IOError, OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _measure_bytes_per_object(createObject, numberOfObjects):
+    # The list holding the objects is made before measuring, so only the objects themselves are counted
+    createdObjects = [None] * numberOfObjects
+    createObject()
+    gc.collect()
+    residentBytesBefore = _get_resident_bytes()
+    for objectNumber in range(numberOfObjects):
+        createdObjects[objectNumber] = createObject()
+    return float(_get_resident_bytes() - residentBytesBefore) / numberOfObjects
+
+def measureBytesPerObject(numberOfObjects=DEFAULT_NUMBER_OF_MEASURED_OBJECTS):
+    '''
+    DESCRIPTION:
+        Measures the memory held by each live board and game command, from the growth of the resident
+        memory of a new process creating many of them
+
+    PARAMETERS:
+        numberOfObjects: (optional) the number of objects of each kind which are created
+
+    RETURNS:
+        A dictionary from each measured object name to its bytes per object
+    '''
+    bytesPerObject = {}
+    for objectName, createSource in _MEMORY_MEASUREMENTS:
+        measurementOutput = subprocess.check_output( [sys.executable, "-c", _MEMORY_MEASUREMENT_SOURCE.format(createSource, numberOfObjects)],
+                                                     cwd=os.path.dirname(os.path.abspath(__file__)) )
+        bytesPerObject[objectName] = float(measurementOutput.strip())
+    return bytesPerObject
+#END
+
+def printMemoryReport():
+    print("Memory per live object:")
+    bytesPerObject = measureBytesPerObject()
+    for objectName, createSource in _MEMORY_MEASUREMENTS:
+        print("    {:<16} {:>8.0f} bytes    {}".format(objectName, bytesPerObject[objectName], createSource))
+#END
+
+#------------------------------------------------------------------------------------------------------
+# STARTUP REPORT
+#------------------------------------------------------------------------------------------------------
+DEFAULT_NUMBER_OF_STARTUPS = 5
+
+# The modules a game loads, or a simulation or tournament worker process, each listed after the modules it
+# imports. The move engine modules are only loaded by the first computer move, and the game log modules
+# only by a logged game
+STARTUP_MODULES = ( "instrumentation", "conditions", "board", "solver", "position_store", "move_table", "alpha_beta",
+                    "game_command", "command_stream", "game_log", "mcts", "policies", "simulator", "tournament",
+                    "panel", "TicTacApplication" )
+MOVE_ENGINE_MODULES = ("solver", "position_store", "move_table", "alpha_beta")
+
+# The first prompt of a game, which is written when the application is ready for its first move
+_FIRST_PROMPT = "First, enter player number: "
+
+_IMPORT_TIMING_SOURCE = ( "import sys\n"
+                          "import timeit\n"
+                          "numberOfModulesBefore = len([module for module in sys.modules.values() if module is not None])\n"
+                          "startTime = timeit.default_timer()\n"
+                          "import {}\n"
+                          "print(timeit.default_timer() - startTime)\n"
+                          "print(len([module for module in sys.modules.values() if module is not None]) - numberOfModulesBefore)\n"
+                          "print(int('unittest' in sys.modules))\n" )
+
+def measureImportTimes(moduleNames=STARTUP_MODULES, numberOfRepeats=DEFAULT_NUMBER_OF_STARTUPS):
+    '''
+    DESCRIPTION:
+        Measures the import of each module in a new process, so each time includes the modules it
+        imports, and keeps the fastest of a number of repeats
+
+    PARAMETERS:
+        moduleNames: (optional) the names of the modules
+        numberOfRepeats: (optional) the number of new processes each module is imported in
+
+    RETURNS:
+        A dictionary from each module name to a dictionary of its fastest import "seconds", the number of
+        "modules" the import loaded, and whether it loaded "unittest"
+    '''
+    importTimes = {}
+    for moduleName in moduleNames:
+        for repeatNumber in range(numberOfRepeats):
+            timingOutput = subprocess.check_output( [sys.executable, "-c", _IMPORT_TIMING_SOURCE.format(moduleName)],
+                                                    cwd=os.path.dirname(os.path.abspath(__file__)) )
+            importSeconds, numberOfModules, loadsUnittest = timingOutput.split()
+            if (moduleName not in importTimes) or (float(importSeconds) < importTimes[moduleName]["seconds"]):
+                importTimes[moduleName] = { "seconds": float(importSeconds),
+                                            "modules": int(numberOfModules),
+                                            "unittest": loadsUnittest == "1" }
+    return importTimes
+#END
+
+def _measure_seconds_to_first_prompt():
+    # The application is run unbuffered, so that the prompt is read as soon as it is written. Closing its
+    # input then ends the game
+    startTime = timeit.default_timer()
+    application = subprocess.Popen( [sys.executable, "-u", "TicTacApplication.py", "-run"], stdin=subprocess.PIPE,
+                                    stdout=subprocess.PIPE, cwd=os.path.dirname(os.path.abspath(__file__)) )
+    applicationOutput = ""
+    while not applicationOutput.endswith(_FIRST_PROMPT):
+        outputChunk = os.read(application.stdout.fileno(), 4096)
+        if not outputChunk:
+            raise RuntimeError("TicTacApplication.py ended before its first prompt")
+        applicationOutput += outputChunk
+    secondsToFirstPrompt = timeit.default_timer() - startTime
+    application.stdin.close()
+    application.stdout.read()
+    application.wait()
+    return secondsToFirstPrompt
+
+def measureStartupSeconds(numberOfStartups=DEFAULT_NUMBER_OF_STARTUPS):
+    '''
+    DESCRIPTION:
+        Measures a cold start of the game, from launching 'TicTacApplication.py -run' in a new process to
+        its first prompt, and keeps the fastest of a number of starts
+
+    PARAMETERS:
+        numberOfStartups: (optional) the number of times the game is started
+
+    RETURNS:
+        The fastest time to the first prompt in seconds, as a float
+    '''
+    return min(_measure_seconds_to_first_prompt() for startupNumber in range(numberOfStartups))
+#END
+
+def printStartupReport():
+    print("Start of 'TicTacApplication.py -run' to its first prompt:")
+    print("    {:>8.1f} ms".format(measureStartupSeconds() * 1000.0))
+    print("Import of each module in a new process (with the modules it imports):")
+    importTimes = measureImportTimes()
+    for moduleName in STARTUP_MODULES:
+        print("    {:<20} {:>8.1f} ms {:>6} modules{}".format(moduleName, importTimes[moduleName]["seconds"] * 1000.0,
+                                                          importTimes[moduleName]["modules"],
+                                                          "    (loads unittest)" if importTimes[moduleName]["unittest"] else ""))
+#END
+
+#------------------------------------------------------------------------------------------------------
+# BENCHMARK SUITE
+#------------------------------------------------------------------------------------------------------
+BENCHMARK_RESULTS_FILE = "benchmark_results.json"
+BENCHMARK_BASELINE_FILE = "benchmark_baseline.json"
+
+# A benchmark regresses when it is slower than its baseline by more than this fraction, and by more than
+# a few nanoseconds (so that the noise in timing very cheap calls is not reported)
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+MINIMUM_REGRESSION_NANOSECONDS = 50.0
+REGRESSION_THRESHOLD_ENVIRONMENT_VARIABLE = "TICTAC_BENCHMARK_THRESHOLD"
+
+# A drawn game, played with a move command and a render after every move
+_SCRIPTED_GAME_MOVES = [(1, 0, 0), (2, 1, 1), (1, 0, 2), (2, 0, 1), (1, 2, 1), (2, 1, 2), (1, 1, 0), (2, 2, 0), (1, 2, 2)]
+
+def _play_scripted_game():
+    board = Board()
+    for playerNumber, boardXPosition, boardYPosition in _SCRIPTED_GAME_MOVES:
+        GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition).executeCommandOnBoard(board)
+        board.getBoardAsString()
+    return board.isGameOver()
+
+def _play_policy_game():
+    return playGame(RandomPolicy(1), GreedyPolicy(2))
+
+def _create_changing_board_render():
+    board = Board()
+    def render_after_placement():
+        board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        board.getBoardAsString()
+        board.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        return board.getBoardAsString()
+    return (render_after_placement, ())
+
+def _create_place_and_undo():
+    board = Board()
+    def place_and_undo():
+        board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        board.undoMove()
+    return (place_and_undo, ())
+
+# Each benchmark is a name, a function creating the (function, arguements) to time, and the number of calls
+# timed in each repeat
+_BENCHMARKS = [ ("board_construction", (lambda: (Board, ())), 20000),
+                ("board_placement", (lambda: (Board().placePlayerMarkerOnBoardAtPosition, (1, 1, 2))), 100000),
+                ("board_get_marker", (lambda: (Board().getMarkerAtBoardPosition, (1, 2))), 100000),
+                ("board_place_and_undo", _create_place_and_undo, 50000),
+                ("board_random_legal_move", (lambda: (Board().getRandomLegalMove, ())), 100000),
+                ("board_string", (lambda: (Board().getBoardAsString, ())), 100000),
+                ("board_string_after_placement", _create_changing_board_render, 20000),
+                ("game_command_print", (lambda: (GameCommand, (GameCommand.PRINT_COMMAND,))), 50000),
+                ("game_command_nothing", (lambda: (GameCommand, (GameCommand.NOTHING_COMMAND,))), 50000),
+                ("game_command_move", (lambda: (GameCommand, (GameCommand.MOVE_COMMAND, 1, 2, 0))), 50000),
+                ("game_command_ai_move", (lambda: (GameCommand, (GameCommand.AI_MOVE_COMMAND, 2))), 50000),
+                ("scripted_game", (lambda: (_play_scripted_game, ())), 2000),
+                ("policy_game", (lambda: (_play_policy_game, ())), 500) ]
+
+BENCHMARK_NAMES = tuple(benchmarkName for benchmarkName, _, _ in _BENCHMARKS) + tuple("precondition_overhead_" + mode for mode in PRECONDITION_MODES)
+
+def runBenchmarkSuite(callScale=1.0, numberOfRepeats=DEFAULT_NUMBER_OF_REPEATS):
+    '''
+    DESCRIPTION:
+        Times each benchmark of the core modules: board construction, placement, reading and rendering,
+        game command construction of each type, the precondition overhead of each mode, and whole games
+
+    PARAMETERS:
+        callScale: (optional) a factor applied to the number of calls timed for every benchmark
+        numberOfRepeats: (optional) the number of times each benchmark is repeated, keeping the fastest
+
+    RETURNS:
+        A dictionary with the "python" version, the "preconditionMode" the modules were decorated in,
+        and the "results" as a dictionary from each of BENCHMARK_NAMES to nanoseconds per call
+    '''
+    results = {}
+    for benchmarkName, createBenchmark, numberOfCalls in _BENCHMARKS:
+        function, arguements = createBenchmark()
+        numberOfCalls = max(1, int(numberOfCalls * callScale))
+        results[benchmarkName] = measureSecondsPerCall(function, arguements, numberOfCalls, numberOfRepeats) * NANOSECONDS_PER_SECOND
+    preconditionOverheads = measurePreconditionOverheads(max(1, int(DEFAULT_NUMBER_OF_CALLS * callScale)))
+    for mode in PRECONDITION_MODES:
+        results["precondition_overhead_" + mode] = preconditionOverheads[mode]
+    return { "python": platform.python_version(),
+             "preconditionMode": getPreconditionMode(),
+             "results": results }
+#END
+
+def writeBenchmarkResults(suiteResults, fileName):
+    with open(fileName, "w") as resultsFile:
+        json.dump(suiteResults, resultsFile, indent=2, sort_keys=True)
+#END
+
+def readBenchmarkResults(fileName):
+    with open(fileName, "r") as resultsFile:
+        return json.load(resultsFile)
+#END
+
+def findRegressions(suiteResults, baselineResults, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    '''
+    DESCRIPTION:
+        Compares benchmark results with a baseline. Benchmarks missing from either are not compared
+
+    PARAMETERS:
+        suiteResults: results given by runBenchmarkSuite
+        baselineResults: earlier results given by runBenchmarkSuite
+        threshold: (optional) the fraction by which a benchmark may be slower than its baseline
+
+    RETURNS:
+        A list of (benchmark name, baseline nanoseconds, result nanoseconds) for every regression,
+        sorted by benchmark name
+    '''
+    regressions = []
+    baselineNanoseconds = baselineResults["results"]
+    for benchmarkName, resultNanoseconds in sorted(suiteResults["results"].items()):
+        if benchmarkName not in baselineNanoseconds:
+            continue
+        allowedNanoseconds = max(baselineNanoseconds[benchmarkName] * (1.0 + threshold),
+                                 baselineNanoseconds[benchmarkName] + MINIMUM_REGRESSION_NANOSECONDS)
+        if resultNanoseconds > allowedNanoseconds:
+            regressions += [(benchmarkName, baselineNanoseconds[benchmarkName], resultNanoseconds)]
+    return regressions
+#END
+
+def _get_regression_threshold():
+    return float(os.environ.get(REGRESSION_THRESHOLD_ENVIRONMENT_VARIABLE, DEFAULT_REGRESSION_THRESHOLD))
+
+def runBenchmarkSuiteAgainstBaseline(resultsFileName=BENCHMARK_RESULTS_FILE, baselineFileName=BENCHMARK_BASELINE_FILE, saveBaseline=False):
+    '''
+    DESCRIPTION:
+        Runs the benchmark suite, prints and writes its results, and compares them with the stored
+        baseline, or makes them the baseline if asked to. Timings depend on the machine, so the baseline
+        is recorded on each machine with 'python benchmark.py -baseline', and the suite is not run
+        against a missing baseline
+
+    PARAMETERS:
+        resultsFileName: (optional) the JSON file the results are written to
+        baselineFileName: (optional) the JSON file holding the baseline
+        saveBaseline: (optional) True to replace the baseline with these results
+
+    RETURNS:
+        True if no benchmark regressed beyond the threshold (set by the TICTAC_BENCHMARK_THRESHOLD
+        environment variable as a fraction, 0.25 by default), and False if one did or there is no baseline
+    '''
+    if (not saveBaseline) and (not os.path.exists(baselineFileName)):
+        print("NO BASELINE in {}: record one on this machine with 'python benchmark.py -baseline'".format(baselineFileName))
+        return False
+    suiteResults = runBenchmarkSuite()
+    writeBenchmarkResults(suiteResults, resultsFileName)
+    baselineResults = None
+    if not saveBaseline:
+        baselineResults = readBenchmarkResults(baselineFileName)
+    for benchmarkName in BENCHMARK_NAMES:
+        baselineColumn = ""
+        if (baselineResults is not None) and (benchmarkName in baselineResults["results"]):
+            baselineColumn = "(baseline {:>12.1f} ns)".format(baselineResults["results"][benchmarkName])
+        print("    {:<34} {:>12.1f} ns {}".format(benchmarkName, suiteResults["results"][benchmarkName], baselineColumn))
+    if saveBaseline:
+        writeBenchmarkResults(suiteResults, baselineFileName)
+        print("Saved the results as the baseline in {}".format(baselineFileName))
+        return True
+    regressions = findRegressions(suiteResults, baselineResults, _get_regression_threshold())
+    for benchmarkName, baselineNanoseconds, resultNanoseconds in regressions:
+        print("REGRESSION {}: {:.1f} ns against a baseline of {:.1f} ns".format(benchmarkName, resultNanoseconds, baselineNanoseconds))
+    return not regressions
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestMeasureSecondsPerCall(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_measure_seconds_per_call_is_positive(self):
+        secondsPerCall = measureSecondsPerCall(_undecorated_placement, (None, 1, 1, 2), 100, 2)
+        self.assertTrue(secondsPerCall > 0.0)
+
+class TestMeasurePreconditionOverheads(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_overhead_measured_for_every_mode(self):
+        preconditionOverheads = measurePreconditionOverheads(100)
+        self.assertEqual(sorted(preconditionOverheads.keys()), sorted(PRECONDITION_MODES))
+
+    def test_disabled_mode_has_no_wrapper(self):
+        wrappedFunction = _wrap_function_in_preconditions(_undecorated_placement, _BOARD_PLACEMENT_PRECONDITIONS, PRECONDITIONS_DISABLED)
+        self.assertTrue(wrappedFunction is _undecorated_placement)
+
+class TestStartupReport(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_startup_reaches_first_prompt(self):
+        self.assertTrue(measureStartupSeconds(1) > 0.0)
+
+    def test_game_modules_do_not_load_the_tests(self):
+        importTimes = measureImportTimes(STARTUP_MODULES, 1)
+        self.assertEqual(sorted(importTimes.keys()), sorted(STARTUP_MODULES))
+        for moduleName in STARTUP_MODULES:
+            self.assertTrue(importTimes[moduleName]["seconds"] > 0.0)
+            self.assertFalse(importTimes[moduleName]["unittest"], moduleName)
+
+    def test_game_does_not_load_the_move_engines(self):
+        loadedModuleNames = subprocess.check_output( [sys.executable, "-c", "import sys, TicTacApplication; print(' '.join(sys.modules))"],
+                                                     cwd=os.path.dirname(os.path.abspath(__file__)) ).split()
+        for moduleName in MOVE_ENGINE_MODULES:
+            self.assertFalse(moduleName in loadedModuleNames, moduleName)
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def _create_suite_results(self, results):
+        return {"python": platform.python_version(), "preconditionMode": getPreconditionMode(), "results": results}
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_every_benchmark_is_run(self):
+        suiteResults = runBenchmarkSuite(0.001, 1)
+        self.assertEqual(sorted(suiteResults["results"].keys()), sorted(BENCHMARK_NAMES))
+        self.assertTrue(all(nanoseconds >= 0.0 for nanoseconds in suiteResults["results"].values()))
+
+    def test_scripted_game_is_played_to_the_end(self):
+        self.assertTrue(_play_scripted_game())
+
+    def test_results_are_written_and_read_back(self):
+        suiteResults = self._create_suite_results({"board_placement": 300.0})
+        resultsFile = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
+        resultsFile.close()
+        try:
+            writeBenchmarkResults(suiteResults, resultsFile.name)
+            self.assertEqual(readBenchmarkResults(resultsFile.name), suiteResults)
+        finally:
+            os.remove(resultsFile.name)
+
+    def test_find_regressions(self):
+        baselineResults = self._create_suite_results({"board_placement": 1000.0, "board_string": 10.0, "scripted_game": 5000.0})
+        suiteResults = self._create_suite_results({"board_placement": 1300.0, "board_string": 30.0, "scripted_game": 5500.0, "new_benchmark": 1.0})
+        self.assertEqual(findRegressions(suiteResults, baselineResults), [("board_placement", 1000.0, 1300.0)])
+        self.assertEqual(findRegressions(suiteResults, baselineResults, 0.5), [])
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_missing_baseline_fails_without_being_created(self):
+        directory = tempfile.mkdtemp()
+        try:
+            baselineFileName = os.path.join(directory, BENCHMARK_BASELINE_FILE)
+            self.assertFalse(runBenchmarkSuiteAgainstBaseline(os.path.join(directory, BENCHMARK_RESULTS_FILE), baselineFileName))
+            self.assertFalse(os.path.exists(baselineFileName))
+        finally:
+            shutil.rmtree(directory)
+
+#------------------------------------------------------------------------------------------------------
+# BENCHMARK AND TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation')) and (not (sys.argv[1] == '-benchmark'))
+        and (not (sys.argv[1] == '-suite')) and (not (sys.argv[1] == '-baseline')) and (not (sys.argv[1] == '-memory'))
+        and (not (sys.argv[1] == '-startup')) ):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Run the benchmarks instead of the tests
+    if testFlag == "-benchmark":
+        printPreconditionBenchmark()
+        sys.exit(0)
+
+    # Report the memory held by each board and game command instead of running the tests
+    if testFlag == "-memory":
+        printMemoryReport()
+        sys.exit(0)
+
+    # Report the time to start the game and to import each of its modules instead of running the tests
+    if testFlag == "-startup":
+        printStartupReport()
+        sys.exit(0)
+
+    # Run the benchmark suite against the baseline (exiting with 1 on a regression), or replace the baseline
+    if (testFlag == "-suite") or (testFlag == "-baseline"):
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        sys.exit(0 if runBenchmarkSuiteAgainstBaseline(saveBaseline=(testFlag == "-baseline")) else 1)
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
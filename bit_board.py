@@ -0,0 +1,314 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import random
+from conditions import preconditions, PreconditionError
+from board import Board, _RENDER_STYLES
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class BitBoard:
+    """ A Tic Tac Toe Board stored as one integer bitmask per player """
+
+    BOARD_SIZE = Board.BOARD_SIZE
+    EMPTY_VALUE = Board.EMPTY_VALUE
+    PLAYER_TOKEN_VALUE = Board.PLAYER_TOKEN_VALUE
+    PLAYER_ONE_SYMBOL = Board.PLAYER_ONE_SYMBOL
+    PLAYER_TWO_SYMBOL = Board.PLAYER_TWO_SYMBOL
+
+    # The bit for board position (x, y) is bit number (x * boardSize + y). The table of bits is shared
+    # by every board of the same size
+    _cellBitTables = {}
+
+    @staticmethod
+    def _get_cell_bits(boardSize):
+        cellBits = BitBoard._cellBitTables.get(boardSize)
+        if cellBits is None:
+            cellBits = tuple( tuple( (1 << (boardXPosition * boardSize + boardYPosition))
+                                     for boardYPosition in range(boardSize) )
+                              for boardXPosition in range(boardSize) )
+            BitBoard._cellBitTables[boardSize] = cellBits
+        return cellBits
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)) )
+    def __init__(self, boardSize=BOARD_SIZE):
+        self._boardSize = boardSize
+        self._cellBits = BitBoard._get_cell_bits(boardSize)
+        self._playerOneBitmask = 0
+        self._playerTwoBitmask = 0
+    #END
+
+    def getBoardSize(self):
+        '''
+        DESCRIPTION:
+            Retrieves the number of positions along each side of the board
+
+        RETURNS:
+            Integer: the board size
+        '''
+        return self._boardSize
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))),
+                    (lambda self, boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < self._boardSize)),
+                    (lambda self, boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < self._boardSize)) )
+    def placePlayerMarkerOnBoardAtPosition(self, playerNumber, boardXPosition, boardYPosition):
+        '''
+        DESCRIPTION:
+            Places a token at a given board position for a given player, replacing any token
+            which was previously at that position (the same behaviour as Board)
+
+        PARAMETERS:
+            playerNumber: an integer which is 1 for 'player 1' and 2 for 'player 2'
+            boardXPosition: a board coordinate in the x direction between 0 and (board size - 1) as an integer
+            boardYPosition: a board coordinate in the y direction between 0 and (board size - 1) as an integer
+
+        RETURNS:
+            (valid arguement)
+                None
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        cellBit = self._cellBits[boardXPosition][boardYPosition]
+        if playerNumber == 1:
+            self._playerOneBitmask |= cellBit
+            self._playerTwoBitmask &= ~cellBit
+        else:
+            self._playerTwoBitmask |= cellBit
+            self._playerOneBitmask &= ~cellBit
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda self, boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < self._boardSize)),
+                    (lambda self, boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < self._boardSize)) )
+    def getMarkerAtBoardPosition(self, boardXPosition, boardYPosition):
+        '''
+        DESCRIPTION:
+            Retrieves the token value at a given board position
+
+        PARAMETERS:
+            boardXPosition: a board coordinate in the x direction between 0 and (board size - 1) as an integer
+            boardYPosition: a board coordinate in the y direction between 0 and (board size - 1) as an integer
+
+        RETURNS:
+            (valid arguement)
+                Integer: Representing the token value, which is an integer defined as Board.EMPTY_VALUE, or
+                         board.PLAYER_TOKEN_VALUE[0], or board.PLAYER_TOKEN_VALUE[1]
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        cellBit = self._cellBits[boardXPosition][boardYPosition]
+        if self._playerOneBitmask & cellBit:
+            return BitBoard.PLAYER_TOKEN_VALUE[0]
+        if self._playerTwoBitmask & cellBit:
+            return BitBoard.PLAYER_TOKEN_VALUE[1]
+        return BitBoard.EMPTY_VALUE
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda style: style in Board.RENDER_STYLES) )
+    def getBoardAsString(self, style=Board.CLASSIC_STYLE):
+        '''
+        DESCRIPTION:
+             Retrieves the current board state as a printable string representation, which is
+             identical to the string given by Board for the same board state
+
+        PARAMETERS:
+            style: (optional) one of Board.RENDER_STYLES, which defaults to Board.CLASSIC_STYLE
+
+        RETURNS:
+            (valid arguement)
+                A string which represents the current board state (a unicode string for Board.UNICODE_STYLE)
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        playerOneBitmask = self._playerOneBitmask
+        playerTwoBitmask = self._playerTwoBitmask
+        cellSymbols, createRowString, createBoardString = _RENDER_STYLES[style]
+        playerOneSymbol = cellSymbols[BitBoard.PLAYER_TOKEN_VALUE[0]]
+        playerTwoSymbol = cellSymbols[BitBoard.PLAYER_TOKEN_VALUE[1]]
+        emptySymbol = cellSymbols[BitBoard.EMPTY_VALUE]
+        rowStrings = []
+        for cellBitsInRow in self._cellBits:
+            rowSymbols = []
+            for cellBit in cellBitsInRow:
+                if playerOneBitmask & cellBit:
+                    rowSymbols.append(playerOneSymbol)
+                elif playerTwoBitmask & cellBit:
+                    rowSymbols.append(playerTwoSymbol)
+                else:
+                    rowSymbols.append(emptySymbol)
+            rowStrings.append(createRowString(rowSymbols))
+        return createBoardString(rowStrings, self._boardSize)
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestConstructor(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = BitBoard()
+
+    def tearDown(self):
+        self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction(self):
+        self.assertEqual(self._board._playerOneBitmask, 0)
+        self.assertEqual(self._board._playerTwoBitmask, 0)
+
+class TestPlacePlayerMarkerOnBoardAtPosition(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = BitBoard()
+
+    def tearDown(self):
+        self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_marking_each_position_for_each_player(self):
+        for boardXPosition in range(BitBoard.BOARD_SIZE):
+            for boardYPosition in range(BitBoard.BOARD_SIZE):
+                for playerNumber in [1, 2]:
+                    self._board = BitBoard()
+                    self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+                    self.assertEqual( self._board.getMarkerAtBoardPosition(boardXPosition, boardYPosition),
+                                      BitBoard.PLAYER_TOKEN_VALUE[playerNumber - 1] )
+
+    def test_marking_replaces_other_player_marker(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        self.assertEqual(self._board.getMarkerAtBoardPosition(1, 1), BitBoard.PLAYER_TOKEN_VALUE[1])
+        self.assertEqual(self._board._playerOneBitmask, 0)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_marking_with_invalid_player_number(self):
+        for player in (0, 3, -1, 0.0, "asd", [1, 2], (1, 2)):
+            self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, player, 1, 1 )
+
+    def test_marking_invalid_positions(self):
+        for invalidPosition in (-1, 3, 100, 0.0, "asd", [1, 2], (1, 2)):
+            self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, 1, invalidPosition, 1 )
+            self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, 1, 1, invalidPosition )
+
+class TestGetMarkerOnBoardAtPosition(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = BitBoard()
+
+    def tearDown(self):
+        self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_board_intially_empty_marked(self):
+        for boardXPosition in range(BitBoard.BOARD_SIZE):
+            for boardYPosition in range(BitBoard.BOARD_SIZE):
+                self.assertEqual( self._board.getMarkerAtBoardPosition(boardXPosition, boardYPosition), BitBoard.EMPTY_VALUE )
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_getting_invalid_positions(self):
+        for invalidPosition in (-1, 3, 100, 0.0, "asd", [1, 2], (1, 2)):
+            self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, invalidPosition, 1 )
+            self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, 1, invalidPosition )
+
+class TestAgreementWithBoard(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _number_of_random_games = 200
+
+    def _assert_boards_agree(self, board, bitBoard):
+        self.assertEqual(board.getBoardSize(), bitBoard.getBoardSize())
+        for boardXPosition in range(board.getBoardSize()):
+            for boardYPosition in range(board.getBoardSize()):
+                self.assertEqual( board.getMarkerAtBoardPosition(boardXPosition, boardYPosition),
+                                  bitBoard.getMarkerAtBoardPosition(boardXPosition, boardYPosition) )
+        for style in Board.RENDER_STYLES:
+            self.assertEqual(board.getBoardAsString(style), bitBoard.getBoardAsString(style))
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_empty_boards_agree(self):
+        self._assert_boards_agree(Board(), BitBoard())
+
+    def test_random_placements_agree(self):
+        randomGenerator = random.Random(2018)
+        for gameNumber in range(self._number_of_random_games):
+            boardSize = randomGenerator.choice([Board.BOARD_SIZE, 4, 7])
+            board = Board(boardSize)
+            bitBoard = BitBoard(boardSize)
+            for moveNumber in range(randomGenerator.randint(1, 12)):
+                playerNumber = randomGenerator.randint(1, 2)
+                boardXPosition = randomGenerator.randint(0, boardSize - 1)
+                boardYPosition = randomGenerator.randint(0, boardSize - 1)
+                board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+                bitBoard.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+            self._assert_boards_agree(board, bitBoard)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
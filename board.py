@@ -1,49 +1,365 @@
 #------------------------------------------------------------------------------------------------------
 # IMPORTS
 #------------------------------------------------------------------------------------------------------
-import unittest
+import random
+from array import array
 from conditions import preconditions, PreconditionError
 import sys
 
-#------------------------------------------------------------------------------------------------------
-# TEST FLAG
-#------------------------------------------------------------------------------------------------------
-testFlag = None
-
 #------------------------------------------------------------------------------------------------------
 # IMPLEMENTATION
 #------------------------------------------------------------------------------------------------------
-class Board:
+def _create_winning_lines(boardSize, winLength):
+    # Every run of winLength positions along a row, then a column, then a diagonal, then an
+    # anti-diagonal, each as a tuple of board positions
+    winningLines = []
+    for xStep, yStep in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for boardXPosition in range(boardSize):
+            for boardYPosition in range(boardSize):
+                lastXPosition = boardXPosition + xStep * (winLength - 1)
+                lastYPosition = boardYPosition + yStep * (winLength - 1)
+                if (0 <= lastXPosition < boardSize) and (0 <= lastYPosition < boardSize):
+                    winningLines += [tuple( (boardXPosition + xStep * step, boardYPosition + yStep * step)
+                                            for step in range(winLength) )]
+    return tuple(winningLines)
+
+def _create_line_indices_for_each_position(boardSize, winningLines):
+    lineIndicesForEachPosition = [[() for boardYPosition in range(boardSize)] for boardXPosition in range(boardSize)]
+    for lineIndex in range(len(winningLines)):
+        for boardXPosition, boardYPosition in winningLines[lineIndex]:
+            lineIndicesForEachPosition[boardXPosition][boardYPosition] += (lineIndex,)
+    return tuple(tuple(lineIndicesForRow) for lineIndicesForRow in lineIndicesForEachPosition)
+
+# How each rendering style draws a board: the symbol for each marker value, a function joining the symbols
+# of a row into a row string, and a function joining the row strings (and the board size) into the board string
+def _create_classic_board_string(rowStrings, boardSize):
+    boardBorder = "_" * (2 * boardSize + 1)
+    return "\n" + boardBorder + "\n" + "".join(rowStrings) + boardBorder + "\n"
+
+def _create_unicode_board_string(rowStrings, boardSize):
+    cellBorders = [u"\u2500" * 3] * boardSize
+    topBorder = u"\u250c" + u"\u252c".join(cellBorders) + u"\u2510\n"
+    rowBorder = u"\u251c" + u"\u253c".join(cellBorders) + u"\u2524\n"
+    bottomBorder = u"\u2514" + u"\u2534".join(cellBorders) + u"\u2518\n"
+    return topBorder + rowBorder.join(rowStrings) + bottomBorder
+
+_RENDER_STYLES = { "classic": ( (" ", "O", "X"),
+                                (lambda cellSymbols: "|" + "|".join(cellSymbols) + "|\n"),
+                                _create_classic_board_string ),
+                   "compact": ( (".", "O", "X"),
+                                (lambda cellSymbols: "".join(cellSymbols)),
+                                (lambda rowStrings, boardSize: "/".join(rowStrings)) ),
+                   "unicode": ( (u" ", u"\u25cb", u"\u2715"),
+                                (lambda cellSymbols: u"\u2502 " + u" \u2502 ".join(cellSymbols) + u" \u2502\n"),
+                                _create_unicode_board_string ) }
+
+class Board(object):
     """ A Tic Tac Toe Board """
 
+    # A fixed layout for every board, with no per-instance dictionary
+    __slots__ = ( "_boardSize", "_winLength", "_winningLines", "_lineIndicesForEachPosition", "_boardGrid",
+                  "_numberOfMarkedPositions", "_lineMarkerCounts", "_numberOfCompletedLines", "_winningPlayerNumber",
+                  "_renderedRows", "_renderedBoardStrings", "_emptyPositions", "_emptyPositionIndices",
+                  "_moveHistory", "_redoMoves" )
+
     BOARD_SIZE = 3
     EMPTY_VALUE = 0
     PLAYER_TOKEN_VALUE = [1, 2]
     PLAYER_ONE_SYMBOL = "O"
     PLAYER_TWO_SYMBOL = "X"
 
+    # Styles for getBoardAsString: the original bordered grid, a single line with the rows separated
+    # by '/' and empty positions shown as '.', and a grid drawn with unicode box drawing characters
+    CLASSIC_STYLE = "classic"
+    COMPACT_STYLE = "compact"
+    UNICODE_STYLE = "unicode"
+    RENDER_STYLES = (CLASSIC_STYLE, COMPACT_STYLE, UNICODE_STYLE)
+
+    WINNING_LINES = _create_winning_lines(BOARD_SIZE, BOARD_SIZE)
+
+    # The winning lines, and the lines through each position, shared by every board of the same size and win length
+    _lineTables = {}
+
+    # Every (x, y) board position tuple, shared by every board of the same size
+    _boardPositions = {}
+
+    # Released boards kept for reuse by acquireBoard, for each board size and win length
+    MAXIMUM_NUMBER_OF_FREE_BOARDS = 10000
+    _freeBoards = {}
+
+    @staticmethod
+    def _get_line_tables(boardSize, winLength):
+        lineTables = Board._lineTables.get((boardSize, winLength))
+        if lineTables is None:
+            winningLines = _create_winning_lines(boardSize, winLength)
+            lineTables = (winningLines, _create_line_indices_for_each_position(boardSize, winningLines))
+            Board._lineTables[(boardSize, winLength)] = lineTables
+        return lineTables
+    #END
+
+    @staticmethod
+    def _get_board_positions(boardSize):
+        boardPositions = Board._boardPositions.get(boardSize)
+        if boardPositions is None:
+            boardPositions = tuple( (boardXPosition, boardYPosition) for boardXPosition in range(boardSize)
+                                                                      for boardYPosition in range(boardSize) )
+            Board._boardPositions[boardSize] = boardPositions
+        return boardPositions
+    #END
+
     def _create_column_of_empty_value(self):
         column = []
         numberColumnEntriesFilled = 0
-        while (numberColumnEntriesFilled < Board.BOARD_SIZE):
+        while (numberColumnEntriesFilled < self._boardSize):
                 column += [Board.EMPTY_VALUE]
                 numberColumnEntriesFilled +=1
         return column
     #END
 
-    def __init__(self):
+    @preconditions( (lambda self: True),
+                    (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)),
+                    (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)) )
+    def __init__(self, boardSize=BOARD_SIZE, winLength=None):
+        '''
+        DESCRIPTION:
+            Constructs an empty board
+
+        PARAMETERS:
+            boardSize: (optional) the number of positions along each side of the board, which
+                       defaults to Board.BOARD_SIZE
+            winLength: (optional) the number of markers in a row needed to win, between 1 and
+                       the board size, which defaults to the board size
+
+        RETURNS:
+            (valid arguement)
+                A Board Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if winLength is None:
+            winLength = boardSize
+        if winLength > boardSize:
+            raise PreconditionError()
+        self._boardSize = boardSize
+        self._winLength = winLength
+        self._winningLines, self._lineIndicesForEachPosition = Board._get_line_tables(boardSize, winLength)
+
         self._boardGrid = []
         numberOfBoardRowsCreated = 0
-        while (numberOfBoardRowsCreated < Board.BOARD_SIZE):
+        while (numberOfBoardRowsCreated < self._boardSize):
             newColumn = self._create_column_of_empty_value()
             numberOfBoardRowsCreated +=1
             self._boardGrid += [newColumn]
+        self._numberOfMarkedPositions = 0
+        self._lineMarkerCounts = [[0] * len(self._winningLines), [0] * len(self._winningLines)]
+        self._numberOfCompletedLines = [0, 0]
+        self._winningPlayerNumber = None
+
+        # The empty positions in no particular order, and the index in that list of each position (at
+        # x * board size + y), which is None once the position is marked. A placement on an empty position
+        # moves the last empty position into its place, so the list is kept up to date in constant time
+        self._emptyPositions = list(Board._get_board_positions(boardSize))
+        self._emptyPositionIndices = range(boardSize * boardSize)
+
+        # Every placement made, and every placement undone since the last new placement, each packed into
+        # one integer by _place_marker
+        self._moveHistory = array("i")
+        self._redoMoves = array("i")
+
+        # The rendered row strings and board string of each style, kept until a placement changes them,
+        # and only made when the board is first rendered
+        self._renderedRows = None
+        self._renderedBoardStrings = None
+    #END
+
+    def _clear(self):
+        emptyRow = [Board.EMPTY_VALUE] * self._boardSize
+        for boardRow in self._boardGrid:
+            boardRow[:] = emptyRow
+        emptyLineMarkerCounts = [0] * len(self._winningLines)
+        for lineMarkerCounts in self._lineMarkerCounts:
+            lineMarkerCounts[:] = emptyLineMarkerCounts
+        self._numberOfCompletedLines[:] = [0, 0]
+        self._numberOfMarkedPositions = 0
+        self._winningPlayerNumber = None
+        self._emptyPositions[:] = Board._get_board_positions(self._boardSize)
+        self._emptyPositionIndices[:] = range(self._boardSize * self._boardSize)
+        del self._moveHistory[:]
+        del self._redoMoves[:]
+        self._renderedRows = None
+        self._renderedBoardStrings = None
+    #END
+
+    @staticmethod
+    @preconditions( (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)),
+                    (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)) )
+    def acquireBoard(boardSize=BOARD_SIZE, winLength=None):
+        '''
+        DESCRIPTION:
+            Retrieves an empty board, reusing a released board of the same size and win length if there
+            is one, so that programs making and dropping many boards do not allocate each one
+
+        PARAMETERS:
+            boardSize: (optional) the number of positions along each side of the board
+            winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+
+        RETURNS:
+            (valid arguement)
+                An empty Board Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        freeBoards = Board._freeBoards.get((boardSize, winLength or boardSize))
+        if freeBoards:
+            board = freeBoards.pop()
+            board._clear()
+            return board
+        return Board(boardSize, winLength)
+    #END
+
+    def releaseBoard(self):
+        '''
+        DESCRIPTION:
+            Gives the board back for reuse by acquireBoard. The board must not be used after it is released
+
+        RETURNS:
+            None
+        '''
+        freeBoards = Board._freeBoards.setdefault((self._boardSize, self._winLength), [])
+        if len(freeBoards) < Board.MAXIMUM_NUMBER_OF_FREE_BOARDS:
+            freeBoards.append(self)
+    #END
+
+    def _add_marker_to_line_counts(self, playerNumber, lineIndices):
+        lineMarkerCounts = self._lineMarkerCounts[playerNumber - 1]
+        for lineIndex in lineIndices:
+            lineMarkerCounts[lineIndex] += 1
+            if lineMarkerCounts[lineIndex] == self._winLength:
+                self._numberOfCompletedLines[playerNumber - 1] += 1
+                if self._winningPlayerNumber is None:
+                    self._winningPlayerNumber = playerNumber
+    #END
+
+    def _remove_marker_from_line_counts(self, playerNumber, lineIndices):
+        lineMarkerCounts = self._lineMarkerCounts[playerNumber - 1]
+        for lineIndex in lineIndices:
+            if lineMarkerCounts[lineIndex] == self._winLength:
+                self._numberOfCompletedLines[playerNumber - 1] -= 1
+            lineMarkerCounts[lineIndex] -= 1
+
+        # A replaced marker can break the winning line, in which case the other player may now hold the win
+        if (self._winningPlayerNumber == playerNumber) and (self._numberOfCompletedLines[playerNumber - 1] == 0):
+            otherPlayerNumber = 3 - playerNumber
+            if self._numberOfCompletedLines[otherPlayerNumber - 1] > 0:
+                self._winningPlayerNumber = otherPlayerNumber
+            else:
+                self._winningPlayerNumber = None
+    #END
+
+    def _remove_empty_position(self, boardXPosition, boardYPosition):
+        emptyPositions = self._emptyPositions
+        emptyPositionIndices = self._emptyPositionIndices
+        positionIndex = boardXPosition * self._boardSize + boardYPosition
+        emptyPositionIndex = emptyPositionIndices[positionIndex]
+        lastEmptyPosition = emptyPositions.pop()
+        if emptyPositionIndex < len(emptyPositions):
+            emptyPositions[emptyPositionIndex] = lastEmptyPosition
+            emptyPositionIndices[lastEmptyPosition[0] * self._boardSize + lastEmptyPosition[1]] = emptyPositionIndex
+        emptyPositionIndices[positionIndex] = None
+    #END
+
+    def _add_empty_position(self, boardXPosition, boardYPosition):
+        self._emptyPositionIndices[boardXPosition * self._boardSize + boardYPosition] = len(self._emptyPositions)
+        self._emptyPositions.append((boardXPosition, boardYPosition))
+    #END
+
+    def _restore_marker(self, previousMarkerValue, boardXPosition, boardYPosition):
+        # Puts back the marker a placement replaced, which may be empty
+        markerValue = self._boardGrid[boardXPosition][boardYPosition]
+        self._boardGrid[boardXPosition][boardYPosition] = previousMarkerValue
+        if self._renderedRows:
+            self._invalidate_rendered_row(boardXPosition)
+
+        lineIndices = self._lineIndicesForEachPosition[boardXPosition][boardYPosition]
+        self._remove_marker_from_line_counts(Board.PLAYER_TOKEN_VALUE.index(markerValue) + 1, lineIndices)
+        if previousMarkerValue == Board.EMPTY_VALUE:
+            self._numberOfMarkedPositions -= 1
+            self._add_empty_position(boardXPosition, boardYPosition)
+        else:
+            self._add_marker_to_line_counts(Board.PLAYER_TOKEN_VALUE.index(previousMarkerValue) + 1, lineIndices)
+    #END
+
+    def _read_history_entry(self, historyEntry):
+        # The player number and position of the placement in a history entry
+        boardXPosition, boardYPosition = divmod(historyEntry >> 6, self._boardSize)
+        return (Board.PLAYER_TOKEN_VALUE.index(historyEntry & 3) + 1, boardXPosition, boardYPosition)
+    #END
+
+    def _place_marker(self, playerNumber, boardXPosition, boardYPosition):
+        # Each history entry packs the position, the winner before the placement (0 for none), the marker
+        # replaced and the marker placed
+        markerValue = Board.PLAYER_TOKEN_VALUE[playerNumber - 1]
+        previousMarkerValue = self._boardGrid[boardXPosition][boardYPosition]
+        self._moveHistory.append( ((boardXPosition * self._boardSize + boardYPosition) << 6) | ((self._winningPlayerNumber or 0) << 4) |
+                                  (previousMarkerValue << 2) | markerValue )
+        if previousMarkerValue == markerValue:
+            return
+        self._boardGrid[boardXPosition][boardYPosition] = markerValue
+        if self._renderedRows:
+            self._invalidate_rendered_row(boardXPosition)
+
+        lineIndices = self._lineIndicesForEachPosition[boardXPosition][boardYPosition]
+        if previousMarkerValue == Board.EMPTY_VALUE:
+            self._numberOfMarkedPositions += 1
+            self._remove_empty_position(boardXPosition, boardYPosition)
+        else:
+            self._remove_marker_from_line_counts(Board.PLAYER_TOKEN_VALUE.index(previousMarkerValue) + 1, lineIndices)
+        self._add_marker_to_line_counts(playerNumber, lineIndices)
+    #END
+
+    def _invalidate_rendered_row(self, boardXPosition):
+        for renderedRows in self._renderedRows.itervalues():
+            renderedRows[boardXPosition] = None
+        self._renderedBoardStrings.clear()
+    #END
+
+    def getBoardSize(self):
+        '''
+        DESCRIPTION:
+            Retrieves the number of positions along each side of the board
+
+        RETURNS:
+            Integer: the board size
+        '''
+        return self._boardSize
+    #END
+
+    def getWinLength(self):
+        '''
+        DESCRIPTION:
+            Retrieves the number of markers in a row needed to win
+
+        RETURNS:
+            Integer: the win length
+        '''
+        return self._winLength
+    #END
+
+    def getWinningLines(self):
+        '''
+        DESCRIPTION:
+            Retrieves every line of positions which wins the game when marked by one player
+
+        RETURNS:
+            A tuple of winning lines, each a tuple of (x, y) board position tuples
+        '''
+        return self._winningLines
     #END
 
     @preconditions( (lambda self: True),
                     (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))),
-                    (lambda boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < Board.BOARD_SIZE)), 
-                    (lambda boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < Board.BOARD_SIZE)) ) 
+                    (lambda self, boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < self._boardSize)), 
+                    (lambda self, boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < self._boardSize)) ) 
     def placePlayerMarkerOnBoardAtPosition(self, playerNumber, boardXPosition, boardYPosition):
         '''
         DESCRIPTION:
@@ -51,8 +367,95 @@ class Board:
 
         PARAMETERS:
             playerNumber: an integer which is 1 for 'player 1' and 2 for 'player 2'
-            boardXPosition: a board coordinate in the x direction between 0 and 2 as an integer
-            boardYPosition: a board coordinate in the y direction between 0 and 2 as an integer
+            boardXPosition: a board coordinate in the x direction between 0 and (board size - 1) as an integer
+            boardYPosition: a board coordinate in the y direction between 0 and (board size - 1) as an integer
+
+        RETURNS:
+            (valid arguement) 
+                None
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if self._redoMoves:
+            del self._redoMoves[:]
+        self._place_marker(playerNumber, boardXPosition, boardYPosition)
+    #END
+
+    def undoMove(self):
+        '''
+        DESCRIPTION:
+            Takes back the last placement, restoring the marker it replaced and the result of the game
+            before it, in constant time. The placement can be made again with redoMove until a new
+            placement is made
+
+        RETURNS:
+            A tuple (player number, x, y) of the placement taken back, or None if there is none
+        '''
+        if not self._moveHistory:
+            return None
+        historyEntry = self._moveHistory.pop()
+        placement = self._read_history_entry(historyEntry)
+        previousMarkerValue = (historyEntry >> 2) & 3
+        if previousMarkerValue != (historyEntry & 3):
+            self._restore_marker(previousMarkerValue, placement[1], placement[2])
+        self._winningPlayerNumber = ((historyEntry >> 4) & 3) or None
+        self._redoMoves.append(historyEntry)
+        return placement
+    #END
+
+    def redoMove(self):
+        '''
+        DESCRIPTION:
+            Makes the last placement taken back by undoMove again
+
+        RETURNS:
+            A tuple (player number, x, y) of the placement made, or None if there is none
+        '''
+        if not self._redoMoves:
+            return None
+        placement = self._read_history_entry(self._redoMoves.pop())
+        self._place_marker(*placement)
+        return placement
+    #END
+
+    def getLastMove(self):
+        '''
+        DESCRIPTION:
+            Retrieves the last placement which has not been taken back
+
+        RETURNS:
+            A tuple (player number, x, y) of the placement, or None if there is none
+        '''
+        if not self._moveHistory:
+            return None
+        return self._read_history_entry(self._moveHistory[-1])
+    #END
+
+    def getMoveHistory(self):
+        '''
+        DESCRIPTION:
+            Retrieves every placement which has not been taken back, in the order they were made
+
+        RETURNS:
+            A list of (player number, x, y) tuples
+        '''
+        return [self._read_history_entry(historyEntry) for historyEntry in self._moveHistory]
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda self, winningPlayerNumber: ((isinstance(winningPlayerNumber, int))) and ((winningPlayerNumber == 1) or (winningPlayerNumber == 2))
+                                                       and (self._numberOfCompletedLines[winningPlayerNumber - 1] > 0)) )
+    def startFromPosition(self, winningPlayerNumber=None):
+        '''
+        DESCRIPTION:
+            Makes the markers on the board the start of the game: the move history is emptied, so no
+            placement can be taken back or made again, and the game is given a winner. The winner of a
+            position is not always the first line completed by placing its markers in order, when markers
+            have been replaced
+
+        PARAMETERS:
+            winningPlayerNumber: the player number (1 or 2) of the winner, who must have a completed line,
+                                 or None when the game has no winner
 
         RETURNS:
             (valid arguement) 
@@ -60,20 +463,22 @@ class Board:
             (invalid arguement)
                 a PreconditionError is thrown
         '''
-        self._boardGrid[boardXPosition][boardYPosition] = Board.PLAYER_TOKEN_VALUE[playerNumber - 1]
+        self._winningPlayerNumber = winningPlayerNumber
+        del self._moveHistory[:]
+        del self._redoMoves[:]
     #END
 
     @preconditions( (lambda self: True),
-                    (lambda boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < Board.BOARD_SIZE)), 
-                    (lambda boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < Board.BOARD_SIZE)) ) 
+                    (lambda self, boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < self._boardSize)), 
+                    (lambda self, boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < self._boardSize)) ) 
     def getMarkerAtBoardPosition(self, boardXPosition, boardYPosition):
         '''
         DESCRIPTION:
             Retrieves the token value at a given board position
 
         PARAMETERS:
-            boardXPosition: a board coordinate in the x direction between 0 and 2 as an integer
-            boardYPosition: a board coordinate in the y direction between 0 and 2 as an integer
+            boardXPosition: a board coordinate in the x direction between 0 and (board size - 1) as an integer
+            boardYPosition: a board coordinate in the y direction between 0 and (board size - 1) as an integer
 
         RETURNS:
             (valid arguement) 
@@ -86,345 +491,151 @@ class Board:
         return markerValue
     #END
 
-    def getBoardAsString(self):
+    def getLegalMoves(self):
+        '''
+        DESCRIPTION:
+            Retrieves the empty positions, which are the positions a player may mark. The board keeps this
+            list up to date as markers are placed, so it is given without copying, and must not be changed
+            by the caller (copy it to keep it past the next placement). Whether the game is over is left to
+            isGameOver
+
+        RETURNS:
+            A list of (x, y) board position tuples in no particular order
+        '''
+        return self._emptyPositions
+    #END
+
+    def getNumberOfLegalMoves(self):
+        '''
+        DESCRIPTION:
+            Retrieves the number of empty positions
+
+        RETURNS:
+            Integer: the number of empty positions
+        '''
+        return len(self._emptyPositions)
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda randomGenerator: hasattr(randomGenerator, "random")) )
+    def getRandomLegalMove(self, randomGenerator=None):
+        '''
+        DESCRIPTION:
+            Picks an empty position uniformly at random
+
+        PARAMETERS:
+            randomGenerator: (optional) a random.Random object to draw from, which defaults to the
+                             random module's own generator
+
+        RETURNS:
+            (valid arguement)
+                A tuple (x, y) of the position, or None if there is no empty position
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        emptyPositions = self._emptyPositions
+        if not emptyPositions:
+            return None
+        return emptyPositions[int((randomGenerator or random).random() * len(emptyPositions))]
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def isWon(self, playerNumber):
+        '''
+        DESCRIPTION:
+            Checks whether a player has a complete winning line, in constant time
+
+        PARAMETERS:
+            playerNumber: an integer which is 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                Boolean: True if the player has a complete line
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        return self._numberOfCompletedLines[playerNumber - 1] > 0
+    #END
+
+    def winner(self):
+        '''
+        DESCRIPTION:
+            Retrieves the player who won the game, in constant time. If both players hold a complete line
+            (only possible by replacing markers) it is the player who completed their line first
+
+        RETURNS:
+            Integer: 1 for 'player 1', 2 for 'player 2', or None if no player has a complete line
+        '''
+        return self._winningPlayerNumber
+    #END
+
+    def isDraw(self):
+        '''
+        DESCRIPTION:
+            Checks whether every board position is marked without either player winning, in constant time
+
+        RETURNS:
+            Boolean: True if the game is drawn
+        '''
+        return (self._winningPlayerNumber is None) and (self._numberOfMarkedPositions == self._boardSize * self._boardSize)
+    #END
+
+    def isGameOver(self):
         '''
         DESCRIPTION:
-             Retrieves the current board state as a printable string representation
+            Checks whether the game is either won or drawn, in constant time
+
+        RETURNS:
+            Boolean: True if no more moves should be played
+        '''
+        return (self._winningPlayerNumber is not None) or (self._numberOfMarkedPositions == self._boardSize * self._boardSize)
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda style: style in Board.RENDER_STYLES) )
+    def getBoardAsString(self, style=CLASSIC_STYLE):
+        '''
+        DESCRIPTION:
+             Retrieves the current board state as a printable string representation. The string is kept
+             until a placement changes the board, and then only the changed row is drawn again
 
         PARAMETERS:
+            style: (optional) one of Board.RENDER_STYLES, which defaults to Board.CLASSIC_STYLE
 
         RETURNS:
             (valid arguement) 
-                A string which represents the current board state
+                A string which represents the current board state (a unicode string for Board.UNICODE_STYLE)
             (invalid arguement)
                 a PreconditionError is thrown
         '''
-        boardString = "\n_______\n"
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                if self._boardGrid[boardXPosition][boardYPosition] == Board.EMPTY_VALUE:
-                    boardString += "| "
-                if self._boardGrid[boardXPosition][boardYPosition] == Board.PLAYER_TOKEN_VALUE[0]:
-                    boardString += "|"+Board.PLAYER_ONE_SYMBOL
-                if self._boardGrid[boardXPosition][boardYPosition] == Board.PLAYER_TOKEN_VALUE[1]:
-                    boardString += "|"+Board.PLAYER_TWO_SYMBOL   
-
-            boardString += "|\n"
-        boardString += "_______\n"
+        if self._renderedRows is None:
+            self._renderedRows = {}
+            self._renderedBoardStrings = {}
+        boardString = self._renderedBoardStrings.get(style)
+        if boardString is None:
+            cellSymbols, createRowString, createBoardString = _RENDER_STYLES[style]
+            renderedRows = self._renderedRows.get(style)
+            if renderedRows is None:
+                renderedRows = [None] * self._boardSize
+                self._renderedRows[style] = renderedRows
+            for boardXPosition in range(self._boardSize):
+                if renderedRows[boardXPosition] is None:
+                    renderedRows[boardXPosition] = createRowString([cellSymbols[markerValue] for markerValue in self._boardGrid[boardXPosition]])
+            boardString = createBoardString(renderedRows, self._boardSize)
+            self._renderedBoardStrings[style] = boardString
         return boardString
     #END
-#------------------------------------------------------------------------------------------------------
-# TESTING IMPLEMENTATION
-#------------------------------------------------------------------------------------------------------
-class TestConstructor(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    _known_initial_board_value = [[0,0,0],[0,0,0],[0,0,0]]
-    _board = None
-
-    def setUp(self):
-        self._board = Board()
-
-    def tearDown(self):
-    	self._board = None
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_construction(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self.assertEqual( self._board._boardGrid[boardXPosition][boardYPosition], 
-                                  self._known_initial_board_value[boardXPosition][boardYPosition])  
-
-class TestCreateColumnWithEmptyMarking(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    _board = None
-
-    def setUp(self):
-        self._board = Board()
-
-    def tearDown(self):
-        self._board = None
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_column_create_of_correct_length(self):
-        createdColumn = self._board._create_column_of_empty_value()
-        self.assertEqual( len(createdColumn), 3) 
-
-    def test_column_create_of_correct_entries(self):
-        createdColumn = self._board._create_column_of_empty_value()
-        for columnIndex in range(Board.BOARD_SIZE):
-            self.assertEqual( createdColumn[columnIndex], Board.EMPTY_VALUE) 
-
-class TestPlacePlayerMarkerOnBoardAtPosition(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    _board = None
-
-    def setUp(self):
-        self._board = Board()
-
-    def tearDown(self):
-        self._board = None
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_board_intially_empty_marked(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self.assertEqual( self._board._boardGrid[boardXPosition][boardYPosition], Board.EMPTY_VALUE)  
-
-    def test_marking_random_position_player1(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self._board = Board()
-                self._board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
-                self.assertTrue( self._board._boardGrid[boardXPosition][boardYPosition], Board.PLAYER_TOKEN_VALUE[1 - 1] )
-                self._board = None
-
-    def test_marking_random_position_player2(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self._board = Board()
-                self._board.placePlayerMarkerOnBoardAtPosition(2, boardXPosition, boardYPosition)
-                self.assertTrue( self._board._boardGrid[boardXPosition][boardYPosition], Board.PLAYER_TOKEN_VALUE[2 - 1] )
-                self._board = None
-
-    #------------------------------------------------------------------------------------------------------
-    # NEGATIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_marking_valid_positions_with_player_number_too_high(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for player in range(2,100):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (player, boardXPosition, boardYPosition) )
-                    self._board = None 
-
-    def test_marking_valid_positions_with_player_number_too_low(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for player in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (player, boardXPosition, boardYPosition) )
-                    self._board = None 
-
-    def test_marking_valid_positions_with_player_number_invalid_type(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for player in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (player, boardXPosition, boardYPosition) )
-                    self._board = None 
-
-    def test_marking_invalid_positions_too_high(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in range(3,100):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
-                    self._board = None 
-                for invalidPosition in range(3,100):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, boardXPosition, invalidPosition) )
-                    self._board = None 
-
-    def test_marking_invalid_positions_too_low(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
-                    self._board = None
-                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
-                    self._board = None 
-
-    def test_marking_invalid_positions_invalid_type(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
-                    self._board = None
-                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
-                    self._board = None 
-
-class TestGetMarkerOnBoardAtPosition(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    _board = None
-
-    def setUp(self):
-        self._board = Board()
-
-    def tearDown(self):
-        self._board = None
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_board_intially_empty_marked(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self.assertEqual( self._board.getMarkerAtBoardPosition(boardXPosition,boardYPosition), Board.EMPTY_VALUE)  
-
-    def test_marking_random_position_player1(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self._board = Board()
-                self._board._boardGrid[boardXPosition][boardYPosition] = Board.PLAYER_TOKEN_VALUE[0]
-                self.assertTrue( self._board.getMarkerAtBoardPosition(boardXPosition,boardYPosition), Board.PLAYER_TOKEN_VALUE[1 - 1] )
-                self._board = None
-
-
-    def test_marking_random_position_player2(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self._board = Board()
-                self._board._boardGrid[boardXPosition][boardYPosition] = Board.PLAYER_TOKEN_VALUE[1]
-                self.assertTrue( self._board.getMarkerAtBoardPosition(boardXPosition,boardYPosition), Board.PLAYER_TOKEN_VALUE[2 - 1] )
-                self._board = None
-
-    #------------------------------------------------------------------------------------------------------
-    # NEGATIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_marking_invalid_positions_too_high(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in range(3,100):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
-                    self._board = None 
-                for player in range(3,100):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (boardXPosition, invalidPosition) )
-                    self._board = None 
-
-    def test_marking_invalid_positions_too_low(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
-                    self._board = None
-                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
-                    self._board = None 
-
-    def test_marking_invalid_positions_invalid_type(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
-                    self._board = None
-                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
-                    self._board = Board()
-                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
-                    self._board = None 
-
-class TestGetBoardString(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    _board = None
-    
-
-    _known_empty_board_string = "\n_______\n"+"| | | |\n"+"| | | |\n"+"| | | |\n"+"_______\n"
-    _known_player1_full_board_string = "\n_______\n"+"|O|O|O|\n"+"|O|O|O|\n"+"|O|O|O|\n"+"_______\n"
-    _known_player2_full_board_string = "\n_______\n"+"|X|X|X|\n"+"|X|X|X|\n"+"|X|X|X|\n"+"_______\n"
-    _known_random_board_one_board_string = "\n_______\n"+"|O| |O|\n"+"| | |X|\n"+"|X| | |\n"+"_______\n"
-    _known_random_board_two_board_string = "\n_______\n"+"| | | |\n"+"| |O| |\n"+"|O|X|X|\n"+"_______\n"
-
-
-    def setUp(self):
-        self._board = Board()
-
-    def tearDown(self):
-        self._board = None
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_empty_board_string(self):
-        boardString = self._board.getBoardAsString()
-        self.assertEqual(boardString, self._known_empty_board_string)
-
-    def test_full_player1_board_string(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self._board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
-        boardString = self._board.getBoardAsString()
-        self.assertEqual(boardString, self._known_player1_full_board_string)
-
-    def test_full_player2_board_string(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self._board.placePlayerMarkerOnBoardAtPosition(2, boardXPosition, boardYPosition)
-        boardString = self._board.getBoardAsString()
-        self.assertEqual(boardString, self._known_player2_full_board_string)
-
-    def test_random_board_one_board_string(self):
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 2)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 2)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 0)
-        boardString = self._board.getBoardAsString()
-        self.assertEqual(boardString, self._known_random_board_one_board_string)
-
-    def test_random_board_two_board_string(self):
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 2, 0)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 2)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 1)
-        boardString = self._board.getBoardAsString()
-        self.assertEqual(boardString, self._known_random_board_two_board_string)
 
 #------------------------------------------------------------------------------------------------------
 # TESTING DRIVER
 #------------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
-    
-    # Check corret length of command line arguement string
-    if not (len(sys.argv) == 2):
-        print "Test Bench: Not Correct Number Testing Arguements\n"
-        sys.exit(0)
-
-    # Check valid command line arguements entered
-    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
-        print "Test Bench: Not Correct Testing Arguements\n"
-        sys.exit(0)
-
-    # Set the testing flag for the testing level for the module
-    testFlag = ((sys.argv[1]) + '.')[:-1]
-    del sys.argv[1]
-
-    # Add verbose output for compilation testing
-    if testFlag == "-compilation":
-        sys.argv[1] = "-v"
-    else:
-        del sys.argv[1]
-    
-    # Run test harness
-    unittest.main()
-
-#END
\ No newline at end of file
+
+    # The tests of this module are in test_board.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_board.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
@@ -0,0 +1,243 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import itertools
+from conditions import preconditions, PreconditionError, getUncheckedFunction
+from game_command import GameCommand
+from board import Board
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# A command stream has one command on each line, optionally after the index of the board it is for:
+#
+#     MOVE <player number> <x board position> <y board position>
+#     PRINT
+#     NOTHING
+#     2 MOVE 1 0 2
+#
+# Blank lines, and lines starting with '#', are ignored. Each command is read into a record tuple
+# (line number, board index, command type, player number, x board position, y board position)
+# where the last three are None for commands which are not moves
+DEFAULT_BATCH_SIZE = 10000
+
+MOVE_KEYWORD = "MOVE"
+PRINT_KEYWORD = "PRINT"
+NOTHING_KEYWORD = "NOTHING"
+
+_COMMAND_TYPES = { MOVE_KEYWORD: GameCommand.MOVE_COMMAND,
+                   PRINT_KEYWORD: GameCommand.PRINT_COMMAND,
+                   NOTHING_KEYWORD: GameCommand.NOTHING_COMMAND }
+
+class CommandStreamError(PreconditionError):
+    '''
+    This exception is given when a line of a command stream cannot be read, or holds a command which
+    cannot be applied to its board
+    '''
+
+def _read_lines(source):
+    # A path is opened here and read a line at a time, so that the file is never held in memory
+    if isinstance(source, basestring):
+        with open(source, "r") as commandFile:
+            for line in commandFile:
+                yield line
+    else:
+        for line in source:
+            yield line
+
+def parseCommandLine(line, lineNumber=0):
+    '''
+    DESCRIPTION:
+        Reads a command record from one line of a command stream
+
+    PARAMETERS:
+        line: the line of text
+        lineNumber: (optional) the number of the line, which is kept in the record for error messages
+
+    RETURNS:
+        (valid arguement)
+            A record tuple (line number, board index, command type, player number, x board position,
+            y board position), or None for a blank or comment line
+        (invalid arguement)
+            a CommandStreamError is thrown
+    '''
+    tokens = line.split()
+    if (not tokens) or tokens[0].startswith("#"):
+        return None
+    boardIndex = 0
+    if tokens[0].isdigit():
+        boardIndex = int(tokens[0])
+        del tokens[0]
+    commandType = _COMMAND_TYPES.get(tokens[0]) if tokens else None
+    if commandType is None:
+        raise CommandStreamError("line {}: unknown command {!r}".format(lineNumber, line.strip()))
+    if commandType != GameCommand.MOVE_COMMAND:
+        if len(tokens) != 1:
+            raise CommandStreamError("line {}: {} takes no arguements".format(lineNumber, tokens[0]))
+        return (lineNumber, boardIndex, commandType, None, None, None)
+    if len(tokens) != 4:
+        raise CommandStreamError("line {}: MOVE takes a player number and two board positions".format(lineNumber))
+    try:
+        return (lineNumber, boardIndex, commandType, int(tokens[1]), int(tokens[2]), int(tokens[3]))
+    except ValueError:
+        raise CommandStreamError("line {}: MOVE arguements must be integers".format(lineNumber))
+#END
+
+@preconditions( (lambda gameCommand: hasattr(gameCommand, "executeCommandOnBoard")),
+                (lambda boardIndex: ((isinstance(boardIndex, int))) and (boardIndex >= 0)) )
+def formatCommandLine(gameCommand, boardIndex=None):
+    '''
+    DESCRIPTION:
+        Writes a game command as a line of a command stream, so that sessions can be recorded and
+        replayed. An AI move command is written as the move it made, or as NOTHING if it made none
+
+    PARAMETERS:
+        gameCommand: a GameCommand object
+        boardIndex: (optional) the index of the board the command is for
+
+    RETURNS:
+        (valid arguement)
+            The line of text, without a line ending
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    commandType = gameCommand._commandType
+    if (commandType == GameCommand.AI_MOVE_COMMAND) and (gameCommand._xBoardPosition is not None):
+        commandType = GameCommand.MOVE_COMMAND
+    if commandType == GameCommand.MOVE_COMMAND:
+        commandLine = "{} {} {} {}".format(MOVE_KEYWORD, gameCommand._playerNumber, gameCommand._xBoardPosition, gameCommand._yBoardPosition)
+    elif commandType == GameCommand.PRINT_COMMAND:
+        commandLine = PRINT_KEYWORD
+    else:
+        commandLine = NOTHING_KEYWORD
+    if boardIndex is not None:
+        commandLine = "{} {}".format(boardIndex, commandLine)
+    return commandLine
+#END
+
+@preconditions( (lambda source: True),
+                (lambda batchSize: ((isinstance(batchSize, int))) and (batchSize >= 1)) )
+def readCommandBatches(source, batchSize=DEFAULT_BATCH_SIZE):
+    '''
+    DESCRIPTION:
+        Lazily reads a command stream in batches of command records, so that only one batch is held
+        in memory at a time
+
+    PARAMETERS:
+        source: the path of a command file, or any iterable of lines (such as an open file)
+        batchSize: (optional) the largest number of command records in a batch
+
+    RETURNS:
+        (valid arguement)
+            A generator of lists of command records
+        (invalid arguement)
+            a PreconditionError is thrown, or a CommandStreamError for a line which cannot be read
+    '''
+    commandRecords = (parseCommandLine(line, lineNumber) for lineNumber, line in enumerate(_read_lines(source), 1))
+    commandRecords = itertools.ifilter(None, commandRecords)
+    while True:
+        commandBatch = list(itertools.islice(commandRecords, batchSize))
+        if not commandBatch:
+            return
+        yield commandBatch
+#END
+
+def validateCommandBatch(commandBatch, boards):
+    '''
+    DESCRIPTION:
+        Checks every command record of a batch against the boards it is for, in one pass. This is the
+        same check that GameCommand and Board make on each command, so a valid batch can be executed
+        without them
+
+    PARAMETERS:
+        commandBatch: a list of command records
+        boards: a list of boards, indexed by the board index of the records
+
+    RETURNS:
+        (valid arguement)
+            None
+        (invalid arguement)
+            a CommandStreamError is thrown, for the first record which is invalid
+    '''
+    boardSizes = [board.getBoardSize() for board in boards]
+    numberOfBoards = len(boardSizes)
+    for lineNumber, boardIndex, commandType, playerNumber, boardXPosition, boardYPosition in commandBatch:
+        if boardIndex >= numberOfBoards:
+            raise CommandStreamError("line {}: there is no board {}".format(lineNumber, boardIndex))
+        if commandType == GameCommand.MOVE_COMMAND:
+            boardSize = boardSizes[boardIndex]
+            if not (((playerNumber == 1) or (playerNumber == 2)) and (0 <= boardXPosition < boardSize) and (0 <= boardYPosition < boardSize)):
+                raise CommandStreamError("line {}: invalid move for board {}".format(lineNumber, boardIndex))
+#END
+
+def executeCommandBatch(commandBatch, boards, outputFile=None):
+    '''
+    DESCRIPTION:
+        Validates a batch of command records, then executes all of them on their boards without
+        checking each command again. Nothing in the batch is executed if any record is invalid
+
+    PARAMETERS:
+        commandBatch: a list of command records
+        boards: a list of boards, indexed by the board index of the records
+        outputFile: (optional) the file which PRINT commands write to, which defaults to standard output
+
+    RETURNS:
+        (valid arguement)
+            None
+        (invalid arguement)
+            a CommandStreamError is thrown
+    '''
+    validateCommandBatch(commandBatch, boards)
+    if outputFile is None:
+        outputFile = sys.stdout
+    placeMarkerFunctions = [getUncheckedFunction(board.__class__.placePlayerMarkerOnBoardAtPosition) for board in boards]
+    for lineNumber, boardIndex, commandType, playerNumber, boardXPosition, boardYPosition in commandBatch:
+        if commandType == GameCommand.MOVE_COMMAND:
+            placeMarkerFunctions[boardIndex](boards[boardIndex], playerNumber, boardXPosition, boardYPosition)
+        elif commandType == GameCommand.PRINT_COMMAND:
+            outputFile.write(boards[boardIndex].getBoardAsString() + "\n")
+#END
+
+@preconditions( (lambda source: True),
+                (lambda boards: True),
+                (lambda batchSize: ((isinstance(batchSize, int))) and (batchSize >= 1)) )
+def replayCommandStream(source, boards, batchSize=DEFAULT_BATCH_SIZE, outputFile=None):
+    '''
+    DESCRIPTION:
+        Executes every command of a command stream on one or many boards, reading and checking the
+        stream a batch at a time. Batches before an invalid batch have already been executed
+
+    PARAMETERS:
+        source: the path of a command file, or any iterable of lines (such as an open file)
+        boards: a board, or a list of boards indexed by the board index of the commands
+        batchSize: (optional) the largest number of commands read and checked together
+        outputFile: (optional) the file which PRINT commands write to, which defaults to standard output
+
+    RETURNS:
+        (valid arguement)
+            The number of commands executed
+        (invalid arguement)
+            a PreconditionError is thrown, or a CommandStreamError for an invalid command
+    '''
+    if hasattr(boards, "placePlayerMarkerOnBoardAtPosition"):
+        boards = [boards]
+    numberOfCommands = 0
+    for commandBatch in readCommandBatches(source, batchSize):
+        executeCommandBatch(commandBatch, boards, outputFile)
+        numberOfCommands += len(commandBatch)
+    return numberOfCommands
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # The tests of this module are in test_command_stream.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_command_stream.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
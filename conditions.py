@@ -2,13 +2,10 @@
 # IMPORTS
 #------------------------------------------------------------------------------------------------------
 import sys
-import unittest
+import os
 import types
-
-#------------------------------------------------------------------------------------------------------
-# TEST FLAG
-#------------------------------------------------------------------------------------------------------
-testFlag = None
+import functools
+import instrumentation
 
 #------------------------------------------------------------------------------------------------------
 # IMPLEMENTATION
@@ -23,15 +20,225 @@ class ArguementError(Exception):
     This exception is given when the precondition tests given in the precondition decorator are invalid
     '''
 
+#------------------------------------------------------------------------------------------------------
+# PRECONDITION MODES
+#------------------------------------------------------------------------------------------------------
+PRECONDITIONS_INTERPRETED = "interpreted"
+PRECONDITIONS_COMPILED = "compiled"
+PRECONDITIONS_DISABLED = "disabled"
+PRECONDITION_MODES = (PRECONDITIONS_INTERPRETED, PRECONDITIONS_COMPILED, PRECONDITIONS_DISABLED)
+PRECONDITION_MODE_ENVIRONMENT_VARIABLE = "TICTAC_PRECONDITIONS"
+
+def _get_default_precondition_mode():
+    mode = os.environ.get(PRECONDITION_MODE_ENVIRONMENT_VARIABLE)
+    if mode is None:
+        # 'python -O' strips the asserts the precondition checks were originally built on
+        if __debug__:
+            return PRECONDITIONS_COMPILED
+        return PRECONDITIONS_DISABLED
+    if mode not in PRECONDITION_MODES:
+        raise ArguementError
+    return mode
+
+_preconditionMode = _get_default_precondition_mode()
+
+def setPreconditionMode(mode):
+    '''
+    DESCRIPTION:
+        Sets the process wide precondition mode. The mode is applied when a function is decorated,
+        so it only affects functions decorated after the call. To change the mode of the game
+        modules, set it before they are imported, or set the TICTAC_PRECONDITIONS environment
+        variable before starting the process
+
+    PARAMETERS:
+        mode: one of PRECONDITIONS_INTERPRETED, PRECONDITIONS_COMPILED or PRECONDITIONS_DISABLED
+
+    RETURNS:
+        (valid arguement)
+            None
+        (invalid arguement)
+            An ArguementError is raised
+    '''
+    global _preconditionMode
+    if mode not in PRECONDITION_MODES:
+        raise ArguementError
+    _preconditionMode = mode
+#END
+
+def getPreconditionMode():
+    '''
+    DESCRIPTION:
+        Retrieves the process wide precondition mode
+
+    RETURNS:
+        One of PRECONDITIONS_INTERPRETED, PRECONDITIONS_COMPILED or PRECONDITIONS_DISABLED
+    '''
+    return _preconditionMode
+#END
+
+#------------------------------------------------------------------------------------------------------
+# PRECONDITION WRAPPERS
+#------------------------------------------------------------------------------------------------------
+_ALWAYS_TRUE_PRECONDITION_CODE = (lambda arguement: True).__code__
+
+def _is_always_true_precondition(precondition):
+    preconditionCode = precondition.__code__
+    return ( (preconditionCode.co_argcount == 1) and
+             (preconditionCode.co_code == _ALWAYS_TRUE_PRECONDITION_CODE.co_code) and
+             (preconditionCode.co_consts == _ALWAYS_TRUE_PRECONDITION_CODE.co_consts) and
+             (preconditionCode.co_names == _ALWAYS_TRUE_PRECONDITION_CODE.co_names) )
+
+def _is_instance_precondition(precondition):
+    # A precondition with two parameters is given the first arguement (the instance of a method) as well
+    return precondition.__code__.co_argcount == 2
+
+def _get_precondition_metric_name(function, scopeName):
+    # The scope a function is decorated in is its class, or '<module>' for a module level function
+    if scopeName == "<module>":
+        return "preconditions.%s.%s" % (function.__module__, function.__name__)
+    return "preconditions.%s.%s.%s" % (function.__module__, scopeName, function.__name__)
+
+def _create_instrumented_call(function, checkArguements, metricName):
+    # Used in place of the check while instrumentation is collecting: the check is timed on its own,
+    # and each PreconditionError is counted as a rejection
+    rejectionCounterName = metricName + ".rejections"
+    def instrumented_call(args, kwargs=None, checkedArguements=None):
+        startTime = instrumentation.clock()
+        try:
+            checkArguements(*(args if checkedArguements is None else checkedArguements))
+        except PreconditionError:
+            instrumentation.incrementCounter(rejectionCounterName)
+            raise
+        finally:
+            instrumentation.recordLatency(metricName, instrumentation.clock() - startTime)
+        return function(*args, **(kwargs or {}))
+    return instrumented_call
+
+def _create_keyword_call(function, checkArguements, instrumented_call):
+    # Used for calls with keyword arguements, which are checked as if they were given at the position of
+    # their parameter, so that a call is checked the same way however its arguements are given. Parameters
+    # left out are None, so are not checked, and unknown or repeated keywords are left to the function
+    functionCode = function.__code__
+    parameterPositions = dict((parameterName, i) for i, parameterName in enumerate(functionCode.co_varnames[:functionCode.co_argcount]))
+    def keyword_call(args, kwargs):
+        checkedArguements = list(args) + [None] * (functionCode.co_argcount - len(args))
+        for parameterName, arguement in kwargs.items():
+            i = parameterPositions.get(parameterName)
+            if (i is not None) and (i >= len(args)):
+                checkedArguements[i] = arguement
+        if instrumentation.collecting:
+            return instrumented_call(args, kwargs, checkedArguements)
+        checkArguements(*checkedArguements)
+        return function(*args, **kwargs)
+    return keyword_call
+
+def _create_interpreted_wrapper(function, preconditions, metricName):
+    def check_arguements(*args):
+        for i in range(len(preconditions)):
+            if (i < len(args)) and (preconditions[i] is not None) and (args[i] is not None):
+                try:
+                    if _is_instance_precondition(preconditions[i]):
+                        assert preconditions[i](args[0], args[i])
+                    else:
+                        assert preconditions[i](args[i])
+                except AssertionError:
+                    raise PreconditionError()
+    instrumented_call = _create_instrumented_call(function, check_arguements, metricName)
+    keyword_call = _create_keyword_call(function, check_arguements, instrumented_call)
+    def function_wrapper(*args, **kwargs):
+        if kwargs:
+            return keyword_call(args, kwargs)
+        if instrumentation.collecting:
+            return instrumented_call(args)
+        check_arguements(*args)
+        result = function(*args)
+        return result
+    return functools.wraps(function)(function_wrapper)
+
+def _create_compiled_wrapper(function, preconditions, metricName):
+    # Generates one straight line validator for the decorated function: no loop, no try block,
+    # and no call at all for preconditions which always hold (such as 'lambda self: True')
+    # Arguements which have a default value may be left out of a call, so only those are tested for.
+    # The same checks are generated on their own, for the instrumented call
+    functionCode = function.__code__
+    numberOfRequiredArguements = functionCode.co_argcount - len(function.__defaults__ or ())
+    wrapperNamespace = {"function": function, "PreconditionError": PreconditionError, "instrumentation": instrumentation}
+    checkSourceLines = []
+    for i in range(len(preconditions)):
+        if _is_always_true_precondition(preconditions[i]):
+            continue
+        wrapperNamespace["precondition%d" % i] = preconditions[i]
+        indent = "    "
+        if i >= numberOfRequiredArguements:
+            checkSourceLines.append("    if len(args) > %d:" % i)
+            indent = "        "
+        checkSourceLines.append(indent + "arguement = args[%d]" % i)
+        if _is_instance_precondition(preconditions[i]):
+            checkSourceLines.append(indent + "if (arguement is not None) and (not precondition%d(args[0], arguement)):" % i)
+        else:
+            checkSourceLines.append(indent + "if (arguement is not None) and (not precondition%d(arguement)):" % i)
+        checkSourceLines.append(indent + "    raise PreconditionError()")
+    wrapperSourceLines = ( ["def check_arguements(*args):"] + checkSourceLines + ["    pass"] +
+                           ["def function_wrapper(*args, **kwargs):",
+                            "    if kwargs:",
+                            "        return keyword_call(args, kwargs)",
+                            "    if instrumentation.collecting:",
+                            "        return instrumented_call(args)"] + checkSourceLines + ["    return function(*args)"] )
+    wrapperCode = compile("\n".join(wrapperSourceLines), "<preconditions of %s>" % function.__name__, "exec")
+    exec(wrapperCode, wrapperNamespace)
+    wrapperNamespace["instrumented_call"] = _create_instrumented_call(function, wrapperNamespace["check_arguements"], metricName)
+    wrapperNamespace["keyword_call"] = _create_keyword_call(function, wrapperNamespace["check_arguements"], wrapperNamespace["instrumented_call"])
+    return functools.wraps(function)(wrapperNamespace["function_wrapper"])
+
+def _wrap_function_in_preconditions(function, preconditions, mode, metricName=None):
+    if mode == PRECONDITIONS_DISABLED:
+        return function
+    if metricName is None:
+        metricName = _get_precondition_metric_name(function, "<module>")
+    if mode == PRECONDITIONS_INTERPRETED:
+        wrappedFunction = _create_interpreted_wrapper(function, preconditions, metricName)
+    else:
+        wrappedFunction = _create_compiled_wrapper(function, preconditions, metricName)
+    wrappedFunction._uncheckedFunction = function
+    return wrappedFunction
+
+def getUncheckedFunction(function):
+    '''
+    DESCRIPTION:
+        Retrieves the function which was decorated by the preconditions decorator, so that a caller
+        which has already checked a whole batch of arguements can skip the check on every call
+
+    PARAMETERS:
+        function: a function or method, which may or may not be decorated with preconditions
+
+    RETURNS:
+        The undecorated function, or the function itself if it has no precondition check
+    '''
+    return getattr(function, "_uncheckedFunction", function)
+
+#------------------------------------------------------------------------------------------------------
+# PRECONDITION DECORATOR
+#------------------------------------------------------------------------------------------------------
 def preconditions(*preconditions):
     '''
     DESCRIPTION:
         Takes a list of preconditions as lambda expressions, and decorates a function in a check
-        of these preconditions on the applied function arguements at runtime
+        of these preconditions on the applied function arguements at runtime. How the check is made
+        depends on the precondition mode when the function is decorated:
+            PRECONDITIONS_COMPILED    - a validator specialised to the preconditions is generated (default)
+            PRECONDITIONS_INTERPRETED - the preconditions are looped over on every call
+            PRECONDITIONS_DISABLED    - the function is returned undecorated, with no checks at all
+        While the instrumentation module is collecting, the time taken by each check is recorded, and
+        each PreconditionError is counted, under 'preconditions.<module>.<class>.<function>'
 
     PARAMETERS:
         *preconditions: A tuple containing lambda expressions representing preconditions for the
-                        wrapped function's arguements
+                        wrapped function's arguements. A lambda expression with two parameters is
+                        given the first arguement (the instance of a method) followed by its own
+                        arguement, so that a check can depend on the state of the instance.
+                        As with arguements given as None, arguements left out of a call (so that
+                        their default value is used) are not tested. Arguements given by keyword
+                        are tested by the precondition at the position of their parameter
 
     RETURNS:
         (valid arguement)
@@ -45,85 +252,19 @@ def preconditions(*preconditions):
             raise ArguementError
 
     def decorator(function):
-        def function_wrapper(*args):
-            for i in range(len(preconditions)):
-            	if (preconditions[i] is not None) and (args[i] is not None):
-            	    try:
-            	    	assert preconditions[i](args[i])
-            	    except AssertionError:
-            	        #print "PreconditionError: with arguement number[", i, "] in function:", function.__name__, "with arg:", args[i]
-            	    	raise PreconditionError()
-            result = function(*args)
-            return result
-        return function_wrapper
+        # Named for the class (or module) it is decorated in, for the instrumentation metrics
+        scopeName = sys._getframe(1).f_code.co_name
+        return _wrap_function_in_preconditions(function, preconditions, _preconditionMode, _get_precondition_metric_name(function, scopeName))
     return decorator
 
-#------------------------------------------------------------------------------------------------------
-# TESTING IMPLEMENTATION
-#------------------------------------------------------------------------------------------------------
-class TestPrecondition(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    ''' Test functions designed to test out different sets of valid preconditions '''
-    @preconditions(     (lambda arg1: arg1 > 2)
-                    and (lambda arg2: arg2 > 2)
-                    and (lambda arg3: arg3 > 2) )
-    def dummyFunctionOne(arg1, arg2, arg3):
-        return True
-
-    @preconditions(     (lambda arg1: arg1 > 20)
-                    and (lambda arg2: arg2 > 29) )
-    def dummyFunctionTwo(arg1, arg2):
-        return True
-
-    ''' Tuples containing the pairs of test functions and aguements for these test functions '''
-    testFunctionPositiveApplicationList = ((dummyFunctionOne, (3, 3, 3)), (dummyFunctionTwo, (30,30)))
-    testFunctionNegativeApplicationList = ((dummyFunctionOne, (1, 3, 3)), (dummyFunctionTwo, (2,30)))
-
-    def setUp(self):
-        pass
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_known_valid_preconditions(self):
-        for testFunction, testFunctionArguements in self.testFunctionPositiveApplicationList:
-            self.assertTrue(testFunction(*testFunctionArguements))  
-
-    #------------------------------------------------------------------------------------------------------
-    # NEGATIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_known_invalid_precondition_arguements(self):
-        for testFunction, testFunctionArguements in self.testFunctionNegativeApplicationList:
-            self.assertRaises(PreconditionError, testFunction, *testFunctionArguements) 
-
 #------------------------------------------------------------------------------------------------------
 # TESTING DRIVER
 #------------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
-    
-    # Check corret length of command line arguement string
-    if not (len(sys.argv) == 2):
-        print "Test Bench: Not Correct Number Testing Arguements\n"
-        sys.exit(0)
-
-    # Check valid command line arguements entered
-    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
-        print "Test Bench: Not Correct Testing Arguements\n"
-        sys.exit(0)
-
-    # Set the testing flag for the testing level for the module
-    testFlag = ((sys.argv[1]) + '.')[:-1]
-
-    # Add verbose output for compilation testing
-    if testFlag == "-compilation":
-        sys.argv[1] = "-v"
-    else:
-        del sys.argv[1]
 
-    # Run test harness
-    unittest.main()
+    # The tests of this module are in test_conditions.py, so that only running them loads them
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_conditions.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
 
-#END
\ No newline at end of file
+#END
@@ -1,25 +1,62 @@
 #------------------------------------------------------------------------------------------------------
 # IMPORTS
 #------------------------------------------------------------------------------------------------------
-import unittest
 from conditions import preconditions, PreconditionError 
 from board import Board
+import instrumentation
 import sys
 
-#------------------------------------------------------------------------------------------------------
-# TEST FLAG
-#------------------------------------------------------------------------------------------------------
-testFlag = None
-
 #------------------------------------------------------------------------------------------------------
 # IMPLEMENTATION
 #------------------------------------------------------------------------------------------------------
-class GameCommand:
+# The instrumentation metric of each command type, indexed by command type
+_COMMAND_METRIC_NAMES = ("commands.print", "commands.move", "commands.nothing", "commands.ai_move")
+
+class GameCommand(object):
     """ A Tic Tac Toe Game Action """
 
+    # A fixed layout shared by every type of command, with no per-instance dictionary. Attributes which
+    # a command type does not use are None
+    __slots__ = ("_commandType", "_playerNumber", "_xBoardPosition", "_yBoardPosition", "_boardSize", "_moveEngine")
+
     PRINT_COMMAND = 0
     MOVE_COMMAND = 1
     NOTHING_COMMAND = 2
+    AI_MOVE_COMMAND = 3
+
+    # Used by AI move commands which are not given a move engine: the precomputed move table for boards
+    # the solver can solve, and the alpha-beta engine for any other board size or win length. Each is
+    # made (and its module imported) by the first such command on a board it plays, so a game only loads
+    # the engine it uses
+    DEFAULT_MOVE_ENGINE = None
+    DEFAULT_LARGE_BOARD_MOVE_ENGINE = None
+
+    # Released commands kept for reuse by acquireCommand
+    MAXIMUM_NUMBER_OF_FREE_COMMANDS = 10000
+    _freeCommands = []
+
+    @staticmethod
+    def _get_default_move_engine(board):
+        from solver import Solver
+        if Solver.canSolveBoard(board):
+            if GameCommand.DEFAULT_MOVE_ENGINE is None:
+                from move_table import MoveTableEngine
+                GameCommand.DEFAULT_MOVE_ENGINE = MoveTableEngine()
+            return GameCommand.DEFAULT_MOVE_ENGINE
+        if GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE is None:
+            from alpha_beta import AlphaBetaEngine
+            GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE = AlphaBetaEngine()
+        return GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE
+    #END
+
+    def _clear_command(self):
+        self._commandType = None
+        self._playerNumber = None
+        self._xBoardPosition = None
+        self._yBoardPosition = None
+        self._boardSize = None
+        self._moveEngine = None
+    #END
 
     @preconditions( (lambda self: True),
                     (lambda commandType: (commandType == GameCommand.PRINT_COMMAND)) )
@@ -36,14 +73,32 @@ class GameCommand:
     @preconditions( (lambda self: True),
                     (lambda commandType: (commandType == GameCommand.MOVE_COMMAND)),
                     (lambda playerNumber:  playerNumber == 1 or playerNumber == 2),
-                    (lambda xBoardPosition: ((isinstance(xBoardPosition, int))) and (xBoardPosition >= 0) and (xBoardPosition < Board.BOARD_SIZE)), 
-                    (lambda yBoardPosition: ((isinstance(yBoardPosition, int))) and (yBoardPosition >= 0) and (yBoardPosition < Board.BOARD_SIZE)) )
+                    (lambda self, xBoardPosition: ((isinstance(xBoardPosition, int))) and (xBoardPosition >= 0) and (xBoardPosition < self._boardSize)), 
+                    (lambda self, yBoardPosition: ((isinstance(yBoardPosition, int))) and (yBoardPosition >= 0) and (yBoardPosition < self._boardSize)) )
     def _create_move_command(self, commandType,playerNumber, xBoardPosition, yBoardPosition):
         self._commandType = commandType
         self._playerNumber = playerNumber
         self._xBoardPosition = xBoardPosition
         self._yBoardPosition = yBoardPosition
     #END
+
+    @preconditions( (lambda self: True),
+                    (lambda commandType: (commandType == GameCommand.AI_MOVE_COMMAND)),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))),
+                    (lambda moveEngine: hasattr(moveEngine, "getBestMove")) )
+    def _create_ai_move_command(self, commandType, playerNumber, moveEngine=None):
+        self._commandType = commandType
+        self._playerNumber = playerNumber
+        self._moveEngine = moveEngine
+        self._xBoardPosition = None
+        self._yBoardPosition = None
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)) )
+    def _set_board_size(self, boardSize):
+        self._boardSize = boardSize
+    #END
     
     @preconditions( (lambda self: True),
                     (lambda *arguements: (len(arguements) == 1) or (len(arguements) == 4)) )
@@ -59,8 +114,15 @@ class GameCommand:
             or
             arguements(0): GameCommand.PRINT_COMMAND
             arguements(1): an integer which is 1 for 'player 1' and 2 for 'player 2'
-            arguements(2): a board coordinate in the x direction between 0 and 2 as an integer
-            arguements(3): a board coordinate in the y direction between 0 and 2 as an integer
+            arguements(2): a board coordinate in the x direction between 0 and (board size - 1) as an integer
+            arguements(3): a board coordinate in the y direction between 0 and (board size - 1) as an integer
+            arguements(4): (optional) the size of the board the move is for, which defaults to Board.BOARD_SIZE
+            or
+            arguements(0): GameCommand.AI_MOVE_COMMAND
+            arguements(1): an integer which is 1 for 'player 1' and 2 for 'player 2'
+            arguements(2): (optional) a move engine with a getBestMove(board, playerNumber) method, which
+                           defaults to GameCommand.DEFAULT_MOVE_ENGINE, or to
+                           GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE for boards the solver cannot solve
 
         RETURNS:
             (valid arguement) 
@@ -68,6 +130,7 @@ class GameCommand:
             (invalid arguement)
                 a PreconditionError is thrown
         '''
+        self._clear_command()
         if len(arguements) == 1 and (arguements[0] == GameCommand.PRINT_COMMAND):
             self._create_print_command(*arguements)
             return
@@ -77,16 +140,69 @@ class GameCommand:
             return
 
         if len(arguements) == 4 and (arguements[0] == GameCommand.MOVE_COMMAND):
+            self._boardSize = Board.BOARD_SIZE
             self._create_move_command(*arguements)
             return
 
+        if len(arguements) == 5 and (arguements[0] == GameCommand.MOVE_COMMAND):
+            self._set_board_size(arguements[4])
+            self._create_move_command(*arguements[:4])
+            return
+
+        if ((len(arguements) == 2) or (len(arguements) == 3)) and (arguements[0] == GameCommand.AI_MOVE_COMMAND):
+            self._create_ai_move_command(*arguements)
+            return
+
         raise PreconditionError
     #END
 
+    @staticmethod
+    def acquireCommand(*arguements):
+        '''
+        DESCRIPTION:
+            Constructs a command with the same arguements as GameCommand(), reusing a released command
+            if there is one, so that programs making and dropping many commands do not allocate each one
+
+        PARAMETERS:
+            arguements: the arguements of GameCommand()
+
+        RETURNS:
+            (valid arguement)
+                A Game Command Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if not GameCommand._freeCommands:
+            return GameCommand(*arguements)
+        gameCommand = GameCommand._freeCommands.pop()
+        try:
+            gameCommand.__init__(*arguements)
+        except PreconditionError:
+            GameCommand._freeCommands.append(gameCommand)
+            raise
+        return gameCommand
+    #END
+
+    def releaseCommand(self):
+        '''
+        DESCRIPTION:
+            Gives the command back for reuse by acquireCommand. The command must not be used after it is released
+
+        RETURNS:
+            None
+        '''
+        self._moveEngine = None
+        if len(GameCommand._freeCommands) < GameCommand.MAXIMUM_NUMBER_OF_FREE_COMMANDS:
+            GameCommand._freeCommands.append(self)
+    #END
+
     def executeCommandOnBoard(self, board):
         '''
         DESCRIPTION:
-            Executes the command instance on a board
+            Executes the command instance on a board. An AI move command asks its move engine for
+            a move, and places nothing if the game is already over. While the instrumentation module
+            is collecting, commands are counted and timed by type under 'commands.<type>', and
+            commands which throw a PreconditionError are counted under 'commands.<type>.rejections'
 
         RETURNS:
             (valid arguement) 
@@ -94,6 +210,26 @@ class GameCommand:
             (invalid arguement)
                 a PreconditionError is thrown
         '''
+        if instrumentation.collecting:
+            self._execute_instrumented_command(board)
+        else:
+            self._execute_command(board)
+    #END
+
+    def _execute_instrumented_command(self, board):
+        metricName = _COMMAND_METRIC_NAMES[self._commandType]
+        instrumentation.incrementCounter(metricName)
+        startTime = instrumentation.clock()
+        try:
+            self._execute_command(board)
+        except PreconditionError:
+            instrumentation.incrementCounter(metricName + ".rejections")
+            raise
+        finally:
+            instrumentation.recordLatency(metricName, instrumentation.clock() - startTime)
+    #END
+
+    def _execute_command(self, board):
         if self._commandType == GameCommand.PRINT_COMMAND:
             boardString = board.getBoardAsString()
             print(boardString)
@@ -103,305 +239,52 @@ class GameCommand:
 
         if self._commandType == GameCommand.NOTHING_COMMAND:
             pass
-    #END
 
-#------------------------------------------------------------------------------------------------------
-# TESTING IMPLEMENTATION
-#------------------------------------------------------------------------------------------------------
-class TestConstructor(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    _player_numbers = [1,2]
-
-    _known_constructor_invalid_arguement_number_for_nothing_command = [(GameCommand.NOTHING_COMMAND, 1),
-                                                                     (GameCommand.NOTHING_COMMAND, 1, 1),
-                                                                     (GameCommand.NOTHING_COMMAND, 1, 1, 1)] 
-
-    _known_constructor_invalid_arguement_number_for_print_command = [(GameCommand.PRINT_COMMAND, 1),
-                                                                     (GameCommand.PRINT_COMMAND, 1, 1),
-                                                                     (GameCommand.PRINT_COMMAND, 1, 1, 1)]
-    _known_constructor_invalid_arguement_number_for_move_command =  [(GameCommand.MOVE_COMMAND),
-                                                                     (GameCommand.MOVE_COMMAND, 1),
-                                                                     (GameCommand.MOVE_COMMAND, 1, 1),
-                                                                     (GameCommand.MOVE_COMMAND, 1, 1, 1, 1) ]
-    _invalid_player_numbers = [0, 3, 4, 5, 6, 7, 8, 9]
-
-    _invalid_board_positions = [-1, 3, 4, 5, 6, 7, 8, 9]
-
-    _invalid_types = [1.2, "hello", (1, 2), []]
-
-    def setUp(self):
-        pass
-
-    def tearDown(self):
-    	pass
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_construction_for_nothing_command(self):
-        printCommand = GameCommand(GameCommand.NOTHING_COMMAND)
-        self.assertEqual(printCommand._commandType, GameCommand.NOTHING_COMMAND)
-
-    def test_construction_for_print_command(self):
-        printCommand = GameCommand(GameCommand.PRINT_COMMAND)
-        self.assertEqual(printCommand._commandType, GameCommand.PRINT_COMMAND)
-
-    def test_construction_for_move_command_for_correct_player_number(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for playerNumber in self._player_numbers:
-                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)
-                    self.assertEqual(moveCommand._playerNumber, playerNumber)  
-
-    def test_construction_for_move_command_for_correct_x_position(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for playerNumber in self._player_numbers:
-                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)
-                    self.assertEqual( moveCommand._xBoardPosition, boardXPosition)  
-
-    def test_construction_for_move_command_for_correct_y_position(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for playerNumber in self._player_numbers:
-                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)
-                    self.assertEqual( moveCommand._yBoardPosition, boardYPosition)  
-
-    #------------------------------------------------------------------------------------------------------
-    # NEGATIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_construction_for_invalid_numbers_of_arguements_for_nothing_command(self):
-        for invalid_constructor_arguements in self._known_constructor_invalid_arguement_number_for_nothing_command:
-            self.assertRaises(PreconditionError, GameCommand, (invalid_constructor_arguements))
-
-    def test_construction_for_invalid_numbers_of_arguements_for_print_command(self):
-        for invalid_constructor_arguements in self._known_constructor_invalid_arguement_number_for_print_command:
-            self.assertRaises(PreconditionError, GameCommand, (invalid_constructor_arguements))
-
-    def test_construction_for_invalid_numbers_of_arguements_for_move_command(self):
-        for invalid_constructor_arguements in self._known_constructor_invalid_arguement_number_for_move_command:
-            self.assertRaises(PreconditionError, GameCommand, (invalid_constructor_arguements))
-
-    def test_construction_for_invalid_player_number_for_move_command(self):
-        for invalid_player_number in self._invalid_player_numbers:
-            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, invalid_player_number, 1, 1))
-
-    def test_construction_for_invalid_x_board_position_for_move_command(self):
-        for invalid_x_board_position in self._invalid_board_positions:
-            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, invalid_x_board_position, 1))
-
-    def test_construction_for_invalid_y_board_position_for_move_command(self):
-        for invalid_y_board_position in self._invalid_board_positions:
-            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, 1, invalid_y_board_position))
-
-    def test_construction_for_invalid_player_type_for_move_command(self):
-        for invalid_player_type in self._invalid_types:
-            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, invalid_player_type, 1, 1))
-
-    def test_construction_for_invalid_x_type_for_move_command(self):
-        for invalid_x_type in self._invalid_types:
-            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, invalid_x_type, 1))
-
-    def test_construction_for_invalid_y_type_for_move_command(self):
-        for invalid_y_type in self._invalid_types:
-            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, 1, invalid_y_type))
-
-    def test_constructor_move_command_valid_positions_with_player_number_too_high(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for playerNumber in range(2,100):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition) )
-
-    def test_constructor_move_command_valid_positions_with_player_number_too_low(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for playerNumber in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition) )
-
-    def test_constructor_move_command_valid_positions_with_player_number_invalid_type(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for playerNumber in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition) ) 
-
-    def test_constructor_move_command_invalid_positions_too_high(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in range(3,100):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, invalidPosition, boardYPosition) )
-                for invalidPosition in range(3,100):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, boardXPosition, invalidPosition) ) 
-
-    def test_constructor_move_command_invalid_positions_too_low(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, invalidPosition, boardYPosition) )
-                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, boardXPosition, invalidPosition) )
-
-    def test_constructor_move_command_invalid_positions_invalid_type(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):       
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, invalidPosition, boardYPosition) )
-                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
-                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, boardXPosition, invalidPosition) )
-
-class TestExecuteCommandOnBoard(unittest.TestCase):
- 
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    _game_command = None
-    _board = None
-
-    _known_empty_board_string = "\n_______\n"+"| | | |\n"+"| | | |\n"+"| | | |\n"+"_______\n"
-    _known_player1_full_board_string = "\n_______\n"+"|O|O|O|\n"+"|O|O|O|\n"+"|O|O|O|\n"+"_______\n"
-    _known_player2_full_board_string = "\n_______\n"+"|X|X|X|\n"+"|X|X|X|\n"+"|X|X|X|\n"+"_______\n"
-    _known_random_board_one_board_string = "\n_______\n"+"|O| |O|\n"+"| | |X|\n"+"|X| | |\n"+"_______\n"
-    _known_random_board_two_board_string = "\n_______\n"+"| | | |\n"+"| |O| |\n"+"|O|X|X|\n"+"_______\n"
-
-    def setUp(self):
-        self._board = Board()
-
-    def tearDown(self):
-        self._board = None
-
-    def __setup_random_board_two(self):
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 2, 0)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 2)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 1)
-
-    def __setup_random_board_one(self):
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
-        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 2)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 2)
-        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 0)
-
-    def _print_interactive_user_message_for_test_board_description_and_string(self, boardDescription, boardString):
-        print(chr(27) + "[2J") # Just clears terminal screen
-        print("This is the expected "+ boardDescription +":")
-        print(boardString)
-        print("This is the given empty board:")        
-
-    def _request_user_confirmation(self):
-        user_answer = raw_input("Enter <y> if they were or same, or <n> if they were different:\n")
-        if(user_answer == 'y'):
-            return
-        if(user_answer == 'n'):
-            raise Exception('Test Failed')
-        raise Exception('Incorrect user testing arguement: Test Discounted and Failed')
-
-    def __setup_full_board_for_player_number(self, playerNumber):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
-
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def test_execute_move_command(self):
-        for boardXPosition in range(Board.BOARD_SIZE):
-            for boardYPosition in range(Board.BOARD_SIZE):
-                for playerNumber in [1, 2]:
-                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)        
-                    moveCommand.executeCommandOnBoard(self._board)
-                    self.assertEqual(self._board.getMarkerAtBoardPosition(boardXPosition, boardYPosition), playerNumber)
-
-    def test_empty_board_print_command(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
-            return
-        self._print_interactive_user_message_for_test_board_description_and_string("empty board", self._known_empty_board_string)
-        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
-        moveCommand.executeCommandOnBoard(self._board)
-        try:
-            self._request_user_confirmation()
-        except Exception:
-            raise Exception
+        if self._commandType == GameCommand.AI_MOVE_COMMAND:
+            moveEngine = self._moveEngine
+            if moveEngine is None:
+                moveEngine = GameCommand._get_default_move_engine(board)
+            bestMove = moveEngine.getBestMove(board, self._playerNumber)
+            if bestMove is not None:
+                self._xBoardPosition, self._yBoardPosition = bestMove
+                board.placePlayerMarkerOnBoardAtPosition(self._playerNumber, self._xBoardPosition, self._yBoardPosition)
+    #END
 
-    def test_full_player1_board_print_command(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
-            return
-        self._print_interactive_user_message_for_test_board_description_and_string("full player 1 board", self._known_player1_full_board_string)
-        self.__setup_full_board_for_player_number(1)
-        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
-        moveCommand.executeCommandOnBoard(self._board)
-        try:
-            self._request_user_confirmation()
-        except Exception:
-            raise Exception
+    @preconditions( (lambda self: True),
+                    (lambda board: hasattr(board, "undoMove") and hasattr(board, "getLastMove")) )
+    def undoCommandOnBoard(self, board):
+        '''
+        DESCRIPTION:
+            Takes back the command after it has been executed on a board. A move command, or an AI move
+            command which placed a marker, takes back its placement, which must be the last placement on
+            the board not yet taken back (so commands are undone in the reverse of the order they were
+            executed). The placement can be made again with board.redoMove. Other commands change nothing
 
-    def test_full_player2_board_print_command(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
-            return
-        self._print_interactive_user_message_for_test_board_description_and_string("full player 2 board", self._known_player2_full_board_string)
-        self.__setup_full_board_for_player_number(2)
-        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
-        moveCommand.executeCommandOnBoard(self._board)
-        try:
-            self._request_user_confirmation()
-        except Exception:
-            raise Exception
+        PARAMETERS:
+            board: the board the command was executed on
 
-    def test_random_board_one_board_print_command(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
+        RETURNS:
+            (valid arguement)
+                None
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if (self._commandType not in (GameCommand.MOVE_COMMAND, GameCommand.AI_MOVE_COMMAND)) or (self._xBoardPosition is None):
             return
-        self._print_interactive_user_message_for_test_board_description_and_string("random board one", self._known_random_board_one_board_string)
-        self.__setup_random_board_one()
-        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
-        moveCommand.executeCommandOnBoard(self._board)
-        try:
-            self._request_user_confirmation()
-        except Exception:
-            raise Exception
-
-    def test_random_board_two_board_print_command(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
-            return 
-        self._print_interactive_user_message_for_test_board_description_and_string("random board two", self._known_random_board_two_board_string)
-        self.__setup_random_board_two()
-        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
-        moveCommand.executeCommandOnBoard(self._board)
-        try:
-            self._request_user_confirmation()
-        except Exception:
-            raise Exception
+        if board.getLastMove() != (self._playerNumber, self._xBoardPosition, self._yBoardPosition):
+            raise PreconditionError()
+        board.undoMove()
+    #END
 
 #------------------------------------------------------------------------------------------------------
 # TESTING DRIVER
 #------------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
-    
-    # Check corret length of command line arguement string
-    if not (len(sys.argv) == 2):
-        print "Test Bench: Not Correct Number Testing Arguements\n"
-        sys.exit(0)
-
-    # Check valid command line arguements entered
-    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
-        print "Test Bench: Not Correct Testing Arguements\n"
-        sys.exit(0)
-
-    # Set the testing flag for the testing level for the module
-    testFlag = ((sys.argv[1]) + '.')[:-1]
-
-    # Add verbose output for compilation testing
-    if testFlag == "-compilation":
-        sys.argv[1] = "-v"
-    else:
-        del sys.argv[1]
 
-    # Run test harness
-    unittest.main()
+    # The tests of this module are in test_game_command.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_game_command.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
 
-#END
\ No newline at end of file
+#END
@@ -0,0 +1,306 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import os
+import struct
+from conditions import preconditions, PreconditionError, getUncheckedFunction
+from board import Board
+from game_command import GameCommand
+from command_stream import formatCommandLine, parseCommandLine, replayCommandStream, MOVE_KEYWORD
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# A game log is a command stream, with one line for every command executed in a game, which starts with
+# a header line and holds a snapshot line of the board every SNAPSHOT_INTERVAL moves (a ply is one move):
+#
+#     #GAMELOG <version> <board size> <win length> <snapshot interval>
+#     #SNAPSHOT <ply> <winner, or 0> <the marker value of every position, row by row>
+#     MOVE 1 0 0
+#     PRINT
+#
+# Both are comment lines, so replayCommandStream replays a whole log. Beside the log, '<log>.index' holds
+# the offset of each snapshot line in the log as fixed width records, so the board at any ply is found by
+# reading one record, then one snapshot, then at most one snapshot interval of moves.
+GAME_LOG_VERSION = 1
+DEFAULT_SNAPSHOT_INTERVAL = 32
+
+_HEADER_KEYWORD = "#GAMELOG"
+_SNAPSHOT_KEYWORD = "#SNAPSHOT"
+_INDEX_FILE_SUFFIX = ".index"
+_INDEX_MAGIC = "TTGI"
+_INDEX_HEADER_FORMAT = struct.Struct("<4sBxxx")
+_INDEX_RECORD_FORMAT = struct.Struct("<Q")
+
+# The moves of a log are checked when it is written, so placements made while reading it skip the check
+_place_marker = getUncheckedFunction(Board.placePlayerMarkerOnBoardAtPosition)
+
+class GameLogError(Exception):
+    '''
+    This exception is given when a file is not a game log, or does not reach the ply asked for
+    '''
+
+def _format_snapshot_line(board, ply):
+    boardSize = board.getBoardSize()
+    markerDigits = "".join(str(board.getMarkerAtBoardPosition(boardXPosition, boardYPosition))
+                           for boardXPosition in range(boardSize) for boardYPosition in range(boardSize))
+    return "{} {} {} {}".format(_SNAPSHOT_KEYWORD, ply, board.winner() or 0, markerDigits)
+
+def _restore_snapshot(snapshotLine, boardSize, winLength):
+    # The board is given the winner of the snapshot, and no move history, as if the game started from it
+    tokens = snapshotLine.split()
+    if (len(tokens) != 4) or (tokens[0] != _SNAPSHOT_KEYWORD) or (len(tokens[3]) != boardSize * boardSize):
+        raise GameLogError("invalid snapshot line: {}".format(snapshotLine.strip()))
+    board = Board(boardSize, winLength)
+    for positionIndex, markerDigit in enumerate(tokens[3]):
+        if markerDigit != "0":
+            boardXPosition, boardYPosition = divmod(positionIndex, boardSize)
+            _place_marker(board, Board.PLAYER_TOKEN_VALUE.index(int(markerDigit)) + 1, boardXPosition, boardYPosition)
+    board.startFromPosition(int(tokens[2]) or None)
+    return board, int(tokens[1])
+
+class GameLogWriter:
+    """ An Append Only Log Of The Commands Executed In A Game """
+
+    @preconditions( (lambda self: True),
+                    (lambda fileName: isinstance(fileName, basestring)),
+                    (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)),
+                    (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)),
+                    (lambda snapshotInterval: ((isinstance(snapshotInterval, int))) and (snapshotInterval >= 1)) )
+    def __init__(self, fileName, boardSize=Board.BOARD_SIZE, winLength=None, snapshotInterval=DEFAULT_SNAPSHOT_INTERVAL):
+        '''
+        DESCRIPTION:
+            Starts a game log for a game on an empty board, replacing any file of the same name, and its
+            index. Each line is written as soon as it is complete, so the log can be read while the game
+            is played
+
+        PARAMETERS:
+            fileName: the path of the log
+            boardSize: (optional) the number of positions along each side of the board
+            winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+            snapshotInterval: (optional) the number of moves between snapshots of the board
+
+        RETURNS:
+            (valid arguement)
+                A Game Log Writer Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if winLength is None:
+            winLength = boardSize
+        if winLength > boardSize:
+            raise PreconditionError()
+        self._snapshotInterval = snapshotInterval
+        self._ply = 0
+        self._logFile = open(fileName, "w", 1)
+        self._indexFile = open(fileName + _INDEX_FILE_SUFFIX, "wb")
+        self._indexFile.write(_INDEX_HEADER_FORMAT.pack(_INDEX_MAGIC, GAME_LOG_VERSION))
+        self._logFile.write("{} {} {} {} {}\n".format(_HEADER_KEYWORD, GAME_LOG_VERSION, boardSize, winLength, snapshotInterval))
+        self._write_snapshot(Board(boardSize, winLength))
+    #END
+
+    def __enter__(self):
+        return self
+    #END
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        self.close()
+    #END
+
+    def _write_snapshot(self, board):
+        # The snapshot line is in the log before its index record, so every indexed snapshot can be read
+        snapshotOffset = self._logFile.tell()
+        self._logFile.write(_format_snapshot_line(board, self._ply) + "\n")
+        self._logFile.flush()
+        self._indexFile.write(_INDEX_RECORD_FORMAT.pack(snapshotOffset))
+        self._indexFile.flush()
+    #END
+
+    def getPly(self):
+        return self._ply
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda gameCommand: hasattr(gameCommand, "executeCommandOnBoard")),
+                    (lambda board: hasattr(board, "getMarkerAtBoardPosition")) )
+    def recordCommand(self, gameCommand, board):
+        '''
+        DESCRIPTION:
+            Appends a command after it has been executed on the board of the game. An AI move command
+            is recorded as the move it made. A snapshot of the board is appended after every
+            snapshot interval of moves
+
+        PARAMETERS:
+            gameCommand: the GameCommand which was executed
+            board: the board it was executed on
+
+        RETURNS:
+            (valid arguement)
+                None
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        commandLine = formatCommandLine(gameCommand)
+        self._logFile.write(commandLine + "\n")
+        if commandLine.startswith(MOVE_KEYWORD):
+            self._ply += 1
+            if self._ply % self._snapshotInterval == 0:
+                self._write_snapshot(board)
+    #END
+
+    def close(self):
+        self._logFile.close()
+        self._indexFile.close()
+    #END
+
+class GameLog:
+    """ A Game Log Which Restores The Board At Any Ply """
+
+    @preconditions( (lambda self: True),
+                    (lambda fileName: isinstance(fileName, basestring)) )
+    def __init__(self, fileName):
+        '''
+        DESCRIPTION:
+            Opens a game log written by GameLogWriter, which may still be being written
+
+        PARAMETERS:
+            fileName: the path of the log
+
+        RETURNS:
+            (valid arguement)
+                A Game Log Object
+            (invalid arguement)
+                a PreconditionError is thrown, an IOError if the log or its index can not be read, or a
+                GameLogError if they are not a game log
+        '''
+        self._fileName = fileName
+        self._logFile = open(fileName, "r")
+        self._indexFile = None
+        try:
+            headerTokens = self._logFile.readline().split()
+            if (len(headerTokens) != 5) or (headerTokens[0] != _HEADER_KEYWORD) or (headerTokens[1] != str(GAME_LOG_VERSION)):
+                raise GameLogError("{} is not a version {} game log".format(fileName, GAME_LOG_VERSION))
+            self._boardSize, self._winLength, self._snapshotInterval = [int(headerToken) for headerToken in headerTokens[2:]]
+            self._indexFile = open(fileName + _INDEX_FILE_SUFFIX, "rb")
+            if self._indexFile.read(_INDEX_HEADER_FORMAT.size) != _INDEX_HEADER_FORMAT.pack(_INDEX_MAGIC, GAME_LOG_VERSION):
+                raise GameLogError("{}{} is not a game log index".format(fileName, _INDEX_FILE_SUFFIX))
+        except:
+            self.close()
+            raise
+    #END
+
+    def __enter__(self):
+        return self
+    #END
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        self.close()
+    #END
+
+    def getBoardSize(self):
+        return self._boardSize
+    #END
+
+    def getWinLength(self):
+        return self._winLength
+    #END
+
+    def getSnapshotInterval(self):
+        return self._snapshotInterval
+    #END
+
+    def getNumberOfSnapshots(self):
+        # Read from the size of the index each time, as the log may still be being written
+        indexBytes = os.fstat(self._indexFile.fileno()).st_size - _INDEX_HEADER_FORMAT.size
+        return indexBytes // _INDEX_RECORD_FORMAT.size
+    #END
+
+    def _read_snapshot(self, snapshotNumber):
+        # Returns the board and ply of a snapshot, with the log positioned after its line
+        self._indexFile.seek(_INDEX_HEADER_FORMAT.size + snapshotNumber * _INDEX_RECORD_FORMAT.size)
+        snapshotOffset, = _INDEX_RECORD_FORMAT.unpack(self._indexFile.read(_INDEX_RECORD_FORMAT.size))
+        self._logFile.seek(snapshotOffset)
+        return _restore_snapshot(self._logFile.readline(), self._boardSize, self._winLength)
+    #END
+
+    def _read_move_records(self):
+        # The move records of the log from its current position, up to the last complete line
+        for line in iter(self._logFile.readline, ""):
+            if not line.endswith("\n"):
+                return
+            commandRecord = parseCommandLine(line)
+            if (commandRecord is not None) and (commandRecord[2] == GameCommand.MOVE_COMMAND):
+                yield commandRecord
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda ply: ((isinstance(ply, int))) and (ply >= 0)) )
+    def getBoardAtPly(self, ply):
+        '''
+        DESCRIPTION:
+            Restores the board after a number of moves, from the last snapshot at or before that ply and
+            the moves after it, so at most one snapshot interval of moves is replayed
+
+        PARAMETERS:
+            ply: the number of moves made, where 0 is the empty board
+
+        RETURNS:
+            (valid arguement)
+                A Board Object, with the moves since the snapshot in its move history
+            (invalid arguement)
+                a PreconditionError is thrown, or a GameLogError if the log has fewer moves
+        '''
+        snapshotNumber = min(ply // self._snapshotInterval, self.getNumberOfSnapshots() - 1)
+        board, snapshotPly = self._read_snapshot(snapshotNumber)
+        if snapshotPly < ply:
+            for lineNumber, boardIndex, commandType, playerNumber, boardXPosition, boardYPosition in self._read_move_records():
+                _place_marker(board, playerNumber, boardXPosition, boardYPosition)
+                snapshotPly += 1
+                if snapshotPly == ply:
+                    break
+        if snapshotPly != ply:
+            raise GameLogError("{} has {} moves, not {}".format(self._fileName, snapshotPly, ply))
+        return board
+    #END
+
+    def getNumberOfPlies(self):
+        '''
+        DESCRIPTION:
+            Counts the moves in the log, from its last snapshot
+
+        RETURNS:
+            Integer: the number of moves
+        '''
+        board, ply = self._read_snapshot(self.getNumberOfSnapshots() - 1)
+        return ply + sum(1 for moveRecord in self._read_move_records())
+    #END
+
+    def close(self):
+        self._logFile.close()
+        if self._indexFile is not None:
+            self._indexFile.close()
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# GAME LOG AND TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string (the board of a log at a ply is given the log and the ply)
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) == 4) and (sys.argv[1] == '-show'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Print the board of a log at a ply instead of running the tests
+    if sys.argv[1] == '-show':
+        with GameLog(sys.argv[2]) as gameLog:
+            print(gameLog.getBoardAtPly(int(sys.argv[3])).getBoardAsString())
+        sys.exit(0)
+
+    # The tests of this module are in test_game_log.py, so that only running them loads them
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_game_log.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
@@ -0,0 +1,540 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import asyncore
+import asynchat
+import socket
+import threading
+import multiprocessing
+import timeit
+from conditions import preconditions, PreconditionError
+from board import Board
+from game_command import GameCommand
+from command_stream import parseCommandLine, CommandStreamError
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# The server speaks a line protocol, with one reply line for every command line:
+#
+#     NEW [board size [win length]]   -> OK                start a new game on a board of this connection's own
+#     JOIN <game name>                -> OK <player>       share a named game with one other connection
+#     MOVE <player> <x> <y>           -> OK | WIN <player> | DRAW | ERROR <reason>
+#     PRINT                           -> BOARD <board>     the board in Board.COMPACT_STYLE
+#     NOTHING                         -> OK
+#     QUIT                            -> BYE
+#
+# A connection starts with a classic board of its own, on which it plays both players. In a joined game
+# each connection plays its own player, the players take turns, and a connection is sent
+# 'MOVED <player> <x> <y>' when the other connection moves.
+#
+# Every connection is served by one event loop, so a board is only made up to MAXIMUM_BOARD_SIZE, and a
+# connection sending a line longer than MAXIMUM_LINE_LENGTH is sent 'ERROR line too long' and closed
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7373
+LISTEN_BACKLOG = 4096
+LINE_TERMINATOR = "\n"
+MAXIMUM_BOARD_SIZE = 25
+MAXIMUM_LINE_LENGTH = 1024
+
+class _GameSession:
+    """ A Board Played By One Connection, Or Shared By Two """
+
+    def __init__(self, board, gameName=None):
+        self._board = board
+        self._gameName = gameName
+        self._connections = []
+        self._nextPlayerNumber = 1
+    #END
+
+class _GameConnection(asynchat.async_chat):
+    """ One Client Connection To The Game Server """
+
+    def __init__(self, connectionSocket, gameServer, socketMap):
+        asynchat.async_chat.__init__(self, connectionSocket, socketMap)
+        self.set_terminator(LINE_TERMINATOR)
+        self._incomingData = []
+        self._incomingLength = 0
+        self._gameServer = gameServer
+        self._session = None
+        self._playerNumber = None
+        self._quitting = False
+        self._start_session(_GameSession(Board()), None)
+    #END
+
+    def collect_incoming_data(self, data):
+        if self._quitting:
+            return
+        self._incomingLength += len(data)
+        if self._incomingLength > MAXIMUM_LINE_LENGTH:
+            self._incomingData = []
+            self._quitting = True
+            self.push("ERROR line too long" + LINE_TERMINATOR)
+            self.close_when_done()
+            return
+        self._incomingData.append(data)
+    #END
+
+    def found_terminator(self):
+        if self._quitting:
+            return
+        line = "".join(self._incomingData)
+        self._incomingData = []
+        self._incomingLength = 0
+        self.push(self._execute_line(line) + LINE_TERMINATOR)
+        if self._quitting:
+            self.close_when_done()
+    #END
+
+    def handle_close(self):
+        self._leave_session()
+        self.close()
+    #END
+
+    def _start_session(self, session, playerNumber):
+        self._leave_session()
+        self._session = session
+        self._playerNumber = playerNumber
+        session._connections.append(self)
+    #END
+
+    def _leave_session(self):
+        if self._session is not None:
+            self._session._connections.remove(self)
+            if (self._session._gameName is not None) and (not self._session._connections):
+                self._gameServer._namedSessions.pop(self._session._gameName, None)
+            self._session = None
+    #END
+
+    def _execute_line(self, line):
+        tokens = line.split()
+        if not tokens:
+            return "ERROR empty command"
+        if tokens[0] == "NEW":
+            return self._execute_new(tokens[1:])
+        if tokens[0] == "JOIN":
+            return self._execute_join(tokens[1:])
+        if tokens[0] == "QUIT":
+            self._quitting = True
+            return "BYE"
+        try:
+            commandRecord = parseCommandLine(line)
+        except CommandStreamError:
+            return "ERROR unknown command"
+        lineNumber, boardIndex, commandType, playerNumber, boardXPosition, boardYPosition = commandRecord
+        if boardIndex != 0:
+            return "ERROR unknown command"
+        board = self._session._board
+        if commandType == GameCommand.PRINT_COMMAND:
+            return "BOARD " + board.getBoardAsString(Board.COMPACT_STYLE)
+        if commandType == GameCommand.NOTHING_COMMAND:
+            return "OK"
+        return self._execute_move(playerNumber, boardXPosition, boardYPosition)
+    #END
+
+    def _execute_new(self, arguements):
+        try:
+            boardArguements = [int(arguement) for arguement in arguements]
+            if boardArguements and (boardArguements[0] > MAXIMUM_BOARD_SIZE):
+                return "ERROR invalid board"
+            board = Board(*boardArguements)
+        except (ValueError, TypeError, PreconditionError):
+            return "ERROR invalid board"
+        self._start_session(_GameSession(board), None)
+        return "OK"
+    #END
+
+    def _execute_join(self, arguements):
+        if len(arguements) != 1:
+            return "ERROR JOIN takes a game name"
+        gameName = arguements[0]
+        session = self._gameServer._namedSessions.get(gameName)
+        if session is None:
+            session = _GameSession(Board(), gameName)
+            self._gameServer._namedSessions[gameName] = session
+        elif self in session._connections:
+            return "OK {}".format(self._playerNumber)
+        elif len(session._connections) == 2:
+            return "ERROR game is full"
+        takenPlayerNumbers = [connection._playerNumber for connection in session._connections]
+        playerNumber = 2 if 1 in takenPlayerNumbers else 1
+        self._start_session(session, playerNumber)
+        return "OK {}".format(playerNumber)
+    #END
+
+    def _execute_move(self, playerNumber, boardXPosition, boardYPosition):
+        session = self._session
+        board = session._board
+        if board.isGameOver():
+            return "ERROR game over"
+        if self._playerNumber is not None:
+            if playerNumber != self._playerNumber:
+                return "ERROR not your player"
+            if playerNumber != session._nextPlayerNumber:
+                return "ERROR not your turn"
+        try:
+            moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition, board.getBoardSize())
+            if board.getMarkerAtBoardPosition(boardXPosition, boardYPosition) != Board.EMPTY_VALUE:
+                return "ERROR position taken"
+        except PreconditionError:
+            return "ERROR invalid move"
+        moveCommand.executeCommandOnBoard(board)
+        session._nextPlayerNumber = 3 - playerNumber
+        for connection in session._connections:
+            if connection is not self:
+                connection.push("MOVED {} {} {}".format(playerNumber, boardXPosition, boardYPosition) + LINE_TERMINATOR)
+        if board.winner() is not None:
+            return "WIN {}".format(board.winner())
+        if board.isDraw():
+            return "DRAW"
+        return "OK"
+    #END
+
+class GameServer(asyncore.dispatcher):
+    """ A Single Process Server Hosting Many Concurrent Games """
+
+    @preconditions( (lambda self: True),
+                    (lambda host: isinstance(host, str)),
+                    (lambda port: ((isinstance(port, int))) and (port >= 0) and (port < 65536)) )
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        '''
+        DESCRIPTION:
+            Constructs a server listening for connections. Every connection is served by one event
+            loop, so no game waits on another game's client
+
+        PARAMETERS:
+            host: (optional) the address to listen on, which defaults to the local host
+            port: (optional) the port to listen on, or 0 for any free port
+
+        RETURNS:
+            (valid arguement)
+                A Game Server Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        self._socketMap = {}
+        self._namedSessions = {}
+        self._serving = True
+        asyncore.dispatcher.__init__(self, None, self._socketMap)
+        self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.set_reuse_addr()
+        self.bind((host, port))
+        self.listen(LISTEN_BACKLOG)
+    #END
+
+    def handle_accept(self):
+        acceptedConnection = self.accept()
+        if acceptedConnection is not None:
+            _GameConnection(acceptedConnection[0], self, self._socketMap)
+    #END
+
+    def getPort(self):
+        '''
+        DESCRIPTION:
+            Retrieves the port the server listens on, which is useful when it was given port 0
+
+        RETURNS:
+            Integer: the port number
+        '''
+        return self.socket.getsockname()[1]
+    #END
+
+    def getNumberOfConnections(self):
+        '''
+        DESCRIPTION:
+            Retrieves the number of open client connections
+
+        RETURNS:
+            Integer: the number of connections
+        '''
+        return len(self._socketMap) - 1
+    #END
+
+    def serveForever(self, pollTimeout=1.0):
+        '''
+        DESCRIPTION:
+            Serves every connection, using poll so that there is no limit on the number of connections,
+            until stopServing is called (checked at least once every poll timeout), and then closes the
+            server and every connection
+
+        PARAMETERS:
+            pollTimeout: (optional) the longest time in seconds that one poll waits
+        '''
+        while self._serving and self._socketMap:
+            asyncore.loop(pollTimeout, True, self._socketMap, 1)
+        asyncore.close_all(self._socketMap)
+    #END
+
+    def stopServing(self):
+        self._serving = False
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# LOAD TEST
+#------------------------------------------------------------------------------------------------------
+# A drawn game, which each load test client plays over and over
+_LOAD_TEST_GAME_MOVES = [(1, 0, 0), (2, 1, 1), (1, 0, 2), (2, 0, 1), (1, 2, 1), (2, 1, 2), (1, 1, 0), (2, 2, 0), (1, 2, 2)]
+
+class _LoadTestClient(asynchat.async_chat):
+    """ A Client Which Plays Games As Fast As The Server Replies """
+
+    def __init__(self, address, numberOfMoves, moveLatencies, socketMap):
+        asynchat.async_chat.__init__(self, None, socketMap)
+        self.set_terminator(LINE_TERMINATOR)
+        self._incomingData = []
+        self._numberOfMovesLeft = numberOfMoves
+        self._moveLatencies = moveLatencies
+        self._moveIndex = 0
+        self._sendTime = None
+        self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.connect(address)
+    #END
+
+    def handle_connect(self):
+        self._send_next_move()
+    #END
+
+    def collect_incoming_data(self, data):
+        self._incomingData.append(data)
+    #END
+
+    def found_terminator(self):
+        reply = "".join(self._incomingData)
+        self._incomingData = []
+        if reply.startswith("ERROR"):
+            raise RuntimeError("load test move failed: " + reply)
+        if self._sendTime is not None:
+            self._moveLatencies.append(timeit.default_timer() - self._sendTime)
+            self._sendTime = None
+            self._numberOfMovesLeft -= 1
+            self._moveIndex += 1
+        self._send_next_move()
+    #END
+
+    def _send_next_move(self):
+        if self._numberOfMovesLeft == 0:
+            self.close()
+            return
+        if self._moveIndex == len(_LOAD_TEST_GAME_MOVES):
+            self._moveIndex = 0
+            self.push("NEW" + LINE_TERMINATOR)
+            return
+        self._sendTime = timeit.default_timer()
+        self.push("MOVE {} {} {}".format(*_LOAD_TEST_GAME_MOVES[self._moveIndex]) + LINE_TERMINATOR)
+    #END
+
+def _serve_in_process(host, portQueue):
+    gameServer = GameServer(host, 0)
+    portQueue.put(gameServer.getPort())
+    gameServer.serveForever()
+
+@preconditions( (lambda numberOfClients: ((isinstance(numberOfClients, int))) and (numberOfClients >= 1)),
+                (lambda movesPerClient: ((isinstance(movesPerClient, int))) and (movesPerClient >= 1)) )
+def runLoadTest(numberOfClients=1000, movesPerClient=90):
+    '''
+    DESCRIPTION:
+        Starts a server in another process, connects many clients at once which each play games
+        as fast as the server replies, and measures the moves served and the latency of each move
+
+    PARAMETERS:
+        numberOfClients: (optional) the number of concurrent connections
+        movesPerClient: (optional) the number of moves each client makes
+
+    RETURNS:
+        (valid arguement)
+            A dictionary with the number of "clients" and "moves", the "seconds" taken, the
+            "movesPerSecond", and the "medianLatency", "99thPercentileLatency" and "maximumLatency"
+            of a move in milliseconds
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    portQueue = multiprocessing.Queue()
+    serverProcess = multiprocessing.Process(target=_serve_in_process, args=(DEFAULT_HOST, portQueue))
+    serverProcess.daemon = True
+    serverProcess.start()
+    try:
+        address = (DEFAULT_HOST, portQueue.get(timeout=10))
+        socketMap = {}
+        moveLatencies = []
+        startTime = timeit.default_timer()
+        for clientNumber in range(numberOfClients):
+            _LoadTestClient(address, movesPerClient, moveLatencies, socketMap)
+        asyncore.loop(1.0, True, socketMap)
+        seconds = timeit.default_timer() - startTime
+    finally:
+        serverProcess.terminate()
+        serverProcess.join()
+    moveLatencies.sort()
+    return { "clients": numberOfClients,
+             "moves": len(moveLatencies),
+             "seconds": seconds,
+             "movesPerSecond": len(moveLatencies) / seconds,
+             "medianLatency": moveLatencies[len(moveLatencies) // 2] * 1000.0,
+             "99thPercentileLatency": moveLatencies[min(len(moveLatencies) - 1, (len(moveLatencies) * 99) // 100)] * 1000.0,
+             "maximumLatency": moveLatencies[-1] * 1000.0 }
+#END
+
+def printLoadTest(numberOfClients=1000, movesPerClient=90):
+    loadTestResults = runLoadTest(numberOfClients, movesPerClient)
+    print("{} clients made {} moves in {:.2f} s ({:.0f} moves/s)".format(loadTestResults["clients"], loadTestResults["moves"],
+                                                                           loadTestResults["seconds"], loadTestResults["movesPerSecond"]))
+    print("    move latency: median {:.2f} ms, 99th percentile {:.2f} ms, maximum {:.2f} ms".format(
+          loadTestResults["medianLatency"], loadTestResults["99thPercentileLatency"], loadTestResults["maximumLatency"]))
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestGameServer(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        self._gameServer = GameServer(DEFAULT_HOST, 0)
+        self._serverThread = threading.Thread(target=self._gameServer.serveForever, args=(0.05,))
+        self._serverThread.daemon = True
+        self._serverThread.start()
+        self._clients = []
+
+    def tearDown(self):
+        for clientSocket, clientFile in self._clients:
+            clientFile.close()
+            clientSocket.close()
+        self._gameServer.stopServing()
+        self._serverThread.join()
+
+    def _connect(self):
+        clientSocket = socket.create_connection((DEFAULT_HOST, self._gameServer.getPort()), 5)
+        self._clients += [(clientSocket, clientSocket.makefile("r"))]
+        return len(self._clients) - 1
+
+    def _send(self, clientNumber, line):
+        clientSocket, clientFile = self._clients[clientNumber]
+        clientSocket.sendall(line + LINE_TERMINATOR)
+        return clientFile.readline().rstrip(LINE_TERMINATOR)
+
+    def _read(self, clientNumber):
+        return self._clients[clientNumber][1].readline().rstrip(LINE_TERMINATOR)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_game_on_own_board(self):
+        client = self._connect()
+        for move in ["MOVE 1 0 0", "MOVE 2 1 1", "MOVE 1 0 1", "MOVE 2 2 2"]:
+            self.assertEqual(self._send(client, move), "OK")
+        self.assertEqual(self._send(client, "MOVE 1 0 2"), "WIN 1")
+        self.assertEqual(self._send(client, "PRINT"), "BOARD OOO/.X./..X")
+        self.assertEqual(self._send(client, "NOTHING"), "OK")
+
+    def test_connections_have_their_own_boards(self):
+        firstClient = self._connect()
+        secondClient = self._connect()
+        self.assertEqual(self._send(firstClient, "MOVE 1 1 1"), "OK")
+        self.assertEqual(self._send(secondClient, "PRINT"), "BOARD .../.../...")
+        self.assertEqual(self._gameServer.getNumberOfConnections(), 2)
+
+    def test_new_larger_board(self):
+        client = self._connect()
+        self.assertEqual(self._send(client, "NEW 5 4"), "OK")
+        self.assertEqual(self._send(client, "MOVE 2 4 4"), "OK")
+        self.assertEqual(self._send(client, "PRINT"), "BOARD ...../...../...../...../....X")
+
+    def test_joined_game_takes_turns(self):
+        firstClient = self._connect()
+        secondClient = self._connect()
+        self.assertEqual(self._send(firstClient, "JOIN lobby"), "OK 1")
+        self.assertEqual(self._send(secondClient, "JOIN lobby"), "OK 2")
+        self.assertEqual(self._send(secondClient, "MOVE 2 0 0"), "ERROR not your turn")
+        self.assertEqual(self._send(firstClient, "MOVE 1 1 1"), "OK")
+        self.assertEqual(self._read(secondClient), "MOVED 1 1 1")
+        self.assertEqual(self._send(secondClient, "MOVE 1 0 0"), "ERROR not your player")
+        self.assertEqual(self._send(secondClient, "MOVE 2 0 0"), "OK")
+        self.assertEqual(self._read(firstClient), "MOVED 2 0 0")
+        self.assertEqual(self._send(firstClient, "PRINT"), "BOARD X../.O./...")
+
+    def test_small_load_test(self):
+        loadTestResults = runLoadTest(20, 20)
+        self.assertEqual(loadTestResults["moves"], 400)
+        self.assertTrue(loadTestResults["movesPerSecond"] > 0)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_commands(self):
+        client = self._connect()
+        self.assertEqual(self._send(client, "JUMP"), "ERROR unknown command")
+        self.assertEqual(self._send(client, "MOVE 1 3 0"), "ERROR invalid move")
+        self.assertEqual(self._send(client, "MOVE 3 0 0"), "ERROR invalid move")
+        self.assertEqual(self._send(client, "NEW 3 4"), "ERROR invalid board")
+        self.assertEqual(self._send(client, "NEW {}".format(MAXIMUM_BOARD_SIZE + 1)), "ERROR invalid board")
+        self.assertEqual(self._send(client, "MOVE 1 0 0"), "OK")
+        self.assertEqual(self._send(client, "MOVE 2 0 0"), "ERROR position taken")
+
+    def test_full_joined_game(self):
+        clients = [self._connect() for _ in range(3)]
+        self.assertEqual(self._send(clients[0], "JOIN lobby"), "OK 1")
+        self.assertEqual(self._send(clients[1], "JOIN lobby"), "OK 2")
+        self.assertEqual(self._send(clients[2], "JOIN lobby"), "ERROR game is full")
+
+    def test_line_too_long(self):
+        client = self._connect()
+        otherClient = self._connect()
+        self.assertEqual(self._send(client, "NOTHING" + " " * MAXIMUM_LINE_LENGTH), "ERROR line too long")
+        self.assertEqual(self._read(client), "")
+        self.assertEqual(self._send(otherClient, "NOTHING"), "OK")
+
+    def test_quit(self):
+        client = self._connect()
+        self.assertEqual(self._send(client, "QUIT"), "BYE")
+        self.assertEqual(self._read(client), "")
+
+    def test_invalid_port(self):
+        self.assertRaises(PreconditionError, GameServer, DEFAULT_HOST, 70000)
+
+#------------------------------------------------------------------------------------------------------
+# SERVER AND TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string (the server may be given a port, and the load
+    # test a number of clients and moves per client)
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) == 3) and (sys.argv[1] == '-serve')) or ((len(sys.argv) <= 4) and (sys.argv[1] == '-loadtest'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation')) and (not (sys.argv[1] == '-serve'))
+        and (not (sys.argv[1] == '-loadtest')) ):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Run the server or the load test instead of the tests
+    if testFlag == "-serve":
+        GameServer(DEFAULT_HOST, *[int(serverArguement) for serverArguement in sys.argv[2:]]).serveForever()
+        sys.exit(0)
+    if testFlag == "-loadtest":
+        printLoadTest(*[int(loadTestArguement) for loadTestArguement in sys.argv[2:]])
+        sys.exit(0)
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
@@ -0,0 +1,272 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import os
+import time
+import timeit
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# This module is imported by conditions.py, so it imports no other module of the project, and its
+# functions are not decorated with preconditions.
+#
+# Instrumented code checks 'instrumentation.collecting' before doing any work, so collection costs one
+# attribute read when it is off. It may be turned on for a whole process with the environment variables
+#     TICTAC_INSTRUMENTATION=on                   collect from the start
+#     TICTAC_INSTRUMENTATION_DUMP=<file name>     and append a snapshot to the file periodically
+#
+# json, threading and atexit are imported when a snapshot is first written or a dump is started, so that
+# a game which never collects does not load them
+INSTRUMENTATION_ENVIRONMENT_VARIABLE = "TICTAC_INSTRUMENTATION"
+INSTRUMENTATION_DUMP_ENVIRONMENT_VARIABLE = "TICTAC_INSTRUMENTATION_DUMP"
+DEFAULT_DUMP_INTERVAL = 10.0
+SNAPSHOT_PERCENTILES = (50, 90, 99)
+
+# Latencies are counted in buckets by the bit length of their number of nanoseconds, so bucket b
+# holds latencies from 2 ** (b - 1) up to 2 ** b nanoseconds
+_NUMBER_OF_LATENCY_BUCKETS = 48
+
+# Latencies are timed with the most precise clock of the platform, as the benchmarks are
+collecting = False
+clock = timeit.default_timer
+
+_counters = {}
+_latencyHistograms = {}
+_dumpThread = None
+_dumpStopEvent = None
+_isDumpStoppedAtExit = False
+
+class _LatencyHistogram:
+    """ The count, total, extremes and log2 buckets of the latencies of one operation """
+
+    def __init__(self):
+        self.count = 0
+        self.totalSeconds = 0.0
+        self.minimumSeconds = None
+        self.maximumSeconds = 0.0
+        self.buckets = [0] * _NUMBER_OF_LATENCY_BUCKETS
+    #END
+
+    def record(self, seconds):
+        # A clock which is set back while an operation runs gives no negative latency
+        seconds = max(seconds, 0.0)
+        self.count += 1
+        self.totalSeconds += seconds
+        if (self.minimumSeconds is None) or (seconds < self.minimumSeconds):
+            self.minimumSeconds = seconds
+        if seconds > self.maximumSeconds:
+            self.maximumSeconds = seconds
+        self.buckets[min(int(seconds * 1e9).bit_length(), _NUMBER_OF_LATENCY_BUCKETS - 1)] += 1
+    #END
+
+    def getSnapshot(self):
+        # A percentile is given as the upper bound of the bucket it falls in
+        buckets = list(self.buckets)
+        numberOfLatencies = sum(buckets)
+        percentiles = {}
+        for percentile in SNAPSHOT_PERCENTILES:
+            latenciesBelow = 0
+            for bucketIndex in range(_NUMBER_OF_LATENCY_BUCKETS):
+                latenciesBelow += buckets[bucketIndex]
+                if latenciesBelow * 100 >= percentile * numberOfLatencies:
+                    percentiles[str(percentile)] = min((2 ** bucketIndex) / 1e9, self.maximumSeconds)
+                    break
+        return { "count": self.count,
+                 "totalSeconds": self.totalSeconds,
+                 "meanSeconds": self.totalSeconds / max(self.count, 1),
+                 "minimumSeconds": self.minimumSeconds or 0.0,
+                 "maximumSeconds": self.maximumSeconds,
+                 "percentileSeconds": percentiles,
+                 "buckets": dict((str(bucketIndex), bucketCount) for bucketIndex, bucketCount in enumerate(buckets) if bucketCount) }
+    #END
+
+def enableInstrumentation():
+    '''
+    DESCRIPTION:
+        Starts collecting counters and latencies in every instrumented function
+
+    RETURNS:
+        None
+    '''
+    global collecting
+    collecting = True
+#END
+
+def disableInstrumentation():
+    '''
+    DESCRIPTION:
+        Stops collecting. What has been collected is kept until resetInstrumentation is called
+
+    RETURNS:
+        None
+    '''
+    global collecting
+    collecting = False
+#END
+
+def isInstrumentationEnabled():
+    '''
+    DESCRIPTION:
+        Tells whether counters and latencies are being collected
+
+    RETURNS:
+        True if collection is on, or False
+    '''
+    return collecting
+#END
+
+def resetInstrumentation():
+    '''
+    DESCRIPTION:
+        Removes every counter and latency collected so far
+
+    RETURNS:
+        None
+    '''
+    _counters.clear()
+    _latencyHistograms.clear()
+#END
+
+def incrementCounter(counterName, amount=1):
+    '''
+    DESCRIPTION:
+        Adds to a named counter, which starts at 0. Callers check 'collecting' first
+
+    PARAMETERS:
+        counterName: the name of the counter, with parts separated by '.'
+        amount: (optional) the amount added, which defaults to 1
+
+    RETURNS:
+        None
+    '''
+    _counters[counterName] = _counters.get(counterName, 0) + amount
+#END
+
+def recordLatency(histogramName, seconds):
+    '''
+    DESCRIPTION:
+        Adds a latency to a named histogram. Callers check 'collecting' first
+
+    PARAMETERS:
+        histogramName: the name of the histogram, with parts separated by '.'
+        seconds: the latency in seconds
+
+    RETURNS:
+        None
+    '''
+    latencyHistogram = _latencyHistograms.get(histogramName)
+    if latencyHistogram is None:
+        latencyHistogram = _LatencyHistogram()
+        _latencyHistograms[histogramName] = latencyHistogram
+    latencyHistogram.record(seconds)
+#END
+
+def getCounter(counterName):
+    return _counters.get(counterName, 0)
+#END
+
+def getSnapshot():
+    '''
+    DESCRIPTION:
+        Copies everything collected so far
+
+    RETURNS:
+        A dictionary of the "time" of the snapshot, whether collection is "enabled", the "counters" by
+        name, and the "latencies" by name, each a dictionary of the "count", "totalSeconds", "meanSeconds",
+        "minimumSeconds", "maximumSeconds", the "percentileSeconds" for each of SNAPSHOT_PERCENTILES,
+        and the non empty log2 nanosecond "buckets"
+    '''
+    return { "time": time.time(),
+             "enabled": collecting,
+             "counters": dict(_counters),
+             "latencies": dict((histogramName, latencyHistogram.getSnapshot())
+                               for histogramName, latencyHistogram in _latencyHistograms.items()) }
+#END
+
+def writeSnapshot(fileName):
+    '''
+    DESCRIPTION:
+        Appends a snapshot to a file as one line of JSON
+
+    PARAMETERS:
+        fileName: the path of the file
+
+    RETURNS:
+        None
+    '''
+    import json
+    snapshotLine = json.dumps(getSnapshot(), sort_keys=True)
+    with open(fileName, "a") as snapshotFile:
+        snapshotFile.write(snapshotLine + "\n")
+#END
+
+def _dump_periodically(fileName, intervalSeconds, stopEvent):
+    while not stopEvent.wait(intervalSeconds):
+        writeSnapshot(fileName)
+    writeSnapshot(fileName)
+
+def startPeriodicDump(fileName, intervalSeconds=DEFAULT_DUMP_INTERVAL):
+    '''
+    DESCRIPTION:
+        Starts a background thread which appends a snapshot to a file every interval, and once more
+        when it is stopped, which is at the latest when the process exits. Any dump already running
+        is stopped first
+
+    PARAMETERS:
+        fileName: the path of the file
+        intervalSeconds: (optional) the number of seconds between snapshots
+
+    RETURNS:
+        None
+    '''
+    global _dumpThread, _dumpStopEvent, _isDumpStoppedAtExit
+    import threading
+    stopPeriodicDump()
+    if not _isDumpStoppedAtExit:
+        import atexit
+        atexit.register(stopPeriodicDump)
+        _isDumpStoppedAtExit = True
+    _dumpStopEvent = threading.Event()
+    _dumpThread = threading.Thread(target=_dump_periodically, args=(fileName, intervalSeconds, _dumpStopEvent))
+    _dumpThread.daemon = True
+    _dumpThread.start()
+#END
+
+def stopPeriodicDump():
+    '''
+    DESCRIPTION:
+        Stops the periodic dump, after it has written its last snapshot
+
+    RETURNS:
+        None
+    '''
+    global _dumpThread, _dumpStopEvent
+    if _dumpThread is not None:
+        _dumpStopEvent.set()
+        _dumpThread.join()
+        _dumpThread = None
+        _dumpStopEvent = None
+#END
+
+def _start_from_environment():
+    if os.environ.get(INSTRUMENTATION_ENVIRONMENT_VARIABLE, "off").lower() in ("on", "1", "true"):
+        enableInstrumentation()
+        dumpFileName = os.environ.get(INSTRUMENTATION_DUMP_ENVIRONMENT_VARIABLE)
+        if dumpFileName:
+            startPeriodicDump(dumpFileName)
+
+_start_from_environment()
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # The tests of this module are in test_instrumentation.py, so that only running them loads them
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_instrumentation.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
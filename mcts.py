@@ -0,0 +1,338 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import math
+import multiprocessing
+import random
+import time
+from conditions import preconditions, PreconditionError, getUncheckedFunction
+from board import Board
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# Every move in a search is checked once when its position is made, so placements skip the check
+_place_marker = getUncheckedFunction(Board.placePlayerMarkerOnBoardAtPosition)
+
+# The search tree is shared with the other Monte Carlo engines (such as the ultimate board engine). Its
+# functions are called for every step of a playout, so their arguements are not checked
+class SearchNode:
+    """ A position in a search tree, with the results of the playouts made through it """
+
+    def __init__(self, move, playerJustMoved, untriedMoves):
+        '''
+        DESCRIPTION:
+            Makes a search tree node without children or playouts. The wins are counted for the player
+            who made the move into this position, a draw counting half
+
+        PARAMETERS:
+            move: the move into this position, in the form used by its board, or None for the root
+            playerJustMoved: the player number (1 or 2) of the player who made the move
+            untriedMoves: a list of the legal moves of the position, which is emptied as children are added
+
+        RETURNS:
+            None
+        '''
+        self.move = move
+        self.playerJustMoved = playerJustMoved
+        self.untriedMoves = untriedMoves
+        self.children = []
+        self.visits = 0
+        self.wins = 0.0
+    #END
+
+def selectChild(node, explorationConstant):
+    '''
+    DESCRIPTION:
+        Chooses the child of a node with the highest upper confidence bound (UCT)
+
+    PARAMETERS:
+        node: a SearchNode which has been visited, and whose children have each been visited
+        explorationConstant: the weight of the exploration term of the bound as a number
+
+    RETURNS:
+        The SearchNode of the child, or None if the node has no children
+    '''
+    logVisits = math.log(node.visits)
+    bestChild = None
+    bestBound = -1.0
+    for child in node.children:
+        childBound = (child.wins / child.visits) + explorationConstant * math.sqrt(logVisits / child.visits)
+        if childBound > bestBound:
+            bestChild, bestBound = child, childBound
+    return bestChild
+
+def takeRandomMove(moves, randomNumber):
+    '''
+    DESCRIPTION:
+        Removes a random move from a list of moves, in constant time, by moving the last move into its place
+
+    PARAMETERS:
+        moves: a list of at least one move
+        randomNumber: a number in the range [0, 1) which chooses the move
+
+    RETURNS:
+        The move removed
+    '''
+    moveIndex = int(randomNumber * len(moves))
+    move = moves[moveIndex]
+    moves[moveIndex] = moves[-1]
+    moves.pop()
+    return move
+
+def _search_tree(searchArguements):
+    # Grows one search tree from the root position, and gives the visits and wins of each root move with
+    # the number of iterations and nodes (positions played through) of the search
+    rootPlacements, boardSize, winLength, playerNumber, numberOfIterations, timeLimit, explorationConstant, seed = searchArguements
+    deadline = None if timeLimit is None else time.time() + timeLimit
+    randomNumber = random.Random(seed).random
+
+    board = Board.acquireBoard(boardSize, winLength)
+    for placement in rootPlacements:
+        _place_marker(board, *placement)
+    rootNode = SearchNode(None, 3 - playerNumber, list(board.getLegalMoves()))
+    board.releaseBoard()
+
+    numberOfIterations = numberOfIterations or sys.maxint
+    numberOfNodes = 0
+    iteration = 0
+    while (iteration < numberOfIterations) and ((deadline is None) or (time.time() < deadline)):
+        iteration += 1
+        board = Board.acquireBoard(boardSize, winLength)
+        for placement in rootPlacements:
+            _place_marker(board, *placement)
+
+        # Select down the tree through fully expanded positions
+        node = rootNode
+        searchPath = [rootNode]
+        while (not node.untriedMoves) and node.children:
+            node = selectChild(node, explorationConstant)
+            _place_marker(board, node.playerJustMoved, *node.move)
+            searchPath += [node]
+
+        # Expand one untried move
+        if node.untriedMoves:
+            move = takeRandomMove(node.untriedMoves, randomNumber())
+            moverNumber = 3 - node.playerJustMoved
+            _place_marker(board, moverNumber, *move)
+            childNode = SearchNode(move, moverNumber, [] if board.isGameOver() else list(board.getLegalMoves()))
+            node.children += [childNode]
+            node = childNode
+            searchPath += [node]
+        numberOfNodes += len(searchPath) - 1
+
+        # Play randomly to the end of the game, drawing from the board's own list of empty positions
+        emptyPositions = board.getLegalMoves()
+        moverNumber = 3 - node.playerJustMoved
+        while not board.isGameOver():
+            boardXPosition, boardYPosition = emptyPositions[int(randomNumber() * len(emptyPositions))]
+            _place_marker(board, moverNumber, boardXPosition, boardYPosition)
+            moverNumber = 3 - moverNumber
+            numberOfNodes += 1
+        winningPlayerNumber = board.winner()
+        board.releaseBoard()
+
+        for node in searchPath:
+            node.visits += 1
+            if winningPlayerNumber is None:
+                node.wins += 0.5
+            elif winningPlayerNumber == node.playerJustMoved:
+                node.wins += 1.0
+
+    rootMoveResults = dict((child.move, (child.visits, child.wins)) for child in rootNode.children)
+    return rootMoveResults, iteration, numberOfNodes
+
+class MonteCarloEngine:
+    """ A Monte Carlo Tree Search Move Engine For Any Board Size And Win Length """
+
+    DEFAULT_TIME_LIMIT = 0.5
+    DEFAULT_EXPLORATION_CONSTANT = math.sqrt(2)
+
+    @preconditions( (lambda self: True),
+                    (lambda timeLimit: ((isinstance(timeLimit, (int, float)))) and (timeLimit > 0)),
+                    (lambda numberOfIterations: ((isinstance(numberOfIterations, int))) and (numberOfIterations >= 1)),
+                    (lambda numberOfProcesses: ((isinstance(numberOfProcesses, int))) and (numberOfProcesses >= 1)),
+                    (lambda explorationConstant: ((isinstance(explorationConstant, (int, float)))) and (explorationConstant >= 0)),
+                    (lambda seed: isinstance(seed, int)) )
+    def __init__(self, timeLimit=None, numberOfIterations=None, numberOfProcesses=1, explorationConstant=DEFAULT_EXPLORATION_CONSTANT, seed=None):
+        '''
+        DESCRIPTION:
+            Constructs a Monte Carlo tree search engine, which grows a search tree by upper confidence
+            bounds (UCT) and plays each new position out with random moves. With more than one process
+            the search is root parallel: each process grows its own tree from the position, and the
+            visits of the root moves are added together to pick the most visited move
+
+        PARAMETERS:
+            timeLimit: (optional) the number of seconds a move may take. Defaults to
+                       MonteCarloEngine.DEFAULT_TIME_LIMIT when no number of iterations is given
+            numberOfIterations: (optional) the number of playouts of each move, shared between the processes.
+                                A search stops at whichever of the time limit and iterations comes first
+            numberOfProcesses: (optional) the number of processes searching, which defaults to 1 (the search
+                               is made in this process). The processes are kept until close is called
+            explorationConstant: (optional) how strongly the search tries moves with few visits
+            seed: (optional) an integer seed for the playouts, which makes a search of a number of
+                  iterations repeatable
+
+        RETURNS:
+            (valid arguement)
+                A MonteCarloEngine Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if (timeLimit is None) and (numberOfIterations is None):
+            timeLimit = MonteCarloEngine.DEFAULT_TIME_LIMIT
+        self._timeLimit = timeLimit
+        self._numberOfIterations = numberOfIterations
+        self._numberOfProcesses = numberOfProcesses
+        self._explorationConstant = explorationConstant
+        self._seed = seed
+        self._processPool = None
+        self._lastSearchStatistics = None
+    #END
+
+    def _create_search_arguements(self, rootPlacements, boardSize, winLength, playerNumber):
+        searchArguements = []
+        for processIndex in range(self._numberOfProcesses):
+            numberOfIterations = None
+            if self._numberOfIterations is not None:
+                numberOfIterations = self._numberOfIterations // self._numberOfProcesses
+                if processIndex < self._numberOfIterations % self._numberOfProcesses:
+                    numberOfIterations += 1
+                if numberOfIterations == 0:
+                    break
+            seed = None if self._seed is None else self._seed + processIndex
+            searchArguements += [(rootPlacements, boardSize, winLength, playerNumber, numberOfIterations,
+                                  self._timeLimit, self._explorationConstant, seed)]
+        return searchArguements
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: hasattr(board, "getMarkerAtBoardPosition") and hasattr(board, "getBoardSize") and hasattr(board, "getWinLength")),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Searches for the best move in a board position for the player whose turn it is
+
+        PARAMETERS:
+            board: a Board of any board size and win length
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                An (x, y) board position tuple, or None if the game is already over
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        startTime = time.time()
+        boardSize = board.getBoardSize()
+        winLength = board.getWinLength()
+        rootPlacements = []
+        for boardXPosition in range(boardSize):
+            for boardYPosition in range(boardSize):
+                markerValue = board.getMarkerAtBoardPosition(boardXPosition, boardYPosition)
+                if markerValue != Board.EMPTY_VALUE:
+                    rootPlacements += [(Board.PLAYER_TOKEN_VALUE.index(markerValue) + 1, boardXPosition, boardYPosition)]
+        self._lastSearchStatistics = { "iterations": 0, "nodes": 0, "processes": 0, "score": 0.0,
+                                       "seconds": 0.0, "iterationsPerSecond": 0.0, "nodesPerSecond": 0.0 }
+        rootBoard = Board(boardSize, winLength)
+        for placement in rootPlacements:
+            _place_marker(rootBoard, *placement)
+        if rootBoard.isGameOver():
+            return None
+
+        searchArguements = self._create_search_arguements(rootPlacements, boardSize, winLength, playerNumber)
+        if len(searchArguements) == 1:
+            searchResults = [_search_tree(searchArguements[0])]
+        else:
+            if self._processPool is None:
+                self._processPool = multiprocessing.Pool(self._numberOfProcesses)
+            searchResults = self._processPool.map(_search_tree, searchArguements)
+
+        moveResults = {}
+        for rootMoveResults, _, _ in searchResults:
+            for move, (moveVisits, moveWins) in rootMoveResults.items():
+                totalVisits, totalWins = moveResults.get(move, (0, 0.0))
+                moveResults[move] = (totalVisits + moveVisits, totalWins + moveWins)
+        bestMove = max(sorted(moveResults), key=(lambda move: moveResults[move][0]))
+        bestMoveVisits, bestMoveWins = moveResults[bestMove]
+
+        searchSeconds = max(time.time() - startTime, 1e-9)
+        numberOfIterations = sum(iterations for _, iterations, _ in searchResults)
+        numberOfNodes = sum(nodes for _, _, nodes in searchResults)
+        self._lastSearchStatistics = { "iterations": numberOfIterations,
+                                       "nodes": numberOfNodes,
+                                       "processes": len(searchResults),
+                                       "score": bestMoveWins / bestMoveVisits,
+                                       "seconds": searchSeconds,
+                                       "iterationsPerSecond": numberOfIterations / searchSeconds,
+                                       "nodesPerSecond": numberOfNodes / searchSeconds }
+        return bestMove
+    #END
+
+    def getLastSearchStatistics(self):
+        '''
+        DESCRIPTION:
+            Retrieves statistics of the last search made by getBestMove
+
+        RETURNS:
+            A dictionary with the number of "iterations" (playouts) and "nodes" (positions played through)
+            over every process, the number of "processes" which searched, the "score" of the chosen move
+            (the fraction of its playouts won, a draw counting half), the "seconds" taken, and the
+            "iterationsPerSecond" and "nodesPerSecond", or None if no search has been made
+        '''
+        return self._lastSearchStatistics
+    #END
+
+    def close(self):
+        '''
+        DESCRIPTION:
+            Stops the search processes. The engine starts them again if it searches after being closed
+
+        RETURNS:
+            None
+        '''
+        if self._processPool is not None:
+            self._processPool.terminate()
+            self._processPool.join()
+            self._processPool = None
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) <= 6) and (sys.argv[1] == '-search'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Search the empty board of a board size and win length, and report the search rate
+    if sys.argv[1] == '-search':
+        boardSize, winLength, numberOfProcesses = 7, 5, 1
+        timeLimit = MonteCarloEngine.DEFAULT_TIME_LIMIT
+        if len(sys.argv) >= 4:
+            boardSize, winLength = int(sys.argv[2]), int(sys.argv[3])
+        if len(sys.argv) >= 5:
+            timeLimit = float(sys.argv[4])
+        if len(sys.argv) == 6:
+            numberOfProcesses = int(sys.argv[5])
+        engine = MonteCarloEngine(timeLimit, None, numberOfProcesses)
+        bestMove = engine.getBestMove(Board(boardSize, winLength), 1)
+        engine.close()
+        searchStatistics = engine.getLastSearchStatistics()
+        print "{}x{} board, win length {}: move {} after {} iterations over {} processes in {:.2f} s".format(
+            boardSize, boardSize, winLength, bestMove, searchStatistics["iterations"], searchStatistics["processes"], searchStatistics["seconds"])
+        print "    {:.0f} nodes/s, {:.0f} iterations/s, score {:.3f}".format(
+            searchStatistics["nodesPerSecond"], searchStatistics["iterationsPerSecond"], searchStatistics["score"])
+        sys.exit(0)
+
+    # The tests of this module are in test_mcts.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_mcts.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
@@ -0,0 +1,218 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import mmap
+import os
+from conditions import preconditions, PreconditionError
+from board import Board
+from solver import Solver
+from position_store import encodePosition, decodePosition
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# The move table holds one byte for every position code and player to move, at (2 * code + player - 1).
+# A zero byte is a position which can not be reached from an empty board with that player to move, and
+# any other byte is 1 + (10 * (game value + 1)) + (move index), where the move index of (x, y) is
+# (x * Board.BOARD_SIZE + y), or 9 if the game is over
+MOVE_TABLE_MAGIC = "TTMT"
+DEFAULT_MOVE_TABLE_FILE_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), "move_table.bin")
+
+_NUMBER_OF_POSITIONS = Board.BOARD_SIZE * Board.BOARD_SIZE
+_NUMBER_OF_ENTRIES = 2 * (3 ** _NUMBER_OF_POSITIONS)
+_NO_MOVE_INDEX = _NUMBER_OF_POSITIONS
+_UNREACHABLE_ENTRY = 0
+
+class MoveTableError(Exception):
+    '''
+    This exception is given when a file is not a move table
+    '''
+
+def _encode_entry(gameValue, bestMove):
+    moveIndex = _NO_MOVE_INDEX
+    if bestMove is not None:
+        moveIndex = bestMove[0] * Board.BOARD_SIZE + bestMove[1]
+    return 1 + 10 * (gameValue + 1) + moveIndex
+
+# The (game value, best move) of each entry byte, so a lookup does no arithmetic
+_DECODED_ENTRIES = [None] * 31
+for _gameValue in (Solver.LOSS_VALUE, Solver.DRAW_VALUE, Solver.WIN_VALUE):
+    _DECODED_ENTRIES[_encode_entry(_gameValue, None)] = (_gameValue, None)
+    for _moveIndex in range(_NUMBER_OF_POSITIONS):
+        _bestMove = divmod(_moveIndex, Board.BOARD_SIZE)
+        _DECODED_ENTRIES[_encode_entry(_gameValue, _bestMove)] = (_gameValue, _bestMove)
+
+def buildMoveTable():
+    '''
+    DESCRIPTION:
+        Enumerates every position which can be reached from an empty board, with either player moving first,
+        and solves each one with the Solver
+
+    RETURNS:
+        A bytearray of the move table entries, without the file header
+    '''
+    moveTable = bytearray(_NUMBER_OF_ENTRIES)
+    solver = Solver()
+    positionWeights = [3 ** positionIndex for positionIndex in range(_NUMBER_OF_POSITIONS)]
+    positionsToSolve = [(0, 1), (0, 2)]
+    while positionsToSolve:
+        positionCode, playerNumber = positionsToSolve.pop()
+        entryIndex = 2 * positionCode + playerNumber - 1
+        if moveTable[entryIndex] != _UNREACHABLE_ENTRY:
+            continue
+        board = decodePosition(positionCode)
+        gameValue, bestMove = solver.solvePosition(board, playerNumber)
+        moveTable[entryIndex] = _encode_entry(gameValue, bestMove)
+        if bestMove is None:
+            continue
+        markerValue = Board.PLAYER_TOKEN_VALUE[playerNumber - 1]
+        for positionIndex in range(_NUMBER_OF_POSITIONS):
+            if (positionCode // positionWeights[positionIndex]) % 3 == Board.EMPTY_VALUE:
+                positionsToSolve.append((positionCode + markerValue * positionWeights[positionIndex], 3 - playerNumber))
+    return moveTable
+#END
+
+@preconditions( (lambda fileName: isinstance(fileName, basestring)) )
+def writeMoveTable(fileName=DEFAULT_MOVE_TABLE_FILE_NAME):
+    '''
+    DESCRIPTION:
+        Builds the move table and writes it to a file, which MoveTableEngine reads
+
+    PARAMETERS:
+        fileName: (optional) the path of the file
+
+    RETURNS:
+        (valid arguement)
+            Integer: the number of reachable positions in the table
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    # The table is written beside the file and renamed into place, so that processes building it at the
+    # same time never read a partly written table
+    moveTable = buildMoveTable()
+    temporaryFileName = "{}.{}.tmp".format(fileName, os.getpid())
+    with open(temporaryFileName, "wb") as moveTableFile:
+        moveTableFile.write(MOVE_TABLE_MAGIC)
+        moveTableFile.write(moveTable)
+    os.rename(temporaryFileName, fileName)
+    return len(moveTable) - moveTable.count(chr(_UNREACHABLE_ENTRY))
+#END
+
+class MoveTableEngine:
+    """ A Perfect Play Tic Tac Toe Engine Which Reads Every Move From A Precomputed Table """
+
+    @preconditions( (lambda self: True),
+                    (lambda fileName: isinstance(fileName, basestring)) )
+    def __init__(self, fileName=DEFAULT_MOVE_TABLE_FILE_NAME):
+        '''
+        DESCRIPTION:
+            Creates an engine for a move table file. Nothing is read until the first move is asked for, when
+            the file is memory mapped, or, if there is no file, the table is built and the file is written
+
+        PARAMETERS:
+            fileName: (optional) the path of the move table file
+
+        RETURNS:
+            (valid arguement)
+                A Move Table Engine Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        self._fileName = fileName
+        self._moveTable = None
+    #END
+
+    def _load_move_table(self):
+        if not os.path.exists(self._fileName):
+            try:
+                writeMoveTable(self._fileName)
+            except (IOError, OSError):
+                self._moveTable = buffer(MOVE_TABLE_MAGIC + str(buildMoveTable()))
+                return
+        with open(self._fileName, "rb") as moveTableFile:
+            if os.fstat(moveTableFile.fileno()).st_size != len(MOVE_TABLE_MAGIC) + _NUMBER_OF_ENTRIES:
+                raise MoveTableError("{} is not a move table".format(self._fileName))
+            moveTable = mmap.mmap(moveTableFile.fileno(), 0, access=mmap.ACCESS_READ)
+        if moveTable[:len(MOVE_TABLE_MAGIC)] != MOVE_TABLE_MAGIC:
+            moveTable.close()
+            raise MoveTableError("{} is not a move table".format(self._fileName))
+        self._moveTable = moveTable
+    #END
+
+    def isLoaded(self):
+        return self._moveTable is not None
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: Solver.canSolveBoard(board)),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def solvePosition(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Finds the game theoretic value of a board position and the best move in it, for the player
+            whose turn it is, with one table read. Positions which can not be reached from an empty board
+            are given to the Solver
+
+        PARAMETERS:
+            board: a Board (or a board with the same interface) of size Board.BOARD_SIZE
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                A tuple (gameValue, bestMove), the same as Solver.solvePosition
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if self._moveTable is None:
+            self._load_move_table()
+        entryIndex = len(MOVE_TABLE_MAGIC) + 2 * encodePosition(board) + playerNumber - 1
+        decodedEntry = _DECODED_ENTRIES[ord(self._moveTable[entryIndex])]
+        if decodedEntry is None:
+            return Solver().solvePosition(board, playerNumber)
+        return decodedEntry
+    #END
+
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Finds the best move in a board position for the player whose turn it is
+
+        PARAMETERS:
+            board: a Board (or a board with the same interface) of size Board.BOARD_SIZE
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                An (x, y) board position tuple, or None if the game is already over
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        gameValue, bestMove = self.solvePosition(board, playerNumber)
+        return bestMove
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) == 3) and (sys.argv[1] == '-build'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Write the move table, to the given file or the default one
+    if sys.argv[1] == '-build':
+        moveTableFileName = DEFAULT_MOVE_TABLE_FILE_NAME
+        if len(sys.argv) == 3:
+            moveTableFileName = sys.argv[2]
+        print "Wrote {} positions to {}".format(writeMoveTable(moveTableFileName), moveTableFileName)
+        sys.exit(0)
+
+    # The tests of this module are in test_move_table.py, so that only running them loads them
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_move_table.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
@@ -1,156 +1,146 @@
 #------------------------------------------------------------------------------------------------------
 # IMPORTS
 #------------------------------------------------------------------------------------------------------
-import unittest
+import collections
 from conditions import preconditions, PreconditionError 
 from game_command import GameCommand
+from board import Board
 import sys
 
-#------------------------------------------------------------------------------------------------------
-# TEST FLAG
-#------------------------------------------------------------------------------------------------------
-testFlag = None
-
 #------------------------------------------------------------------------------------------------------
 # IMPLEMENTATION
 #------------------------------------------------------------------------------------------------------
+# A script is read this many characters at a time, and parsed this many moves at a time
+SCRIPT_BUFFER_SIZE = 1 << 16
+SCRIPT_BATCH_SIZE = 1024
+
 class Panel:
     """ User Panel For Tic Tac To """
 
-    def __init__(self):
-        pass
+    @preconditions( (lambda self: True),
+                    (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)),
+                    (lambda scriptSource: isinstance(scriptSource, basestring) or hasattr(scriptSource, "read")) )
+    def __init__(self, boardSize=Board.BOARD_SIZE, scriptSource=None):
+        '''
+        DESCRIPTION:
+            Constructs a panel, which asks the user for each move, or reads the moves from a script
+
+        PARAMETERS:
+            boardSize: (optional) the number of positions along each side of the board
+            scriptSource: (optional) the path of a script, or an open file (such as sys.stdin). A script
+                          holds the answers to the prompts, three whitespace separated integers (player
+                          number, x board position, y board position) for each move, and no prompts are
+                          shown while it is read
+
+        RETURNS:
+            (valid arguement)
+                A Panel Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        self._boardSize = boardSize
+        self._scriptFile = None
+        self._closeScriptAtEnd = False
+        if isinstance(scriptSource, basestring):
+            self._scriptFile = open(scriptSource)
+            self._closeScriptAtEnd = True
+        elif scriptSource is not None:
+            self._scriptFile = scriptSource
+        self._scriptTokens = []
+        self._partialScriptToken = ""
+        self._scriptHasEnded = False
+        self._scriptedCommands = collections.deque()
+    #END
+
+    def isScripted(self):
+        return self._scriptFile is not None
+    #END
+
+    def _read_script_batch(self):
+        # Reads chunks of the script until there is a batch of whole moves, or the script ends.
+        # A chunk may end part way through a token, which is kept for the next chunk
+        while (len(self._scriptTokens) < 3 * SCRIPT_BATCH_SIZE) and (not self._scriptHasEnded):
+            scriptChunk = self._scriptFile.read(SCRIPT_BUFFER_SIZE)
+            if not scriptChunk:
+                self._scriptHasEnded = True
+                if self._closeScriptAtEnd:
+                    self._scriptFile.close()
+            scriptTokens = (self._partialScriptToken + scriptChunk).split()
+            self._partialScriptToken = ""
+            if scriptChunk and scriptTokens and (not scriptChunk[-1].isspace()):
+                self._partialScriptToken = scriptTokens.pop()
+            self._scriptTokens.extend(scriptTokens)
+
+        # Each move keeps its own outcome: a command, None for an invalid move, or the ValueError of an
+        # answer which is not an integer (or of a script which ends part way through a move), which is
+        # only raised when the moves before it have been played
+        numberOfMoveTokens = min(len(self._scriptTokens), 3 * SCRIPT_BATCH_SIZE)
+        numberOfMoveTokens -= numberOfMoveTokens % 3
+        moveTokens = self._scriptTokens[:numberOfMoveTokens]
+        del self._scriptTokens[:numberOfMoveTokens]
+        for tokenIndex in range(0, numberOfMoveTokens, 3):
+            try:
+                self._scriptedCommands.append(GameCommand(GameCommand.MOVE_COMMAND, int(moveTokens[tokenIndex]), int(moveTokens[tokenIndex + 1]),
+                                                          int(moveTokens[tokenIndex + 2]), self._boardSize))
+            except PreconditionError:
+                self._scriptedCommands.append(None)
+            except ValueError as valueError:
+                self._scriptedCommands.append(valueError)
+        if self._scriptHasEnded and (0 < len(self._scriptTokens) < 3):
+            self._scriptedCommands.append(ValueError("the script ends part way through a move: {}".format(" ".join(self._scriptTokens))))
+            del self._scriptTokens[:]
+    #END
+
+    def _get_scripted_command(self):
+        if not self._scriptedCommands:
+            self._read_script_batch()
+            if not self._scriptedCommands:
+                raise EOFError()
+        userCommand = self._scriptedCommands.popleft()
+        if isinstance(userCommand, ValueError):
+            raise userCommand
+        if userCommand is None:
+            print("Invalid Move!")
+            return GameCommand(GameCommand.NOTHING_COMMAND)
+        return userCommand
     #END
 
     def getCommandFromUser(self):
         '''
         DESCRIPTION:
-            Gets A Tic Tac Toe Move Command From User
+            Gets A Tic Tac Toe Move Command From User, or the next move of the script
 
         RETURNS:
             (valid arguement) 
-                A Game Command Object
+                A Game Command Object, which is a nothing command if the move was invalid
             (invalid arguement)
-                a PreconditionError is thrown
+                a PreconditionError is thrown, a ValueError if an answer is not an integer, or an
+                EOFError when the input (or the script) ends
         '''
+        if self._scriptFile is not None:
+            return self._get_scripted_command()
+
         print("Please Follow Instructions.")
         playerNumber = int(raw_input("First, enter player number: "))
-        xBoardPosition = int(raw_input("Next, enter x-axis board position (0 -> 2): "))
-        yBoardPosition = int(raw_input("Next, enter y-axis board position (0 -> 2): "))
+        xBoardPosition = int(raw_input("Next, enter x-axis board position (0 -> {}): ".format(self._boardSize - 1)))
+        yBoardPosition = int(raw_input("Next, enter y-axis board position (0 -> {}): ".format(self._boardSize - 1)))
         try:
-            userCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, xBoardPosition, yBoardPosition)
+            userCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, xBoardPosition, yBoardPosition, self._boardSize)
         except PreconditionError:
             print("Invalid Move!")
             return GameCommand(GameCommand.NOTHING_COMMAND)
         return userCommand
     #END
 
-#------------------------------------------------------------------------------------------------------
-# TESTING IMPLEMENTATION
-#------------------------------------------------------------------------------------------------------
-class TestGetCommandFromUser(unittest.TestCase):
-
-    #------------------------------------------------------------------------------------------------------
-    # TESTING SUPPORT CODE
-    #------------------------------------------------------------------------------------------------------
-    def setUp(self):
-        self._panel = Panel()
-
-    def tearDown(self):
-        self._panel = None
- 
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def _print_interactive_user_message(self, playerNumber, xBoardPosition, yBoardPosition):
-        print(chr(27) + "[2J") # Just clears terminal screen
-        print("Follow the prompts to create a command with:")
-        print("Player Number = {}".format(playerNumber))
-        print("x Board Position  = {}".format(xBoardPosition))
-        print("y Board Position  = {}".format(yBoardPosition))       
-
-    #------------------------------------------------------------------------------------------------------
-    # POSITIVE TESTING
-    #------------------------------------------------------------------------------------------------------
-    def _test_get_user_command_for_player_number(self, playerNumber, xBoardPosition, yBoardPosition):
-        self._print_interactive_user_message(playerNumber, xBoardPosition, yBoardPosition)
-        userCommand = self._panel.getCommandFromUser()
-        self.assertEqual(userCommand._playerNumber, playerNumber)
-
-    def _test_get_user_command_for_x_position(self, playerNumber, xBoardPosition, yBoardPosition):
-        self._print_interactive_user_message(playerNumber, xBoardPosition, yBoardPosition)
-        userCommand = self._panel.getCommandFromUser()
-        self.assertEqual(userCommand._xBoardPosition, xBoardPosition)
-
-    def _test_get_user_command_for_y_position(self, playerNumber, xBoardPosition, yBoardPosition):
-        self._print_interactive_user_message(playerNumber, xBoardPosition, yBoardPosition)
-        userCommand = self._panel.getCommandFromUser()
-        self.assertEqual(userCommand._yBoardPosition, yBoardPosition)
-
-    def test_get_user_command_player_number(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'ttest_get_user_command' is not run on this testing mode.>")
-            return
-
-        for boardXPosition in [0,1,2]:
-            for boardYPosition in [0,1,2]:
-                for playerNumber in [1,2]:
-                    try:
-                        self._test_get_user_command_for_player_number(playerNumber, boardXPosition, boardYPosition)
-                    except Exception:
-                        raise Exception
-
-    def test_get_user_command_x_position(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'ttest_get_user_command' is not run on this testing mode.>")
-            return
-
-        for boardXPosition in [0,1,2]:
-            for boardYPosition in [0,1,2]:
-                for playerNumber in [1,2]:
-                    try:
-                        self._test_get_user_command_for_x_position(playerNumber, boardXPosition, boardYPosition)
-                    except Exception:
-                        raise Exception
-
-    def test_get_user_command_y_position(self):
-        if not (testFlag == "-interactive"):
-            print("\n<Test function 'test_get_user_command' is not run on this testing mode.>")
-            return
-
-        for boardXPosition in [0,1,2]:
-            for boardYPosition in [0,1,2]:
-                for playerNumber in [1,2]:
-                    try:
-                        self._test_get_user_command_for_y_position(playerNumber, boardXPosition, boardYPosition)
-                    except Exception:
-                        raise Exception
-
 #------------------------------------------------------------------------------------------------------
 # TESTING DRIVER
 #------------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
-    
-    # Check corret length of command line arguement string
-    if not (len(sys.argv) == 2):
-        print "Test Bench: Not Correct Number Testing Arguements\n"
-        sys.exit(0)
-
-    # Check valid command line arguements entered
-    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
-        print "Test Bench: Not Correct Testing Arguements\n"
-        sys.exit(0)
-
-    # Set the testing flag for the testing level for the module
-    testFlag = ((sys.argv[1]) + '.')[:-1]
-
-    # Add verbose output for compilation testing
-    if testFlag == "-compilation":
-        sys.argv[1] = "-v"
-    else:
-        del sys.argv[1]
 
-    # Run test harness
-    unittest.main()
+    # The tests of this module are in test_panel.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_panel.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
 
 #END
-        
\ No newline at end of file
@@ -0,0 +1,174 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import random
+from conditions import preconditions, PreconditionError
+from board import Board
+from solver import Solver
+from alpha_beta import AlphaBetaEngine
+from mcts import MonteCarloEngine
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+def _get_line_completing_positions(board, playerNumber):
+    # The empty positions which complete a winning line for the player
+    markerValue = Board.PLAYER_TOKEN_VALUE[playerNumber - 1]
+    completingPositions = set()
+    for winningLine in board.getWinningLines():
+        emptyPositions = []
+        for boardXPosition, boardYPosition in winningLine:
+            lineMarkerValue = board.getMarkerAtBoardPosition(boardXPosition, boardYPosition)
+            if lineMarkerValue == Board.EMPTY_VALUE:
+                emptyPositions += [(boardXPosition, boardYPosition)]
+            elif lineMarkerValue != markerValue:
+                break
+        else:
+            if len(emptyPositions) == 1:
+                completingPositions.add(emptyPositions[0])
+    return sorted(completingPositions)
+
+class RandomPolicy:
+    """ A Move Engine Which Marks Any Empty Position """
+
+    @preconditions( (lambda self: True),
+                    (lambda seed: isinstance(seed, int)) )
+    def __init__(self, seed=None):
+        '''
+        DESCRIPTION:
+            Constructs a policy which picks uniformly from the empty positions
+
+        PARAMETERS:
+            seed: (optional) an integer seed for the policy's random number generator
+
+        RETURNS:
+            (valid arguement)
+                A Random Policy Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        self._random = random.Random(seed)
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: True),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Picks an empty position for a player
+
+        PARAMETERS:
+            board: the board to move on
+            playerNumber: an integer which is 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                A tuple (x, y) of the position, or None if the game is over
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if board.isGameOver():
+            return None
+        return board.getRandomLegalMove(self._random)
+    #END
+
+class GreedyPolicy:
+    """ A Move Engine Which Wins Or Blocks When It Can """
+
+    @preconditions( (lambda self: True),
+                    (lambda seed: isinstance(seed, int)) )
+    def __init__(self, seed=None):
+        '''
+        DESCRIPTION:
+            Constructs a policy which completes its own line if it can, otherwise blocks a line the
+            opponent could complete, and otherwise picks uniformly from the empty positions
+
+        PARAMETERS:
+            seed: (optional) an integer seed for the policy's random number generator
+
+        RETURNS:
+            (valid arguement)
+                A Greedy Policy Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        self._random = random.Random(seed)
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: True),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Picks a winning position, or else a blocking position, or else any empty position for a player
+
+        PARAMETERS:
+            board: the board to move on
+            playerNumber: an integer which is 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                A tuple (x, y) of the position, or None if the game is over
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if board.isGameOver():
+            return None
+        for linePlayerNumber in (playerNumber, 3 - playerNumber):
+            completingPositions = _get_line_completing_positions(board, linePlayerNumber)
+            if completingPositions:
+                return self._random.choice(completingPositions)
+        return board.getRandomLegalMove(self._random)
+    #END
+
+RANDOM_POLICY = "random"
+GREEDY_POLICY = "greedy"
+SOLVER_POLICY = "solver"
+ALPHA_BETA_POLICY = "alphabeta"
+MONTE_CARLO_POLICY = "mcts"
+POLICY_NAMES = (RANDOM_POLICY, GREEDY_POLICY, SOLVER_POLICY, ALPHA_BETA_POLICY, MONTE_CARLO_POLICY)
+
+@preconditions( (lambda policyName: policyName in POLICY_NAMES),
+                (lambda seed: isinstance(seed, int)) )
+def createPolicy(policyName, seed=None):
+    '''
+    DESCRIPTION:
+        Creates a move engine from its name, so that policies can be chosen on the command line and sent
+        to other processes by name
+
+    PARAMETERS:
+        policyName: one of POLICY_NAMES
+        seed: (optional) an integer seed for policies which make random choices
+
+    RETURNS:
+        (valid arguement)
+            An object with a getBestMove(board, playerNumber) method
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    if policyName == RANDOM_POLICY:
+        return RandomPolicy(seed)
+    if policyName == GREEDY_POLICY:
+        return GreedyPolicy(seed)
+    if policyName == SOLVER_POLICY:
+        return Solver()
+    if policyName == MONTE_CARLO_POLICY:
+        return MonteCarloEngine(None, None, 1, MonteCarloEngine.DEFAULT_EXPLORATION_CONSTANT, seed)
+    return AlphaBetaEngine()
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # The tests of this module are in test_policies.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_policies.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
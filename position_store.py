@@ -0,0 +1,409 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import struct
+import mmap
+import os
+from conditions import preconditions, PreconditionError
+from board import Board
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# A position code is the board read as a base 3 number, with the marker value at (x, y) as the digit
+# for 3 ** (x * boardSize + y), so the empty board is 0 and a 3x3 board fits in 15 bits
+LARGEST_BOARD_SIZE = 6
+
+RESULT_UNKNOWN = 0
+RESULT_PLAYER_ONE_WIN = 1
+RESULT_PLAYER_TWO_WIN = 2
+RESULT_DRAW = 3
+GAME_RESULTS = (RESULT_UNKNOWN, RESULT_PLAYER_ONE_WIN, RESULT_PLAYER_TWO_WIN, RESULT_DRAW)
+
+# A position store file is a header followed by fixed width records of (position code, game result),
+# each packed little endian with the smallest integer type holding every position code of the board size
+POSITION_STORE_MAGIC = "TTPS"
+POSITION_STORE_VERSION = 1
+_HEADER_FORMAT = struct.Struct("<4sBBBBQ")
+_CODE_FORMATS = {2: "H", 4: "I", 8: "Q"}
+_WRITE_BUFFER_RECORDS = 65536
+
+# The code of each possible row, and the marker values of each row code, for each board size
+_rowCodeTables = {}
+
+class PositionStoreError(Exception):
+    '''
+    This exception is given when a file is not a position store, or does not match the board it is used for
+    '''
+
+def _get_row_code_tables(boardSize):
+    rowCodeTables = _rowCodeTables.get(boardSize)
+    if rowCodeTables is None:
+        rowCodes = {}
+        rowMarkerValues = []
+        for rowCode in range(3 ** boardSize):
+            markerValues = []
+            remainingCode = rowCode
+            for boardYPosition in range(boardSize):
+                markerValues.append(remainingCode % 3)
+                remainingCode //= 3
+            rowCodes[tuple(markerValues)] = rowCode
+            rowMarkerValues.append(markerValues)
+        rowCodeTables = (rowCodes, rowMarkerValues, 3 ** boardSize)
+        _rowCodeTables[boardSize] = rowCodeTables
+    return rowCodeTables
+
+def _get_code_width(boardSize):
+    # The number of bytes needed for every position code of the board size
+    for codeWidth in sorted(_CODE_FORMATS):
+        if 3 ** (boardSize * boardSize) <= 2 ** (8 * codeWidth):
+            return codeWidth
+    raise PreconditionError()
+
+def _get_record_format(boardSize):
+    return struct.Struct("<" + _CODE_FORMATS[_get_code_width(boardSize)] + "B")
+
+@preconditions( (lambda board: (board.getBoardSize() <= LARGEST_BOARD_SIZE)) )
+def encodePosition(board):
+    '''
+    DESCRIPTION:
+        Converts the markers of a board to its position code
+
+    PARAMETERS:
+        board: a Board (or a board with the same interface) of at most LARGEST_BOARD_SIZE positions a side
+
+    RETURNS:
+        (valid arguement)
+            Integer: the position code
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    boardSize = board.getBoardSize()
+    rowCodes, rowMarkerValues, rowCodeBase = _get_row_code_tables(boardSize)
+    if hasattr(board, "_boardGrid"):
+        boardRows = board._boardGrid
+    else:
+        boardRows = [[board.getMarkerAtBoardPosition(boardXPosition, boardYPosition) for boardYPosition in range(boardSize)]
+                     for boardXPosition in range(boardSize)]
+    positionCode = 0
+    for boardRow in reversed(boardRows):
+        positionCode = positionCode * rowCodeBase + rowCodes[tuple(boardRow)]
+    return positionCode
+#END
+
+@preconditions( (lambda positionCode: ((isinstance(positionCode, (int, long)))) and (positionCode >= 0)),
+                (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1) and (boardSize <= LARGEST_BOARD_SIZE)) )
+def decodeMarkers(positionCode, boardSize=Board.BOARD_SIZE):
+    '''
+    DESCRIPTION:
+        Converts a position code to the marker value at each board position
+
+    PARAMETERS:
+        positionCode: a position code
+        boardSize: (optional) the number of positions along each side of the board
+
+    RETURNS:
+        (valid arguement)
+            A list of rows of marker values, where the marker value at (x, y) is at [x][y]
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    rowCodes, rowMarkerValues, rowCodeBase = _get_row_code_tables(boardSize)
+    if positionCode >= rowCodeBase ** boardSize:
+        raise PreconditionError()
+    boardRows = []
+    for boardXPosition in range(boardSize):
+        positionCode, rowCode = divmod(positionCode, rowCodeBase)
+        boardRows.append(list(rowMarkerValues[rowCode]))
+    return boardRows
+#END
+
+@preconditions( (lambda positionCode: ((isinstance(positionCode, (int, long)))) and (positionCode >= 0)),
+                (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1) and (boardSize <= LARGEST_BOARD_SIZE)),
+                (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)) )
+def decodePosition(positionCode, boardSize=Board.BOARD_SIZE, winLength=None):
+    '''
+    DESCRIPTION:
+        Converts a position code to a board
+
+    PARAMETERS:
+        positionCode: a position code
+        boardSize: (optional) the number of positions along each side of the board
+        winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+
+    RETURNS:
+        (valid arguement)
+            A Board Object with the markers of the position
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    board = Board(boardSize, winLength)
+    boardRows = decodeMarkers(positionCode, boardSize)
+    for boardXPosition in range(boardSize):
+        for boardYPosition in range(boardSize):
+            markerValue = boardRows[boardXPosition][boardYPosition]
+            if markerValue != Board.EMPTY_VALUE:
+                board.placePlayerMarkerOnBoardAtPosition(Board.PLAYER_TOKEN_VALUE.index(markerValue) + 1, boardXPosition, boardYPosition)
+    return board
+#END
+
+def getGameResult(board):
+    '''
+    DESCRIPTION:
+        Retrieves the result of the game on a board, as stored with its position
+
+    RETURNS:
+        Integer: RESULT_PLAYER_ONE_WIN, RESULT_PLAYER_TWO_WIN, RESULT_DRAW, or RESULT_UNKNOWN if the game is not over
+    '''
+    if board.winner() == 1:
+        return RESULT_PLAYER_ONE_WIN
+    if board.winner() == 2:
+        return RESULT_PLAYER_TWO_WIN
+    if board.isDraw():
+        return RESULT_DRAW
+    return RESULT_UNKNOWN
+#END
+
+class PositionStoreWriter:
+    """ Writes A File Of Position Codes And Game Results """
+
+    @preconditions( (lambda self: True),
+                    (lambda fileName: isinstance(fileName, basestring)),
+                    (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1) and (boardSize <= LARGEST_BOARD_SIZE)),
+                    (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)) )
+    def __init__(self, fileName, boardSize=Board.BOARD_SIZE, winLength=None):
+        '''
+        DESCRIPTION:
+            Creates (or replaces) a position store file for boards of one size and win length
+
+        PARAMETERS:
+            fileName: the path of the file
+            boardSize: (optional) the number of positions along each side of the stored boards
+            winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+
+        RETURNS:
+            (valid arguement)
+                A Position Store Writer Object, which must be closed to complete the file
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if winLength is None:
+            winLength = boardSize
+        if winLength > boardSize:
+            raise PreconditionError()
+        self._boardSize = boardSize
+        self._winLength = winLength
+        self._recordFormat = _get_record_format(boardSize)
+        self._largestPositionCode = 3 ** (boardSize * boardSize) - 1
+        self._numberOfPositions = 0
+        self._bufferedRecords = []
+        self._storeFile = open(fileName, "wb")
+        self._write_header()
+    #END
+
+    def __enter__(self):
+        return self
+    #END
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        self.close()
+    #END
+
+    def _write_header(self):
+        self._storeFile.seek(0)
+        self._storeFile.write(_HEADER_FORMAT.pack(POSITION_STORE_MAGIC, POSITION_STORE_VERSION, self._boardSize, self._winLength,
+                                                  self._recordFormat.size - 1, self._numberOfPositions))
+    #END
+
+    def _write_buffered_records(self):
+        self._storeFile.write("".join(self._bufferedRecords))
+        self._bufferedRecords = []
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda self, positionCode: ((isinstance(positionCode, (int, long)))) and (positionCode >= 0) and (positionCode <= self._largestPositionCode)),
+                    (lambda gameResult: gameResult in GAME_RESULTS) )
+    def addPosition(self, positionCode, gameResult=RESULT_UNKNOWN):
+        '''
+        DESCRIPTION:
+            Adds a record to the end of the store
+
+        PARAMETERS:
+            positionCode: the position code
+            gameResult: (optional) one of GAME_RESULTS
+
+        RETURNS:
+            (valid arguement)
+                Integer: the index of the record
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        self._bufferedRecords.append(self._recordFormat.pack(positionCode, gameResult))
+        if len(self._bufferedRecords) == _WRITE_BUFFER_RECORDS:
+            self._write_buffered_records()
+        self._numberOfPositions += 1
+        return self._numberOfPositions - 1
+    #END
+
+    def addBoard(self, board):
+        '''
+        DESCRIPTION:
+            Adds a record of a board's position and game result to the end of the store
+
+        RETURNS:
+            (valid arguement)
+                Integer: the index of the record
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if (board.getBoardSize() != self._boardSize) or (board.getWinLength() != self._winLength):
+            raise PreconditionError()
+        return self.addPosition(encodePosition(board), getGameResult(board))
+    #END
+
+    def close(self):
+        '''
+        DESCRIPTION:
+            Writes every buffered record, and the number of records in the header, then closes the file
+        '''
+        if self._storeFile is not None:
+            self._write_buffered_records()
+            self._write_header()
+            self._storeFile.close()
+            self._storeFile = None
+    #END
+
+class PositionStore:
+    """ A Memory Mapped, Read Only File Of Position Codes And Game Results """
+
+    @preconditions( (lambda self: True),
+                    (lambda fileName: isinstance(fileName, basestring)) )
+    def __init__(self, fileName):
+        '''
+        DESCRIPTION:
+            Opens a position store file written by PositionStoreWriter. The file is memory mapped, so a
+            record is read straight from the page cache and the file is never read as a whole
+
+        PARAMETERS:
+            fileName: the path of the file
+
+        RETURNS:
+            (valid arguement)
+                A Position Store Object
+            (invalid arguement)
+                a PreconditionError is thrown, or a PositionStoreError if the file is not a position store
+        '''
+        self._storeFile = open(fileName, "rb")
+        self._storeMap = None
+        try:
+            headerBytes = self._storeFile.read(_HEADER_FORMAT.size)
+            if len(headerBytes) != _HEADER_FORMAT.size:
+                raise PositionStoreError("{} is too short to be a position store".format(fileName))
+            magic, version, self._boardSize, self._winLength, codeWidth, self._numberOfPositions = _HEADER_FORMAT.unpack(headerBytes)
+            if (magic != POSITION_STORE_MAGIC) or (version != POSITION_STORE_VERSION):
+                raise PositionStoreError("{} is not a position store".format(fileName))
+            if (self._boardSize > LARGEST_BOARD_SIZE) or (codeWidth != _get_code_width(self._boardSize)):
+                raise PositionStoreError("{} has an invalid record format".format(fileName))
+            self._recordFormat = _get_record_format(self._boardSize)
+            if os.fstat(self._storeFile.fileno()).st_size < _HEADER_FORMAT.size + self._numberOfPositions * self._recordFormat.size:
+                raise PositionStoreError("{} is missing records".format(fileName))
+            if self._numberOfPositions > 0:
+                self._storeMap = mmap.mmap(self._storeFile.fileno(), 0, access=mmap.ACCESS_READ)
+        except:
+            self._storeFile.close()
+            raise
+    #END
+
+    def __enter__(self):
+        return self
+    #END
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        self.close()
+    #END
+
+    def __len__(self):
+        return self._numberOfPositions
+    #END
+
+    def getNumberOfPositions(self):
+        return self._numberOfPositions
+    #END
+
+    def getBoardSize(self):
+        return self._boardSize
+    #END
+
+    def getWinLength(self):
+        return self._winLength
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda self, positionIndex: ((isinstance(positionIndex, (int, long)))) and (positionIndex >= 0) and (positionIndex < self._numberOfPositions)) )
+    def getPosition(self, positionIndex):
+        '''
+        DESCRIPTION:
+            Reads one record
+
+        PARAMETERS:
+            positionIndex: the index of the record, between 0 and (number of positions - 1)
+
+        RETURNS:
+            (valid arguement)
+                A tuple (position code, game result)
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        return self._recordFormat.unpack_from(self._storeMap, _HEADER_FORMAT.size + positionIndex * self._recordFormat.size)
+    #END
+
+    def getBoard(self, positionIndex):
+        '''
+        DESCRIPTION:
+            Reads one record as a board
+
+        PARAMETERS:
+            positionIndex: the index of the record, between 0 and (number of positions - 1)
+
+        RETURNS:
+            (valid arguement)
+                A Board Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        positionCode, gameResult = self.getPosition(positionIndex)
+        return decodePosition(positionCode, self._boardSize, self._winLength)
+    #END
+
+    def iteratePositions(self):
+        '''
+        DESCRIPTION:
+            Reads every record in order
+
+        RETURNS:
+            A generator of (position code, game result) tuples
+        '''
+        recordFormat = self._recordFormat
+        for recordOffset in xrange(_HEADER_FORMAT.size, _HEADER_FORMAT.size + self._numberOfPositions * recordFormat.size, recordFormat.size):
+            yield recordFormat.unpack_from(self._storeMap, recordOffset)
+    #END
+
+    def close(self):
+        if self._storeMap is not None:
+            self._storeMap.close()
+            self._storeMap = None
+        self._storeFile.close()
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # The tests of this module are in test_position_store.py, so that only running them loads them
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_position_store.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
@@ -0,0 +1,191 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import multiprocessing
+import timeit
+from conditions import preconditions, PreconditionError
+from board import Board
+from game_command import GameCommand
+from policies import createPolicy, POLICY_NAMES, SOLVER_POLICY
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# The number of chunks of games given to each worker process, so that slow chunks are shared out evenly
+CHUNKS_PER_PROCESS = 4
+
+@preconditions( (lambda firstPolicy: hasattr(firstPolicy, "getBestMove")),
+                (lambda secondPolicy: hasattr(secondPolicy, "getBestMove")),
+                (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)),
+                (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)) )
+def playGame(firstPolicy, secondPolicy, boardSize=Board.BOARD_SIZE, winLength=None):
+    '''
+    DESCRIPTION:
+        Plays one complete game without any user input, with the first policy as 'player 1'
+
+    PARAMETERS:
+        firstPolicy: the move engine for 'player 1'
+        secondPolicy: the move engine for 'player 2'
+        boardSize: (optional) the number of positions along each side of the board
+        winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+
+    RETURNS:
+        (valid arguement)
+            A tuple (winning player number or None for a draw, number of moves played)
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    board = Board(boardSize, winLength)
+    moveCommands = (GameCommand(GameCommand.AI_MOVE_COMMAND, 1, firstPolicy), GameCommand(GameCommand.AI_MOVE_COMMAND, 2, secondPolicy))
+    numberOfMoves = 0
+    while not board.isGameOver():
+        moveCommands[numberOfMoves % 2].executeCommandOnBoard(board)
+        numberOfMoves += 1
+    return (board.winner(), numberOfMoves)
+#END
+
+def _play_chunk_of_games(chunk):
+    # Runs in a worker process, so the policies are sent by name and created here. Each game seeds its own
+    # policies, so the results do not depend on how the games are shared out. The first policy plays first
+    # in even numbered games, so that each policy plays both sides equally often
+    firstPolicyName, secondPolicyName, boardSize, winLength, firstGameNumber, numberOfGames, seed = chunk
+    gameResults = []
+    for gameNumber in range(firstGameNumber, firstGameNumber + numberOfGames):
+        firstPolicy = createPolicy(firstPolicyName, seed + 2 * gameNumber)
+        secondPolicy = createPolicy(secondPolicyName, seed + 2 * gameNumber + 1)
+        if gameNumber % 2 == 0:
+            winningPlayerNumber, numberOfMoves = playGame(firstPolicy, secondPolicy, boardSize, winLength)
+            firstPolicyPlayerNumber = 1
+        else:
+            winningPlayerNumber, numberOfMoves = playGame(secondPolicy, firstPolicy, boardSize, winLength)
+            firstPolicyPlayerNumber = 2
+        gameResults += [(firstPolicyPlayerNumber, winningPlayerNumber, numberOfMoves)]
+    return gameResults
+
+def _create_chunks(firstPolicyName, secondPolicyName, numberOfGames, boardSize, winLength, numberOfChunks, seed):
+    chunks = []
+    firstGameNumber = 0
+    for chunkNumber in range(numberOfChunks):
+        numberOfChunkGames = (numberOfGames - firstGameNumber) // (numberOfChunks - chunkNumber)
+        if numberOfChunkGames > 0:
+            chunks += [(firstPolicyName, secondPolicyName, boardSize, winLength, firstGameNumber, numberOfChunkGames, seed)]
+        firstGameNumber += numberOfChunkGames
+    return chunks
+
+def _summarise_game_results(gameResults, seconds):
+    numberOfGames = len(gameResults)
+    summary = { "games": numberOfGames,
+                "firstPolicyWins": 0,
+                "secondPolicyWins": 0,
+                "draws": 0,
+                "firstPolicyWinsAsPlayerOne": 0,
+                "secondPolicyWinsAsPlayerOne": 0,
+                "gameLengths": {},
+                "seconds": seconds }
+    for firstPolicyPlayerNumber, winningPlayerNumber, numberOfMoves in gameResults:
+        if winningPlayerNumber is None:
+            summary["draws"] += 1
+        elif winningPlayerNumber == firstPolicyPlayerNumber:
+            summary["firstPolicyWins"] += 1
+            summary["firstPolicyWinsAsPlayerOne"] += (winningPlayerNumber == 1)
+        else:
+            summary["secondPolicyWins"] += 1
+            summary["secondPolicyWinsAsPlayerOne"] += (winningPlayerNumber == 1)
+        summary["gameLengths"][numberOfMoves] = summary["gameLengths"].get(numberOfMoves, 0) + 1
+    for resultName in ("firstPolicyWins", "secondPolicyWins", "draws"):
+        summary[resultName + "Rate"] = float(summary[resultName]) / max(1, numberOfGames)
+    summary["averageGameLength"] = float(sum(numberOfMoves for _, _, numberOfMoves in gameResults)) / max(1, numberOfGames)
+    summary["gamesPerSecond"] = numberOfGames / seconds if seconds > 0 else float("inf")
+    return summary
+
+@preconditions( (lambda firstPolicyName: firstPolicyName in POLICY_NAMES),
+                (lambda secondPolicyName: secondPolicyName in POLICY_NAMES),
+                (lambda numberOfGames: ((isinstance(numberOfGames, int))) and (numberOfGames >= 1)),
+                (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)),
+                (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)),
+                (lambda numberOfProcesses: ((isinstance(numberOfProcesses, int))) and (numberOfProcesses >= 1)),
+                (lambda seed: isinstance(seed, int)) )
+def simulateGames(firstPolicyName, secondPolicyName, numberOfGames, boardSize=Board.BOARD_SIZE, winLength=None, numberOfProcesses=None, seed=0):
+    '''
+    DESCRIPTION:
+        Plays many games between two policies over a pool of processes. The policies swap sides every
+        game, so the first policy is 'player 1' in half of the games
+
+    PARAMETERS:
+        firstPolicyName: one of policies.POLICY_NAMES
+        secondPolicyName: one of policies.POLICY_NAMES
+        numberOfGames: the number of games to play
+        boardSize: (optional) the number of positions along each side of the board
+        winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+        numberOfProcesses: (optional) the number of worker processes, which defaults to the number of
+                           processors. With 1 process the games are played in this process
+        seed: (optional) an integer seed for policies which make random choices
+
+    RETURNS:
+        (valid arguement)
+            A dictionary with the number and rate of "firstPolicyWins", "secondPolicyWins" and "draws",
+            the wins of each policy as 'player 1', "gameLengths" (the number of games of each length),
+            "averageGameLength", "seconds" and "gamesPerSecond"
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    if winLength is None:
+        winLength = boardSize
+    if (SOLVER_POLICY in (firstPolicyName, secondPolicyName)) and ((boardSize != Board.BOARD_SIZE) or (winLength != Board.BOARD_SIZE)):
+        raise PreconditionError()
+    if numberOfProcesses is None:
+        numberOfProcesses = multiprocessing.cpu_count()
+    numberOfProcesses = min(numberOfProcesses, numberOfGames)
+
+    startTime = timeit.default_timer()
+    if numberOfProcesses == 1:
+        gameResults = _play_chunk_of_games((firstPolicyName, secondPolicyName, boardSize, winLength, 0, numberOfGames, seed))
+    else:
+        chunks = _create_chunks(firstPolicyName, secondPolicyName, numberOfGames, boardSize, winLength,
+                                numberOfProcesses * CHUNKS_PER_PROCESS, seed)
+        processPool = multiprocessing.Pool(numberOfProcesses)
+        try:
+            gameResults = [gameResult for chunkResults in processPool.map(_play_chunk_of_games, chunks) for gameResult in chunkResults]
+        finally:
+            processPool.terminate()
+            processPool.join()
+    return _summarise_game_results(gameResults, timeit.default_timer() - startTime)
+#END
+
+def printSimulationSummary(firstPolicyName, secondPolicyName, summary):
+    print("{} games of {} against {} in {:.2f} s ({:.1f} games/s)".format(summary["games"], firstPolicyName, secondPolicyName,
+                                                                           summary["seconds"], summary["gamesPerSecond"]))
+    print("    {:<10} wins   {:>6.1%} ({} as player 1)".format(firstPolicyName, summary["firstPolicyWinsRate"], summary["firstPolicyWinsAsPlayerOne"]))
+    print("    {:<10} wins   {:>6.1%} ({} as player 1)".format(secondPolicyName, summary["secondPolicyWinsRate"], summary["secondPolicyWinsAsPlayerOne"]))
+    print("    {:<10}        {:>6.1%}".format("draws", summary["drawsRate"]))
+    print("    average game length {:.2f} moves".format(summary["averageGameLength"]))
+    for numberOfMoves in sorted(summary["gameLengths"]):
+        print("        {:>3} moves: {}".format(numberOfMoves, summary["gameLengths"][numberOfMoves]))
+#END
+
+#------------------------------------------------------------------------------------------------------
+# SIMULATION AND TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string (a simulation is given two policies, a number of games,
+    # and optionally a board size, win length, number of processes and seed)
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) >= 5) and (len(sys.argv) <= 9) and (sys.argv[1] == '-run'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Run a simulation instead of the tests
+    if sys.argv[1] == '-run':
+        firstPolicyName, secondPolicyName = sys.argv[2], sys.argv[3]
+        simulationSummary = simulateGames(firstPolicyName, secondPolicyName, *[int(simulationArguement) for simulationArguement in sys.argv[4:]])
+        printSimulationSummary(firstPolicyName, secondPolicyName, simulationSummary)
+        sys.exit(0)
+
+    # The tests of this module are in test_simulator.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_simulator.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
@@ -0,0 +1,244 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+from conditions import preconditions, PreconditionError
+from board import Board
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+def _create_position_bit(boardXPosition, boardYPosition):
+    return 1 << (boardXPosition * Board.BOARD_SIZE + boardYPosition)
+
+def _create_symmetry_tables():
+    # One table for each of the 8 symmetries of the board (4 rotations, each optionally mirrored),
+    # mapping every bitmask of marked positions to the bitmask of the transformed positions
+    lastBoardPosition = Board.BOARD_SIZE - 1
+    symmetryTables = []
+    for isMirrored in (False, True):
+        for numberOfRotations in range(4):
+            transformedPositionBits = []
+            for boardXPosition in range(Board.BOARD_SIZE):
+                for boardYPosition in range(Board.BOARD_SIZE):
+                    transformedXPosition, transformedYPosition = boardXPosition, boardYPosition
+                    if isMirrored:
+                        transformedYPosition = lastBoardPosition - transformedYPosition
+                    for rotationNumber in range(numberOfRotations):
+                        transformedXPosition, transformedYPosition = transformedYPosition, lastBoardPosition - transformedXPosition
+                    transformedPositionBits += [_create_position_bit(transformedXPosition, transformedYPosition)]
+            symmetryTable = []
+            for bitmask in range(1 << len(transformedPositionBits)):
+                transformedBitmask = 0
+                for positionIndex in range(len(transformedPositionBits)):
+                    if bitmask & (1 << positionIndex):
+                        transformedBitmask |= transformedPositionBits[positionIndex]
+                symmetryTable += [transformedBitmask]
+            symmetryTables += [tuple(symmetryTable)]
+    return tuple(symmetryTables)
+
+class Solver:
+    """ A Perfect Play Tic Tac Toe Solver """
+
+    WIN_VALUE = 1
+    DRAW_VALUE = 0
+    LOSS_VALUE = -1
+
+    _NUMBER_OF_POSITIONS = Board.BOARD_SIZE * Board.BOARD_SIZE
+    _FULL_BOARD_BITMASK = (1 << _NUMBER_OF_POSITIONS) - 1
+    _POSITION_BITS = tuple( (boardXPosition, boardYPosition, _create_position_bit(boardXPosition, boardYPosition))
+                            for boardXPosition in range(Board.BOARD_SIZE)
+                            for boardYPosition in range(Board.BOARD_SIZE) )
+    _WINNING_LINE_BITMASKS = tuple( sum(_create_position_bit(boardXPosition, boardYPosition) for boardXPosition, boardYPosition in winningLine)
+                                    for winningLine in Board.WINNING_LINES )
+    # Built by the first solvePosition, so that importing the solver costs nothing
+    _SYMMETRY_TABLES = None
+
+    # Shared by every solver, so that positions solved for one game are not searched again for the next.
+    # Keyed by the canonical position, and holding the score for the player to move
+    _transpositionTable = {}
+
+    @staticmethod
+    def _has_winning_line(bitmask):
+        for winningLineBitmask in Solver._WINNING_LINE_BITMASKS:
+            if (bitmask & winningLineBitmask) == winningLineBitmask:
+                return True
+        return False
+    #END
+
+    @staticmethod
+    def _create_symmetry_tables_once():
+        if Solver._SYMMETRY_TABLES is None:
+            Solver._SYMMETRY_TABLES = _create_symmetry_tables()
+    #END
+
+    @staticmethod
+    def _get_canonical_position(moverBitmask, opponentBitmask):
+        return min( (symmetryTable[moverBitmask] | (symmetryTable[opponentBitmask] << Solver._NUMBER_OF_POSITIONS))
+                    for symmetryTable in Solver._SYMMETRY_TABLES )
+    #END
+
+    @staticmethod
+    def _get_position_score(moverBitmask, opponentBitmask):
+        # A win scores more the fewer moves it takes, so that the quickest win and the slowest loss are preferred
+        canonicalPosition = Solver._get_canonical_position(moverBitmask, opponentBitmask)
+        positionScore = Solver._transpositionTable.get(canonicalPosition)
+        if positionScore is not None:
+            return positionScore
+
+        emptyBitmask = Solver._FULL_BOARD_BITMASK & ~(moverBitmask | opponentBitmask)
+        if Solver._has_winning_line(opponentBitmask):
+            positionScore = -(bin(emptyBitmask).count("1") + 1)
+        elif emptyBitmask == 0:
+            positionScore = 0
+        else:
+            positionScore = None
+            for boardXPosition, boardYPosition, positionBit in Solver._POSITION_BITS:
+                if emptyBitmask & positionBit:
+                    moveScore = -Solver._get_position_score(opponentBitmask, moverBitmask | positionBit)
+                    if (positionScore is None) or (moveScore > positionScore):
+                        positionScore = moveScore
+
+        Solver._transpositionTable[canonicalPosition] = positionScore
+        return positionScore
+    #END
+
+    @staticmethod
+    def _get_player_bitmasks(board, playerNumber):
+        moverBitmask = 0
+        opponentBitmask = 0
+        moverMarkerValue = Board.PLAYER_TOKEN_VALUE[playerNumber - 1]
+        for boardXPosition, boardYPosition, positionBit in Solver._POSITION_BITS:
+            markerValue = board.getMarkerAtBoardPosition(boardXPosition, boardYPosition)
+            if markerValue == moverMarkerValue:
+                moverBitmask |= positionBit
+            elif markerValue != Board.EMPTY_VALUE:
+                opponentBitmask |= positionBit
+        return moverBitmask, opponentBitmask
+    #END
+
+    @staticmethod
+    def canSolveBoard(board):
+        '''
+        DESCRIPTION:
+            Checks whether a board is one the solver can solve: a board of size Board.BOARD_SIZE which
+            is won with a complete row, column or diagonal
+
+        PARAMETERS:
+            board: a Board (or a board with the same interface)
+
+        RETURNS:
+            Boolean: True if the board can be given to solvePosition
+        '''
+        if not hasattr(board, "getMarkerAtBoardPosition"):
+            return False
+        if hasattr(board, "getBoardSize") and (board.getBoardSize() != Board.BOARD_SIZE):
+            return False
+        if hasattr(board, "getWinLength") and (board.getWinLength() != Board.BOARD_SIZE):
+            return False
+        return True
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: Solver.canSolveBoard(board)),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def solvePosition(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Finds the game theoretic value of a board position and the best move in it, for the player
+            whose turn it is. Positions are looked up in a transposition table shared by all solvers,
+            which holds one entry for each set of positions which are the same under the 8 board symmetries
+
+        PARAMETERS:
+            board: a Board (or a board with the same interface) of size Board.BOARD_SIZE
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                A tuple (gameValue, bestMove) where gameValue is Solver.WIN_VALUE, Solver.DRAW_VALUE or
+                Solver.LOSS_VALUE for the player to move under perfect play, and bestMove is an
+                (x, y) board position tuple, or None if the game is already over
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        Solver._create_symmetry_tables_once()
+        moverBitmask, opponentBitmask = Solver._get_player_bitmasks(board, playerNumber)
+        emptyBitmask = Solver._FULL_BOARD_BITMASK & ~(moverBitmask | opponentBitmask)
+        if Solver._has_winning_line(opponentBitmask):
+            return Solver.LOSS_VALUE, None
+        if Solver._has_winning_line(moverBitmask):
+            return Solver.WIN_VALUE, None
+        if emptyBitmask == 0:
+            return Solver.DRAW_VALUE, None
+
+        bestScore = None
+        bestMove = None
+        for boardXPosition, boardYPosition, positionBit in Solver._POSITION_BITS:
+            if emptyBitmask & positionBit:
+                moveScore = -Solver._get_position_score(opponentBitmask, moverBitmask | positionBit)
+                if (bestScore is None) or (moveScore > bestScore):
+                    bestScore = moveScore
+                    bestMove = (boardXPosition, boardYPosition)
+        gameValue = Solver.DRAW_VALUE
+        if bestScore > 0:
+            gameValue = Solver.WIN_VALUE
+        if bestScore < 0:
+            gameValue = Solver.LOSS_VALUE
+        return gameValue, bestMove
+    #END
+
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Finds the best move in a board position for the player whose turn it is
+
+        PARAMETERS:
+            board: a Board (or a board with the same interface) of size Board.BOARD_SIZE
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                An (x, y) board position tuple, or None if the game is already over
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        gameValue, bestMove = self.solvePosition(board, playerNumber)
+        return bestMove
+    #END
+
+    @staticmethod
+    def getTranspositionTableSize():
+        '''
+        DESCRIPTION:
+            Retrieves the number of positions held in the shared transposition table
+
+        RETURNS:
+            Integer: the number of canonical positions solved so far
+        '''
+        return len(Solver._transpositionTable)
+    #END
+
+    @staticmethod
+    def clearTranspositionTable():
+        '''
+        DESCRIPTION:
+            Removes every position from the shared transposition table
+
+        RETURNS:
+            None
+        '''
+        Solver._transpositionTable.clear()
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # The tests of this module are in test_solver.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_solver.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
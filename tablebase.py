@@ -0,0 +1,535 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import collections
+import json
+import mmap
+import multiprocessing
+import os
+import time
+from conditions import preconditions, PreconditionError
+from board import Board
+from solver import Solver
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# A tablebase holds every position of one board size and win length with up to a maximum number of empty
+# positions, as the game value and the number of moves left under perfect play for the player to move.
+#
+# Positions are those of a game which the first player started, so with m marked positions the first
+# player has (m + 1) // 2 markers and is to move when m is even. A position where the second player
+# started is looked up with the players swapped. Each number of empty positions e is a level of the
+# tablebase, and the index of a position in its level is
+#     (rank of the set of empty positions) * C(m, (m + 1) // 2) + (rank of the first player's markers among the marked positions)
+# where the rank of a set is its colexicographic rank. Board position (x, y) is bit (x * boardSize + y).
+#
+# Each level is split into files of at most chunkEntries one byte entries, which are written whole and
+# then renamed, so generation can be stopped and resumed, and each chunk can be made by a different process
+TABLEBASE_INDEX_FILE_NAME = "index.json"
+TABLEBASE_VERSION = 1
+DEFAULT_CHUNK_ENTRIES = 1 << 20
+MAXIMUM_OPEN_CHUNKS = 64
+
+WIN_VALUE = Solver.WIN_VALUE
+DRAW_VALUE = Solver.DRAW_VALUE
+LOSS_VALUE = Solver.LOSS_VALUE
+
+# An entry of 0 is not a position of a game (the player to move has already won), and any other
+# entry is 1 + (game value + 1) + 3 * (moves left)
+_NOT_A_POSITION = 0
+
+class TablebaseError(Exception):
+    '''
+    This exception is given when a tablebase directory does not match the tablebase it is used as
+    '''
+
+def _encode_entry(gameValue, movesLeft):
+    return 1 + (gameValue + 1) + 3 * movesLeft
+
+def _decode_entry(entry):
+    movesLeft, gameValueIndex = divmod(entry - 1, 3)
+    return gameValueIndex - 1, movesLeft
+
+def _get_entry_score(gameValue, movesLeft):
+    # The quickest win and the slowest loss are preferred
+    if gameValue == WIN_VALUE:
+        return 1000 - movesLeft
+    if gameValue == LOSS_VALUE:
+        return movesLeft - 1000
+    return 0
+
+def _get_chunk_file_name(directory, numberOfEmptyPositions, chunkNumber):
+    return os.path.join(directory, "level_{:02d}_chunk_{:05d}.bin".format(numberOfEmptyPositions, chunkNumber))
+
+class _TablebaseTables:
+    """ The tables used to index and solve positions of one board size and win length """
+
+    def __init__(self, boardSize, winLength):
+        winningLines, lineIndicesForEachPosition = Board._get_line_tables(boardSize, winLength)
+        self.numberOfPositions = boardSize * boardSize
+        self.fullBoardMask = (1 << self.numberOfPositions) - 1
+        self.lineMasks = tuple( sum(1 << (boardXPosition * boardSize + boardYPosition) for boardXPosition, boardYPosition in winningLine)
+                                for winningLine in winningLines )
+        self.lineMasksForEachPosition = tuple( tuple(self.lineMasks[lineIndex] for lineIndex in lineIndicesForEachPosition[boardXPosition][boardYPosition])
+                                               for boardXPosition in range(boardSize)
+                                               for boardYPosition in range(boardSize) )
+        self.binomials = [[0] * (self.numberOfPositions + 2) for _ in range(self.numberOfPositions + 1)]
+        for setSize in range(self.numberOfPositions + 1):
+            self.binomials[setSize][0] = 1
+            for subsetSize in range(1, setSize + 1):
+                self.binomials[setSize][subsetSize] = self.binomials[setSize - 1][subsetSize - 1] + self.binomials[setSize - 1][subsetSize]
+    #END
+
+    def getNumberOfEntries(self, numberOfEmptyPositions):
+        numberOfMarkedPositions = self.numberOfPositions - numberOfEmptyPositions
+        return self.binomials[self.numberOfPositions][numberOfEmptyPositions] * self.binomials[numberOfMarkedPositions][(numberOfMarkedPositions + 1) // 2]
+    #END
+
+    def hasLine(self, markerMask):
+        for lineMask in self.lineMasks:
+            if (markerMask & lineMask) == lineMask:
+                return True
+        return False
+    #END
+
+    def getIndex(self, emptyMask, firstPlayerMask):
+        binomials = self.binomials
+        emptyRank = 0
+        markerRank = 0
+        numberOfEmptyPositions = 0
+        numberOfFirstPlayerMarkers = 0
+        numberOfMarkedPositions = 0
+        for position in range(self.numberOfPositions):
+            positionBit = 1 << position
+            if emptyMask & positionBit:
+                numberOfEmptyPositions += 1
+                emptyRank += binomials[position][numberOfEmptyPositions]
+            else:
+                if firstPlayerMask & positionBit:
+                    numberOfFirstPlayerMarkers += 1
+                    markerRank += binomials[numberOfMarkedPositions][numberOfFirstPlayerMarkers]
+                numberOfMarkedPositions += 1
+        return numberOfEmptyPositions, emptyRank * binomials[numberOfMarkedPositions][(numberOfMarkedPositions + 1) // 2] + markerRank
+    #END
+
+    def _unrank_subset(self, subsetRank, subsetSize, setSize):
+        binomials = self.binomials
+        subsetMembers = []
+        candidate = setSize - 1
+        for memberNumber in range(subsetSize, 0, -1):
+            while binomials[candidate][memberNumber] > subsetRank:
+                candidate -= 1
+            subsetMembers.append(candidate)
+            subsetRank -= binomials[candidate][memberNumber]
+            candidate -= 1
+        return subsetMembers
+    #END
+
+    def getMasks(self, numberOfEmptyPositions, positionIndex):
+        numberOfMarkedPositions = self.numberOfPositions - numberOfEmptyPositions
+        numberOfFirstPlayerMarkers = (numberOfMarkedPositions + 1) // 2
+        emptyRank, markerRank = divmod(positionIndex, self.binomials[numberOfMarkedPositions][numberOfFirstPlayerMarkers])
+        emptyMask = 0
+        for position in self._unrank_subset(emptyRank, numberOfEmptyPositions, self.numberOfPositions):
+            emptyMask |= 1 << position
+        markedPositions = [position for position in range(self.numberOfPositions) if not (emptyMask & (1 << position))]
+        firstPlayerMask = 0
+        for markedPositionNumber in self._unrank_subset(markerRank, numberOfFirstPlayerMarkers, numberOfMarkedPositions):
+            firstPlayerMask |= 1 << markedPositions[markedPositionNumber]
+        return emptyMask, firstPlayerMask
+    #END
+
+# Shared by every tablebase, keyed by (board size, win length)
+_tablebaseTables = {}
+
+def _get_tablebase_tables(boardSize, winLength):
+    tables = _tablebaseTables.get((boardSize, winLength))
+    if tables is None:
+        tables = _TablebaseTables(boardSize, winLength)
+        _tablebaseTables[(boardSize, winLength)] = tables
+    return tables
+
+class Tablebase:
+    """ A Read Only, Memory Mapped Endgame Tablebase """
+
+    @preconditions( (lambda self: True),
+                    (lambda directory: isinstance(directory, basestring)) )
+    def __init__(self, directory):
+        '''
+        DESCRIPTION:
+            Opens a tablebase made by generateTablebase. Chunk files are memory mapped the first time a
+            position in them is probed, and at most MAXIMUM_OPEN_CHUNKS are kept open, so a tablebase of
+            any size is probed without reading it into memory. Only levels with every chunk present when
+            the tablebase is opened are probed
+
+        PARAMETERS:
+            directory: the tablebase directory
+
+        RETURNS:
+            (valid arguement)
+                A Tablebase Object
+            (invalid arguement)
+                a PreconditionError is thrown, or a TablebaseError if the directory is not a tablebase
+        '''
+        tablebaseIndex = _read_tablebase_index(directory)
+        self._directory = directory
+        self._boardSize = tablebaseIndex["boardSize"]
+        self._winLength = tablebaseIndex["winLength"]
+        self._chunkEntries = tablebaseIndex["chunkEntries"]
+        self._tables = _get_tablebase_tables(self._boardSize, self._winLength)
+        self._openChunks = collections.OrderedDict()
+        self._maximumEmptyPositions = -1
+        while (self._maximumEmptyPositions < tablebaseIndex["maximumEmptyPositions"]) and \
+              not _get_missing_chunks(directory, self._tables, self._maximumEmptyPositions + 1, self._chunkEntries):
+            self._maximumEmptyPositions += 1
+    #END
+
+    def getBoardSize(self):
+        return self._boardSize
+    #END
+
+    def getWinLength(self):
+        return self._winLength
+    #END
+
+    def getMaximumEmptyPositions(self):
+        '''
+        DESCRIPTION:
+            Retrieves the largest number of empty positions a probed position may have
+
+        RETURNS:
+            Integer: the number of empty positions, or -1 if the tablebase has no complete level
+        '''
+        return self._maximumEmptyPositions
+    #END
+
+    def getNumberOfOpenChunks(self):
+        return len(self._openChunks)
+    #END
+
+    def _read_entry(self, numberOfEmptyPositions, positionIndex):
+        chunkNumber, entryOffset = divmod(positionIndex, self._chunkEntries)
+        chunkKey = (numberOfEmptyPositions, chunkNumber)
+        chunkMap = self._openChunks.get(chunkKey)
+        if chunkMap is None:
+            if len(self._openChunks) >= MAXIMUM_OPEN_CHUNKS:
+                oldestChunkKey, oldestChunkMap = self._openChunks.popitem(last=False)
+                oldestChunkMap.close()
+            with open(_get_chunk_file_name(self._directory, numberOfEmptyPositions, chunkNumber), "rb") as chunkFile:
+                chunkMap = mmap.mmap(chunkFile.fileno(), 0, access=mmap.ACCESS_READ)
+            self._openChunks[chunkKey] = chunkMap
+        return ord(chunkMap[entryOffset])
+    #END
+
+    def _probe_entry(self, emptyMask, firstPlayerMask):
+        numberOfEmptyPositions, positionIndex = self._tables.getIndex(emptyMask, firstPlayerMask)
+        return self._read_entry(numberOfEmptyPositions, positionIndex)
+    #END
+
+    def probePlayerMasks(self, playerOneMask, playerTwoMask, playerNumber):
+        '''
+        DESCRIPTION:
+            Finds the game value of a position, given as the bitmasks of each player's markers, where the
+            marker at board position (x, y) is bit (x * board size + y)
+
+        PARAMETERS:
+            playerOneMask: the bitmask of player 1's markers
+            playerTwoMask: the bitmask of player 2's markers
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            A tuple (gameValue, movesLeft) for the player to move, where gameValue is WIN_VALUE, DRAW_VALUE
+            or LOSS_VALUE, or None if the position has too many empty positions, has marker counts which
+            can not happen with that player to move, or is already won by the player to move
+        '''
+        emptyMask = self._tables.fullBoardMask & ~(playerOneMask | playerTwoMask)
+        if bin(emptyMask).count("1") > self._maximumEmptyPositions:
+            return None
+        playerOneMarkers = bin(playerOneMask).count("1")
+        playerTwoMarkers = bin(playerTwoMask).count("1")
+        if playerOneMarkers - playerTwoMarkers == (0 if playerNumber == 1 else 1):
+            firstPlayerMask = playerOneMask
+        elif playerTwoMarkers - playerOneMarkers == (0 if playerNumber == 2 else 1):
+            firstPlayerMask = playerTwoMask
+        else:
+            return None
+        entry = self._probe_entry(emptyMask, firstPlayerMask)
+        if entry == _NOT_A_POSITION:
+            return None
+        return _decode_entry(entry)
+    #END
+
+    def _get_player_masks(self, board):
+        playerOneMask = 0
+        playerTwoMask = 0
+        for boardXPosition in range(self._boardSize):
+            for boardYPosition in range(self._boardSize):
+                markerValue = board.getMarkerAtBoardPosition(boardXPosition, boardYPosition)
+                if markerValue == Board.PLAYER_TOKEN_VALUE[0]:
+                    playerOneMask |= 1 << (boardXPosition * self._boardSize + boardYPosition)
+                elif markerValue == Board.PLAYER_TOKEN_VALUE[1]:
+                    playerTwoMask |= 1 << (boardXPosition * self._boardSize + boardYPosition)
+        return playerOneMask, playerTwoMask
+    #END
+
+    def coversBoard(self, board):
+        '''
+        DESCRIPTION:
+            Checks whether a board has the board size and win length of the tablebase
+
+        RETURNS:
+            Boolean: True if positions of the board can be probed
+        '''
+        return (board.getBoardSize() == self._boardSize) and (board.getWinLength() == self._winLength)
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: hasattr(board, "getMarkerAtBoardPosition") and hasattr(board, "getBoardSize") and hasattr(board, "getWinLength")),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def probePosition(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Finds the game value of a board position for the player whose turn it is
+
+        PARAMETERS:
+            board: a Board (or a board with the same interface)
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                A tuple (gameValue, movesLeft) as given by probePlayerMasks, or None if the board is not
+                covered by the tablebase
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if not self.coversBoard(board):
+            return None
+        playerOneMask, playerTwoMask = self._get_player_masks(board)
+        return self.probePlayerMasks(playerOneMask, playerTwoMask, playerNumber)
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: hasattr(board, "getMarkerAtBoardPosition") and hasattr(board, "getBoardSize") and hasattr(board, "getWinLength")),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Finds the move with the best game value, winning as quickly and losing as slowly as possible
+
+        PARAMETERS:
+            board: a Board (or a board with the same interface)
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                An (x, y) board position tuple, or None if the game is over or the position is not
+                covered by the tablebase
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        positionValue = self.probePosition(board, playerNumber)
+        if (positionValue is None) or (positionValue[1] == 0):
+            return None
+        tables = self._tables
+        playerMasks = list(self._get_player_masks(board))
+        emptyMask = tables.fullBoardMask & ~(playerMasks[0] | playerMasks[1])
+        bestScore = None
+        bestMove = None
+        for position in range(tables.numberOfPositions):
+            positionBit = 1 << position
+            if emptyMask & positionBit:
+                moverMask = playerMasks[playerNumber - 1] | positionBit
+                if tables.hasLine(moverMask):
+                    return divmod(position, self._boardSize)
+                childMasks = list(playerMasks)
+                childMasks[playerNumber - 1] = moverMask
+                childGameValue, childMovesLeft = self.probePlayerMasks(childMasks[0], childMasks[1], 3 - playerNumber)
+                moveScore = _get_entry_score(-childGameValue, childMovesLeft + 1)
+                if (bestScore is None) or (moveScore > bestScore):
+                    bestScore = moveScore
+                    bestMove = divmod(position, self._boardSize)
+        return bestMove
+    #END
+
+    def close(self):
+        for chunkMap in self._openChunks.values():
+            chunkMap.close()
+        self._openChunks.clear()
+    #END
+
+def _read_tablebase_index(directory):
+    try:
+        with open(os.path.join(directory, TABLEBASE_INDEX_FILE_NAME)) as indexFile:
+            tablebaseIndex = json.load(indexFile)
+    except (IOError, ValueError):
+        raise TablebaseError("{} is not a tablebase".format(directory))
+    if tablebaseIndex.get("version") != TABLEBASE_VERSION:
+        raise TablebaseError("{} is not a version {} tablebase".format(directory, TABLEBASE_VERSION))
+    return tablebaseIndex
+
+def _get_missing_chunks(directory, tables, numberOfEmptyPositions, chunkEntries):
+    numberOfChunks = (tables.getNumberOfEntries(numberOfEmptyPositions) + chunkEntries - 1) // chunkEntries
+    return [ chunkNumber for chunkNumber in range(numberOfChunks)
+             if not os.path.exists(_get_chunk_file_name(directory, numberOfEmptyPositions, chunkNumber)) ]
+
+def _solve_position(tables, emptyMask, firstPlayerMask, previousLevel):
+    # Returns the entry of a position, from the entries of the positions after each move
+    secondPlayerMask = tables.fullBoardMask & ~(emptyMask | firstPlayerMask)
+    firstPlayerIsMoving = (bin(firstPlayerMask).count("1") == bin(secondPlayerMask).count("1"))
+    moverMask, opponentMask = (firstPlayerMask, secondPlayerMask) if firstPlayerIsMoving else (secondPlayerMask, firstPlayerMask)
+    if tables.hasLine(moverMask):
+        return _NOT_A_POSITION
+    if tables.hasLine(opponentMask):
+        return _encode_entry(LOSS_VALUE, 0)
+    if emptyMask == 0:
+        return _encode_entry(DRAW_VALUE, 0)
+
+    bestScore = None
+    bestEntry = None
+    for position in range(tables.numberOfPositions):
+        positionBit = 1 << position
+        if emptyMask & positionBit:
+            for lineMask in tables.lineMasksForEachPosition[position]:
+                if ((moverMask | positionBit) & lineMask) == lineMask:
+                    return _encode_entry(WIN_VALUE, 1)
+            childFirstPlayerMask = (firstPlayerMask | positionBit) if firstPlayerIsMoving else firstPlayerMask
+            childGameValue, childMovesLeft = _decode_entry(previousLevel._probe_entry(emptyMask & ~positionBit, childFirstPlayerMask))
+            moveScore = _get_entry_score(-childGameValue, childMovesLeft + 1)
+            if (bestScore is None) or (moveScore > bestScore):
+                bestScore = moveScore
+                bestEntry = _encode_entry(-childGameValue, childMovesLeft + 1)
+    return bestEntry
+
+def _generate_chunk(chunkArguements):
+    directory, numberOfEmptyPositions, chunkNumber = chunkArguements
+    tablebaseIndex = _read_tablebase_index(directory)
+    tables = _get_tablebase_tables(tablebaseIndex["boardSize"], tablebaseIndex["winLength"])
+    chunkEntries = tablebaseIndex["chunkEntries"]
+    previousLevel = None
+    if numberOfEmptyPositions > 0:
+        previousLevel = Tablebase(directory)
+        if previousLevel.getMaximumEmptyPositions() < numberOfEmptyPositions - 1:
+            raise TablebaseError("level {} of {} is not complete".format(numberOfEmptyPositions - 1, directory))
+
+    firstPositionIndex = chunkNumber * chunkEntries
+    lastPositionIndex = min(firstPositionIndex + chunkEntries, tables.getNumberOfEntries(numberOfEmptyPositions))
+    chunkBytes = bytearray(lastPositionIndex - firstPositionIndex)
+    for positionIndex in xrange(firstPositionIndex, lastPositionIndex):
+        emptyMask, firstPlayerMask = tables.getMasks(numberOfEmptyPositions, positionIndex)
+        chunkBytes[positionIndex - firstPositionIndex] = _solve_position(tables, emptyMask, firstPlayerMask, previousLevel)
+    if previousLevel is not None:
+        previousLevel.close()
+
+    chunkFileName = _get_chunk_file_name(directory, numberOfEmptyPositions, chunkNumber)
+    with open(chunkFileName + ".tmp", "wb") as chunkFile:
+        chunkFile.write(chunkBytes)
+    os.rename(chunkFileName + ".tmp", chunkFileName)
+    return len(chunkBytes)
+
+@preconditions( (lambda directory: isinstance(directory, basestring)),
+                (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1) and (boardSize <= 6)),
+                (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)),
+                (lambda maximumEmptyPositions: ((isinstance(maximumEmptyPositions, int))) and (maximumEmptyPositions >= 0)),
+                (lambda numberOfProcesses: ((isinstance(numberOfProcesses, int))) and (numberOfProcesses >= 1)),
+                (lambda chunkEntries: ((isinstance(chunkEntries, int))) and (chunkEntries >= 1)) )
+def generateTablebase(directory, boardSize, winLength, maximumEmptyPositions, numberOfProcesses=None, chunkEntries=DEFAULT_CHUNK_ENTRIES):
+    '''
+    DESCRIPTION:
+        Generates a tablebase by retrograde analysis: the level of full boards first, then each level with
+        one more empty position from the level before it. The chunks of a level are generated in parallel,
+        and chunks already in the directory are kept, so an interrupted generation resumes where it stopped,
+        and a tablebase can be extended to more empty positions
+
+    PARAMETERS:
+        directory: the tablebase directory, which is created if needed
+        boardSize: the number of positions along each side of the board, at most 6
+        winLength: the number of markers in a row needed to win, at most the board size
+        maximumEmptyPositions: the largest number of empty positions, at most the number of board positions
+        numberOfProcesses: (optional) the number of worker processes, which defaults to the number of CPUs
+        chunkEntries: (optional) the number of positions in each chunk file
+
+    RETURNS:
+        (valid arguement)
+            A dictionary of the number of "entries" in the tablebase, the "generatedChunks", the
+            "skippedChunks" which were already complete, and the "seconds" taken
+        (invalid arguement)
+            a PreconditionError is thrown, or a TablebaseError if the directory holds a different tablebase
+    '''
+    if (winLength > boardSize) or (maximumEmptyPositions > boardSize * boardSize):
+        raise PreconditionError()
+    if numberOfProcesses is None:
+        numberOfProcesses = multiprocessing.cpu_count()
+    startTime = time.time()
+
+    tablebaseIndex = { "version": TABLEBASE_VERSION, "boardSize": boardSize, "winLength": winLength,
+                       "maximumEmptyPositions": maximumEmptyPositions, "chunkEntries": chunkEntries }
+    if os.path.exists(os.path.join(directory, TABLEBASE_INDEX_FILE_NAME)):
+        existingIndex = _read_tablebase_index(directory)
+        for indexKey in ("boardSize", "winLength", "chunkEntries"):
+            if existingIndex[indexKey] != tablebaseIndex[indexKey]:
+                raise TablebaseError("{} holds a tablebase with a different {}".format(directory, indexKey))
+        tablebaseIndex["maximumEmptyPositions"] = max(maximumEmptyPositions, existingIndex["maximumEmptyPositions"])
+    elif not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(os.path.join(directory, TABLEBASE_INDEX_FILE_NAME), "w") as indexFile:
+        json.dump(tablebaseIndex, indexFile, sort_keys=True)
+
+    tables = _get_tablebase_tables(boardSize, winLength)
+    summary = {"entries": 0, "generatedChunks": 0, "skippedChunks": 0}
+    processPool = None
+    if numberOfProcesses > 1:
+        processPool = multiprocessing.Pool(numberOfProcesses)
+    try:
+        for numberOfEmptyPositions in range(maximumEmptyPositions + 1):
+            numberOfChunks = (tables.getNumberOfEntries(numberOfEmptyPositions) + chunkEntries - 1) // chunkEntries
+            missingChunks = _get_missing_chunks(directory, tables, numberOfEmptyPositions, chunkEntries)
+            chunkArguements = [(directory, numberOfEmptyPositions, chunkNumber) for chunkNumber in missingChunks]
+            if processPool is None:
+                for chunkArguement in chunkArguements:
+                    _generate_chunk(chunkArguement)
+            else:
+                for chunkSize in processPool.imap_unordered(_generate_chunk, chunkArguements):
+                    pass
+            summary["entries"] += tables.getNumberOfEntries(numberOfEmptyPositions)
+            summary["generatedChunks"] += len(missingChunks)
+            summary["skippedChunks"] += numberOfChunks - len(missingChunks)
+    finally:
+        if processPool is not None:
+            processPool.terminate()
+            processPool.join()
+    summary["seconds"] = time.time() - startTime
+    return summary
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) >= 5) and (len(sys.argv) <= 7) and (sys.argv[1] == '-generate'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Generate (or resume generating) a tablebase for a board size, win length and number of empty positions
+    if sys.argv[1] == '-generate':
+        boardSize, winLength, maximumEmptyPositions = [int(arguement) for arguement in sys.argv[2:5]]
+        directory = "tablebase_{}_{}".format(boardSize, winLength)
+        if len(sys.argv) >= 6:
+            directory = sys.argv[5]
+        numberOfProcesses = None
+        if len(sys.argv) == 7:
+            numberOfProcesses = int(sys.argv[6])
+        summary = generateTablebase(directory, boardSize, winLength, maximumEmptyPositions, numberOfProcesses)
+        print "{} positions in {}: {} chunks generated, {} already complete, {:.1f} seconds".format(
+            summary["entries"], directory, summary["generatedChunks"], summary["skippedChunks"], summary["seconds"])
+        sys.exit(0)
+
+    # The tests of this module are in test_tablebase.py, so that only running them loads them
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_tablebase.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
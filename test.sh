@@ -15,7 +15,7 @@
 #----------------------------------------------------------------------------------------------------------------------
 # GLOBAL FLAGS
 #----------------------------------------------------------------------------------------------------------------------
-testResultForFastTesting="PASSED"
+exitStatus=0
 
 #----------------------------------------------------------------------------------------------------------------------
 # MAIN
@@ -24,10 +24,16 @@ main()
 {
     echo "<START>"
     
-    echo "    Testing All Modules"
-    testAllModules "$1"
-    
-    cleanupTestFiles
+    if [ "$1" = "-benchmark" ]; then
+        echo "    Benchmarking Core Modules"
+        benchmarkModules
+    elif [ "$1" = "-fast" ] || [ "$1" = "-timings" ]; then
+        echo "    Testing All Modules"
+        runAllTests "$1"
+    else
+        echo "    Testing All Modules"
+        testAllModules "$1"
+    fi
 
     echo "<DONE>"
 }
@@ -40,38 +46,47 @@ function testAllModules()
     # Enter Project Files Directory
     cd ./
 
-    # Loop through testing all files in Project Files Directory
+    # Loop through testing all files in Project Files Directory. The tests in test_<module>.py are run by
+    # <module>.py, so they are not run twice
     for filename in ./*.py; do
         file=$(echo "$filename" | cut -c 3-)
+        case "$file" in
+            test_*)
+                if [ -f "./${file#test_}" ]; then
+                    continue
+                fi
+                ;;
+        esac
         testModule "$file" "$1"
     done
 
-    # Output testing result if fast compilation was chosen
-    if [ "$1" = "-fast" ]; then
-        echo "    Test Result = "$testResultForFastTesting""
-    fi
 }
 
-function testModule()
+function runAllTests()
 {
-    filename="$1"
-    testFlag="$2"
+    # Every test class of every module is run by the test runner in one go, over a process for each
+    # processor. '-timings' also shows the outcome and time of each test, and the slowest tests
+    if [ "$1" = "-timings" ]; then
+        python ./test_runner.py "-timings"
+    else
+        python ./test_runner.py "-run" 1>./testResult.txt 2>&1
+    fi
 
-    if [ "$2" = "-fast" ]; then
-        fastTestModule "$1" "$2"
+    if [ $? -eq 0 ]; then
+        echo "    Test Result = PASSED"
     else
-        slowTestModule "$1" "$2"
+        if [ -f ./testResult.txt ]; then
+            cat ./testResult.txt
+        fi
+        echo "    Test Result = FAILED"
+        exitStatus=1
     fi
+    rm -f ./testResult.txt
 }
 
-function fastTestModule()
+function testModule()
 {
-    python "$filename" "-compilation" 2>./testResult.txt 1>/dev/null
-    result=`cat ./testResult.txt`
-    
-    if [[ "$result" = *"FAILED"* ]]; then
-        testResultForFastTesting="FAILED"
-    fi
+    slowTestModule "$1" "$2"
 }
 
 function slowTestModule()
@@ -91,12 +106,21 @@ function slowTestModule()
     echo ""
 }
 
-function cleanupTestFiles()
+function benchmarkModules()
 {
-    rm testResult.txt
+    # Results are written to benchmark_results.json and compared with benchmark_baseline.json, which is
+    # recorded on each machine by 'python benchmark.py -baseline'. A missing baseline, or a benchmark slower
+    # than its baseline by more than TICTAC_BENCHMARK_THRESHOLD (a fraction, 0.25 by default), fails the run
+    if python "./benchmark.py" "-suite"; then
+        echo "    Benchmark Result = PASSED"
+    else
+        echo "    Benchmark Result = FAILED"
+        exitStatus=1
+    fi
 }
 
 #----------------------------------------------------------------------------------------------------------------------
 # SCRIPT
 #----------------------------------------------------------------------------------------------------------------------
-    main "$1"
\ No newline at end of file
+    main "$1"
+    exit $exitStatus
\ No newline at end of file
@@ -0,0 +1,154 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import shutil
+import tempfile
+import time
+from conditions import PreconditionError
+from board import Board
+from tablebase import Tablebase, generateTablebase
+from alpha_beta import AlphaBetaEngine
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestGetBestMove(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _engine = None
+
+    def setUp(self):
+        self._engine = AlphaBetaEngine(2.0)
+
+    def tearDown(self):
+        self._engine = None
+
+    def _create_board(self, boardSize, winLength, markers):
+        board = Board(boardSize, winLength)
+        for playerNumber, boardXPosition, boardYPosition in markers:
+            board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+        return board
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_takes_immediate_win(self):
+        board = self._create_board(3, 3, [(1, 0, 0), (2, 1, 0), (1, 0, 1), (2, 1, 1)])
+        self.assertEqual(self._engine.getBestMove(board, 1), (0, 2))
+        self.assertEqual(self._engine.getBestMove(board, 2), (1, 2))
+
+    def test_blocks_opponent_line(self):
+        board = self._create_board(3, 3, [(1, 0, 0), (2, 1, 1), (1, 0, 1)])
+        self.assertEqual(self._engine.getBestMove(board, 2), (0, 2))
+
+    def test_perfect_play_on_classic_board_is_a_draw(self):
+        board = Board()
+        playerNumber = 1
+        while not board.isGameOver():
+            boardXPosition, boardYPosition = self._engine.getBestMove(board, playerNumber)
+            board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+            playerNumber = 3 - playerNumber
+        self.assertTrue(board.isDraw())
+
+    def test_blocks_open_line_on_larger_board(self):
+        board = self._create_board(7, 5, [(1, 3, 1), (2, 0, 0), (1, 3, 2), (2, 0, 6), (1, 3, 3), (2, 6, 0), (1, 3, 4)])
+        self.assertTrue(self._engine.getBestMove(board, 2) in [(3, 0), (3, 5)])
+
+    def test_takes_win_on_larger_board(self):
+        board = self._create_board(4, 4, [(1, 0, 0), (2, 3, 0), (1, 1, 1), (2, 3, 1), (1, 2, 2), (2, 0, 3)])
+        self.assertEqual(self._engine.getBestMove(board, 1), (3, 3))
+
+    def test_larger_board_move_is_fast(self):
+        engine = AlphaBetaEngine(0.5)
+        board = self._create_board(7, 5, [(1, 3, 3), (2, 2, 2)])
+        startTime = time.time()
+        move = engine.getBestMove(board, 1)
+        self.assertTrue(time.time() - startTime < 1.0)
+        self.assertEqual(board.getMarkerAtBoardPosition(*move), Board.EMPTY_VALUE)
+        self.assertTrue(engine.getLastSearchStatistics()["depth"] >= 1)
+
+    def test_win_distance_is_kept_between_searches(self):
+        # The second search starts two plies deeper, from positions stored by the first search, and must
+        # find the same distance to the win as an engine which has not searched before
+        engine = AlphaBetaEngine(5.0)
+        board = self._create_board(5, 4, [(1, 1, 1), (2, 0, 0)])
+        engine.getBestMove(board, 1)
+        board.placePlayerMarkerOnBoardAtPosition(1, 2, 2)
+        board.placePlayerMarkerOnBoardAtPosition(2, 0, 1)
+        engine.getBestMove(board, 1)
+        newEngine = AlphaBetaEngine(5.0)
+        newEngine.getBestMove(board, 1)
+        self.assertTrue(newEngine.getLastSearchStatistics()["score"] >= AlphaBetaEngine._DECIDED_SCORE)
+        self.assertEqual(engine.getLastSearchStatistics()["score"], newEngine.getLastSearchStatistics()["score"])
+
+    def test_game_over_has_no_move(self):
+        board = self._create_board(4, 3, [(1, 0, 0), (1, 1, 1), (1, 2, 2)])
+        self.assertEqual(self._engine.getBestMove(board, 2), None)
+
+    def test_tablebase_is_probed(self):
+        tablebaseDirectory = tempfile.mkdtemp()
+        try:
+            generateTablebase(tablebaseDirectory, 4, 4, 1, 1)
+            engine = AlphaBetaEngine(2.0, None, None, Tablebase(tablebaseDirectory))
+            board = self._create_board(4, 4, [(1, 0, 0), (2, 0, 1), (1, 0, 2), (2, 0, 3), (1, 1, 0), (2, 1, 1),
+                                              (1, 1, 3), (2, 1, 2), (1, 2, 1), (2, 2, 0), (1, 2, 3), (2, 2, 2)])
+            self.assertEqual(engine.getBestMove(board, 1), self._engine.getBestMove(board, 1))
+            self.assertTrue(engine.getLastSearchStatistics()["tablebaseHits"] > 0)
+            board.placePlayerMarkerOnBoardAtPosition(1, 3, 3)
+            board.placePlayerMarkerOnBoardAtPosition(2, 3, 0)
+            board.placePlayerMarkerOnBoardAtPosition(1, 3, 1)
+            self.assertEqual(engine.getBestMove(board, 2), (3, 2))
+            self.assertEqual(engine.getLastSearchStatistics()["tablebaseHits"], 1)
+        finally:
+            shutil.rmtree(tablebaseDirectory)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_player_number(self):
+        for playerNumber in (0, 3, 1.0, "1"):
+            self.assertRaises(PreconditionError, self._engine.getBestMove, Board(), playerNumber)
+
+    def test_invalid_engine_settings(self):
+        self.assertRaises(PreconditionError, AlphaBetaEngine, 0)
+        self.assertRaises(PreconditionError, AlphaBetaEngine, 1.0, 0)
+        self.assertRaises(PreconditionError, AlphaBetaEngine, 1.0, 4, 0)
+        self.assertRaises(PreconditionError, AlphaBetaEngine, 1.0, 4, 1, "tablebase")
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
@@ -0,0 +1,767 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import random
+from conditions import PreconditionError
+from board import Board
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestConstructor(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _known_initial_board_value = [[0,0,0],[0,0,0],[0,0,0]]
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+    	self._board = None
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self.assertEqual( self._board._boardGrid[boardXPosition][boardYPosition], 
+                                  self._known_initial_board_value[boardXPosition][boardYPosition])  
+
+class TestCreateColumnWithEmptyMarking(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_column_create_of_correct_length(self):
+        createdColumn = self._board._create_column_of_empty_value()
+        self.assertEqual( len(createdColumn), 3) 
+
+    def test_column_create_of_correct_entries(self):
+        createdColumn = self._board._create_column_of_empty_value()
+        for columnIndex in range(Board.BOARD_SIZE):
+            self.assertEqual( createdColumn[columnIndex], Board.EMPTY_VALUE) 
+
+class TestPlacePlayerMarkerOnBoardAtPosition(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_board_intially_empty_marked(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self.assertEqual( self._board._boardGrid[boardXPosition][boardYPosition], Board.EMPTY_VALUE)  
+
+    def test_marking_random_position_player1(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self._board = Board()
+                self._board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
+                self.assertTrue( self._board._boardGrid[boardXPosition][boardYPosition], Board.PLAYER_TOKEN_VALUE[1 - 1] )
+                self._board = None
+
+    def test_marking_random_position_player2(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self._board = Board()
+                self._board.placePlayerMarkerOnBoardAtPosition(2, boardXPosition, boardYPosition)
+                self.assertTrue( self._board._boardGrid[boardXPosition][boardYPosition], Board.PLAYER_TOKEN_VALUE[2 - 1] )
+                self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_marking_valid_positions_with_player_number_too_high(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for player in range(2,100):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (player, boardXPosition, boardYPosition) )
+                    self._board = None 
+
+    def test_marking_valid_positions_with_player_number_too_low(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for player in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (player, boardXPosition, boardYPosition) )
+                    self._board = None 
+
+    def test_marking_valid_positions_with_player_number_invalid_type(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for player in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (player, boardXPosition, boardYPosition) )
+                    self._board = None 
+
+    def test_marking_invalid_positions_too_high(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in range(3,100):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
+                    self._board = None 
+                for invalidPosition in range(3,100):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, boardXPosition, invalidPosition) )
+                    self._board = None 
+
+    def test_marking_invalid_positions_too_low(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
+                    self._board = None
+                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
+                    self._board = None 
+
+    def test_marking_invalid_positions_invalid_type(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
+                    self._board = None
+                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, (1, invalidPosition, boardYPosition) )
+                    self._board = None 
+
+class TestGetMarkerOnBoardAtPosition(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_board_intially_empty_marked(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self.assertEqual( self._board.getMarkerAtBoardPosition(boardXPosition,boardYPosition), Board.EMPTY_VALUE)  
+
+    def test_marking_random_position_player1(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self._board = Board()
+                self._board._boardGrid[boardXPosition][boardYPosition] = Board.PLAYER_TOKEN_VALUE[0]
+                self.assertTrue( self._board.getMarkerAtBoardPosition(boardXPosition,boardYPosition), Board.PLAYER_TOKEN_VALUE[1 - 1] )
+                self._board = None
+
+
+    def test_marking_random_position_player2(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self._board = Board()
+                self._board._boardGrid[boardXPosition][boardYPosition] = Board.PLAYER_TOKEN_VALUE[1]
+                self.assertTrue( self._board.getMarkerAtBoardPosition(boardXPosition,boardYPosition), Board.PLAYER_TOKEN_VALUE[2 - 1] )
+                self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_marking_invalid_positions_too_high(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in range(3,100):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
+                    self._board = None 
+                for player in range(3,100):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (boardXPosition, invalidPosition) )
+                    self._board = None 
+
+    def test_marking_invalid_positions_too_low(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
+                    self._board = None
+                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
+                    self._board = None 
+
+    def test_marking_invalid_positions_invalid_type(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
+                    self._board = None
+                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
+                    self._board = Board()
+                    self.assertRaises( PreconditionError, self._board.getMarkerAtBoardPosition, (invalidPosition, boardYPosition) )
+                    self._board = None 
+
+class TestGetBoardString(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+    
+
+    _known_empty_board_string = "\n_______\n"+"| | | |\n"+"| | | |\n"+"| | | |\n"+"_______\n"
+    _known_player1_full_board_string = "\n_______\n"+"|O|O|O|\n"+"|O|O|O|\n"+"|O|O|O|\n"+"_______\n"
+    _known_player2_full_board_string = "\n_______\n"+"|X|X|X|\n"+"|X|X|X|\n"+"|X|X|X|\n"+"_______\n"
+    _known_random_board_one_board_string = "\n_______\n"+"|O| |O|\n"+"| | |X|\n"+"|X| | |\n"+"_______\n"
+    _known_random_board_two_board_string = "\n_______\n"+"| | | |\n"+"| |O| |\n"+"|O|X|X|\n"+"_______\n"
+
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_empty_board_string(self):
+        boardString = self._board.getBoardAsString()
+        self.assertEqual(boardString, self._known_empty_board_string)
+
+    def test_full_player1_board_string(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self._board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
+        boardString = self._board.getBoardAsString()
+        self.assertEqual(boardString, self._known_player1_full_board_string)
+
+    def test_full_player2_board_string(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self._board.placePlayerMarkerOnBoardAtPosition(2, boardXPosition, boardYPosition)
+        boardString = self._board.getBoardAsString()
+        self.assertEqual(boardString, self._known_player2_full_board_string)
+
+    def test_random_board_one_board_string(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 2)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 2)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 0)
+        boardString = self._board.getBoardAsString()
+        self.assertEqual(boardString, self._known_random_board_one_board_string)
+
+    def test_random_board_two_board_string(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 2, 0)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 2)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 1)
+        boardString = self._board.getBoardAsString()
+        self.assertEqual(boardString, self._known_random_board_two_board_string)
+
+class TestRenderStyles(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _known_compact_board_string = "O.O/..X/X.."
+    _known_unicode_board_string = ( u"\u250c\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2510\n"
+                                    u"\u2502 \u25cb \u2502   \u2502\n"
+                                    u"\u251c\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2524\n"
+                                    u"\u2502   \u2502 \u2715 \u2502\n"
+                                    u"\u2514\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2518\n" )
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_compact_board_string(self):
+        for playerNumber, boardXPosition, boardYPosition in [(1, 0, 0), (1, 0, 2), (2, 1, 2), (2, 2, 0)]:
+            self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+        self.assertEqual(self._board.getBoardAsString(Board.COMPACT_STYLE), self._known_compact_board_string)
+
+    def test_unicode_board_string(self):
+        self._board = Board(2)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        self.assertEqual(self._board.getBoardAsString(Board.UNICODE_STYLE), self._known_unicode_board_string)
+
+    def test_board_string_is_kept_until_board_changes(self):
+        firstBoardString = self._board.getBoardAsString()
+        self.assertTrue(self._board.getBoardAsString() is firstBoardString)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        secondBoardString = self._board.getBoardAsString()
+        self.assertEqual(secondBoardString, "\n_______\n| | | |\n| |O| |\n| | | |\n_______\n")
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        self.assertTrue(self._board.getBoardAsString() is secondBoardString)
+
+    def test_only_changed_row_is_drawn_again(self):
+        for style in Board.RENDER_STYLES:
+            self._board.getBoardAsString(style)
+        firstRenderedRows = dict((style, list(renderedRows)) for style, renderedRows in self._board._renderedRows.items())
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 1)
+        for style in Board.RENDER_STYLES:
+            renderedRows = self._board._renderedRows[style]
+            self.assertEqual(renderedRows[2], None)
+            self.assertTrue(renderedRows[0] is firstRenderedRows[style][0])
+            self.assertTrue(renderedRows[1] is firstRenderedRows[style][1])
+        self.assertEqual(self._board.getBoardAsString(Board.COMPACT_STYLE), ".../.../.X.")
+
+    def test_every_style_on_larger_board(self):
+        self._board = Board(5, 4)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 4, 4)
+        self.assertEqual(self._board.getBoardAsString(Board.COMPACT_STYLE), "...../...../...../...../....O")
+        self.assertEqual(self._board.getBoardAsString(Board.UNICODE_STYLE).count(u"\u25cb"), 1)
+        self.assertEqual(len(self._board.getBoardAsString().split("\n")), 5 + 4)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_style(self):
+        for invalidStyle in ("fancy", 1, ""):
+            self.assertRaises(PreconditionError, self._board.getBoardAsString, invalidStyle)
+
+class TestBoardPool(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        Board._freeBoards.clear()
+
+    def tearDown(self):
+        Board._freeBoards.clear()
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_released_board_is_reused_empty(self):
+        board = Board.acquireBoard()
+        for playerNumber, boardXPosition, boardYPosition in [(1, 0, 0), (1, 0, 1), (1, 0, 2), (2, 1, 1)]:
+            board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+        board.getBoardAsString()
+        board.releaseBoard()
+        reusedBoard = Board.acquireBoard(3, 3)
+        self.assertTrue(reusedBoard is board)
+        self.assertEqual(reusedBoard.getBoardAsString(), Board().getBoardAsString())
+        self.assertEqual((reusedBoard.winner(), reusedBoard.isGameOver()), (None, False))
+        reusedBoard.placePlayerMarkerOnBoardAtPosition(2, 2, 0)
+        reusedBoard.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        reusedBoard.placePlayerMarkerOnBoardAtPosition(2, 0, 2)
+        self.assertEqual(reusedBoard.winner(), 2)
+
+    def test_boards_are_reused_only_for_same_size(self):
+        board = Board.acquireBoard(4, 3)
+        board.releaseBoard()
+        self.assertFalse(Board.acquireBoard(4) is board)
+        self.assertFalse(Board.acquireBoard() is board)
+        self.assertTrue(Board.acquireBoard(4, 3) is board)
+
+    def test_board_has_fixed_layout(self):
+        board = Board()
+        self.assertFalse(hasattr(board, "__dict__"))
+        self.assertRaises(AttributeError, setattr, board, "_unknownAttribute", 1)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_acquire_invalid_board(self):
+        self.assertRaises(PreconditionError, Board.acquireBoard, 0)
+        self.assertRaises(PreconditionError, Board.acquireBoard, 3, 4)
+
+class TestLegalMoves(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+
+    def _get_empty_positions_by_reading_board(self):
+        boardSize = self._board.getBoardSize()
+        return [ (boardXPosition, boardYPosition) for boardXPosition in range(boardSize) for boardYPosition in range(boardSize)
+                 if self._board.getMarkerAtBoardPosition(boardXPosition, boardYPosition) == Board.EMPTY_VALUE ]
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_empty_board_has_every_move(self):
+        self.assertEqual(sorted(self._board.getLegalMoves()), self._get_empty_positions_by_reading_board())
+        self.assertEqual(self._board.getNumberOfLegalMoves(), 9)
+
+    def test_legal_moves_follow_random_placements(self):
+        randomGenerator = random.Random(5)
+        for boardSize, winLength in [(3, 3), (4, 3), (7, 5)]:
+            self._board = Board(boardSize, winLength)
+            for _ in range(boardSize * boardSize * 2):
+                self._board.placePlayerMarkerOnBoardAtPosition( randomGenerator.choice([1, 2]),
+                                                                randomGenerator.randrange(boardSize),
+                                                                randomGenerator.randrange(boardSize) )
+                emptyPositions = self._get_empty_positions_by_reading_board()
+                self.assertEqual(sorted(self._board.getLegalMoves()), emptyPositions)
+                self.assertEqual(self._board.getNumberOfLegalMoves(), len(emptyPositions))
+
+    def test_replacing_marker_keeps_legal_moves(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        self.assertEqual(self._board.getNumberOfLegalMoves(), 8)
+        self.assertFalse((1, 1) in self._board.getLegalMoves())
+
+    def test_random_legal_move_is_uniform_over_empty_positions(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 2)
+        randomGenerator = random.Random(11)
+        moveCounts = {}
+        for _ in range(7000):
+            move = self._board.getRandomLegalMove(randomGenerator)
+            moveCounts[move] = moveCounts.get(move, 0) + 1
+        self.assertEqual(sorted(moveCounts), self._get_empty_positions_by_reading_board())
+        self.assertTrue(all(800 < moveCount < 1200 for moveCount in moveCounts.values()))
+
+    def test_released_board_has_every_move_again(self):
+        Board._freeBoards.clear()
+        for boardXPosition in range(3):
+            self._board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, 1)
+        self._board.releaseBoard()
+        reusedBoard = Board.acquireBoard()
+        self.assertEqual(sorted(reusedBoard.getLegalMoves()), list(Board._get_board_positions(3)))
+        reusedBoard.placePlayerMarkerOnBoardAtPosition(2, 2, 2)
+        self.assertEqual(reusedBoard.getNumberOfLegalMoves(), 8)
+        Board._freeBoards.clear()
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_full_board_has_no_legal_move(self):
+        for boardXPosition in range(3):
+            for boardYPosition in range(3):
+                self._board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
+        self.assertEqual(self._board.getLegalMoves(), [])
+        self.assertEqual(self._board.getNumberOfLegalMoves(), 0)
+        self.assertEqual(self._board.getRandomLegalMove(), None)
+
+    def test_random_legal_move_with_invalid_generator(self):
+        for invalidGenerator in (1, "random", [0.5]):
+            self.assertRaises(PreconditionError, self._board.getRandomLegalMove, invalidGenerator)
+
+class TestMoveHistory(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+
+    def _get_board_state(self):
+        return ( self._board.getBoardAsString(Board.COMPACT_STYLE), self._board.winner(), self._board.isDraw(),
+                 sorted(self._board.getLegalMoves()), self._board._lineMarkerCounts, self._board._numberOfCompletedLines )
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_undo_and_redo_restore_every_state(self):
+        randomGenerator = random.Random(3)
+        for boardSize, winLength in [(3, 3), (4, 3), (5, 4)]:
+            self._board = Board(boardSize, winLength)
+            boardStates = [repr(self._get_board_state())]
+            placements = []
+            for _ in range(boardSize * boardSize * 2):
+                placement = (randomGenerator.choice([1, 2]), randomGenerator.randrange(boardSize), randomGenerator.randrange(boardSize))
+                self._board.placePlayerMarkerOnBoardAtPosition(*placement)
+                boardStates += [repr(self._get_board_state())]
+                placements += [placement]
+            self.assertEqual(self._board.getMoveHistory(), placements)
+            for placementIndex in reversed(range(len(placements))):
+                self.assertEqual(self._board.undoMove(), placements[placementIndex])
+                self.assertEqual(repr(self._get_board_state()), boardStates[placementIndex])
+            for placementIndex in range(len(placements)):
+                self.assertEqual(self._board.redoMove(), placements[placementIndex])
+                self.assertEqual(repr(self._get_board_state()), boardStates[placementIndex + 1])
+
+    def test_undo_restores_win_and_draw(self):
+        drawnGame = TestGameResult._known_drawn_game
+        for playerNumber, boardXPosition, boardYPosition in drawnGame:
+            self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+        self.assertTrue(self._board.isDraw())
+        self.assertEqual(self._board.undoMove(), drawnGame[-1])
+        self.assertFalse(self._board.isGameOver())
+        self.assertEqual(self._board.getLegalMoves(), [drawnGame[-1][1:]])
+        self._board.redoMove()
+        self.assertTrue(self._board.isDraw())
+        for _ in range(3):
+            self._board.undoMove()
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 1)
+        self.assertEqual(self._board.winner(), 1)
+        self._board.undoMove()
+        self.assertEqual(self._board.winner(), None)
+
+    def test_new_placement_ends_redo(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self._board.undoMove()
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        self.assertEqual(self._board.redoMove(), None)
+        self.assertEqual(self._board.getLastMove(), (2, 1, 1))
+
+    def test_released_board_has_no_history(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self._board.undoMove()
+        self._board._clear()
+        self.assertEqual((self._board.getLastMove(), self._board.undoMove(), self._board.redoMove()), (None, None, None))
+
+    def test_start_from_position(self):
+        for playerNumber in [1, 2]:
+            for boardYPosition in range(3):
+                self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, playerNumber - 1, boardYPosition)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 2, 2)
+        self._board.undoMove()
+        self.assertEqual(self._board.winner(), 1)
+        self._board.startFromPosition(2)
+        self.assertEqual(self._board.winner(), 2)
+        self.assertEqual((self._board.getLastMove(), self._board.undoMove(), self._board.redoMove()), (None, None, None))
+        self.assertEqual(self._board.getMoveHistory(), [])
+        self.assertEqual(self._board.getMarkerAtBoardPosition(1, 1), Board.PLAYER_TOKEN_VALUE[1])
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_nothing_to_undo_or_redo(self):
+        self.assertEqual(self._board.undoMove(), None)
+        self.assertEqual(self._board.redoMove(), None)
+        self.assertEqual(self._board.getLastMove(), None)
+        self.assertEqual(self._board.getMoveHistory(), [])
+
+    def test_start_from_position_with_invalid_winner(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        for winningPlayerNumber in [0, 3, "1", 1, 2]:
+            self.assertRaises(PreconditionError, self._board.startFromPosition, winningPlayerNumber)
+
+class TestGameResult(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    _known_drawn_game = [(1, 0, 0), (2, 1, 1), (1, 0, 2), (2, 0, 1), (1, 2, 1), (2, 1, 2), (1, 1, 0), (2, 2, 0), (1, 2, 2)]
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+
+    def _place_markers(self, markers):
+        for playerNumber, boardXPosition, boardYPosition in markers:
+            self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_empty_board_has_no_result(self):
+        self.assertFalse(self._board.isWon(1))
+        self.assertFalse(self._board.isWon(2))
+        self.assertEqual(self._board.winner(), None)
+        self.assertFalse(self._board.isDraw())
+        self.assertFalse(self._board.isGameOver())
+
+    def test_every_winning_line_for_each_player(self):
+        for winningLine in Board.WINNING_LINES:
+            for playerNumber in [1, 2]:
+                self._board = Board()
+                self._place_markers([(playerNumber, boardXPosition, boardYPosition) for boardXPosition, boardYPosition in winningLine])
+                self.assertTrue(self._board.isWon(playerNumber))
+                self.assertFalse(self._board.isWon(3 - playerNumber))
+                self.assertEqual(self._board.winner(), playerNumber)
+                self.assertFalse(self._board.isDraw())
+                self.assertTrue(self._board.isGameOver())
+
+    def test_incomplete_line_is_not_won(self):
+        self._place_markers([(1, 0, 0), (1, 0, 1), (2, 0, 2)])
+        self.assertEqual(self._board.winner(), None)
+        self.assertFalse(self._board.isGameOver())
+
+    def test_drawn_game(self):
+        self._place_markers(self._known_drawn_game[:-1])
+        self.assertFalse(self._board.isDraw())
+        self._place_markers(self._known_drawn_game[-1:])
+        self.assertTrue(self._board.isDraw())
+        self.assertEqual(self._board.winner(), None)
+        self.assertTrue(self._board.isGameOver())
+
+    def test_replacing_marker_breaks_win(self):
+        self._place_markers([(1, 0, 0), (1, 1, 1), (1, 2, 2)])
+        self.assertEqual(self._board.winner(), 1)
+        self._place_markers([(2, 1, 1)])
+        self.assertFalse(self._board.isWon(1))
+        self.assertEqual(self._board.winner(), None)
+
+    def test_replacing_same_marker_keeps_counts(self):
+        self._place_markers([(1, 0, 0), (1, 0, 0), (1, 0, 1)])
+        self.assertFalse(self._board.isWon(1))
+        self._place_markers([(1, 0, 2)])
+        self.assertTrue(self._board.isWon(1))
+
+    def test_first_completed_line_wins(self):
+        self._place_markers([(1, 0, 0), (1, 0, 1), (1, 0, 2), (2, 2, 0), (2, 2, 1), (2, 2, 2)])
+        self.assertEqual(self._board.winner(), 1)
+        self._place_markers([(2, 0, 0)])
+        self.assertEqual(self._board.winner(), 2)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_is_won_with_invalid_player_number(self):
+        for playerNumber in (0, 3, -1, 1.0, "1", [1], (1, 2)):
+            self.assertRaises(PreconditionError, self._board.isWon, playerNumber)
+
+class TestLargerBoards(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _known_board_sizes_and_numbers_of_winning_lines = [(3, 3, 8), (4, 4, 10), (4, 3, 24), (7, 5, 60), (1, 1, 4)]
+
+    _known_four_by_four_board_string = "\n_________\n"+"|O| | | |\n"+"| | | | |\n"+"| | | | |\n"+"| | | |X|\n"+"_________\n"
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_default_board_size(self):
+        board = Board()
+        self.assertEqual(board.getBoardSize(), Board.BOARD_SIZE)
+        self.assertEqual(board.getWinLength(), Board.BOARD_SIZE)
+        self.assertEqual(board.getWinningLines(), Board.WINNING_LINES)
+
+    def test_number_of_winning_lines(self):
+        for boardSize, winLength, numberOfWinningLines in self._known_board_sizes_and_numbers_of_winning_lines:
+            self.assertEqual(len(Board(boardSize, winLength).getWinningLines()), numberOfWinningLines)
+
+    def test_every_position_is_marked_on_larger_board(self):
+        board = Board(7, 5)
+        for boardXPosition in range(7):
+            for boardYPosition in range(7):
+                board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
+                self.assertEqual(board.getMarkerAtBoardPosition(boardXPosition, boardYPosition), Board.PLAYER_TOKEN_VALUE[0])
+
+    def test_win_needs_win_length_in_a_row(self):
+        board = Board(7, 5)
+        for boardPosition in range(1, 5):
+            board.placePlayerMarkerOnBoardAtPosition(2, boardPosition, boardPosition)
+        self.assertFalse(board.isWon(2))
+        board.placePlayerMarkerOnBoardAtPosition(2, 5, 5)
+        self.assertTrue(board.isWon(2))
+        self.assertEqual(board.winner(), 2)
+
+    def test_win_on_shorter_anti_diagonal(self):
+        board = Board(4, 3)
+        for boardXPosition, boardYPosition in [(1, 3), (2, 2), (3, 1)]:
+            board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
+        self.assertTrue(board.isWon(1))
+
+    def test_larger_board_string(self):
+        board = Board(4)
+        board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        board.placePlayerMarkerOnBoardAtPosition(2, 3, 3)
+        self.assertEqual(board.getBoardAsString(), self._known_four_by_four_board_string)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_positions_outside_larger_board(self):
+        board = Board(5, 4)
+        for invalidPosition in (-1, 5, 6, 100):
+            self.assertRaises(PreconditionError, board.placePlayerMarkerOnBoardAtPosition, 1, invalidPosition, 0)
+            self.assertRaises(PreconditionError, board.placePlayerMarkerOnBoardAtPosition, 1, 0, invalidPosition)
+            self.assertRaises(PreconditionError, board.getMarkerAtBoardPosition, invalidPosition, 0)
+            self.assertRaises(PreconditionError, board.getMarkerAtBoardPosition, 0, invalidPosition)
+
+    def test_invalid_board_size(self):
+        for invalidBoardSize in (0, -3, 3.0, "3", [3]):
+            self.assertRaises(PreconditionError, Board, invalidBoardSize)
+
+    def test_invalid_win_length(self):
+        for invalidWinLength in (0, -1, 4, 3.0, "3"):
+            self.assertRaises(PreconditionError, Board, 3, invalidWinLength)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+    
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
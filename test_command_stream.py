@@ -0,0 +1,159 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import tempfile
+import os
+from StringIO import StringIO
+from conditions import PreconditionError
+from game_command import GameCommand
+from board import Board
+from bit_board import BitBoard
+from command_stream import CommandStreamError, formatCommandLine, parseCommandLine, readCommandBatches, replayCommandStream
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestParseCommandLine(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_known_command_lines(self):
+        self.assertEqual(parseCommandLine("MOVE 1 0 2\n", 4), (4, 0, GameCommand.MOVE_COMMAND, 1, 0, 2))
+        self.assertEqual(parseCommandLine("3 MOVE 2 1 1"), (0, 3, GameCommand.MOVE_COMMAND, 2, 1, 1))
+        self.assertEqual(parseCommandLine("  PRINT  "), (0, 0, GameCommand.PRINT_COMMAND, None, None, None))
+        self.assertEqual(parseCommandLine("1 NOTHING"), (0, 1, GameCommand.NOTHING_COMMAND, None, None, None))
+
+    def test_blank_and_comment_lines(self):
+        for line in ("", "\n", "   ", "# a recorded session"):
+            self.assertEqual(parseCommandLine(line), None)
+
+    def test_format_is_read_back(self):
+        moveCommand = GameCommand(GameCommand.MOVE_COMMAND, 2, 1, 0)
+        self.assertEqual(formatCommandLine(moveCommand), "MOVE 2 1 0")
+        self.assertEqual(parseCommandLine(formatCommandLine(moveCommand, 5)), (0, 5, GameCommand.MOVE_COMMAND, 2, 1, 0))
+        self.assertEqual(formatCommandLine(GameCommand(GameCommand.PRINT_COMMAND)), "PRINT")
+        self.assertEqual(formatCommandLine(GameCommand(GameCommand.NOTHING_COMMAND), 1), "1 NOTHING")
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_command_lines(self):
+        for line in ("JUMP 1 0 0", "MOVE 1 0", "MOVE 1 0 0 0", "MOVE one 0 0", "PRINT 1", "2", "-1 MOVE 1 0 0"):
+            self.assertRaises(CommandStreamError, parseCommandLine, line)
+
+    def test_command_stream_error_is_a_precondition_error(self):
+        self.assertRaises(PreconditionError, parseCommandLine, "JUMP")
+
+class TestReplayCommandStream(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _game_lines = ["# player 1 wins down the first column", "MOVE 1 0 0", "MOVE 2 1 1", "", "MOVE 1 1 0", "MOVE 2 2 2", "MOVE 1 2 0"]
+
+    def setUp(self):
+        self._outputFile = StringIO()
+
+    def tearDown(self):
+        self._outputFile = None
+
+    def _replay_with_game_commands(self, lines, boards):
+        for line in lines:
+            commandRecord = parseCommandLine(line)
+            if commandRecord is not None:
+                lineNumber, boardIndex, commandType, playerNumber, boardXPosition, boardYPosition = commandRecord
+                if commandType == GameCommand.MOVE_COMMAND:
+                    GameCommand(commandType, playerNumber, boardXPosition, boardYPosition, boards[boardIndex].getBoardSize()).executeCommandOnBoard(boards[boardIndex])
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_replay_on_one_board(self):
+        board = Board()
+        self.assertEqual(replayCommandStream(self._game_lines, board), 5)
+        self.assertEqual(board.winner(), 1)
+
+    def test_replay_matches_game_commands_on_many_boards(self):
+        lines = ["{} MOVE {} {} {}".format(boardIndex, (moveNumber % 2) + 1, (moveNumber * 7 + boardIndex) % 4, (moveNumber * 3) % 4)
+                 for moveNumber in range(16) for boardIndex in range(3)]
+        boards = [Board(4, 3), Board(4, 3), BitBoard(4)]
+        expectedBoards = [Board(4, 3), Board(4, 3), BitBoard(4)]
+        self.assertEqual(replayCommandStream(iter(lines), boards, 7), len(lines))
+        self._replay_with_game_commands(lines, expectedBoards)
+        for boardIndex in range(len(boards)):
+            self.assertEqual(boards[boardIndex].getBoardAsString(), expectedBoards[boardIndex].getBoardAsString())
+        self.assertEqual(boards[0].winner(), expectedBoards[0].winner())
+
+    def test_replay_from_file(self):
+        commandFile = tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False)
+        try:
+            commandFile.write("\n".join(self._game_lines + ["PRINT"]) + "\n")
+            commandFile.close()
+            board = Board()
+            self.assertEqual(replayCommandStream(commandFile.name, board, 2, self._outputFile), 6)
+            self.assertEqual(self._outputFile.getvalue(), board.getBoardAsString() + "\n")
+        finally:
+            os.remove(commandFile.name)
+
+    def test_batches_are_read_lazily(self):
+        def endless_lines():
+            while True:
+                yield "MOVE 1 0 0"
+        firstBatch = next(readCommandBatches(endless_lines(), 3))
+        self.assertEqual(len(firstBatch), 3)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_batch_is_not_executed(self):
+        board = Board()
+        lines = ["MOVE 1 0 0", "MOVE 2 1 1", "MOVE 1 3 0", "MOVE 2 2 2"]
+        self.assertRaises(CommandStreamError, replayCommandStream, lines, board, 2)
+        self.assertEqual(board.getMarkerAtBoardPosition(0, 0), Board.PLAYER_TOKEN_VALUE[0])
+        self.assertEqual(board.getMarkerAtBoardPosition(2, 2), Board.EMPTY_VALUE)
+
+    def test_invalid_board_index(self):
+        self.assertRaises(CommandStreamError, replayCommandStream, ["1 MOVE 1 0 0"], Board())
+
+    def test_invalid_player_number(self):
+        self.assertRaises(CommandStreamError, replayCommandStream, ["MOVE 3 0 0"], Board())
+
+    def test_invalid_batch_size(self):
+        self.assertRaises(PreconditionError, replayCommandStream, self._game_lines, Board(), 0)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
@@ -0,0 +1,240 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import instrumentation
+from conditions import preconditions, PreconditionError, ArguementError, getUncheckedFunction
+from conditions import PRECONDITIONS_COMPILED, PRECONDITIONS_INTERPRETED, PRECONDITIONS_DISABLED
+from conditions import getPreconditionMode, setPreconditionMode, _wrap_function_in_preconditions
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestPrecondition(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    ''' Test functions designed to test out different sets of valid preconditions '''
+    @preconditions(     (lambda arg1: arg1 > 2)
+                    and (lambda arg2: arg2 > 2)
+                    and (lambda arg3: arg3 > 2) )
+    def dummyFunctionOne(arg1, arg2, arg3):
+        return True
+
+    @preconditions(     (lambda arg1: arg1 > 20)
+                    and (lambda arg2: arg2 > 29) )
+    def dummyFunctionTwo(arg1, arg2):
+        return True
+
+    ''' Tuples containing the pairs of test functions and aguements for these test functions '''
+    testFunctionPositiveApplicationList = ((dummyFunctionOne, (3, 3, 3)), (dummyFunctionTwo, (30,30)))
+    testFunctionNegativeApplicationList = ((dummyFunctionOne, (1, 3, 3)), (dummyFunctionTwo, (2,30)))
+
+    def setUp(self):
+        pass
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_known_valid_preconditions(self):
+        for testFunction, testFunctionArguements in self.testFunctionPositiveApplicationList:
+            self.assertTrue(testFunction(*testFunctionArguements))  
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_known_invalid_precondition_arguements(self):
+        for testFunction, testFunctionArguements in self.testFunctionNegativeApplicationList:
+            self.assertRaises(PreconditionError, testFunction, *testFunctionArguements) 
+
+class TestPreconditionModes(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _preconditions = ( (lambda self: True),
+                       (lambda playerNumber: (isinstance(playerNumber, int)) and ((playerNumber == 1) or (playerNumber == 2))),
+                       (lambda position: (isinstance(position, int)) and (position >= 0) and (position < 3)) )
+
+    _valid_arguements = [(None, 1, 0), (None, 2, 2), (None, None, 1), (None, 1, None), (None, 1, 2, "extra")]
+
+    _invalid_arguements = [(None, 0, 0), (None, 3, 1), (None, 1, 3), (None, "1", 1), (None, 1, -1), (None, 1.0, 1)]
+
+    _short_arguements = [(None,), (None, 1)]
+
+    def _dummy_function(self, *args):
+        return args
+
+    def _create_wrapped_functions(self):
+        return [ _wrap_function_in_preconditions(self._dummy_function.__func__, self._preconditions, mode)
+                 for mode in (PRECONDITIONS_INTERPRETED, PRECONDITIONS_COMPILED) ]
+
+    def setUp(self):
+        self._previous_precondition_mode = getPreconditionMode()
+
+    def tearDown(self):
+        setPreconditionMode(self._previous_precondition_mode)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_checked_modes_accept_valid_arguements(self):
+        for wrappedFunction in self._create_wrapped_functions():
+            for arguements in self._valid_arguements:
+                self.assertEqual(wrappedFunction(*arguements), arguements[1:])
+
+    def test_checked_modes_skip_missing_arguements(self):
+        for wrappedFunction in self._create_wrapped_functions():
+            for arguements in self._short_arguements:
+                self.assertEqual(wrappedFunction(*arguements), arguements[1:])
+
+    def test_keyword_arguements_are_checked_at_their_position(self):
+        def dummyFunction(self, playerNumber, position=None):
+            return (playerNumber, position)
+        for mode in (PRECONDITIONS_INTERPRETED, PRECONDITIONS_COMPILED, PRECONDITIONS_DISABLED):
+            wrappedFunction = _wrap_function_in_preconditions(dummyFunction, self._preconditions, mode)
+            self.assertEqual(wrappedFunction(None, 1, position=2), (1, 2))
+            self.assertEqual(wrappedFunction(None, position=2, playerNumber=2), (2, 2))
+            self.assertEqual(wrappedFunction(None, playerNumber=1), (1, None))
+            self.assertRaises(TypeError, wrappedFunction, None, 1, playerNumber=1)
+            self.assertRaises(TypeError, wrappedFunction, None, 1, size=1)
+            if mode != PRECONDITIONS_DISABLED:
+                self.assertRaises(PreconditionError, wrappedFunction, None, 1, position=3)
+                self.assertRaises(PreconditionError, wrappedFunction, None, position=0, playerNumber=3)
+
+    def test_keyword_arguements_of_a_board(self):
+        from board import Board
+        self.assertEqual(Board(4, winLength=3).getWinLength(), 3)
+        self.assertEqual(Board().getBoardAsString(style=Board.COMPACT_STYLE), ".../.../...")
+        if getPreconditionMode() != PRECONDITIONS_DISABLED:
+            self.assertRaises(PreconditionError, Board().getBoardAsString, style="fancy")
+
+    def test_disabled_mode_returns_undecorated_function(self):
+        function = self._dummy_function.__func__
+        self.assertTrue(_wrap_function_in_preconditions(function, self._preconditions, PRECONDITIONS_DISABLED) is function)
+
+    def test_disabled_mode_skips_checks(self):
+        setPreconditionMode(PRECONDITIONS_DISABLED)
+        @preconditions( (lambda arg1: arg1 > 2) )
+        def dummyFunction(arg1):
+            return True
+        self.assertTrue(dummyFunction(1))
+
+    def test_compiled_mode_keeps_function_name(self):
+        setPreconditionMode(PRECONDITIONS_COMPILED)
+        @preconditions( (lambda arg1: arg1 > 2) )
+        def dummyFunction(arg1):
+            return True
+        self.assertEqual(dummyFunction.__name__, "dummyFunction")
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_checked_modes_reject_invalid_arguements(self):
+        for wrappedFunction in self._create_wrapped_functions():
+            for arguements in self._invalid_arguements:
+                self.assertRaises(PreconditionError, wrappedFunction, *arguements)
+
+    def test_instance_precondition_is_given_first_arguement(self):
+        instancePreconditions = ( (lambda self: True),
+                                  (lambda self, position: position < self) )
+        for mode in (PRECONDITIONS_INTERPRETED, PRECONDITIONS_COMPILED):
+            wrappedFunction = _wrap_function_in_preconditions(self._dummy_function.__func__, instancePreconditions, mode)
+            self.assertEqual(wrappedFunction(5, 4), (4,))
+            self.assertRaises(PreconditionError, wrappedFunction, 5, 5)
+
+    def test_unchecked_function_skips_checks(self):
+        for wrappedFunction in self._create_wrapped_functions():
+            self.assertTrue(getUncheckedFunction(wrappedFunction) is self._dummy_function.__func__)
+            self.assertEqual(getUncheckedFunction(wrappedFunction)(None, -1, -1), (-1, -1))
+        self.assertTrue(getUncheckedFunction(self._dummy_function.__func__) is self._dummy_function.__func__)
+
+    def test_invalid_precondition_mode(self):
+        self.assertRaises(ArguementError, setPreconditionMode, "fast")
+
+class TestPreconditionInstrumentation(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    class _DummyClass:
+        @preconditions( (lambda self: True),
+                        (lambda position: position >= 0) )
+        def dummyMethod(self, position):
+            return position
+
+    def setUp(self):
+        instrumentation.resetInstrumentation()
+        instrumentation.enableInstrumentation()
+
+    def tearDown(self):
+        instrumentation.disableInstrumentation()
+        instrumentation.resetInstrumentation()
+
+    def _create_wrapped_functions(self):
+        return [ _wrap_function_in_preconditions(TestPreconditionModes._dummy_function.__func__, TestPreconditionModes._preconditions, mode, "preconditions.dummy")
+                 for mode in (PRECONDITIONS_INTERPRETED, PRECONDITIONS_COMPILED) ]
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_checks_are_timed_and_rejections_counted(self):
+        for wrappedFunction in self._create_wrapped_functions():
+            self.assertEqual(wrappedFunction(None, 1, 2), (1, 2))
+            self.assertRaises(PreconditionError, wrappedFunction, None, 3, 2)
+        snapshot = instrumentation.getSnapshot()
+        self.assertEqual(snapshot["latencies"]["preconditions.dummy"]["count"], 4)
+        self.assertEqual(snapshot["counters"], {"preconditions.dummy.rejections": 2})
+
+    def test_metrics_are_named_for_the_class(self):
+        dummyObject = self._DummyClass()
+        dummyObject.dummyMethod(1)
+        self.assertRaises(PreconditionError, dummyObject.dummyMethod, -1)
+        self.assertEqual(instrumentation.getCounter("preconditions.%s._DummyClass.dummyMethod.rejections" % __name__), 1)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_nothing_is_collected_when_disabled(self):
+        instrumentation.disableInstrumentation()
+        for wrappedFunction in self._create_wrapped_functions():
+            wrappedFunction(None, 1, 2)
+            self.assertRaises(PreconditionError, wrappedFunction, None, 3, 2)
+        self.assertEqual(instrumentation.getSnapshot()["latencies"], {})
+        self.assertEqual(instrumentation.getSnapshot()["counters"], {})
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
@@ -0,0 +1,569 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+from conditions import PreconditionError
+from board import Board
+from alpha_beta import AlphaBetaEngine
+from game_command import GameCommand
+import instrumentation
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestConstructor(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _player_numbers = [1,2]
+
+    _known_constructor_invalid_arguement_number_for_nothing_command = [(GameCommand.NOTHING_COMMAND, 1),
+                                                                     (GameCommand.NOTHING_COMMAND, 1, 1),
+                                                                     (GameCommand.NOTHING_COMMAND, 1, 1, 1)] 
+
+    _known_constructor_invalid_arguement_number_for_print_command = [(GameCommand.PRINT_COMMAND, 1),
+                                                                     (GameCommand.PRINT_COMMAND, 1, 1),
+                                                                     (GameCommand.PRINT_COMMAND, 1, 1, 1)]
+    _known_constructor_invalid_arguement_number_for_move_command =  [(GameCommand.MOVE_COMMAND),
+                                                                     (GameCommand.MOVE_COMMAND, 1),
+                                                                     (GameCommand.MOVE_COMMAND, 1, 1),
+                                                                     (GameCommand.MOVE_COMMAND, 1, 1, 1, 1) ]
+    _invalid_player_numbers = [0, 3, 4, 5, 6, 7, 8, 9]
+
+    _invalid_board_positions = [-1, 3, 4, 5, 6, 7, 8, 9]
+
+    _invalid_types = [1.2, "hello", (1, 2), []]
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+    	pass
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction_for_nothing_command(self):
+        printCommand = GameCommand(GameCommand.NOTHING_COMMAND)
+        self.assertEqual(printCommand._commandType, GameCommand.NOTHING_COMMAND)
+
+    def test_construction_for_print_command(self):
+        printCommand = GameCommand(GameCommand.PRINT_COMMAND)
+        self.assertEqual(printCommand._commandType, GameCommand.PRINT_COMMAND)
+
+    def test_construction_for_move_command_for_correct_player_number(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for playerNumber in self._player_numbers:
+                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)
+                    self.assertEqual(moveCommand._playerNumber, playerNumber)  
+
+    def test_construction_for_move_command_for_correct_x_position(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for playerNumber in self._player_numbers:
+                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)
+                    self.assertEqual( moveCommand._xBoardPosition, boardXPosition)  
+
+    def test_construction_for_move_command_for_correct_y_position(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for playerNumber in self._player_numbers:
+                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)
+                    self.assertEqual( moveCommand._yBoardPosition, boardYPosition)  
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction_for_invalid_numbers_of_arguements_for_nothing_command(self):
+        for invalid_constructor_arguements in self._known_constructor_invalid_arguement_number_for_nothing_command:
+            self.assertRaises(PreconditionError, GameCommand, (invalid_constructor_arguements))
+
+    def test_construction_for_invalid_numbers_of_arguements_for_print_command(self):
+        for invalid_constructor_arguements in self._known_constructor_invalid_arguement_number_for_print_command:
+            self.assertRaises(PreconditionError, GameCommand, (invalid_constructor_arguements))
+
+    def test_construction_for_invalid_numbers_of_arguements_for_move_command(self):
+        for invalid_constructor_arguements in self._known_constructor_invalid_arguement_number_for_move_command:
+            self.assertRaises(PreconditionError, GameCommand, (invalid_constructor_arguements))
+
+    def test_construction_for_invalid_player_number_for_move_command(self):
+        for invalid_player_number in self._invalid_player_numbers:
+            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, invalid_player_number, 1, 1))
+
+    def test_construction_for_invalid_x_board_position_for_move_command(self):
+        for invalid_x_board_position in self._invalid_board_positions:
+            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, invalid_x_board_position, 1))
+
+    def test_construction_for_invalid_y_board_position_for_move_command(self):
+        for invalid_y_board_position in self._invalid_board_positions:
+            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, 1, invalid_y_board_position))
+
+    def test_construction_for_invalid_player_type_for_move_command(self):
+        for invalid_player_type in self._invalid_types:
+            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, invalid_player_type, 1, 1))
+
+    def test_construction_for_invalid_x_type_for_move_command(self):
+        for invalid_x_type in self._invalid_types:
+            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, invalid_x_type, 1))
+
+    def test_construction_for_invalid_y_type_for_move_command(self):
+        for invalid_y_type in self._invalid_types:
+            self.assertRaises(PreconditionError, GameCommand, (GameCommand.MOVE_COMMAND, 1, 1, invalid_y_type))
+
+    def test_constructor_move_command_valid_positions_with_player_number_too_high(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for playerNumber in range(2,100):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition) )
+
+    def test_constructor_move_command_valid_positions_with_player_number_too_low(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for playerNumber in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition) )
+
+    def test_constructor_move_command_valid_positions_with_player_number_invalid_type(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for playerNumber in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition) ) 
+
+    def test_constructor_move_command_invalid_positions_too_high(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in range(3,100):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, invalidPosition, boardYPosition) )
+                for invalidPosition in range(3,100):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, boardXPosition, invalidPosition) ) 
+
+    def test_constructor_move_command_invalid_positions_too_low(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, invalidPosition, boardYPosition) )
+                for invalidPosition in (0, -1, -2, -3, -4, -5, -6, -7):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, boardXPosition, invalidPosition) )
+
+    def test_constructor_move_command_invalid_positions_invalid_type(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):       
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, invalidPosition, boardYPosition) )
+                for invalidPosition in (0.0, -1.134234, "asd", [1, 2], (1, 2)):
+                    self.assertRaises( PreconditionError, GameCommand,( GameCommand.MOVE_COMMAND, 1, boardXPosition, invalidPosition) )
+
+class TestExecuteCommandOnBoard(unittest.TestCase):
+ 
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _game_command = None
+    _board = None
+
+    _known_empty_board_string = "\n_______\n"+"| | | |\n"+"| | | |\n"+"| | | |\n"+"_______\n"
+    _known_player1_full_board_string = "\n_______\n"+"|O|O|O|\n"+"|O|O|O|\n"+"|O|O|O|\n"+"_______\n"
+    _known_player2_full_board_string = "\n_______\n"+"|X|X|X|\n"+"|X|X|X|\n"+"|X|X|X|\n"+"_______\n"
+    _known_random_board_one_board_string = "\n_______\n"+"|O| |O|\n"+"| | |X|\n"+"|X| | |\n"+"_______\n"
+    _known_random_board_two_board_string = "\n_______\n"+"| | | |\n"+"| |O| |\n"+"|O|X|X|\n"+"_______\n"
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+
+    def __setup_random_board_two(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 1, 1)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 2, 0)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 2)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 1)
+
+    def __setup_random_board_one(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 2)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 2)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 2, 0)
+
+    def _print_interactive_user_message_for_test_board_description_and_string(self, boardDescription, boardString):
+        print(chr(27) + "[2J") # Just clears terminal screen
+        print("This is the expected "+ boardDescription +":")
+        print(boardString)
+        print("This is the given empty board:")        
+
+    def _request_user_confirmation(self):
+        user_answer = raw_input("Enter <y> if they were or same, or <n> if they were different:\n")
+        if(user_answer == 'y'):
+            return
+        if(user_answer == 'n'):
+            raise Exception('Test Failed')
+        raise Exception('Incorrect user testing arguement: Test Discounted and Failed')
+
+    def __setup_full_board_for_player_number(self, playerNumber):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_execute_move_command(self):
+        for boardXPosition in range(Board.BOARD_SIZE):
+            for boardYPosition in range(Board.BOARD_SIZE):
+                for playerNumber in [1, 2]:
+                    moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition)        
+                    moveCommand.executeCommandOnBoard(self._board)
+                    self.assertEqual(self._board.getMarkerAtBoardPosition(boardXPosition, boardYPosition), playerNumber)
+
+    def test_empty_board_print_command(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
+            return
+        self._print_interactive_user_message_for_test_board_description_and_string("empty board", self._known_empty_board_string)
+        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
+        moveCommand.executeCommandOnBoard(self._board)
+        try:
+            self._request_user_confirmation()
+        except Exception:
+            raise Exception
+
+    def test_full_player1_board_print_command(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
+            return
+        self._print_interactive_user_message_for_test_board_description_and_string("full player 1 board", self._known_player1_full_board_string)
+        self.__setup_full_board_for_player_number(1)
+        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
+        moveCommand.executeCommandOnBoard(self._board)
+        try:
+            self._request_user_confirmation()
+        except Exception:
+            raise Exception
+
+    def test_full_player2_board_print_command(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
+            return
+        self._print_interactive_user_message_for_test_board_description_and_string("full player 2 board", self._known_player2_full_board_string)
+        self.__setup_full_board_for_player_number(2)
+        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
+        moveCommand.executeCommandOnBoard(self._board)
+        try:
+            self._request_user_confirmation()
+        except Exception:
+            raise Exception
+
+    def test_random_board_one_board_print_command(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
+            return
+        self._print_interactive_user_message_for_test_board_description_and_string("random board one", self._known_random_board_one_board_string)
+        self.__setup_random_board_one()
+        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
+        moveCommand.executeCommandOnBoard(self._board)
+        try:
+            self._request_user_confirmation()
+        except Exception:
+            raise Exception
+
+    def test_random_board_two_board_print_command(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'test_execute_print_command' is not run on this testing mode.>")
+            return 
+        self._print_interactive_user_message_for_test_board_description_and_string("random board two", self._known_random_board_two_board_string)
+        self.__setup_random_board_two()
+        moveCommand = GameCommand(GameCommand.PRINT_COMMAND)        
+        moveCommand.executeCommandOnBoard(self._board)
+        try:
+            self._request_user_confirmation()
+        except Exception:
+            raise Exception
+
+class TestLargerBoardMoveCommand(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction_for_larger_board(self):
+        moveCommand = GameCommand(GameCommand.MOVE_COMMAND, 2, 6, 5, 7)
+        self.assertEqual((moveCommand._playerNumber, moveCommand._xBoardPosition, moveCommand._yBoardPosition), (2, 6, 5))
+
+    def test_execute_on_larger_board(self):
+        board = Board(7, 5)
+        GameCommand(GameCommand.MOVE_COMMAND, 1, 6, 6, 7).executeCommandOnBoard(board)
+        self.assertEqual(board.getMarkerAtBoardPosition(6, 6), Board.PLAYER_TOKEN_VALUE[0])
+
+    def test_ai_move_on_larger_board(self):
+        board = Board(4, 4)
+        GameCommand(GameCommand.AI_MOVE_COMMAND, 1, AlphaBetaEngine(0.1)).executeCommandOnBoard(board)
+        self.assertEqual(board._numberOfMarkedPositions, 1)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction_outside_larger_board(self):
+        for invalidPosition in (-1, 7, 8, 100):
+            self.assertRaises(PreconditionError, GameCommand, GameCommand.MOVE_COMMAND, 1, invalidPosition, 0, 7)
+            self.assertRaises(PreconditionError, GameCommand, GameCommand.MOVE_COMMAND, 1, 0, invalidPosition, 7)
+
+    def test_construction_with_invalid_board_size(self):
+        for invalidBoardSize in (0, -1, 3.0, "3"):
+            self.assertRaises(PreconditionError, GameCommand, GameCommand.MOVE_COMMAND, 1, 0, 0, invalidBoardSize)
+
+class TestAIMoveCommand(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    class _FixedMoveEngine:
+        def __init__(self, bestMove):
+            self._bestMove = bestMove
+        def getBestMove(self, board, playerNumber):
+            return self._bestMove
+
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction_with_default_engine(self):
+        aiMoveCommand = GameCommand(GameCommand.AI_MOVE_COMMAND, 2)
+        self.assertEqual(aiMoveCommand._commandType, GameCommand.AI_MOVE_COMMAND)
+        self.assertEqual(aiMoveCommand._playerNumber, 2)
+        self.assertTrue(aiMoveCommand._moveEngine is None)
+        self.assertTrue(GameCommand._get_default_move_engine(self._board) is GameCommand.DEFAULT_MOVE_ENGINE)
+        self.assertTrue(GameCommand._get_default_move_engine(Board(4)) is GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE)
+
+    def test_default_engine_is_made_only_for_its_boards(self):
+        defaultMoveEngines = (GameCommand.DEFAULT_MOVE_ENGINE, GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE)
+        GameCommand.DEFAULT_MOVE_ENGINE, GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE = None, None
+        try:
+            GameCommand(GameCommand.AI_MOVE_COMMAND, 1).executeCommandOnBoard(self._board)
+            self.assertFalse(GameCommand.DEFAULT_MOVE_ENGINE is None)
+            self.assertTrue(GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE is None)
+            GameCommand(GameCommand.AI_MOVE_COMMAND, 1).executeCommandOnBoard(Board(4))
+            self.assertFalse(GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE is None)
+        finally:
+            GameCommand.DEFAULT_MOVE_ENGINE, GameCommand.DEFAULT_LARGE_BOARD_MOVE_ENGINE = defaultMoveEngines
+
+    def test_execute_uses_given_engine(self):
+        aiMoveCommand = GameCommand(GameCommand.AI_MOVE_COMMAND, 1, self._FixedMoveEngine((2, 1)))
+        aiMoveCommand.executeCommandOnBoard(self._board)
+        self.assertEqual(self._board.getMarkerAtBoardPosition(2, 1), Board.PLAYER_TOKEN_VALUE[0])
+        self.assertEqual((aiMoveCommand._xBoardPosition, aiMoveCommand._yBoardPosition), (2, 1))
+
+    def test_execute_blocks_opponent(self):
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self._board.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        self._board.placePlayerMarkerOnBoardAtPosition(1, 0, 1)
+        GameCommand(GameCommand.AI_MOVE_COMMAND, 2).executeCommandOnBoard(self._board)
+        self.assertEqual(self._board.getMarkerAtBoardPosition(0, 2), Board.PLAYER_TOKEN_VALUE[1])
+
+    def test_execute_on_finished_game_places_nothing(self):
+        for boardYPosition in range(Board.BOARD_SIZE):
+            self._board.placePlayerMarkerOnBoardAtPosition(1, 0, boardYPosition)
+        boardString = self._board.getBoardAsString()
+        GameCommand(GameCommand.AI_MOVE_COMMAND, 2).executeCommandOnBoard(self._board)
+        self.assertEqual(self._board.getBoardAsString(), boardString)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_construction_with_invalid_player_number(self):
+        for invalidPlayerNumber in (0, 3, 1.0, "1"):
+            self.assertRaises(PreconditionError, GameCommand, GameCommand.AI_MOVE_COMMAND, invalidPlayerNumber)
+
+    def test_construction_with_invalid_engine(self):
+        for invalidMoveEngine in (1, "solver", [], Board()):
+            self.assertRaises(PreconditionError, GameCommand, GameCommand.AI_MOVE_COMMAND, 1, invalidMoveEngine)
+
+class TestUndoCommand(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        self._board = None
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_commands_are_undone_in_reverse_order(self):
+        emptyBoardString = self._board.getBoardAsString()
+        gameCommands = [ GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 0),
+                         GameCommand(GameCommand.PRINT_COMMAND),
+                         GameCommand(GameCommand.AI_MOVE_COMMAND, 2, TestAIMoveCommand._FixedMoveEngine((1, 1))),
+                         GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 1),
+                         GameCommand(GameCommand.NOTHING_COMMAND) ]
+        boardStrings = []
+        for gameCommand in gameCommands:
+            boardStrings += [self._board.getBoardAsString()]
+            if gameCommand._commandType != GameCommand.PRINT_COMMAND:
+                gameCommand.executeCommandOnBoard(self._board)
+        for gameCommand, boardString in reversed(zip(gameCommands, boardStrings)):
+            gameCommand.undoCommandOnBoard(self._board)
+            self.assertEqual(self._board.getBoardAsString(), boardString)
+        self.assertEqual(self._board.getBoardAsString(), emptyBoardString)
+        self.assertEqual(self._board.getMoveHistory(), [])
+
+    def test_undone_move_is_redone(self):
+        moveCommand = GameCommand(GameCommand.MOVE_COMMAND, 2, 2, 1)
+        moveCommand.executeCommandOnBoard(self._board)
+        moveCommand.undoCommandOnBoard(self._board)
+        self.assertEqual(self._board.getMarkerAtBoardPosition(2, 1), Board.EMPTY_VALUE)
+        self.assertEqual(self._board.redoMove(), (2, 2, 1))
+        self.assertEqual(self._board.getMarkerAtBoardPosition(2, 1), Board.PLAYER_TOKEN_VALUE[1])
+
+    def test_ai_move_on_finished_game_undoes_nothing(self):
+        for boardYPosition in range(Board.BOARD_SIZE):
+            self._board.placePlayerMarkerOnBoardAtPosition(1, 0, boardYPosition)
+        aiMoveCommand = GameCommand(GameCommand.AI_MOVE_COMMAND, 2)
+        aiMoveCommand.executeCommandOnBoard(self._board)
+        aiMoveCommand.undoCommandOnBoard(self._board)
+        self.assertEqual(self._board.winner(), 1)
+        self.assertEqual(len(self._board.getMoveHistory()), 3)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_undo_out_of_order(self):
+        firstMoveCommand = GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 0)
+        firstMoveCommand.executeCommandOnBoard(self._board)
+        GameCommand(GameCommand.MOVE_COMMAND, 2, 1, 1).executeCommandOnBoard(self._board)
+        self.assertRaises(PreconditionError, firstMoveCommand.undoCommandOnBoard, self._board)
+        self.assertEqual(self._board.getMarkerAtBoardPosition(1, 1), Board.PLAYER_TOKEN_VALUE[1])
+
+    def test_undo_move_not_executed(self):
+        self.assertRaises(PreconditionError, GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 0).undoCommandOnBoard, self._board)
+
+    def test_undo_on_board_without_history(self):
+        self.assertRaises(PreconditionError, GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 0).undoCommandOnBoard, "board")
+
+class TestCommandPool(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        del GameCommand._freeCommands[:]
+
+    def tearDown(self):
+        del GameCommand._freeCommands[:]
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_released_command_is_reused(self):
+        moveCommand = GameCommand.acquireCommand(GameCommand.MOVE_COMMAND, 2, 1, 0)
+        moveCommand.releaseCommand()
+        printCommand = GameCommand.acquireCommand(GameCommand.PRINT_COMMAND)
+        self.assertTrue(printCommand is moveCommand)
+        self.assertEqual((printCommand._commandType, printCommand._playerNumber, printCommand._xBoardPosition), (GameCommand.PRINT_COMMAND, None, None))
+
+    def test_reused_command_executes(self):
+        GameCommand.acquireCommand(GameCommand.PRINT_COMMAND).releaseCommand()
+        board = Board()
+        GameCommand.acquireCommand(GameCommand.MOVE_COMMAND, 1, 2, 1).executeCommandOnBoard(board)
+        self.assertEqual(board.getMarkerAtBoardPosition(2, 1), Board.PLAYER_TOKEN_VALUE[0])
+
+    def test_every_command_has_same_layout(self):
+        for arguements in [(GameCommand.PRINT_COMMAND,), (GameCommand.MOVE_COMMAND, 1, 0, 0), (GameCommand.AI_MOVE_COMMAND, 1)]:
+            gameCommand = GameCommand(*arguements)
+            self.assertFalse(hasattr(gameCommand, "__dict__"))
+            for attributeName in GameCommand.__slots__:
+                getattr(gameCommand, attributeName)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_command_is_not_taken_from_pool(self):
+        GameCommand.acquireCommand(GameCommand.PRINT_COMMAND).releaseCommand()
+        self.assertRaises(PreconditionError, GameCommand.acquireCommand, GameCommand.MOVE_COMMAND, 3, 0, 0)
+        self.assertEqual(len(GameCommand._freeCommands), 1)
+
+class TestCommandInstrumentation(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        instrumentation.resetInstrumentation()
+        instrumentation.enableInstrumentation()
+        self._board = Board()
+
+    def tearDown(self):
+        instrumentation.disableInstrumentation()
+        instrumentation.resetInstrumentation()
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_commands_are_counted_and_timed_by_type(self):
+        GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 0).executeCommandOnBoard(self._board)
+        GameCommand(GameCommand.MOVE_COMMAND, 2, 1, 1).executeCommandOnBoard(self._board)
+        GameCommand(GameCommand.NOTHING_COMMAND).executeCommandOnBoard(self._board)
+        snapshot = instrumentation.getSnapshot()
+        self.assertEqual((snapshot["counters"]["commands.move"], snapshot["counters"]["commands.nothing"]), (2, 1))
+        self.assertEqual(snapshot["latencies"]["commands.move"]["count"], 2)
+        self.assertTrue(snapshot["latencies"]["preconditions.board.Board.placePlayerMarkerOnBoardAtPosition"]["count"] >= 2)
+
+    def test_rejected_moves_are_counted(self):
+        GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 0).executeCommandOnBoard(self._board)
+        self.assertRaises(PreconditionError, GameCommand(GameCommand.MOVE_COMMAND, 2, 3, 3, 4).executeCommandOnBoard, self._board)
+        self.assertEqual(instrumentation.getCounter("commands.move.rejections"), 1)
+        self.assertEqual(instrumentation.getCounter("preconditions.board.Board.placePlayerMarkerOnBoardAtPosition.rejections"), 1)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_nothing_is_collected_when_disabled(self):
+        instrumentation.disableInstrumentation()
+        GameCommand(GameCommand.MOVE_COMMAND, 1, 0, 0).executeCommandOnBoard(self._board)
+        self.assertEqual(instrumentation.getSnapshot()["counters"], {})
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
@@ -0,0 +1,172 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import os
+import shutil
+import tempfile
+from conditions import PreconditionError
+from board import Board
+from game_command import GameCommand
+from command_stream import replayCommandStream
+from game_log import GameLog, GameLogError, GameLogWriter
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestGameLog(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    # A game on a 7x7 board, each player filling rows from opposite corners until player 1 completes five in a row
+    _larger_board_moves = ( [(1, 0, boardYPosition) for boardYPosition in range(4)] + [(2, 6, boardYPosition) for boardYPosition in range(4)] +
+                            [(1, 2, boardYPosition) for boardYPosition in range(7)] + [(2, 4, boardYPosition) for boardYPosition in range(7)] )
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._logFileName = os.path.join(self._directory, "game.log")
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def _write_game(self, moves, boardSize, winLength, snapshotInterval):
+        # Returns the board after each ply
+        board = Board(boardSize, winLength)
+        boardsAfterEachPly = [board.getBoardAsString(Board.COMPACT_STYLE)]
+        with GameLogWriter(self._logFileName, boardSize, winLength, snapshotInterval) as gameLogWriter:
+            for playerNumber, boardXPosition, boardYPosition in moves:
+                for gameCommand in (GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition, boardSize),
+                                    GameCommand(GameCommand.NOTHING_COMMAND)):
+                    gameCommand.executeCommandOnBoard(board)
+                    gameLogWriter.recordCommand(gameCommand, board)
+                boardsAfterEachPly += [board.getBoardAsString(Board.COMPACT_STYLE)]
+        return boardsAfterEachPly, board
+
+    def _interleave_moves(self, moves):
+        playerOneMoves = [move for move in moves if move[0] == 1]
+        playerTwoMoves = [move for move in moves if move[0] == 2]
+        return [move for movePair in zip(playerOneMoves, playerTwoMoves) for move in movePair]
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_board_at_every_ply(self):
+        moves = self._interleave_moves(self._larger_board_moves)
+        boardsAfterEachPly, board = self._write_game(moves, 7, 5, 4)
+        with GameLog(self._logFileName) as gameLog:
+            self.assertEqual((gameLog.getBoardSize(), gameLog.getWinLength(), gameLog.getSnapshotInterval()), (7, 5, 4))
+            self.assertEqual(gameLog.getNumberOfPlies(), len(moves))
+            self.assertEqual(gameLog.getNumberOfSnapshots(), len(moves) // 4 + 1)
+            for ply in [len(moves), 0, 7, 8, 9, 3] + range(len(moves)):
+                restoredBoard = gameLog.getBoardAtPly(ply)
+                self.assertEqual(restoredBoard.getBoardAsString(Board.COMPACT_STYLE), boardsAfterEachPly[ply])
+            restoredBoard = gameLog.getBoardAtPly(len(moves))
+            self.assertEqual((restoredBoard.winner(), restoredBoard.isGameOver()), (board.winner(), True))
+            self.assertEqual(len(restoredBoard.getLegalMoves()), board.getNumberOfLegalMoves())
+
+    def test_seek_replays_at_most_one_interval(self):
+        moves = self._interleave_moves(self._larger_board_moves)
+        self._write_game(moves, 7, 5, 4)
+        with GameLog(self._logFileName) as gameLog:
+            self.assertEqual(len(gameLog.getBoardAtPly(11).getMoveHistory()), 3)
+            self.assertEqual(len(gameLog.getBoardAtPly(12).getMoveHistory()), 0)
+
+    def test_log_is_a_command_stream(self):
+        moves = [(1, 0, 0), (2, 1, 1), (1, 0, 1), (2, 2, 2), (1, 0, 2)]
+        boardsAfterEachPly, board = self._write_game(moves, 3, 3, 2)
+        replayedBoard = Board()
+        self.assertEqual(replayCommandStream(self._logFileName, replayedBoard), 10)
+        self.assertEqual(replayedBoard.getBoardAsString(Board.COMPACT_STYLE), boardsAfterEachPly[-1])
+        self.assertEqual(replayedBoard.winner(), 1)
+
+    def test_ai_move_is_recorded_as_its_move(self):
+        board = Board()
+        with GameLogWriter(self._logFileName) as gameLogWriter:
+            for playerNumber in (1, 2, 1):
+                aiMoveCommand = GameCommand(GameCommand.AI_MOVE_COMMAND, playerNumber)
+                aiMoveCommand.executeCommandOnBoard(board)
+                gameLogWriter.recordCommand(aiMoveCommand, board)
+            self.assertEqual(gameLogWriter.getPly(), 3)
+        with GameLog(self._logFileName) as gameLog:
+            self.assertEqual(gameLog.getBoardAtPly(3).getBoardAsString(), board.getBoardAsString())
+
+    def test_log_is_read_while_written(self):
+        board = Board(4)
+        gameLogWriter = GameLogWriter(self._logFileName, 4, 4, 2)
+        try:
+            gameLog = GameLog(self._logFileName)
+            for ply, (playerNumber, boardXPosition, boardYPosition) in enumerate([(1, 0, 0), (2, 3, 3), (1, 1, 1)], 1):
+                moveCommand = GameCommand(GameCommand.MOVE_COMMAND, playerNumber, boardXPosition, boardYPosition, 4)
+                moveCommand.executeCommandOnBoard(board)
+                gameLogWriter.recordCommand(moveCommand, board)
+                self.assertEqual(gameLog.getNumberOfPlies(), ply)
+                self.assertEqual(gameLog.getBoardAtPly(ply).getBoardAsString(), board.getBoardAsString())
+            gameLog.close()
+        finally:
+            gameLogWriter.close()
+
+    def test_replaced_markers_keep_the_winner(self):
+        # Player 1 completes a row first, then player 2 completes a column through it, replacing a marker of
+        # the row but not breaking the other rows of player 1
+        moves = [(1, 0, 0), (1, 0, 1), (1, 0, 2), (1, 1, 0), (1, 1, 1), (1, 1, 2), (2, 0, 2), (2, 1, 2), (2, 2, 2)]
+        boardsAfterEachPly, board = self._write_game(moves, 3, 3, 3)
+        with GameLog(self._logFileName) as gameLog:
+            self.assertEqual(gameLog.getBoardAtPly(9).winner(), board.winner())
+            self.assertEqual(gameLog.getBoardAtPly(9).getBoardAsString(), board.getBoardAsString())
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_ply_past_the_end(self):
+        self._write_game([(1, 0, 0), (2, 1, 1)], 3, 3, 8)
+        with GameLog(self._logFileName) as gameLog:
+            self.assertRaises(GameLogError, gameLog.getBoardAtPly, 3)
+            self.assertRaises(PreconditionError, gameLog.getBoardAtPly, -1)
+
+    def test_not_a_game_log(self):
+        with open(self._logFileName, "w") as logFile:
+            logFile.write("MOVE 1 0 0\n")
+        self.assertRaises(GameLogError, GameLog, self._logFileName)
+        self.assertRaises(IOError, GameLog, os.path.join(self._directory, "missing.log"))
+
+    def test_invalid_arguements(self):
+        self.assertRaises(PreconditionError, GameLogWriter, self._logFileName, 3, 4)
+        self.assertRaises(PreconditionError, GameLogWriter, self._logFileName, 3, 3, 0)
+        with GameLogWriter(self._logFileName) as gameLogWriter:
+            self.assertRaises(PreconditionError, gameLogWriter.recordCommand, "MOVE 1 0 0", Board())
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
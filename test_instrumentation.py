@@ -0,0 +1,142 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import json
+import os
+import subprocess
+import tempfile
+import time
+import instrumentation
+from instrumentation import enableInstrumentation, disableInstrumentation, isInstrumentationEnabled, resetInstrumentation
+from instrumentation import incrementCounter, recordLatency, getCounter, getSnapshot, startPeriodicDump, stopPeriodicDump
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestInstrumentation(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        resetInstrumentation()
+        enableInstrumentation()
+
+    def tearDown(self):
+        disableInstrumentation()
+        resetInstrumentation()
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_counters(self):
+        incrementCounter("moves")
+        incrementCounter("moves", 4)
+        self.assertEqual(getCounter("moves"), 5)
+        self.assertEqual(getCounter("unknown"), 0)
+        self.assertEqual(getSnapshot()["counters"], {"moves": 5})
+
+    def test_latency_histogram(self):
+        for latency in [0.000001] * 90 + [0.001] * 10:
+            recordLatency("moves", latency)
+        latencies = getSnapshot()["latencies"]["moves"]
+        self.assertEqual(latencies["count"], 100)
+        self.assertAlmostEqual(latencies["meanSeconds"], 0.0001009)
+        self.assertEqual((latencies["minimumSeconds"], latencies["maximumSeconds"]), (0.000001, 0.001))
+        self.assertTrue(0.000001 <= latencies["percentileSeconds"]["50"] <= 0.000002)
+        self.assertTrue(0.000001 <= latencies["percentileSeconds"]["90"] <= 0.000002)
+        self.assertEqual(latencies["percentileSeconds"]["99"], 0.001)
+        self.assertEqual(sum(latencies["buckets"].values()), 100)
+
+    def test_enable_and_reset(self):
+        disableInstrumentation()
+        self.assertFalse(isInstrumentationEnabled())
+        self.assertFalse(getSnapshot()["enabled"])
+        enableInstrumentation()
+        self.assertTrue(isInstrumentationEnabled())
+        incrementCounter("moves")
+        resetInstrumentation()
+        self.assertEqual(getSnapshot()["counters"], {})
+
+    def test_periodic_dump(self):
+        dumpFile = tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False)
+        dumpFile.close()
+        try:
+            incrementCounter("moves")
+            startPeriodicDump(dumpFile.name, 0.01)
+            time.sleep(0.1)
+            stopPeriodicDump()
+            with open(dumpFile.name) as dumpFileLines:
+                snapshots = [json.loads(snapshotLine) for snapshotLine in dumpFileLines]
+            self.assertTrue(len(snapshots) >= 2)
+            self.assertEqual(snapshots[-1]["counters"], {"moves": 1})
+        finally:
+            os.remove(dumpFile.name)
+
+    def test_dump_from_environment_writes_at_exit(self):
+        # A process much shorter than the dump interval still writes its last snapshot when it exits
+        dumpFile = tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False)
+        dumpFile.close()
+        os.remove(dumpFile.name)
+        environment = dict(os.environ)
+        environment[instrumentation.INSTRUMENTATION_ENVIRONMENT_VARIABLE] = "on"
+        environment[instrumentation.INSTRUMENTATION_DUMP_ENVIRONMENT_VARIABLE] = dumpFile.name
+        try:
+            subprocess.check_call( [sys.executable, "-c", "import instrumentation; instrumentation.incrementCounter('moves', 3)"],
+                                   cwd=os.path.dirname(os.path.abspath(instrumentation.__file__)), env=environment )
+            with open(dumpFile.name) as dumpFileLines:
+                snapshots = [json.loads(snapshotLine) for snapshotLine in dumpFileLines]
+            self.assertEqual(len(snapshots), 1)
+            self.assertEqual(snapshots[0]["counters"], {"moves": 3})
+        finally:
+            if os.path.exists(dumpFile.name):
+                os.remove(dumpFile.name)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_stop_without_dump(self):
+        stopPeriodicDump()
+        self.assertTrue(instrumentation._dumpThread is None)
+
+    def test_latency_of_a_clock_set_back(self):
+        recordLatency("moves", -0.5)
+        latencies = getSnapshot()["latencies"]["moves"]
+        self.assertEqual((latencies["minimumSeconds"], latencies["maximumSeconds"], latencies["meanSeconds"]), (0.0, 0.0, 0.0))
+        self.assertEqual(latencies["buckets"], {"0": 1})
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
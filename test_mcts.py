@@ -0,0 +1,136 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import time
+from conditions import PreconditionError
+from board import Board
+from game_command import GameCommand
+from mcts import MonteCarloEngine
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestGetBestMove(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _engine = None
+
+    def setUp(self):
+        self._engine = self._create_engine(2000, 1)
+
+    def tearDown(self):
+        self._engine.close()
+        self._engine = None
+
+    def _create_engine(self, numberOfIterations, seed, numberOfProcesses=1):
+        return MonteCarloEngine(None, numberOfIterations, numberOfProcesses, MonteCarloEngine.DEFAULT_EXPLORATION_CONSTANT, seed)
+
+    def _create_board(self, boardSize, winLength, markers):
+        board = Board(boardSize, winLength)
+        for playerNumber, boardXPosition, boardYPosition in markers:
+            board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+        return board
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_takes_immediate_win(self):
+        board = self._create_board(3, 3, [(1, 0, 0), (2, 1, 0), (1, 0, 1), (2, 1, 1)])
+        self.assertEqual(self._engine.getBestMove(board, 1), (0, 2))
+
+    def test_blocks_opponent_line(self):
+        board = self._create_board(3, 3, [(1, 0, 0), (2, 1, 1), (1, 0, 1)])
+        self.assertEqual(self._engine.getBestMove(board, 2), (0, 2))
+
+    def test_ai_move_command_on_larger_board(self):
+        board = self._create_board(5, 4, [(1, 1, 1), (1, 1, 2), (1, 1, 3), (2, 2, 2), (2, 3, 3)])
+        GameCommand(GameCommand.AI_MOVE_COMMAND, 2, self._create_engine(3000, 2)).executeCommandOnBoard(board)
+        self.assertTrue(Board.PLAYER_TOKEN_VALUE[1] in (board.getMarkerAtBoardPosition(1, 0), board.getMarkerAtBoardPosition(1, 4)))
+
+    def test_search_of_iterations_is_repeatable(self):
+        board = self._create_board(4, 3, [(1, 1, 1)])
+        firstMove = self._create_engine(300, 4).getBestMove(board, 2)
+        self.assertEqual(self._create_engine(300, 4).getBestMove(board, 2), firstMove)
+
+    def test_search_statistics(self):
+        self._engine.getBestMove(Board(), 1)
+        searchStatistics = self._engine.getLastSearchStatistics()
+        self.assertEqual((searchStatistics["iterations"], searchStatistics["processes"]), (2000, 1))
+        self.assertTrue(searchStatistics["nodes"] > searchStatistics["iterations"])
+        self.assertTrue(searchStatistics["nodesPerSecond"] > 0)
+        self.assertTrue(0.0 <= searchStatistics["score"] <= 1.0)
+
+    def test_time_limit(self):
+        engine = MonteCarloEngine(0.05)
+        startTime = time.time()
+        engine.getBestMove(Board(7, 5), 1)
+        self.assertTrue(time.time() - startTime < 1.0)
+        self.assertTrue(engine.getLastSearchStatistics()["iterations"] >= 1)
+
+    def test_root_parallel_search(self):
+        board = self._create_board(3, 3, [(1, 0, 0), (2, 1, 1), (1, 0, 1)])
+        engine = self._create_engine(3000, 3, 2)
+        try:
+            self.assertEqual(engine.getBestMove(board, 2), (0, 2))
+            searchStatistics = engine.getLastSearchStatistics()
+            self.assertEqual((searchStatistics["iterations"], searchStatistics["processes"]), (3000, 2))
+        finally:
+            engine.close()
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_game_over_has_no_move(self):
+        board = self._create_board(3, 3, [(1, 0, 0), (1, 1, 1), (1, 2, 2)])
+        self.assertEqual(self._engine.getBestMove(board, 2), None)
+        self.assertEqual(self._engine.getLastSearchStatistics()["iterations"], 0)
+
+    def test_invalid_player_number(self):
+        for invalidPlayerNumber in (0, 3, "1"):
+            self.assertRaises(PreconditionError, self._engine.getBestMove, Board(), invalidPlayerNumber)
+
+    def test_invalid_engine_settings(self):
+        self.assertRaises(PreconditionError, MonteCarloEngine, 0)
+        self.assertRaises(PreconditionError, MonteCarloEngine, None, 0)
+        self.assertRaises(PreconditionError, MonteCarloEngine, None, 10, 0)
+        self.assertRaises(PreconditionError, MonteCarloEngine, None, 10, 1, -1.0)
+        self.assertRaises(PreconditionError, MonteCarloEngine, None, 10, 1, 1.0, "1")
+        self.assertRaises(PreconditionError, self._engine.getBestMove, "board", 1)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
@@ -0,0 +1,128 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import os
+import tempfile
+from conditions import PreconditionError
+from board import Board
+from solver import Solver
+from position_store import decodePosition
+from move_table import MoveTableEngine, MoveTableError, buildMoveTable, MOVE_TABLE_MAGIC
+from move_table import _NUMBER_OF_ENTRIES, _UNREACHABLE_ENTRY, _DECODED_ENTRIES
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestMoveTable(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _moveTable = None
+
+    def setUp(self):
+        moveTableFile = tempfile.NamedTemporaryFile(suffix=".bin", delete=False)
+        moveTableFile.close()
+        os.remove(moveTableFile.name)
+        self._moveTableFileName = moveTableFile.name
+        if TestMoveTable._moveTable is None:
+            TestMoveTable._moveTable = buildMoveTable()
+
+    def tearDown(self):
+        if os.path.exists(self._moveTableFileName):
+            os.remove(self._moveTableFileName)
+
+    def _create_engine_from_built_table(self):
+        with open(self._moveTableFileName, "wb") as moveTableFile:
+            moveTableFile.write(MOVE_TABLE_MAGIC)
+            moveTableFile.write(self._moveTable)
+        return MoveTableEngine(self._moveTableFileName)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_every_reachable_position_is_in_the_table(self):
+        # 5478 positions are reachable with player 1 moving first, and the same number with player 2 first
+        self.assertEqual(len(self._moveTable) - self._moveTable.count(chr(_UNREACHABLE_ENTRY)), 2 * 5478)
+
+    def test_table_agrees_with_solver(self):
+        solver = Solver()
+        for entryIndex in range(0, _NUMBER_OF_ENTRIES, 7):
+            if self._moveTable[entryIndex] != _UNREACHABLE_ENTRY:
+                positionCode, playerIndex = divmod(entryIndex, 2)
+                board = decodePosition(positionCode)
+                self.assertEqual(_DECODED_ENTRIES[self._moveTable[entryIndex]], solver.solvePosition(board, playerIndex + 1))
+
+    def test_engine_is_loaded_lazily_from_file(self):
+        moveTableEngine = MoveTableEngine(self._moveTableFileName)
+        self.assertFalse(moveTableEngine.isLoaded())
+        self.assertFalse(os.path.exists(self._moveTableFileName))
+        self.assertEqual(moveTableEngine.solvePosition(Board(), 1), Solver().solvePosition(Board(), 1))
+        self.assertTrue(moveTableEngine.isLoaded())
+        self.assertEqual(os.path.getsize(self._moveTableFileName), len(MOVE_TABLE_MAGIC) + _NUMBER_OF_ENTRIES)
+        self.assertEqual(MoveTableEngine(self._moveTableFileName).getBestMove(Board(), 2), Solver().getBestMove(Board(), 2))
+
+    def test_perfect_play_is_a_draw(self):
+        moveTableEngine = self._create_engine_from_built_table()
+        board = Board()
+        playerNumber = 1
+        while not board.isGameOver():
+            boardXPosition, boardYPosition = moveTableEngine.getBestMove(board, playerNumber)
+            board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+            playerNumber = 3 - playerNumber
+        self.assertTrue(board.isDraw())
+
+    def test_unreachable_position_is_solved(self):
+        board = Board()
+        for boardYPosition in range(3):
+            board.placePlayerMarkerOnBoardAtPosition(1, 0, boardYPosition)
+        board.placePlayerMarkerOnBoardAtPosition(2, 1, 1)
+        self.assertEqual(self._create_engine_from_built_table().solvePosition(board, 1), (Solver.WIN_VALUE, None))
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_board(self):
+        for board in (1, Board(4), Board(3, 2)):
+            self.assertRaises(PreconditionError, MoveTableEngine(self._moveTableFileName).getBestMove, board, 1)
+
+    def test_file_which_is_not_a_move_table(self):
+        with open(self._moveTableFileName, "wb") as moveTableFile:
+            moveTableFile.write("not a move table")
+        self.assertRaises(MoveTableError, MoveTableEngine(self._moveTableFileName).getBestMove, Board(), 1)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
@@ -0,0 +1,208 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import os
+import tempfile
+import StringIO
+from conditions import PreconditionError
+from game_command import GameCommand
+from panel import Panel, SCRIPT_BATCH_SIZE
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestGetCommandFromUser(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        self._panel = Panel()
+
+    def tearDown(self):
+        self._panel = None
+ 
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def _print_interactive_user_message(self, playerNumber, xBoardPosition, yBoardPosition):
+        print(chr(27) + "[2J") # Just clears terminal screen
+        print("Follow the prompts to create a command with:")
+        print("Player Number = {}".format(playerNumber))
+        print("x Board Position  = {}".format(xBoardPosition))
+        print("y Board Position  = {}".format(yBoardPosition))       
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def _test_get_user_command_for_player_number(self, playerNumber, xBoardPosition, yBoardPosition):
+        self._print_interactive_user_message(playerNumber, xBoardPosition, yBoardPosition)
+        userCommand = self._panel.getCommandFromUser()
+        self.assertEqual(userCommand._playerNumber, playerNumber)
+
+    def _test_get_user_command_for_x_position(self, playerNumber, xBoardPosition, yBoardPosition):
+        self._print_interactive_user_message(playerNumber, xBoardPosition, yBoardPosition)
+        userCommand = self._panel.getCommandFromUser()
+        self.assertEqual(userCommand._xBoardPosition, xBoardPosition)
+
+    def _test_get_user_command_for_y_position(self, playerNumber, xBoardPosition, yBoardPosition):
+        self._print_interactive_user_message(playerNumber, xBoardPosition, yBoardPosition)
+        userCommand = self._panel.getCommandFromUser()
+        self.assertEqual(userCommand._yBoardPosition, yBoardPosition)
+
+    def test_get_user_command_player_number(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'ttest_get_user_command' is not run on this testing mode.>")
+            return
+
+        for boardXPosition in [0,1,2]:
+            for boardYPosition in [0,1,2]:
+                for playerNumber in [1,2]:
+                    try:
+                        self._test_get_user_command_for_player_number(playerNumber, boardXPosition, boardYPosition)
+                    except Exception:
+                        raise Exception
+
+    def test_get_user_command_x_position(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'ttest_get_user_command' is not run on this testing mode.>")
+            return
+
+        for boardXPosition in [0,1,2]:
+            for boardYPosition in [0,1,2]:
+                for playerNumber in [1,2]:
+                    try:
+                        self._test_get_user_command_for_x_position(playerNumber, boardXPosition, boardYPosition)
+                    except Exception:
+                        raise Exception
+
+    def test_get_user_command_y_position(self):
+        if not (testFlag == "-interactive"):
+            print("\n<Test function 'test_get_user_command' is not run on this testing mode.>")
+            return
+
+        for boardXPosition in [0,1,2]:
+            for boardYPosition in [0,1,2]:
+                for playerNumber in [1,2]:
+                    try:
+                        self._test_get_user_command_for_y_position(playerNumber, boardXPosition, boardYPosition)
+                    except Exception:
+                        raise Exception
+
+class TestScriptedCommands(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    class _TrickleFile:
+        # Gives a script one character per read, so tokens are split across every chunk
+        def __init__(self, scriptText):
+            self._scriptText = scriptText
+        def read(self, size):
+            scriptCharacter = self._scriptText[:1]
+            self._scriptText = self._scriptText[1:]
+            return scriptCharacter
+
+    def _read_all_commands(self, panel):
+        userCommands = []
+        while True:
+            try:
+                userCommands.append(panel.getCommandFromUser())
+            except EOFError:
+                return userCommands
+
+    def _get_moves(self, userCommands):
+        return [(userCommand._commandType, userCommand._playerNumber, userCommand._xBoardPosition, userCommand._yBoardPosition) for userCommand in userCommands]
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_moves_are_read_from_script(self):
+        panel = Panel(3, StringIO.StringIO("1 0 0\n2 1 1\n1\n2\n2\n"))
+        self.assertTrue(panel.isScripted())
+        self.assertEqual(self._get_moves(self._read_all_commands(panel)),
+                         [(GameCommand.MOVE_COMMAND, 1, 0, 0), (GameCommand.MOVE_COMMAND, 2, 1, 1), (GameCommand.MOVE_COMMAND, 1, 2, 2)])
+
+    def test_tokens_split_across_chunks(self):
+        panel = Panel(12, self._TrickleFile("1 10 11\n2 11 10"))
+        self.assertEqual(self._get_moves(self._read_all_commands(panel)), [(GameCommand.MOVE_COMMAND, 1, 10, 11), (GameCommand.MOVE_COMMAND, 2, 11, 10)])
+
+    def test_script_file_in_batches(self):
+        scriptFile = tempfile.NamedTemporaryFile(suffix=".txt", delete=False)
+        scriptFile.write("1 0 0 2 0 1\n" * SCRIPT_BATCH_SIZE)
+        scriptFile.close()
+        try:
+            userCommands = self._read_all_commands(Panel(3, scriptFile.name))
+        finally:
+            os.remove(scriptFile.name)
+        self.assertEqual(len(userCommands), 2 * SCRIPT_BATCH_SIZE)
+        self.assertEqual(self._get_moves(userCommands[-1:]), [(GameCommand.MOVE_COMMAND, 2, 0, 1)])
+
+    def test_interactive_panel_is_not_scripted(self):
+        self.assertFalse(Panel().isScripted())
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_move_is_nothing(self):
+        userCommands = self._read_all_commands(Panel(3, StringIO.StringIO("3 0 0\n1 3 0\n1 2 2")))
+        self.assertEqual([userCommand._commandType for userCommand in userCommands],
+                         [GameCommand.NOTHING_COMMAND, GameCommand.NOTHING_COMMAND, GameCommand.MOVE_COMMAND])
+
+    def test_incomplete_last_move(self):
+        for scriptText in ["1 0 0 2 1", "1 0 0\n2", "1 0 0\n2 1\n"]:
+            panel = Panel(3, StringIO.StringIO(scriptText))
+            self.assertEqual(self._get_moves([panel.getCommandFromUser()]), [(GameCommand.MOVE_COMMAND, 1, 0, 0)])
+            self.assertRaises(ValueError, panel.getCommandFromUser)
+            self.assertRaises(EOFError, panel.getCommandFromUser)
+        panel = Panel(3, self._TrickleFile("1 0"))
+        self.assertRaises(ValueError, panel.getCommandFromUser)
+
+    def test_answer_which_is_not_an_integer(self):
+        self.assertRaises(ValueError, Panel(3, StringIO.StringIO("1 0 x")).getCommandFromUser)
+
+    def test_moves_before_an_answer_which_is_not_an_integer(self):
+        panel = Panel(3, StringIO.StringIO("1 0 0\n2 1 1\nx y z\n1 0 1\n"))
+        self.assertEqual(self._get_moves([panel.getCommandFromUser(), panel.getCommandFromUser()]),
+                         [(GameCommand.MOVE_COMMAND, 1, 0, 0), (GameCommand.MOVE_COMMAND, 2, 1, 1)])
+        self.assertRaises(ValueError, panel.getCommandFromUser)
+
+    def test_invalid_script_source(self):
+        self.assertRaises(PreconditionError, Panel, 3, 5)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
+        
\ No newline at end of file
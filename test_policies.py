@@ -0,0 +1,110 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+from conditions import PreconditionError
+from board import Board
+from policies import createPolicy, GreedyPolicy, RandomPolicy, POLICY_NAMES
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestPolicies(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        self._board = Board()
+
+    def tearDown(self):
+        pass
+
+    def _place_markers(self, markers):
+        for playerNumber, boardXPosition, boardYPosition in markers:
+            self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_random_policy_picks_empty_positions(self):
+        self._place_markers([(1, 0, 0), (2, 1, 1), (1, 2, 2)])
+        randomPolicy = RandomPolicy(7)
+        for _ in range(50):
+            boardXPosition, boardYPosition = randomPolicy.getBestMove(self._board, 2)
+            self.assertEqual(self._board.getMarkerAtBoardPosition(boardXPosition, boardYPosition), Board.EMPTY_VALUE)
+
+    def test_random_policy_is_repeatable_with_seed(self):
+        firstMoves = [RandomPolicy(3).getBestMove(self._board, 1) for _ in range(5)]
+        secondMoves = [RandomPolicy(3).getBestMove(self._board, 1) for _ in range(5)]
+        self.assertEqual(firstMoves, secondMoves)
+
+    def test_greedy_policy_takes_win(self):
+        self._place_markers([(1, 0, 0), (2, 1, 0), (1, 0, 1), (2, 1, 1)])
+        self.assertEqual(GreedyPolicy(0).getBestMove(self._board, 1), (0, 2))
+
+    def test_greedy_policy_blocks_line(self):
+        self._place_markers([(1, 0, 0), (2, 2, 2), (1, 0, 1)])
+        self.assertEqual(GreedyPolicy(0).getBestMove(self._board, 2), (0, 2))
+
+    def test_greedy_policy_on_larger_board(self):
+        self._board = Board(5, 4)
+        self._place_markers([(1, 2, 0), (1, 2, 1), (1, 2, 2)])
+        self.assertEqual(GreedyPolicy(0).getBestMove(self._board, 2), (2, 3))
+
+    def test_game_over_has_no_move(self):
+        self._place_markers([(1, 0, 0), (1, 0, 1), (1, 0, 2)])
+        self.assertEqual(RandomPolicy(0).getBestMove(self._board, 2), None)
+        self.assertEqual(GreedyPolicy(0).getBestMove(self._board, 2), None)
+
+    def test_create_every_policy(self):
+        for policyName in POLICY_NAMES:
+            self.assertTrue(hasattr(createPolicy(policyName, 1), "getBestMove"))
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_create_unknown_policy(self):
+        self.assertRaises(PreconditionError, createPolicy, "unknown")
+
+    def test_invalid_player_number(self):
+        self.assertRaises(PreconditionError, RandomPolicy(0).getBestMove, self._board, 3)
+        self.assertRaises(PreconditionError, GreedyPolicy(0).getBestMove, self._board, 0)
+
+    def test_invalid_seed(self):
+        self.assertRaises(PreconditionError, RandomPolicy, "seed")
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
@@ -0,0 +1,168 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import os
+import random
+import tempfile
+from conditions import PreconditionError
+from board import Board
+from position_store import PositionStore, PositionStoreWriter, PositionStoreError, encodePosition, decodePosition
+from position_store import decodeMarkers, getGameResult, LARGEST_BOARD_SIZE, RESULT_PLAYER_TWO_WIN, _HEADER_FORMAT
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+def _create_random_board(randomGenerator, boardSize, winLength=None):
+    board = Board(boardSize, winLength)
+    for moveNumber in range(randomGenerator.randint(0, boardSize * boardSize)):
+        board.placePlayerMarkerOnBoardAtPosition(randomGenerator.randint(1, 2), randomGenerator.randint(0, boardSize - 1), randomGenerator.randint(0, boardSize - 1))
+    return board
+
+class TestPositionCode(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_known_position_codes(self):
+        board = Board()
+        self.assertEqual(encodePosition(board), 0)
+        board.placePlayerMarkerOnBoardAtPosition(1, 0, 0)
+        self.assertEqual(encodePosition(board), 1)
+        board.placePlayerMarkerOnBoardAtPosition(2, 0, 1)
+        self.assertEqual(encodePosition(board), 1 + 2 * 3)
+        board.placePlayerMarkerOnBoardAtPosition(2, 2, 2)
+        self.assertEqual(encodePosition(board), 1 + 2 * 3 + 2 * 3 ** 8)
+
+    def test_largest_classic_code_fits_in_15_bits(self):
+        board = Board()
+        for boardXPosition in range(3):
+            for boardYPosition in range(3):
+                board.placePlayerMarkerOnBoardAtPosition(2, boardXPosition, boardYPosition)
+        self.assertEqual(encodePosition(board), 3 ** 9 - 1)
+        self.assertTrue(encodePosition(board) < 2 ** 15)
+
+    def test_codes_convert_both_ways(self):
+        randomGenerator = random.Random(2018)
+        for boardSize in (1, 3, 4, 6):
+            for _ in range(50):
+                board = _create_random_board(randomGenerator, boardSize)
+                positionCode = encodePosition(board)
+                decodedBoard = decodePosition(positionCode, boardSize)
+                self.assertEqual(decodedBoard.getBoardAsString(), board.getBoardAsString())
+                self.assertEqual(encodePosition(decodedBoard), positionCode)
+                self.assertEqual(decodeMarkers(positionCode, boardSize), board._boardGrid)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_position_codes(self):
+        for invalidPositionCode in (-1, 3 ** 9, 1.0, "1"):
+            self.assertRaises(PreconditionError, decodePosition, invalidPositionCode)
+
+    def test_board_too_large(self):
+        self.assertRaises(PreconditionError, encodePosition, Board(LARGEST_BOARD_SIZE + 1))
+
+class TestPositionStore(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        storeFile = tempfile.NamedTemporaryFile(suffix=".positions", delete=False)
+        storeFile.close()
+        self._storeFileName = storeFile.name
+
+    def tearDown(self):
+        os.remove(self._storeFileName)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_boards_are_stored_and_read_back(self):
+        randomGenerator = random.Random(7)
+        boards = [_create_random_board(randomGenerator, 3) for _ in range(1000)]
+        with PositionStoreWriter(self._storeFileName) as storeWriter:
+            for board in boards:
+                storeWriter.addBoard(board)
+        self.assertEqual(os.path.getsize(self._storeFileName), _HEADER_FORMAT.size + 3 * len(boards))
+        with PositionStore(self._storeFileName) as positionStore:
+            self.assertEqual((len(positionStore), positionStore.getBoardSize(), positionStore.getWinLength()), (1000, 3, 3))
+            for positionIndex in (0, 1, 499, 999):
+                self.assertEqual(positionStore.getPosition(positionIndex), (encodePosition(boards[positionIndex]), getGameResult(boards[positionIndex])))
+                self.assertEqual(positionStore.getBoard(positionIndex).getBoardAsString(), boards[positionIndex].getBoardAsString())
+            self.assertEqual([positionCode for positionCode, gameResult in positionStore.iteratePositions()], [encodePosition(board) for board in boards])
+
+    def test_larger_board_store(self):
+        board = Board(5, 4)
+        for boardYPosition in range(4):
+            board.placePlayerMarkerOnBoardAtPosition(2, 4, boardYPosition)
+        with PositionStoreWriter(self._storeFileName, 5, 4) as storeWriter:
+            storeWriter.addBoard(board)
+        with PositionStore(self._storeFileName) as positionStore:
+            self.assertEqual(positionStore.getPosition(0), (encodePosition(board), RESULT_PLAYER_TWO_WIN))
+            self.assertEqual(positionStore.getBoard(0).winner(), 2)
+
+    def test_empty_store(self):
+        PositionStoreWriter(self._storeFileName).close()
+        with PositionStore(self._storeFileName) as positionStore:
+            self.assertEqual(list(positionStore.iteratePositions()), [])
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_records(self):
+        with PositionStoreWriter(self._storeFileName) as storeWriter:
+            self.assertRaises(PreconditionError, storeWriter.addPosition, 3 ** 9)
+            self.assertRaises(PreconditionError, storeWriter.addPosition, 0, 4)
+            self.assertRaises(PreconditionError, storeWriter.addBoard, Board(4))
+        with PositionStore(self._storeFileName) as positionStore:
+            self.assertRaises(PreconditionError, positionStore.getPosition, 0)
+
+    def test_file_which_is_not_a_store(self):
+        with open(self._storeFileName, "wb") as storeFile:
+            storeFile.write("not a position store at all")
+        self.assertRaises(PositionStoreError, PositionStore, self._storeFileName)
+
+    def test_file_missing_records(self):
+        with PositionStoreWriter(self._storeFileName) as storeWriter:
+            for positionCode in range(10):
+                storeWriter.addPosition(positionCode)
+        with open(self._storeFileName, "r+b") as storeFile:
+            storeFile.truncate(_HEADER_FORMAT.size + 5)
+        self.assertRaises(PositionStoreError, PositionStore, self._storeFileName)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
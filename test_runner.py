@@ -0,0 +1,394 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import glob
+import importlib
+import multiprocessing
+import os
+import shutil
+import tempfile
+import timeit
+from conditions import preconditions, PreconditionError
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# The runner imports every module once, and runs their test classes in worker processes, each class in
+# one process (so that a class's tests share their process as they would under unittest.main). Workers
+# are ordinary processes rather than a multiprocessing.Pool, whose daemonic workers could not start the
+# process pools some tests use, and each is sent its classes over its own pipe, so that the runner knows
+# which class a worker was running if it stops
+TEST_PASSED = "ok"
+TEST_FAILED = "FAIL"
+TEST_ERROR = "ERROR"
+TEST_SKIPPED = "skipped"
+TEST_OUTCOMES = (TEST_PASSED, TEST_FAILED, TEST_ERROR, TEST_SKIPPED)
+
+DEFAULT_NUMBER_OF_SLOWEST_TESTS = 10
+
+# How long the runner waits on each worker in turn for its results
+_WORKER_POLL_INTERVAL = 0.01
+
+class _TimedTestResult(unittest.TestResult):
+    """ A test result which keeps the outcome and time of every test, with the output of failing tests """
+
+    def __init__(self):
+        unittest.TestResult.__init__(self)
+        self.buffer = True
+        self.testOutcomes = []
+        self._testStartTime = None
+    #END
+
+    def startTest(self, test):
+        unittest.TestResult.startTest(self, test)
+        self._testStartTime = timeit.default_timer()
+    #END
+
+    def _add_outcome(self, test, outcome, details=""):
+        self.testOutcomes += [(test.id(), outcome, timeit.default_timer() - self._testStartTime, details)]
+    #END
+
+    def addSuccess(self, test):
+        unittest.TestResult.addSuccess(self, test)
+        self._add_outcome(test, TEST_PASSED)
+    #END
+
+    def addFailure(self, test, errorInformation):
+        unittest.TestResult.addFailure(self, test, errorInformation)
+        self._add_outcome(test, TEST_FAILED, self.failures[-1][1])
+    #END
+
+    def addError(self, test, errorInformation):
+        unittest.TestResult.addError(self, test, errorInformation)
+        self._add_outcome(test, TEST_ERROR, self.errors[-1][1])
+    #END
+
+    def addSkip(self, test, reason):
+        unittest.TestResult.addSkip(self, test, reason)
+        self._add_outcome(test, TEST_SKIPPED, reason)
+    #END
+
+    def addExpectedFailure(self, test, errorInformation):
+        unittest.TestResult.addExpectedFailure(self, test, errorInformation)
+        self._add_outcome(test, TEST_PASSED)
+    #END
+
+    def addUnexpectedSuccess(self, test):
+        unittest.TestResult.addUnexpectedSuccess(self, test)
+        self._add_outcome(test, TEST_FAILED, "Unexpected success")
+    #END
+
+def _get_test_class(testClassName):
+    moduleName, className = testClassName.rsplit(".", 1)
+    return getattr(importlib.import_module(moduleName), className)
+
+def _run_test_class(testClassName):
+    # The outcome of each test of one class. A class which can not be loaded gives one error for the class
+    timedTestResult = _TimedTestResult()
+    try:
+        testSuite = unittest.TestLoader().loadTestsFromTestCase(_get_test_class(testClassName))
+    except Exception as error:
+        return [(testClassName, TEST_ERROR, 0.0, "Could not load the tests: {!r}\n".format(error))]
+    testSuite.run(timedTestResult)
+    return timedTestResult.testOutcomes
+
+def _run_test_classes_from_connection(connection):
+    # A worker runs each class it is sent, and sends back the outcomes, until it is sent None
+    while True:
+        testClassName = connection.recv()
+        if testClassName is None:
+            return
+        connection.send(_run_test_class(testClassName))
+
+class _TestWorker:
+    """ A worker process, its end of the connection, and the test class it is running """
+
+    def __init__(self):
+        self.connection, workerConnection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_run_test_classes_from_connection, args=(workerConnection,))
+        self.process.start()
+        workerConnection.close()
+        self.testClassName = None
+    #END
+
+    def startTestClass(self, testClassName):
+        self.testClassName = testClassName
+        self.connection.send(testClassName)
+    #END
+
+    def stop(self):
+        if self.process.is_alive():
+            try:
+                self.connection.send(None)
+            except (IOError, OSError):
+                pass
+        self.process.join()
+        self.connection.close()
+    #END
+
+def _get_module_names(directory):
+    return sorted(os.path.splitext(os.path.basename(fileName))[0] for fileName in glob.glob(os.path.join(directory, "*.py")))
+
+@preconditions( (lambda moduleNames: isinstance(moduleNames, (list, tuple)) and all(isinstance(moduleName, str) for moduleName in moduleNames)) )
+def discoverTestClasses(moduleNames=None):
+    '''
+    DESCRIPTION:
+        Imports modules and finds the test classes defined in them
+
+    PARAMETERS:
+        moduleNames: (optional) the names of the modules, which defaults to every module beside this one
+
+    RETURNS:
+        (valid arguement)
+            A list of the names of the test classes, each as 'module.Class', in the order of the modules
+            and then the classes' names
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    if moduleNames is None:
+        moduleNames = _get_module_names(os.path.dirname(os.path.abspath(__file__)))
+    testClassNames = []
+    for moduleName in moduleNames:
+        module = importlib.import_module(moduleName)
+        for attributeName in sorted(dir(module)):
+            attribute = getattr(module, attributeName)
+            if (isinstance(attribute, type) and issubclass(attribute, unittest.TestCase) and (attribute.__module__ == module.__name__)
+                    and unittest.TestLoader().getTestCaseNames(attribute)):
+                testClassNames += [moduleName + "." + attributeName]
+    return testClassNames
+#END
+
+def _collect_outcomes(testClassNames, numberOfProcesses):
+    # Each worker is sent its next class as soon as it finishes one, so a slow class holds up only its own
+    # worker. A worker which stops part way through a class is replaced, and the class is given as an error
+    remainingTestClassNames = list(reversed(testClassNames))
+    outcomesByClass = {}
+    workers = [_TestWorker() for _ in range(min(numberOfProcesses, len(testClassNames)))]
+    try:
+        for worker in workers:
+            worker.startTestClass(remainingTestClassNames.pop())
+        while len(outcomesByClass) < len(testClassNames):
+            for workerIndex, worker in enumerate(workers):
+                if (worker.testClassName is None) or (not worker.connection.poll(_WORKER_POLL_INTERVAL)):
+                    continue
+                try:
+                    outcomesByClass[worker.testClassName] = worker.connection.recv()
+                except EOFError:
+                    outcomesByClass[worker.testClassName] = [(worker.testClassName, TEST_ERROR, 0.0, "The test process stopped while running the class\n")]
+                    worker.stop()
+                    worker = _TestWorker()
+                    workers[workerIndex] = worker
+                worker.testClassName = None
+                if remainingTestClassNames:
+                    worker.startTestClass(remainingTestClassNames.pop())
+    finally:
+        for worker in workers:
+            worker.stop()
+    return [testOutcome for testClassName in testClassNames for testOutcome in outcomesByClass[testClassName]]
+
+@preconditions( (lambda moduleNames: isinstance(moduleNames, (list, tuple)) and all(isinstance(moduleName, str) for moduleName in moduleNames)),
+                (lambda numberOfProcesses: ((isinstance(numberOfProcesses, int))) and (numberOfProcesses >= 1)) )
+def runTests(moduleNames=None, numberOfProcesses=None):
+    '''
+    DESCRIPTION:
+        Runs the tests of many modules in one go, spread over a number of processes
+
+    PARAMETERS:
+        moduleNames: (optional) the names of the modules, which defaults to every module beside this one
+        numberOfProcesses: (optional) the number of worker processes, which defaults to the number of
+                           processors. With 1 process the tests are run in this process
+
+    RETURNS:
+        (valid arguement)
+            A dictionary with the "outcomes" of the tests, each a tuple (test name, outcome, seconds,
+            details) where the outcome is one of TEST_OUTCOMES and the details are the traceback of a
+            failure or error, the number of tests with each outcome by name ("passed", "failed", "errors"
+            and "skipped"), the number of "processes" and the "seconds" taken
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    startTime = timeit.default_timer()
+    testClassNames = discoverTestClasses(moduleNames)
+    if numberOfProcesses is None:
+        numberOfProcesses = multiprocessing.cpu_count()
+    numberOfProcesses = max(1, min(numberOfProcesses, len(testClassNames)))
+    if numberOfProcesses == 1:
+        testOutcomes = [testOutcome for testClassName in testClassNames for testOutcome in _run_test_class(testClassName)]
+    else:
+        testOutcomes = _collect_outcomes(testClassNames, numberOfProcesses)
+    outcomeCounts = dict((outcome, 0) for outcome in TEST_OUTCOMES)
+    for _, outcome, _, _ in testOutcomes:
+        outcomeCounts[outcome] += 1
+    return { "outcomes": testOutcomes,
+             "passed": outcomeCounts[TEST_PASSED],
+             "failed": outcomeCounts[TEST_FAILED],
+             "errors": outcomeCounts[TEST_ERROR],
+             "skipped": outcomeCounts[TEST_SKIPPED],
+             "processes": numberOfProcesses,
+             "seconds": timeit.default_timer() - startTime }
+#END
+
+def wasSuccessful(testSummary):
+    return (testSummary["failed"] == 0) and (testSummary["errors"] == 0)
+#END
+
+def getSlowestTests(testSummary, numberOfTests=DEFAULT_NUMBER_OF_SLOWEST_TESTS):
+    '''
+    DESCRIPTION:
+        Finds the tests which took the longest
+
+    PARAMETERS:
+        testSummary: the summary given by runTests
+        numberOfTests: (optional) the number of tests to find
+
+    RETURNS:
+        A list of (seconds, test name) tuples, slowest first
+    '''
+    return sorted(((seconds, testName) for testName, _, seconds, _ in testSummary["outcomes"]), reverse=True)[:numberOfTests]
+#END
+
+def printTestReport(testSummary, verbose=False, numberOfSlowestTests=DEFAULT_NUMBER_OF_SLOWEST_TESTS):
+    if verbose:
+        for testName, outcome, seconds, _ in testSummary["outcomes"]:
+            print("{} ... {} ({:.3f} s)".format(testName, outcome, seconds))
+    for testName, outcome, seconds, details in testSummary["outcomes"]:
+        if outcome in (TEST_FAILED, TEST_ERROR):
+            print("=" * 70)
+            print("{}: {} ({:.3f} s)".format(outcome, testName, seconds))
+            print("-" * 70)
+            print(details.rstrip("\n"))
+    print("-" * 70)
+    print("Ran {} tests in {:.2f} s over {} processes: {} passed, {} failed, {} errors, {} skipped".format(
+        len(testSummary["outcomes"]), testSummary["seconds"], testSummary["processes"],
+        testSummary["passed"], testSummary["failed"], testSummary["errors"], testSummary["skipped"]))
+    if numberOfSlowestTests > 0:
+        print("Slowest tests:")
+        for seconds, testName in getSlowestTests(testSummary, numberOfSlowestTests):
+            print("    {:>8.3f} s  {}".format(seconds, testName))
+    print("OK" if wasSuccessful(testSummary) else "FAILED")
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestRunTests(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _example_module_source = ( "import unittest\n"
+                               "import os\n"
+                               "class TestPassing(unittest.TestCase):\n"
+                               "    def test_one(self):\n"
+                               "        print('output which is not shown')\n"
+                               "    def test_two(self):\n"
+                               "        pass\n"
+                               "class TestFailing(unittest.TestCase):\n"
+                               "    def test_failure(self):\n"
+                               "        self.assertEqual(1, 2)\n"
+                               "    def test_error(self):\n"
+                               "        raise KeyError('missing')\n"
+                               "    @unittest.skip('not needed')\n"
+                               "    def test_skipped(self):\n"
+                               "        pass\n"
+                               "class TestStopping(unittest.TestCase):\n"
+                               "    def test_process_stops(self):\n"
+                               "        os._exit(1)\n"
+                               "class HelperWithoutTests(unittest.TestCase):\n"
+                               "    pass\n" )
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        with open(os.path.join(self._directory, "example_tests.py"), "w") as moduleFile:
+            moduleFile.write(self._example_module_source)
+        sys.path.insert(0, self._directory)
+
+    def tearDown(self):
+        sys.path.remove(self._directory)
+        sys.modules.pop("example_tests", None)
+        shutil.rmtree(self._directory)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_discover_test_classes(self):
+        self.assertEqual(discoverTestClasses(["example_tests"]),
+                         ["example_tests.TestFailing", "example_tests.TestPassing", "example_tests.TestStopping"])
+
+    def test_outcomes_over_processes(self):
+        testSummary = runTests(["example_tests"], 2)
+        outcomes = dict((testName, outcome) for testName, outcome, _, _ in testSummary["outcomes"])
+        self.assertEqual(outcomes, { "example_tests.TestPassing.test_one": TEST_PASSED,
+                                     "example_tests.TestPassing.test_two": TEST_PASSED,
+                                     "example_tests.TestFailing.test_failure": TEST_FAILED,
+                                     "example_tests.TestFailing.test_error": TEST_ERROR,
+                                     "example_tests.TestFailing.test_skipped": TEST_SKIPPED,
+                                     "example_tests.TestStopping": TEST_ERROR })
+        self.assertEqual((testSummary["passed"], testSummary["failed"], testSummary["errors"], testSummary["skipped"]), (2, 1, 2, 1))
+        self.assertEqual(testSummary["processes"], 2)
+        self.assertFalse(wasSuccessful(testSummary))
+        failureDetails = [details for testName, _, _, details in testSummary["outcomes"] if testName.endswith("test_error")][0]
+        self.assertTrue("KeyError" in failureDetails)
+
+    def test_slowest_tests(self):
+        testSummary = { "outcomes": [("a", TEST_PASSED, 0.5, ""), ("b", TEST_PASSED, 2.0, ""), ("c", TEST_FAILED, 1.0, "")] }
+        self.assertEqual(getSlowestTests(testSummary, 2), [(2.0, "b"), (1.0, "c")])
+
+    def test_passing_module_in_one_process(self):
+        with open(os.path.join(self._directory, "example_tests.py"), "w") as moduleFile:
+            moduleFile.write(self._example_module_source.split("class TestFailing")[0])
+        testSummary = runTests(["example_tests"], 1)
+        self.assertEqual((testSummary["passed"], testSummary["processes"]), (2, 1))
+        self.assertTrue(wasSuccessful(testSummary))
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_arguements(self):
+        self.assertRaises(PreconditionError, runTests, "example_tests")
+        self.assertRaises(PreconditionError, runTests, ["example_tests"], 0)
+        self.assertRaises(PreconditionError, discoverTestClasses, [1])
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) == 3) and (sys.argv[1] in ('-run', '-timings')))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Run the tests of every module, optionally over a given number of processes, with the outcome and
+    # time of every test for '-timings'
+    if sys.argv[1] in ('-run', '-timings'):
+        numberOfProcesses = int(sys.argv[2]) if len(sys.argv) == 3 else None
+        testSummary = runTests(None, numberOfProcesses)
+        printTestReport(testSummary, sys.argv[1] == '-timings')
+        sys.exit(0 if wasSuccessful(testSummary) else 1)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
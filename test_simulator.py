@@ -0,0 +1,102 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+from conditions import PreconditionError
+from policies import createPolicy
+from simulator import playGame, simulateGames, _create_chunks
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestPlayGame(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_solver_against_itself_is_a_draw(self):
+        self.assertEqual(playGame(createPolicy("solver"), createPolicy("solver")), (None, 9))
+
+    def test_game_is_played_to_the_end(self):
+        winningPlayerNumber, numberOfMoves = playGame(createPolicy("random", 1), createPolicy("random", 2), 4, 3)
+        self.assertTrue(winningPlayerNumber in (None, 1, 2))
+        self.assertTrue((numberOfMoves >= 5) and (numberOfMoves <= 16))
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_policy(self):
+        self.assertRaises(PreconditionError, playGame, "random", createPolicy("random"))
+
+class TestSimulateGames(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_results_add_up(self):
+        summary = simulateGames("random", "greedy", 40, 3, 3, 1)
+        self.assertEqual(summary["firstPolicyWins"] + summary["secondPolicyWins"] + summary["draws"], 40)
+        self.assertEqual(sum(summary["gameLengths"].values()), 40)
+        self.assertAlmostEqual(summary["firstPolicyWinsRate"] + summary["secondPolicyWinsRate"] + summary["drawsRate"], 1.0)
+
+    def test_solver_never_loses(self):
+        summary = simulateGames("solver", "random", 20, 3, 3, 1)
+        self.assertEqual(summary["secondPolicyWins"], 0)
+
+    def test_process_pool_matches_single_process(self):
+        singleProcessSummary = simulateGames("greedy", "random", 24, 3, 3, 1, 5)
+        processPoolSummary = simulateGames("greedy", "random", 24, 3, 3, 2, 5)
+        self.assertTrue(processPoolSummary["gamesPerSecond"] > 0)
+        for resultName in ("games", "firstPolicyWins", "secondPolicyWins", "draws", "gameLengths"):
+            self.assertEqual(processPoolSummary[resultName], singleProcessSummary[resultName])
+
+    def test_chunks_cover_every_game(self):
+        chunks = _create_chunks("random", "random", 10, 3, 3, 4, 0)
+        self.assertEqual(sum(chunk[5] for chunk in chunks), 10)
+        self.assertEqual([chunk[4] for chunk in chunks], [0, 2, 4, 7])
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_invalid_arguements(self):
+        self.assertRaises(PreconditionError, simulateGames, "unknown", "random", 10)
+        self.assertRaises(PreconditionError, simulateGames, "random", "random", 0)
+        self.assertRaises(PreconditionError, simulateGames, "random", "random", 10, 3, 3, 0)
+
+    def test_solver_on_larger_board(self):
+        self.assertRaises(PreconditionError, simulateGames, "solver", "random", 10, 4, 3)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
@@ -0,0 +1,133 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+from conditions import PreconditionError
+from board import Board
+from solver import Solver, _create_position_bit
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestSolvePosition(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _solver = None
+    _board = None
+
+    def setUp(self):
+        self._solver = Solver()
+        self._board = Board()
+
+    def tearDown(self):
+        self._solver = None
+        self._board = None
+
+    def _place_markers(self, markers):
+        for playerNumber, boardXPosition, boardYPosition in markers:
+            self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_empty_board_is_a_draw(self):
+        gameValue, bestMove = self._solver.solvePosition(self._board, 1)
+        self.assertEqual(gameValue, Solver.DRAW_VALUE)
+        self.assertTrue(bestMove is not None)
+
+    def test_takes_immediate_win(self):
+        self._place_markers([(1, 0, 0), (2, 1, 0), (1, 0, 1), (2, 1, 1)])
+        self.assertEqual(self._solver.solvePosition(self._board, 1), (Solver.WIN_VALUE, (0, 2)))
+
+    def test_prefers_immediate_win_over_block(self):
+        self._place_markers([(1, 0, 0), (2, 1, 0), (1, 0, 1), (2, 1, 1)])
+        self.assertEqual(self._solver.getBestMove(self._board, 2), (1, 2))
+
+    def test_blocks_opponent_line(self):
+        self._place_markers([(1, 0, 0), (2, 1, 1), (1, 0, 1)])
+        self.assertEqual(self._solver.getBestMove(self._board, 2), (0, 2))
+
+    def test_lost_position(self):
+        self._place_markers([(1, 0, 0), (2, 0, 1), (1, 1, 1), (2, 2, 2), (1, 2, 0)])
+        gameValue, bestMove = self._solver.solvePosition(self._board, 2)
+        self.assertEqual(gameValue, Solver.LOSS_VALUE)
+
+    def test_perfect_play_is_a_draw(self):
+        playerNumber = 1
+        while not self._board.isGameOver():
+            boardXPosition, boardYPosition = self._solver.getBestMove(self._board, playerNumber)
+            self._board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+            playerNumber = 3 - playerNumber
+        self.assertTrue(self._board.isDraw())
+
+    def test_game_over_has_no_move(self):
+        self._place_markers([(1, 0, 0), (1, 0, 1), (1, 0, 2)])
+        self.assertEqual(self._solver.solvePosition(self._board, 2), (Solver.LOSS_VALUE, None))
+        self.assertEqual(self._solver.solvePosition(self._board, 1), (Solver.WIN_VALUE, None))
+
+    def test_symmetric_positions_share_table_entries(self):
+        self._place_markers([(1, 0, 0)])
+        self._solver.solvePosition(self._board, 2)
+        tableSize = Solver.getTranspositionTableSize()
+        for boardXPosition, boardYPosition in [(0, 2), (2, 0), (2, 2)]:
+            self._board = Board()
+            self._place_markers([(1, boardXPosition, boardYPosition)])
+            self._solver.solvePosition(self._board, 2)
+            self.assertEqual(Solver.getTranspositionTableSize(), tableSize)
+
+    def test_canonical_position_is_the_same_under_every_symmetry(self):
+        moverBitmask = _create_position_bit(0, 1) | _create_position_bit(2, 2)
+        opponentBitmask = _create_position_bit(1, 1)
+        Solver._create_symmetry_tables_once()
+        canonicalPosition = Solver._get_canonical_position(moverBitmask, opponentBitmask)
+        for symmetryTable in Solver._SYMMETRY_TABLES:
+            self.assertEqual( Solver._get_canonical_position(symmetryTable[moverBitmask], symmetryTable[opponentBitmask]),
+                              canonicalPosition )
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_solve_with_invalid_player_number(self):
+        for playerNumber in (0, 3, 1.0, "1"):
+            self.assertRaises(PreconditionError, self._solver.solvePosition, self._board, playerNumber)
+
+    def test_solve_with_invalid_board(self):
+        for board in (1, "board", [[0, 0, 0]], Board(4), Board(3, 2)):
+            self.assertRaises(PreconditionError, self._solver.solvePosition, board, 1)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
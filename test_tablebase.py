@@ -0,0 +1,185 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import os
+import shutil
+import tempfile
+from conditions import PreconditionError
+from board import Board
+from solver import Solver
+from tablebase import Tablebase, TablebaseError, generateTablebase, WIN_VALUE, DRAW_VALUE, LOSS_VALUE
+from tablebase import _get_chunk_file_name, _get_tablebase_tables
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestPositionIndex(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_indices_convert_both_ways(self):
+        tables = _get_tablebase_tables(4, 3)
+        for numberOfEmptyPositions in (0, 3, 16):
+            numberOfEntries = tables.getNumberOfEntries(numberOfEmptyPositions)
+            for positionIndex in set([0, numberOfEntries // 3, numberOfEntries - 1]):
+                emptyMask, firstPlayerMask = tables.getMasks(numberOfEmptyPositions, positionIndex)
+                self.assertEqual(bin(emptyMask).count("1"), numberOfEmptyPositions)
+                self.assertEqual(bin(firstPlayerMask).count("1"), (16 - numberOfEmptyPositions + 1) // 2)
+                self.assertEqual(emptyMask & firstPlayerMask, 0)
+                self.assertEqual(tables.getIndex(emptyMask, firstPlayerMask), (numberOfEmptyPositions, positionIndex))
+
+    def test_level_sizes(self):
+        tables = _get_tablebase_tables(3, 3)
+        self.assertEqual([tables.getNumberOfEntries(numberOfEmptyPositions) for numberOfEmptyPositions in (0, 1, 9)], [126, 9 * 70, 1])
+
+class TestTablebase(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _directory = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls._directory = tempfile.mkdtemp()
+        generateTablebase(cls._directory, 3, 3, 9, 1, 1000)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._directory)
+
+    def setUp(self):
+        self._tablebase = Tablebase(self._directory)
+        self._otherDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self._tablebase.close()
+        shutil.rmtree(self._otherDirectory)
+
+    def _create_board(self, markers, boardSize=3, winLength=None):
+        board = Board(boardSize, winLength)
+        for playerNumber, boardXPosition, boardYPosition in markers:
+            board.placePlayerMarkerOnBoardAtPosition(playerNumber, boardXPosition, boardYPosition)
+        return board
+
+    def _read_chunks(self, directory):
+        return dict( (chunkFileName, open(os.path.join(directory, chunkFileName), "rb").read())
+                     for chunkFileName in os.listdir(directory) if chunkFileName.endswith(".bin") )
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_values_agree_with_solver(self):
+        tables = _get_tablebase_tables(3, 3)
+        solver = Solver()
+        for numberOfEmptyPositions in range(10):
+            for positionIndex in range(0, tables.getNumberOfEntries(numberOfEmptyPositions), 37):
+                emptyMask, firstPlayerMask = tables.getMasks(numberOfEmptyPositions, positionIndex)
+                secondPlayerMask = tables.fullBoardMask & ~(emptyMask | firstPlayerMask)
+                playerNumber = 1 if numberOfEmptyPositions % 2 == 1 else 2
+                positionValue = self._tablebase.probePlayerMasks(firstPlayerMask, secondPlayerMask, playerNumber)
+                if positionValue is not None:
+                    board = Board()
+                    for position in range(9):
+                        if (firstPlayerMask | secondPlayerMask) & (1 << position):
+                            board.placePlayerMarkerOnBoardAtPosition(1 if firstPlayerMask & (1 << position) else 2, position // 3, position % 3)
+                    self.assertEqual(positionValue[0], solver.solvePosition(board, playerNumber)[0])
+
+    def test_empty_board_is_a_draw_in_nine_moves(self):
+        self.assertEqual(self._tablebase.probePosition(Board(), 1), (DRAW_VALUE, 9))
+        self.assertEqual(self._tablebase.probePosition(Board(), 2), (DRAW_VALUE, 9))
+
+    def test_best_move_wins_quickly_and_blocks(self):
+        board = self._create_board([(1, 0, 0), (2, 1, 0), (1, 0, 1), (2, 1, 1)])
+        self.assertEqual(self._tablebase.probePosition(board, 1), (WIN_VALUE, 1))
+        self.assertEqual(self._tablebase.getBestMove(board, 1), (0, 2))
+        board = self._create_board([(1, 0, 0), (2, 1, 1), (1, 0, 1)])
+        self.assertEqual(self._tablebase.getBestMove(board, 2), (0, 2))
+
+    def test_players_may_be_swapped(self):
+        board = self._create_board([(2, 0, 0), (1, 1, 0), (2, 0, 1), (1, 1, 1)])
+        self.assertEqual(self._tablebase.probePosition(board, 2), (WIN_VALUE, 1))
+        self.assertEqual(self._tablebase.getBestMove(board, 2), (0, 2))
+
+    def test_game_over_has_no_move(self):
+        board = self._create_board([(1, 0, 0), (2, 1, 0), (1, 0, 1), (2, 1, 1), (1, 0, 2)])
+        self.assertEqual(self._tablebase.probePosition(board, 2), (LOSS_VALUE, 0))
+        self.assertEqual(self._tablebase.getBestMove(board, 2), None)
+
+    def test_chunks_are_mapped_lazily(self):
+        self.assertEqual(self._tablebase.getNumberOfOpenChunks(), 0)
+        self._tablebase.probePosition(Board(), 1)
+        self.assertEqual(self._tablebase.getNumberOfOpenChunks(), 1)
+
+    def test_generation_resumes_and_runs_in_parallel(self):
+        generateTablebase(self._otherDirectory, 3, 3, 4, 1, 1000)
+        os.remove(_get_chunk_file_name(self._otherDirectory, 4, 1))
+        summary = generateTablebase(self._otherDirectory, 3, 3, 5, 2, 1000)
+        self.assertEqual((summary["generatedChunks"], summary["entries"]), (2, 126 + 630 + 1260 + 1680 + 1260 + 756))
+        expectedChunks = self._read_chunks(self._directory)
+        for chunkFileName, chunkBytes in self._read_chunks(self._otherDirectory).items():
+            self.assertEqual(chunkBytes, expectedChunks[chunkFileName])
+        self.assertEqual(Tablebase(self._otherDirectory).getMaximumEmptyPositions(), 5)
+
+    def test_larger_board(self):
+        generateTablebase(self._otherDirectory, 4, 3, 1, 1)
+        tablebase = Tablebase(self._otherDirectory)
+        board = self._create_board([(1, 0, 0), (2, 0, 1), (1, 0, 2), (2, 0, 3),
+                                    (2, 1, 0), (1, 1, 1), (2, 1, 2), (1, 1, 3),
+                                    (1, 2, 0), (2, 2, 1), (1, 2, 2), (2, 2, 3),
+                                    (2, 3, 0), (1, 3, 1), (2, 3, 2)], 4, 3)
+        self.assertEqual(tablebase.probePosition(board, 2), None)
+        self.assertEqual(tablebase.probePosition(self._create_board([], 4, 3), 1), None)
+        self.assertEqual(self._tablebase.probePosition(board, 1), None)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_impossible_marker_counts(self):
+        board = self._create_board([(1, 0, 0), (1, 1, 1)])
+        self.assertEqual(self._tablebase.probePosition(board, 1), None)
+        self.assertEqual(self._tablebase.probePosition(board, 2), None)
+
+    def test_invalid_tablebase_arguements(self):
+        self.assertRaises(PreconditionError, generateTablebase, self._otherDirectory, 3, 4, 2)
+        self.assertRaises(PreconditionError, generateTablebase, self._otherDirectory, 3, 3, 10)
+        self.assertRaises(PreconditionError, self._tablebase.probePosition, Board(), 3)
+        self.assertRaises(TablebaseError, Tablebase, self._otherDirectory)
+        self.assertRaises(TablebaseError, generateTablebase, self._directory, 3, 3, 2, 1, 500)
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
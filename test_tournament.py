@@ -0,0 +1,208 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import math
+import os
+import random
+import shutil
+import tempfile
+from conditions import PreconditionError
+from tournament import runTournament, readTournamentResults, computeEloRatings, createRoundRobinPairings, createSwissPairings, _create_pairing_games, TournamentError, ROUND_ROBIN_FORMAT, SWISS_FORMAT, BASE_RATING, ELO_SCALE
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestPairings(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def _create_result(self, roundNumber, firstPlayer, secondPlayer, winner):
+        return {"game": 0, "round": roundNumber, "firstPlayer": firstPlayer, "secondPlayer": secondPlayer, "winner": winner, "moves": 9}
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_round_robin_pairs_every_policy_once(self):
+        self.assertEqual(createRoundRobinPairings(["random", "greedy", "solver"]),
+                         [("random", "greedy"), ("random", "solver"), ("greedy", "solver")])
+
+    def test_policies_take_turns_to_move_first(self):
+        tournamentGames = _create_pairing_games([("random", "greedy")], 4, 0, 3, 3, 3, 0)
+        self.assertEqual([tournamentGame[:4] for tournamentGame in tournamentGames],
+                         [(4, 0, "random", "greedy"), (5, 0, "greedy", "random"), (6, 0, "random", "greedy")])
+
+    def test_swiss_pairs_equal_scores_without_rematches(self):
+        playerNames = ["random", "greedy", "solver", "alphabeta"]
+        self.assertEqual(createSwissPairings(playerNames, []), ([("random", "greedy"), ("solver", "alphabeta")], None))
+        gameResults = [self._create_result(0, "random", "greedy", "greedy"), self._create_result(0, "solver", "alphabeta", "solver")]
+        self.assertEqual(createSwissPairings(playerNames, gameResults), ([("greedy", "solver"), ("random", "alphabeta")], None))
+
+    def test_swiss_bye_goes_to_a_new_policy(self):
+        playerNames = ["random", "greedy", "solver"]
+        self.assertEqual(createSwissPairings(playerNames, []), ([("random", "greedy")], "solver"))
+        gameResults = [self._create_result(0, "random", "greedy", "random")]
+        pairings, byePlayer = createSwissPairings(playerNames, gameResults)
+        self.assertEqual(byePlayer, "greedy")
+        self.assertEqual(pairings, [("random", "solver")])
+
+class TestEloRatings(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def _create_results(self, firstPlayer, secondPlayer, winners):
+        return [{"game": gameNumber, "round": 0, "firstPlayer": firstPlayer, "secondPlayer": secondPlayer, "winner": winner, "moves": 9}
+                for gameNumber, winner in enumerate(winners)]
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_even_results_give_even_ratings(self):
+        gameResults = self._create_results("random", "greedy", ["random", "greedy", None, None])
+        eloRatings = computeEloRatings(gameResults, ["random", "greedy"], 0)
+        self.assertAlmostEqual(eloRatings["random"][0], BASE_RATING)
+        self.assertAlmostEqual(eloRatings["greedy"][0], BASE_RATING)
+
+    def test_winner_is_rated_higher_and_finite(self):
+        gameResults = self._create_results("random", "greedy", ["greedy"] * 10)
+        eloRatings = computeEloRatings(gameResults, ["random", "greedy"], 50)
+        self.assertTrue(eloRatings["greedy"][0] > eloRatings["random"][0])
+        self.assertAlmostEqual(eloRatings["greedy"][0] + eloRatings["random"][0], 2 * BASE_RATING)
+        # 10.5 to 0.5 is an expected score of 21 to 1
+        self.assertAlmostEqual(eloRatings["greedy"][0] - eloRatings["random"][0], ELO_SCALE * math.log10(21.0))
+
+    def test_confidence_interval_holds_rating_and_narrows(self):
+        fewResults = self._create_results("random", "greedy", ["greedy", "random", "greedy", None])
+        manyResults = self._create_results("random", "greedy", ["greedy", "random", "greedy", None] * 25)
+        for gameResults in (fewResults, manyResults):
+            for rating, lowRating, highRating in computeEloRatings(gameResults, ["random", "greedy"], 100, 3).values():
+                self.assertTrue(lowRating <= rating <= highRating)
+        fewRating = computeEloRatings(fewResults, ["random", "greedy"], 100, 3)["greedy"]
+        manyRating = computeEloRatings(manyResults, ["random", "greedy"], 100, 3)["greedy"]
+        self.assertTrue(manyRating[2] - manyRating[1] < fewRating[2] - fewRating[1])
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_no_games(self):
+        self.assertEqual(computeEloRatings([], ["random", "greedy"]), {"random": (BASE_RATING,) * 3, "greedy": (BASE_RATING,) * 3})
+
+    def test_invalid_arguements(self):
+        self.assertRaises(PreconditionError, computeEloRatings, "games", ["random"])
+        self.assertRaises(PreconditionError, computeEloRatings, [], [])
+        self.assertRaises(PreconditionError, computeEloRatings, [], ["random"], -1)
+
+class TestRunTournament(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self._resultsFileName = os.path.join(self._directory, "results.jsonl")
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def _read_sorted_results(self, resultsFileName):
+        settings, gameResults = readTournamentResults(resultsFileName)
+        return sorted(gameResults, key=(lambda gameResult: gameResult["game"]))
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_round_robin_plays_and_records_every_game(self):
+        standings = runTournament(self._resultsFileName, ["random", "greedy", "solver"], ROUND_ROBIN_FORMAT, 4, None, 3, 3, 1, 7)
+        self.assertEqual((standings["games"], standings["playedGames"]), (12, 12))
+        gameResults = self._read_sorted_results(self._resultsFileName)
+        self.assertEqual([gameResult["game"] for gameResult in gameResults], range(12))
+        for playerName in ("random", "greedy", "solver"):
+            self.assertEqual(standings["players"][playerName]["games"], 8)
+            self.assertEqual(len([gameResult for gameResult in gameResults if gameResult["firstPlayer"] == playerName]), 4)
+        self.assertEqual(standings["players"]["solver"]["losses"], 0)
+        self.assertTrue(standings["players"]["solver"]["rating"] > standings["players"]["random"]["rating"])
+
+    def test_stopped_tournament_resumes(self):
+        runTournament(self._resultsFileName, ["random", "greedy"], ROUND_ROBIN_FORMAT, 6, None, 3, 3, 1, 5)
+        completeResults = self._read_sorted_results(self._resultsFileName)
+        with open(self._resultsFileName, "r") as resultsFile:
+            resultsLines = resultsFile.readlines()
+        with open(self._resultsFileName, "w") as resultsFile:
+            resultsFile.writelines(resultsLines[:4])
+            resultsFile.write(resultsLines[4][:10])
+        standings = runTournament(self._resultsFileName, ["random", "greedy"], ROUND_ROBIN_FORMAT, 6, None, 3, 3, 1, 5)
+        self.assertEqual((standings["games"], standings["playedGames"]), (6, 3))
+        self.assertEqual(self._read_sorted_results(self._resultsFileName), completeResults)
+        standings = runTournament(self._resultsFileName, ["random", "greedy"], ROUND_ROBIN_FORMAT, 6, None, 3, 3, 1, 5)
+        self.assertEqual(standings["playedGames"], 0)
+
+    def test_process_pool_matches_single_process(self):
+        otherResultsFileName = os.path.join(self._directory, "other_results.jsonl")
+        runTournament(self._resultsFileName, ["random", "greedy", "solver"], SWISS_FORMAT, 2, 2, 3, 3, 1, 3)
+        runTournament(otherResultsFileName, ["random", "greedy", "solver"], SWISS_FORMAT, 2, 2, 3, 3, 2, 3)
+        gameResults = self._read_sorted_results(self._resultsFileName)
+        self.assertEqual(self._read_sorted_results(otherResultsFileName), gameResults)
+        self.assertEqual(sorted(set(gameResult["round"] for gameResult in gameResults)), [0, 1])
+
+    def test_swiss_on_larger_board(self):
+        standings = runTournament(self._resultsFileName, ["random", "greedy"], SWISS_FORMAT, 1, 3, 4, 3, 1, 0)
+        self.assertEqual(standings["games"], 3)
+        gameResults = self._read_sorted_results(self._resultsFileName)
+        self.assertEqual([gameResult["round"] for gameResult in gameResults], [0, 1, 2])
+        self.assertTrue(all(gameResult["moves"] <= 16 for gameResult in gameResults))
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_different_tournament_in_results_file(self):
+        runTournament(self._resultsFileName, ["random", "greedy"], ROUND_ROBIN_FORMAT, 2, None, 3, 3, 1, 0)
+        self.assertRaises(TournamentError, runTournament, self._resultsFileName, ["random", "greedy"], ROUND_ROBIN_FORMAT, 4, None, 3, 3, 1, 0)
+        with open(self._resultsFileName, "w") as resultsFile:
+            resultsFile.write("not a tournament\n")
+        self.assertRaises(TournamentError, readTournamentResults, self._resultsFileName)
+
+    def test_invalid_arguements(self):
+        self.assertRaises(PreconditionError, runTournament, self._resultsFileName, ["random"])
+        self.assertRaises(PreconditionError, runTournament, self._resultsFileName, ["random", "random"])
+        self.assertRaises(PreconditionError, runTournament, self._resultsFileName, ["random", "unknown"])
+        self.assertRaises(PreconditionError, runTournament, self._resultsFileName, ["random", "greedy"], "knockout")
+        self.assertRaises(PreconditionError, runTournament, self._resultsFileName, ["random", "greedy"], SWISS_FORMAT, 0)
+        self.assertRaises(PreconditionError, runTournament, self._resultsFileName, ["random", "solver"], ROUND_ROBIN_FORMAT, 2, None, 4, 3)
+        self.assertFalse(os.path.exists(self._resultsFileName))
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
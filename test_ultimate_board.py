@@ -0,0 +1,242 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import unittest
+import random
+import time
+from conditions import PreconditionError
+from board import Board
+from ultimate_board import UltimateBoard, UltimateEngine
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# TEST FLAG
+#------------------------------------------------------------------------------------------------------
+testFlag = None
+
+#------------------------------------------------------------------------------------------------------
+# TESTING IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+class TestUltimateBoard(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    _board = None
+
+    def setUp(self):
+        self._board = UltimateBoard()
+
+    def tearDown(self):
+        self._board = None
+
+    def _play_moves(self, moves):
+        for boardXPosition, boardYPosition in moves:
+            self._board.placePlayerMarkerOnBoardAtPosition(self._board.getPlayerToMove(), boardXPosition, boardYPosition)
+
+    def _get_board_state(self, board):
+        return ( [list(playerMasks) for playerMasks in board._playerMasks], list(board._wonMasks), board._closedMask,
+                 board._nextSubBoardIndex, board._playerToMove, board._winningPlayerNumber )
+
+    # A game which player 1 wins with the middle row of sub boards on the last move
+    _player_one_win_moves = [ (5, 0), (7, 2), (4, 6), (4, 2), (5, 6), (8, 2), (8, 6), (7, 1), (5, 5), (7, 8), (3, 6), (1, 0), (5, 2),
+                              (8, 7), (6, 4), (0, 4), (0, 5), (1, 7), (3, 3), (0, 0), (2, 2), (7, 7), (4, 4), (7, 4), (5, 1) ]
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_empty_board(self):
+        self.assertEqual(len(self._board.getLegalMoves()), 81)
+        self.assertEqual((self._board.getPlayerToMove(), self._board.getNextSubBoard(), self._board.winner()), (1, None, None))
+        self.assertFalse(self._board.isGameOver())
+
+    def test_move_picks_the_next_sub_board(self):
+        self._play_moves([(4, 5)])
+        self.assertEqual(self._board.getNextSubBoard(), (1, 2))
+        self.assertEqual(sorted(self._board.getLegalMoves()), [(boardXPosition, boardYPosition) for boardXPosition in range(3, 6) for boardYPosition in range(6, 9)])
+        self.assertEqual(self._board.getMarkerAtBoardPosition(4, 5), Board.PLAYER_TOKEN_VALUE[0])
+        self.assertEqual(self._board.getSubBoard(1, 1).getMarkerAtBoardPosition(1, 2), Board.PLAYER_TOKEN_VALUE[0])
+
+    def test_won_sub_board_is_closed(self):
+        self._play_moves(self._player_one_win_moves[:11])
+        self.assertEqual(self._board.getSubBoardWinner(1, 2), 1)
+        self.assertEqual(self._board.getSubBoard(1, 2).winner(), 1)
+        self.assertEqual(self._board.getMetaBoard().getMarkerAtBoardPosition(1, 2), Board.PLAYER_TOKEN_VALUE[0])
+        # Player 1 wins the centre sub board with its centre, so player 2 may play in any open sub board
+        self._play_moves(self._player_one_win_moves[11:23])
+        self.assertEqual(self._board.getSubBoardWinner(1, 1), 1)
+        self.assertEqual(self._board.getNextSubBoard(), None)
+        self.assertEqual(len(self._board.getLegalMoves()), 46)
+        self.assertRaises(PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, 2, 4, 3)
+
+    def test_meta_line_wins_the_game(self):
+        self._play_moves(self._player_one_win_moves[:-1])
+        self.assertEqual((self._board.winner(), self._board.isGameOver()), (None, False))
+        self._play_moves(self._player_one_win_moves[-1:])
+        self.assertEqual((self._board.winner(), self._board.isGameOver(), self._board.isDraw()), (1, True, False))
+        self.assertEqual(self._board.getMetaBoard().winner(), 1)
+        self.assertEqual(self._board.getLegalMoves(), [])
+
+    def test_undo_restores_every_position(self):
+        randomGenerator = random.Random(5)
+        board = UltimateBoard()
+        boardStates = []
+        while not board.isGameOver():
+            boardStates += [self._get_board_state(board)]
+            boardXPosition, boardYPosition = randomGenerator.choice(board.getLegalMoves())
+            board.placePlayerMarkerOnBoardAtPosition(board.getPlayerToMove(), boardXPosition, boardYPosition)
+        self.assertEqual(len(board.getMoveHistory()), len(boardStates))
+        for boardState in reversed(boardStates):
+            board.undoMove()
+            self.assertEqual(self._get_board_state(board), boardState)
+        self.assertEqual(board.undoMove(), None)
+
+    def test_random_games_agree_with_boards(self):
+        # The incremental sub board and meta board results agree with Boards built from the markers
+        randomGenerator = random.Random(11)
+        for gameNumber in range(20):
+            board = UltimateBoard()
+            while not board.isGameOver():
+                boardXPosition, boardYPosition = randomGenerator.choice(board.getLegalMoves())
+                board.placePlayerMarkerOnBoardAtPosition(board.getPlayerToMove(), boardXPosition, boardYPosition)
+            closedSubBoards = 0
+            for metaXPosition in range(3):
+                for metaYPosition in range(3):
+                    subBoard = board.getSubBoard(metaXPosition, metaYPosition)
+                    self.assertEqual(board.getSubBoardWinner(metaXPosition, metaYPosition), subBoard.winner())
+                    closedSubBoards += subBoard.isGameOver()
+            self.assertEqual(board.winner(), board.getMetaBoard().winner())
+            self.assertEqual(board.isDraw(), (board.winner() is None) and (closedSubBoards == 9))
+
+    def test_board_as_string(self):
+        self._play_moves([(0, 0), (1, 1)])
+        boardRows = self._board.getBoardAsString().split("\n")
+        self.assertEqual(len(boardRows), 11)
+        self.assertEqual(boardRows[:4], ["O..|...|...", ".X.|...|...", "...|...|...", "---+---+---"])
+
+    def test_copy_is_independent(self):
+        self._play_moves([(0, 0)])
+        boardCopy = self._board.copyBoard()
+        self._play_moves([(0, 1)])
+        self.assertEqual(boardCopy.getMarkerAtBoardPosition(0, 1), Board.EMPTY_VALUE)
+        self.assertEqual(boardCopy.getMoveHistory(), [(1, 0, 0)])
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_illegal_moves(self):
+        self._play_moves([(4, 4)])
+        self.assertRaises(PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, 1, 3, 3)
+        self.assertRaises(PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, 2, 4, 4)
+        self.assertRaises(PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, 2, 0, 0)
+        for invalidPosition in (-1, 9, 0.0, "1"):
+            self.assertRaises(PreconditionError, self._board.placePlayerMarkerOnBoardAtPosition, 2, invalidPosition, 3)
+            self.assertRaises(PreconditionError, self._board.getMarkerAtBoardPosition, 3, invalidPosition)
+        self.assertRaises(PreconditionError, self._board.getSubBoard, 3, 0)
+        self.assertRaises(PreconditionError, self._board.getSubBoardWinner, 0, -1)
+
+class TestUltimateEngine(unittest.TestCase):
+
+    #------------------------------------------------------------------------------------------------------
+    # TESTING SUPPORT CODE
+    #------------------------------------------------------------------------------------------------------
+    def _create_board(self, moves):
+        board = UltimateBoard()
+        for boardXPosition, boardYPosition in moves:
+            board.placePlayerMarkerOnBoardAtPosition(board.getPlayerToMove(), boardXPosition, boardYPosition)
+        return board
+
+    #------------------------------------------------------------------------------------------------------
+    # POSITIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_takes_winning_move(self):
+        board = self._create_board(TestUltimateBoard._player_one_win_moves[:-1])
+        winningMoves = []
+        for boardXPosition, boardYPosition in board.getLegalMoves():
+            board.placePlayerMarkerOnBoardAtPosition(1, boardXPosition, boardYPosition)
+            if board.winner() == 1:
+                winningMoves += [(boardXPosition, boardYPosition)]
+            board.undoMove()
+        self.assertTrue(TestUltimateBoard._player_one_win_moves[-1] in winningMoves)
+        engine = UltimateEngine(None, 20000, UltimateEngine.DEFAULT_EXPLORATION_CONSTANT, 1)
+        self.assertTrue(engine.getBestMove(board, 1) in winningMoves)
+
+    def test_search_leaves_board_unchanged(self):
+        board = self._create_board([(4, 4), (3, 3)])
+        boardString = board.getBoardAsString()
+        engine = UltimateEngine(None, 5000, UltimateEngine.DEFAULT_EXPLORATION_CONSTANT, 2)
+        bestMove = engine.getBestMove(board, 1)
+        self.assertTrue(bestMove in board.getLegalMoves())
+        self.assertEqual(board.getBoardAsString(), boardString)
+
+    def test_search_of_nodes_is_repeatable(self):
+        board = self._create_board([(4, 4)])
+        firstMove = UltimateEngine(None, 3000, UltimateEngine.DEFAULT_EXPLORATION_CONSTANT, 3).getBestMove(board, 2)
+        self.assertEqual(UltimateEngine(None, 3000, UltimateEngine.DEFAULT_EXPLORATION_CONSTANT, 3).getBestMove(board, 2), firstMove)
+
+    def test_search_statistics(self):
+        engine = UltimateEngine(None, 5000, UltimateEngine.DEFAULT_EXPLORATION_CONSTANT, 4)
+        engine.getBestMove(UltimateBoard(), 1)
+        searchStatistics = engine.getLastSearchStatistics()
+        self.assertTrue(5000 <= searchStatistics["nodes"] < 5000 + 81)
+        self.assertTrue(searchStatistics["iterations"] >= 1)
+        self.assertTrue(searchStatistics["nodesPerSecond"] > 0)
+        self.assertTrue(0.0 <= searchStatistics["score"] <= 1.0)
+
+    def test_time_limit(self):
+        engine = UltimateEngine(0.05)
+        startTime = time.time()
+        engine.getBestMove(UltimateBoard(), 1)
+        self.assertTrue(time.time() - startTime < 1.0)
+        self.assertTrue(engine.getLastSearchStatistics()["iterations"] >= 1)
+
+    #------------------------------------------------------------------------------------------------------
+    # NEGATIVE TESTING
+    #------------------------------------------------------------------------------------------------------
+    def test_game_over_has_no_move(self):
+        board = UltimateBoard()
+        randomGenerator = random.Random(8)
+        while not board.isGameOver():
+            boardXPosition, boardYPosition = randomGenerator.choice(board.getLegalMoves())
+            board.placePlayerMarkerOnBoardAtPosition(board.getPlayerToMove(), boardXPosition, boardYPosition)
+        engine = UltimateEngine(None, 100)
+        self.assertEqual(engine.getBestMove(board, board.getPlayerToMove()), None)
+        self.assertEqual(engine.getLastSearchStatistics()["iterations"], 0)
+
+    def test_invalid_arguements(self):
+        engine = UltimateEngine(None, 100)
+        self.assertRaises(PreconditionError, engine.getBestMove, UltimateBoard(), 2)
+        self.assertRaises(PreconditionError, engine.getBestMove, Board(), 1)
+        self.assertRaises(PreconditionError, UltimateEngine, 0)
+        self.assertRaises(PreconditionError, UltimateEngine, None, 0)
+        self.assertRaises(PreconditionError, UltimateEngine, None, 10, -1.0)
+        self.assertRaises(PreconditionError, UltimateEngine, None, 10, 1.0, "1")
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+    
+    # Check corret length of command line arguement string
+    if not (len(sys.argv) == 2):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Check valid command line arguements entered
+    if ((not (sys.argv[1] == '-interactive')) and (not (sys.argv[1] == '-compilation'))):
+        print "Test Bench: Not Correct Testing Arguements\n"
+        sys.exit(0)
+
+    # Set the testing flag for the testing level for the module
+    testFlag = ((sys.argv[1]) + '.')[:-1]
+
+    # Add verbose output for compilation testing
+    if testFlag == "-compilation":
+        sys.argv[1] = "-v"
+    else:
+        del sys.argv[1]
+
+    # Run test harness
+    unittest.main()
+
+#END
\ No newline at end of file
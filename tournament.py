@@ -0,0 +1,472 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import json
+import math
+import multiprocessing
+import os
+import random
+import timeit
+from conditions import preconditions, PreconditionError
+from board import Board
+from policies import createPolicy, POLICY_NAMES, SOLVER_POLICY
+from simulator import playGame
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# A tournament is played between policies, each pairing playing a number of games in which the policies
+# take turns to move first. A round robin tournament pairs every policy with every other policy once. A
+# Swiss tournament plays rounds, pairing policies with equal scores who have not met yet.
+#
+# The results file holds one line of JSON with the settings of the tournament, then one line for each
+# game as it finishes:
+#     {"game": <game number>, "round": <round number>, "firstPlayer": <policy>, "secondPlayer": <policy>,
+#      "winner": <policy or null for a draw>, "moves": <number of moves>}
+# Each game seeds its own policies from its game number, so a stopped tournament is resumed by playing
+# only the games missing from its results file, and the results do not depend on the worker processes.
+ROUND_ROBIN_FORMAT = "roundrobin"
+SWISS_FORMAT = "swiss"
+TOURNAMENT_FORMATS = (ROUND_ROBIN_FORMAT, SWISS_FORMAT)
+TOURNAMENT_VERSION = 1
+
+# Elo ratings are fitted to every game, centred on BASE_RATING, with one virtual draw added between each
+# pair of policies which have met (so that a policy which wins or loses every game has a finite rating).
+# The confidence interval is the middle CONFIDENCE of the ratings fitted to resampled games
+BASE_RATING = 1500.0
+ELO_SCALE = 400.0
+CONFIDENCE = 0.95
+DEFAULT_NUMBER_OF_RESAMPLES = 200
+_MAXIMUM_FITTING_ITERATIONS = 10000
+_FITTING_TOLERANCE = 1e-10
+
+class TournamentError(Exception):
+    '''
+    This exception is given when a results file is not of the tournament being played
+    '''
+
+def _play_tournament_game(tournamentGame):
+    # Runs in a worker process, so the policies are sent by name and created here
+    gameNumber, roundNumber, firstPlayer, secondPlayer, boardSize, winLength, seed = tournamentGame
+    firstPolicy = createPolicy(firstPlayer, seed + 2 * gameNumber)
+    secondPolicy = createPolicy(secondPlayer, seed + 2 * gameNumber + 1)
+    winningPlayerNumber, numberOfMoves = playGame(firstPolicy, secondPolicy, boardSize, winLength)
+    winner = None
+    if winningPlayerNumber is not None:
+        winner = (firstPlayer, secondPlayer)[winningPlayerNumber - 1]
+    return { "game": gameNumber,
+             "round": roundNumber,
+             "firstPlayer": firstPlayer,
+             "secondPlayer": secondPlayer,
+             "winner": winner,
+             "moves": numberOfMoves }
+
+def _create_pairing_games(pairings, firstGameNumber, roundNumber, gamesPerPairing, boardSize, winLength, seed):
+    # The policies of a pairing take turns to move first
+    tournamentGames = []
+    for firstPlayer, secondPlayer in pairings:
+        for pairingGameNumber in range(gamesPerPairing):
+            players = (firstPlayer, secondPlayer) if pairingGameNumber % 2 == 0 else (secondPlayer, firstPlayer)
+            tournamentGames += [(firstGameNumber + len(tournamentGames), roundNumber, players[0], players[1], boardSize, winLength, seed)]
+    return tournamentGames
+
+def createRoundRobinPairings(playerNames):
+    '''
+    DESCRIPTION:
+        Pairs every policy with every other policy once
+
+    PARAMETERS:
+        playerNames: a list of policy names
+
+    RETURNS:
+        A list of (policy name, policy name) pairings, in the order of the policies
+    '''
+    return [(playerNames[firstIndex], playerNames[secondIndex])
+            for firstIndex in range(len(playerNames)) for secondIndex in range(firstIndex + 1, len(playerNames))]
+#END
+
+def createSwissPairings(playerNames, gameResults):
+    '''
+    DESCRIPTION:
+        Pairs the policies for the next round of a Swiss tournament. Policies are ranked by their score
+        (a win scoring 1, a draw 1/2, and a bye 1), then by their order, and each policy from the top is
+        paired with the highest ranked policy it has not met, or the next policy if it has met them all.
+        With an odd number of policies, the lowest ranked policy without a bye sits the round out
+
+    PARAMETERS:
+        playerNames: a list of policy names, in the order which breaks ties
+        gameResults: the results of the games of the earlier rounds
+
+    RETURNS:
+        A tuple (a list of (policy name, policy name) pairings, the policy with a bye or None)
+    '''
+    scores = _get_swiss_scores(playerNames, gameResults)
+    metPlayers = dict((playerName, set()) for playerName in playerNames)
+    for gameResult in gameResults:
+        metPlayers[gameResult["firstPlayer"]].add(gameResult["secondPlayer"])
+        metPlayers[gameResult["secondPlayer"]].add(gameResult["firstPlayer"])
+    rankedPlayers = sorted(playerNames, key=(lambda playerName: (-scores[playerName], playerNames.index(playerName))))
+
+    byePlayer = None
+    if len(rankedPlayers) % 2 == 1:
+        earlierByePlayers = _get_bye_players(playerNames, gameResults)
+        byePlayer = rankedPlayers[-1]
+        for playerName in reversed(rankedPlayers):
+            if playerName not in earlierByePlayers:
+                byePlayer = playerName
+                break
+        rankedPlayers.remove(byePlayer)
+
+    pairings = []
+    while rankedPlayers:
+        firstPlayer = rankedPlayers.pop(0)
+        newOpponents = [playerName for playerName in rankedPlayers if playerName not in metPlayers[firstPlayer]]
+        secondPlayer = (newOpponents or rankedPlayers)[0]
+        rankedPlayers.remove(secondPlayer)
+        pairings += [(firstPlayer, secondPlayer)]
+    return pairings, byePlayer
+#END
+
+def _get_bye_players(playerNames, gameResults):
+    # The policies which played no game in a round had its bye, so a policy is listed once for each bye
+    byePlayers = []
+    for roundNumber in sorted(set(gameResult["round"] for gameResult in gameResults)):
+        roundPlayers = set()
+        for gameResult in gameResults:
+            if gameResult["round"] == roundNumber:
+                roundPlayers.update((gameResult["firstPlayer"], gameResult["secondPlayer"]))
+        byePlayers += [playerName for playerName in playerNames if playerName not in roundPlayers]
+    return byePlayers
+
+def _get_swiss_scores(playerNames, gameResults):
+    scores = dict((playerName, 0.0) for playerName in playerNames)
+    for gameResult in gameResults:
+        if gameResult["winner"] is None:
+            scores[gameResult["firstPlayer"]] += 0.5
+            scores[gameResult["secondPlayer"]] += 0.5
+        else:
+            scores[gameResult["winner"]] += 1.0
+    for byePlayer in _get_bye_players(playerNames, gameResults):
+        scores[byePlayer] += 1.0
+    return scores
+
+def _fit_ratings(playerNames, pairScores):
+    # Fits Bradley-Terry strengths by minorization-maximization (each strength is the policy's score over
+    # the sum of its games weighted by the pairing's total strength), and converts them to Elo ratings
+    strengths = dict((playerName, 1.0) for playerName in playerNames)
+    totalScores = dict((playerName, 0.0) for playerName in playerNames)
+    numbersOfGames = {}
+    for (firstPlayer, secondPlayer), (firstScore, secondScore) in pairScores.items():
+        totalScores[firstPlayer] += firstScore
+        totalScores[secondPlayer] += secondScore
+        numbersOfGames[(firstPlayer, secondPlayer)] = firstScore + secondScore
+    for iterationNumber in range(_MAXIMUM_FITTING_ITERATIONS):
+        denominators = dict((playerName, 0.0) for playerName in playerNames)
+        for (firstPlayer, secondPlayer), numberOfGames in numbersOfGames.items():
+            pairingWeight = numberOfGames / (strengths[firstPlayer] + strengths[secondPlayer])
+            denominators[firstPlayer] += pairingWeight
+            denominators[secondPlayer] += pairingWeight
+        newStrengths = dict((playerName, totalScores[playerName] / denominators[playerName] if denominators[playerName] > 0.0 else 1.0)
+                            for playerName in playerNames)
+        geometricMean = math.exp(sum(math.log(strength) for strength in newStrengths.values()) / len(playerNames))
+        newStrengths = dict((playerName, strength / geometricMean) for playerName, strength in newStrengths.items())
+        largestChange = max(abs(newStrengths[playerName] - strengths[playerName]) for playerName in playerNames)
+        strengths = newStrengths
+        if largestChange < _FITTING_TOLERANCE:
+            break
+    return dict((playerName, BASE_RATING + ELO_SCALE * math.log10(strengths[playerName])) for playerName in playerNames)
+
+def _get_pair_scores(gameResults):
+    # The score of each policy of every pairing which has met, starting from one virtual draw
+    pairScores = {}
+    for gameResult in gameResults:
+        pairing = tuple(sorted((gameResult["firstPlayer"], gameResult["secondPlayer"])))
+        firstScore, secondScore = pairScores.get(pairing, (0.5, 0.5))
+        if gameResult["winner"] is None:
+            firstScore, secondScore = firstScore + 0.5, secondScore + 0.5
+        elif gameResult["winner"] == pairing[0]:
+            firstScore += 1.0
+        else:
+            secondScore += 1.0
+        pairScores[pairing] = (firstScore, secondScore)
+    return pairScores
+
+@preconditions( (lambda gameResults: isinstance(gameResults, list)),
+                (lambda playerNames: isinstance(playerNames, list) and (len(playerNames) >= 1)),
+                (lambda numberOfResamples: ((isinstance(numberOfResamples, int))) and (numberOfResamples >= 0)),
+                (lambda seed: isinstance(seed, int)) )
+def computeEloRatings(gameResults, playerNames, numberOfResamples=DEFAULT_NUMBER_OF_RESAMPLES, seed=0):
+    '''
+    DESCRIPTION:
+        Fits Elo ratings to the results of a tournament, with a confidence interval for each rating from
+        the ratings fitted to resampled games (the games drawn again at random, with replacement)
+
+    PARAMETERS:
+        gameResults: a list of game results, as held in a results file
+        playerNames: a list of the policy names
+        numberOfResamples: (optional) the number of resamples for the confidence intervals, or 0 for none
+        seed: (optional) an integer seed for the resampling
+
+    RETURNS:
+        (valid arguement)
+            A dictionary from each policy name to a tuple (rating, lowest rating, highest rating) of its
+            rating and the CONFIDENCE interval around it
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    ratings = _fit_ratings(playerNames, _get_pair_scores(gameResults))
+    resampledRatings = dict((playerName, []) for playerName in playerNames)
+    randomGenerator = random.Random(seed)
+    for resampleNumber in range(numberOfResamples if gameResults else 0):
+        resampledGames = [randomGenerator.choice(gameResults) for _ in gameResults]
+        for playerName, rating in _fit_ratings(playerNames, _get_pair_scores(resampledGames)).items():
+            resampledRatings[playerName] += [rating]
+    eloRatings = {}
+    for playerName in playerNames:
+        playerRatings = sorted(resampledRatings[playerName])
+        if not playerRatings:
+            eloRatings[playerName] = (ratings[playerName], ratings[playerName], ratings[playerName])
+            continue
+        lowIndex = int(math.floor((1.0 - CONFIDENCE) / 2.0 * (len(playerRatings) - 1)))
+        highIndex = int(math.ceil((1.0 + CONFIDENCE) / 2.0 * (len(playerRatings) - 1)))
+        eloRatings[playerName] = (ratings[playerName], min(playerRatings[lowIndex], ratings[playerName]),
+                                  max(playerRatings[highIndex], ratings[playerName]))
+    return eloRatings
+#END
+
+@preconditions( (lambda resultsFileName: isinstance(resultsFileName, basestring)) )
+def readTournamentResults(resultsFileName):
+    '''
+    DESCRIPTION:
+        Reads the settings and the finished games of a tournament. A game line left part written by a
+        stopped tournament is ignored
+
+    PARAMETERS:
+        resultsFileName: the path of the results file
+
+    RETURNS:
+        (valid arguement)
+            A tuple (a dictionary of the settings, a list of the game results in the order they finished)
+        (invalid arguement)
+            a PreconditionError is thrown, an IOError if the file can not be read, or a TournamentError if
+            it is not a results file
+    '''
+    with open(resultsFileName, "r") as resultsFile:
+        resultsLines = resultsFile.read().split("\n")
+    try:
+        settings = json.loads(resultsLines[0])["settings"]
+    except (ValueError, KeyError, TypeError):
+        raise TournamentError("{} is not a tournament results file".format(resultsFileName))
+    if settings.get("version") != TOURNAMENT_VERSION:
+        raise TournamentError("{} is not a version {} tournament".format(resultsFileName, TOURNAMENT_VERSION))
+    # The last line is complete only if the file ends with a new line, when it is empty
+    return settings, [json.loads(resultsLine) for resultsLine in resultsLines[1:-1]]
+#END
+
+def _open_results_file(resultsFileName, settings):
+    # Checks that an existing results file is of the same tournament, and removes any part written game
+    # line, so that new games are appended after the finished ones
+    if not os.path.exists(resultsFileName):
+        with open(resultsFileName, "w") as resultsFile:
+            resultsFile.write(json.dumps({"settings": settings}, sort_keys=True) + "\n")
+        return []
+    fileSettings, gameResults = readTournamentResults(resultsFileName)
+    if fileSettings != settings:
+        raise TournamentError("{} holds the results of a different tournament".format(resultsFileName))
+    with open(resultsFileName, "r+") as resultsFile:
+        resultsFile.truncate(resultsFile.read().rindex("\n") + 1)
+    return gameResults
+
+def _play_games(tournamentGames, processPool, resultsFileName):
+    # Games are given to the workers one at a time as each worker becomes free, and each result is appended
+    # to the results file as soon as it finishes
+    if processPool is None:
+        finishedGames = (_play_tournament_game(tournamentGame) for tournamentGame in tournamentGames)
+    else:
+        finishedGames = processPool.imap_unordered(_play_tournament_game, tournamentGames, 1)
+    gameResults = []
+    with open(resultsFileName, "a") as resultsFile:
+        for gameResult in finishedGames:
+            resultsFile.write(json.dumps(gameResult, sort_keys=True) + "\n")
+            resultsFile.flush()
+            gameResults += [gameResult]
+    return gameResults
+
+@preconditions( (lambda resultsFileName: isinstance(resultsFileName, basestring)),
+                (lambda playerNames: isinstance(playerNames, list) and (len(playerNames) >= 2) and (len(set(playerNames)) == len(playerNames))
+                                     and all((playerName in POLICY_NAMES) for playerName in playerNames)),
+                (lambda tournamentFormat: tournamentFormat in TOURNAMENT_FORMATS),
+                (lambda gamesPerPairing: ((isinstance(gamesPerPairing, int))) and (gamesPerPairing >= 1)),
+                (lambda numberOfRounds: ((isinstance(numberOfRounds, int))) and (numberOfRounds >= 1)),
+                (lambda boardSize: ((isinstance(boardSize, int))) and (boardSize >= 1)),
+                (lambda winLength: ((isinstance(winLength, int))) and (winLength >= 1)),
+                (lambda numberOfProcesses: ((isinstance(numberOfProcesses, int))) and (numberOfProcesses >= 1)),
+                (lambda seed: isinstance(seed, int)) )
+def runTournament(resultsFileName, playerNames, tournamentFormat=ROUND_ROBIN_FORMAT, gamesPerPairing=2, numberOfRounds=None,
+                  boardSize=Board.BOARD_SIZE, winLength=None, numberOfProcesses=None, seed=0):
+    '''
+    DESCRIPTION:
+        Plays a tournament between policies over a pool of processes, appending each game to a results
+        file as it finishes. If the results file already holds some games of the same tournament, only the
+        missing games are played
+
+    PARAMETERS:
+        resultsFileName: the path of the results file
+        playerNames: a list of two or more different names from policies.POLICY_NAMES
+        tournamentFormat: (optional) ROUND_ROBIN_FORMAT or SWISS_FORMAT
+        gamesPerPairing: (optional) the number of games each pairing plays, the policies taking turns to
+                         move first
+        numberOfRounds: (optional) the number of rounds of a Swiss tournament, which defaults to enough
+                        rounds to find a winner by elimination
+        boardSize: (optional) the number of positions along each side of the board
+        winLength: (optional) the number of markers in a row needed to win, which defaults to the board size
+        numberOfProcesses: (optional) the number of worker processes, which defaults to the number of
+                           processors. With 1 process the games are played in this process
+        seed: (optional) an integer seed for policies which make random choices
+
+    RETURNS:
+        (valid arguement)
+            The standings given by getStandings for every game of the tournament, with the number of
+            "playedGames" played by this call and the "seconds" they took
+        (invalid arguement)
+            a PreconditionError is thrown, or a TournamentError if the results file holds a different
+            tournament
+    '''
+    if winLength is None:
+        winLength = boardSize
+    if (SOLVER_POLICY in playerNames) and ((boardSize != Board.BOARD_SIZE) or (winLength != Board.BOARD_SIZE)):
+        raise PreconditionError()
+    if numberOfRounds is None:
+        numberOfRounds = 1
+        if tournamentFormat == SWISS_FORMAT:
+            numberOfRounds = int(math.ceil(math.log(len(playerNames), 2)))
+    if numberOfProcesses is None:
+        numberOfProcesses = multiprocessing.cpu_count()
+    settings = { "version": TOURNAMENT_VERSION,
+                 "players": playerNames,
+                 "format": tournamentFormat,
+                 "gamesPerPairing": gamesPerPairing,
+                 "rounds": numberOfRounds,
+                 "boardSize": boardSize,
+                 "winLength": winLength,
+                 "seed": seed }
+    gameResults = _open_results_file(resultsFileName, settings)
+    finishedGameNumbers = set(gameResult["game"] for gameResult in gameResults)
+
+    startTime = timeit.default_timer()
+    numberOfPlayedGames = 0
+    processPool = None
+    if numberOfProcesses > 1:
+        processPool = multiprocessing.Pool(numberOfProcesses)
+    try:
+        # A round robin tournament is one round. Each Swiss round is paired from the rounds before it, so
+        # the rounds are played one after the other, and the games of a round in parallel
+        firstGameNumber = 0
+        for roundNumber in range(numberOfRounds):
+            if tournamentFormat == ROUND_ROBIN_FORMAT:
+                pairings = createRoundRobinPairings(playerNames)
+            else:
+                pairings, byePlayer = createSwissPairings(playerNames, [gameResult for gameResult in gameResults if gameResult["round"] < roundNumber])
+            roundGames = _create_pairing_games(pairings, firstGameNumber, roundNumber, gamesPerPairing, boardSize, winLength, seed)
+            firstGameNumber += len(roundGames)
+            missingGames = [roundGame for roundGame in roundGames if roundGame[0] not in finishedGameNumbers]
+            playedResults = _play_games(missingGames, processPool, resultsFileName)
+            numberOfPlayedGames += len(playedResults)
+            gameResults += playedResults
+    finally:
+        if processPool is not None:
+            processPool.terminate()
+            processPool.join()
+
+    standings = getStandings(playerNames, gameResults, seed)
+    standings["playedGames"] = numberOfPlayedGames
+    standings["seconds"] = timeit.default_timer() - startTime
+    return standings
+#END
+
+@preconditions( (lambda playerNames: isinstance(playerNames, list) and (len(playerNames) >= 1)),
+                (lambda gameResults: isinstance(gameResults, list)),
+                (lambda seed: isinstance(seed, int)) )
+def getStandings(playerNames, gameResults, seed=0):
+    '''
+    DESCRIPTION:
+        Totals the results of each policy and rates them
+
+    PARAMETERS:
+        playerNames: a list of the policy names
+        gameResults: a list of game results, as held in a results file
+        seed: (optional) an integer seed for the confidence intervals of the ratings
+
+    RETURNS:
+        (valid arguement)
+            A dictionary with the number of "games", and the "players" as a dictionary from each policy
+            name to a dictionary of its "games", "wins", "draws", "losses", "score" (a win scoring 1 and a
+            draw 1/2), "winsMovingFirst", and its Elo "rating", "ratingLow" and "ratingHigh"
+        (invalid arguement)
+            a PreconditionError is thrown
+    '''
+    players = dict((playerName, {"games": 0, "wins": 0, "draws": 0, "losses": 0, "score": 0.0, "winsMovingFirst": 0}) for playerName in playerNames)
+    for gameResult in gameResults:
+        for playerName in (gameResult["firstPlayer"], gameResult["secondPlayer"]):
+            players[playerName]["games"] += 1
+            if gameResult["winner"] is None:
+                players[playerName]["draws"] += 1
+            elif gameResult["winner"] == playerName:
+                players[playerName]["wins"] += 1
+                players[playerName]["winsMovingFirst"] += (playerName == gameResult["firstPlayer"])
+            else:
+                players[playerName]["losses"] += 1
+            players[playerName]["score"] = players[playerName]["wins"] + 0.5 * players[playerName]["draws"]
+    for playerName, (rating, lowRating, highRating) in computeEloRatings(gameResults, playerNames, DEFAULT_NUMBER_OF_RESAMPLES, seed).items():
+        players[playerName]["rating"] = rating
+        players[playerName]["ratingLow"] = lowRating
+        players[playerName]["ratingHigh"] = highRating
+    return {"games": len(gameResults), "players": players}
+#END
+
+def printStandings(standings):
+    print("{} games".format(standings["games"]))
+    print("    {:<10} {:>7} {:>17} {:>6} {:>6} {:>6} {:>7}".format("policy", "rating", "({:.0%} interval)".format(CONFIDENCE),
+                                                                    "wins", "draws", "losses", "score"))
+    players = standings["players"]
+    for playerName in sorted(players, key=(lambda playerName: -players[playerName]["rating"])):
+        player = players[playerName]
+        print("    {:<10} {:>7.0f} {:>17} {:>6} {:>6} {:>6} {:>7.1f}".format(playerName, player["rating"],
+                                                                            "({:.0f} to {:.0f})".format(player["ratingLow"], player["ratingHigh"]),
+                                                                            player["wins"], player["draws"], player["losses"], player["score"]))
+#END
+
+#------------------------------------------------------------------------------------------------------
+# TOURNAMENT AND TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string (a tournament is given a results file, a format, the
+    # number of games for each pairing, a board size and win length, and two or more policies, and the standings
+    # of a tournament are given its results file)
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) >= 8) and (sys.argv[1] == '-run')) or ((len(sys.argv) == 3) and (sys.argv[1] == '-standings'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Play (or resume) a tournament instead of running the tests
+    if sys.argv[1] == '-run':
+        resultsFileName, tournamentFormat = sys.argv[2], sys.argv[3]
+        gamesPerPairing, boardSize, winLength = [int(tournamentArguement) for tournamentArguement in sys.argv[4:7]]
+        standings = runTournament(resultsFileName, sys.argv[7:], tournamentFormat, gamesPerPairing, None, boardSize, winLength)
+        print("Played {} games in {:.2f} s".format(standings["playedGames"], standings["seconds"]))
+        printStandings(standings)
+        sys.exit(0)
+
+    # Print the standings of the games in a results file
+    if sys.argv[1] == '-standings':
+        settings, gameResults = readTournamentResults(sys.argv[2])
+        printStandings(getStandings(settings["players"], gameResults, settings["seed"]))
+        sys.exit(0)
+
+    # The tests of this module are in test_tournament.py, so that only running them loads them
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_tournament.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END
@@ -0,0 +1,582 @@
+#------------------------------------------------------------------------------------------------------
+# IMPORTS
+#------------------------------------------------------------------------------------------------------
+import math
+import random
+import time
+from conditions import preconditions, PreconditionError
+from board import Board
+from mcts import SearchNode, selectChild, takeRandomMove
+import sys
+
+#------------------------------------------------------------------------------------------------------
+# IMPLEMENTATION
+#------------------------------------------------------------------------------------------------------
+# Ultimate tic tac toe is played on a 3x3 meta board of 3x3 sub boards, so the board is 9x9 positions. The
+# position of a move within its sub board picks the sub board the opponent must play in next, unless that
+# sub board is closed (won or full), when the opponent may play in any open sub board. A sub board is won
+# by a line within it, and the game by a line of won sub boards. A game whose sub boards are all closed
+# without such a line is drawn.
+#
+# Each sub board is held as one 9 bit mask of positions for each player, and the meta board as one 9 bit
+# mask of sub boards won by each player and one of sub boards closed, which every move updates in constant
+# time from tables of the 512 masks. Inside this module a move is numbered (sub board * 9 + cell), where
+# sub board (meta x * 3 + meta y) and cell (x * 3 + y) are numbered like the bits of a BitBoard.
+SUB_BOARD_SIZE = Board.BOARD_SIZE
+BOARD_SIZE = SUB_BOARD_SIZE * SUB_BOARD_SIZE
+
+_NUMBER_OF_CELLS = SUB_BOARD_SIZE * SUB_BOARD_SIZE
+_FULL_MASK = (1 << _NUMBER_OF_CELLS) - 1
+_ANY_SUB_BOARD = _NUMBER_OF_CELLS
+
+def _create_winning_masks():
+    lineMasks = [sum(1 << (lineXPosition * SUB_BOARD_SIZE + lineYPosition) for lineXPosition, lineYPosition in winningLine)
+                 for winningLine in Board.WINNING_LINES]
+    return tuple(any((mask & lineMask) == lineMask for lineMask in lineMasks) for mask in range(_FULL_MASK + 1))
+
+# Whether each mask of a sub board (or of the meta board) holds a line
+_IS_WINNING_MASK = _create_winning_masks()
+
+# The cells, and for each sub board the moves, of the positions set in each mask
+_MASK_CELLS = tuple(tuple(cell for cell in range(_NUMBER_OF_CELLS) if mask & (1 << cell)) for mask in range(_FULL_MASK + 1))
+_SUB_BOARD_MOVES = tuple(tuple(tuple(subBoardIndex * _NUMBER_OF_CELLS + cell for cell in cells) for cells in _MASK_CELLS)
+                         for subBoardIndex in range(_NUMBER_OF_CELLS))
+
+# The board position of each move, and the move at each board position
+_MOVE_POSITIONS = tuple( ((subBoardIndex // SUB_BOARD_SIZE) * SUB_BOARD_SIZE + cell // SUB_BOARD_SIZE,
+                          (subBoardIndex % SUB_BOARD_SIZE) * SUB_BOARD_SIZE + cell % SUB_BOARD_SIZE)
+                         for subBoardIndex in range(_NUMBER_OF_CELLS) for cell in range(_NUMBER_OF_CELLS) )
+_POSITION_MOVES = tuple( tuple( ((boardXPosition // SUB_BOARD_SIZE) * SUB_BOARD_SIZE + boardYPosition // SUB_BOARD_SIZE) * _NUMBER_OF_CELLS +
+                                (boardXPosition % SUB_BOARD_SIZE) * SUB_BOARD_SIZE + boardYPosition % SUB_BOARD_SIZE
+                                for boardYPosition in range(BOARD_SIZE) )
+                         for boardXPosition in range(BOARD_SIZE) )
+
+def _get_legal_moves(playerOneMasks, playerTwoMasks, closedMask, nextSubBoardIndex):
+    # The moves of the sub board which must be played in, or of every open sub board
+    if nextSubBoardIndex != _ANY_SUB_BOARD:
+        return _SUB_BOARD_MOVES[nextSubBoardIndex][_FULL_MASK ^ (playerOneMasks[nextSubBoardIndex] | playerTwoMasks[nextSubBoardIndex])]
+    legalMoves = ()
+    for subBoardIndex in _MASK_CELLS[_FULL_MASK ^ closedMask]:
+        legalMoves += _SUB_BOARD_MOVES[subBoardIndex][_FULL_MASK ^ (playerOneMasks[subBoardIndex] | playerTwoMasks[subBoardIndex])]
+    return legalMoves
+
+def _play_out(playerMasks, wonMasks, closedMask, nextSubBoardIndex, moverNumber, randomNumber):
+    # Plays random moves to the end of a game, changing the masks given, and gives the winner (0 for a
+    # draw) and the number of moves played. The moves are made here rather than by UltimateBoard, as
+    # nearly every node of a search is a move of a playout
+    playerOneMasks, playerTwoMasks = playerMasks
+    numberOfMoves = 0
+    while closedMask != _FULL_MASK:
+        legalMoves = _get_legal_moves(playerOneMasks, playerTwoMasks, closedMask, nextSubBoardIndex)
+        subBoardIndex, cell = divmod(legalMoves[int(randomNumber() * len(legalMoves))], _NUMBER_OF_CELLS)
+        moverMasks = playerMasks[moverNumber - 1]
+        subBoardMask = moverMasks[subBoardIndex] | (1 << cell)
+        moverMasks[subBoardIndex] = subBoardMask
+        numberOfMoves += 1
+        if _IS_WINNING_MASK[subBoardMask]:
+            closedMask |= 1 << subBoardIndex
+            wonMasks[moverNumber - 1] |= 1 << subBoardIndex
+            if _IS_WINNING_MASK[wonMasks[moverNumber - 1]]:
+                return moverNumber, numberOfMoves
+        elif (playerOneMasks[subBoardIndex] | playerTwoMasks[subBoardIndex]) == _FULL_MASK:
+            closedMask |= 1 << subBoardIndex
+        nextSubBoardIndex = _ANY_SUB_BOARD if (closedMask >> cell) & 1 else cell
+        moverNumber = 3 - moverNumber
+    return 0, numberOfMoves
+
+class UltimateBoard(object):
+    """ An Ultimate Tic Tac Toe Board, A Meta Board Of Tic Tac Toe Boards """
+
+    __slots__ = ( "_playerMasks", "_wonMasks", "_closedMask", "_nextSubBoardIndex", "_playerToMove",
+                  "_winningPlayerNumber", "_moveHistory" )
+
+    BOARD_SIZE = BOARD_SIZE
+    SUB_BOARD_SIZE = SUB_BOARD_SIZE
+
+    def __init__(self):
+        '''
+        DESCRIPTION:
+            Constructs an empty board, on which player 1 moves first, in any sub board
+
+        RETURNS:
+            An Ultimate Board Object
+        '''
+        self._playerMasks = ([0] * _NUMBER_OF_CELLS, [0] * _NUMBER_OF_CELLS)
+        self._wonMasks = [0, 0]
+        self._closedMask = 0
+        self._nextSubBoardIndex = _ANY_SUB_BOARD
+        self._playerToMove = 1
+        self._winningPlayerNumber = None
+        self._moveHistory = []
+    #END
+
+    def copyBoard(self):
+        '''
+        DESCRIPTION:
+            Copies the board, with its move history, in time proportional to the number of moves made
+
+        RETURNS:
+            An Ultimate Board Object
+        '''
+        boardCopy = UltimateBoard()
+        boardCopy._playerMasks = (list(self._playerMasks[0]), list(self._playerMasks[1]))
+        boardCopy._wonMasks = list(self._wonMasks)
+        boardCopy._closedMask = self._closedMask
+        boardCopy._nextSubBoardIndex = self._nextSubBoardIndex
+        boardCopy._playerToMove = self._playerToMove
+        boardCopy._winningPlayerNumber = self._winningPlayerNumber
+        boardCopy._moveHistory = list(self._moveHistory)
+        return boardCopy
+    #END
+
+    def _play_move(self, move):
+        # Makes a legal move for the player to move. Each history entry packs the move and the sub board
+        # which had to be played in before it, which is all undoing the move needs, as a move is only
+        # made in an open sub board of a game which is not over
+        subBoardIndex, cell = divmod(move, _NUMBER_OF_CELLS)
+        moverNumber = self._playerToMove
+        self._moveHistory.append((self._nextSubBoardIndex << 7) | move)
+        moverMasks = self._playerMasks[moverNumber - 1]
+        subBoardMask = moverMasks[subBoardIndex] | (1 << cell)
+        moverMasks[subBoardIndex] = subBoardMask
+        if _IS_WINNING_MASK[subBoardMask]:
+            self._closedMask |= 1 << subBoardIndex
+            self._wonMasks[moverNumber - 1] |= 1 << subBoardIndex
+            if _IS_WINNING_MASK[self._wonMasks[moverNumber - 1]]:
+                self._winningPlayerNumber = moverNumber
+        elif (self._playerMasks[0][subBoardIndex] | self._playerMasks[1][subBoardIndex]) == _FULL_MASK:
+            self._closedMask |= 1 << subBoardIndex
+        self._nextSubBoardIndex = _ANY_SUB_BOARD if (self._closedMask >> cell) & 1 else cell
+        self._playerToMove = 3 - moverNumber
+    #END
+
+    def _undo_move(self):
+        historyEntry = self._moveHistory.pop()
+        subBoardIndex, cell = divmod(historyEntry & 127, _NUMBER_OF_CELLS)
+        moverNumber = 3 - self._playerToMove
+        self._playerMasks[moverNumber - 1][subBoardIndex] &= ~(1 << cell)
+        self._wonMasks[moverNumber - 1] &= ~(1 << subBoardIndex)
+        self._closedMask &= ~(1 << subBoardIndex)
+        self._winningPlayerNumber = None
+        self._nextSubBoardIndex = historyEntry >> 7
+        self._playerToMove = moverNumber
+        return moverNumber, historyEntry & 127
+    #END
+
+    def _get_legal_move_numbers(self):
+        if self.isGameOver():
+            return ()
+        return _get_legal_moves(self._playerMasks[0], self._playerMasks[1], self._closedMask, self._nextSubBoardIndex)
+    #END
+
+    def getBoardSize(self):
+        '''
+        DESCRIPTION:
+            Retrieves the number of positions along each side of the whole board
+
+        RETURNS:
+            Integer: the board size, which is 9
+        '''
+        return BOARD_SIZE
+    #END
+
+    def getPlayerToMove(self):
+        '''
+        DESCRIPTION:
+            Retrieves the player whose turn it is. The players take turns, player 1 first
+
+        RETURNS:
+            Integer: 1 for 'player 1' and 2 for 'player 2'
+        '''
+        return self._playerToMove
+    #END
+
+    def getNextSubBoard(self):
+        '''
+        DESCRIPTION:
+            Retrieves the sub board the next move must be played in
+
+        RETURNS:
+            A (meta x, meta y) tuple, or None if the next move may be played in any open sub board
+        '''
+        if self._nextSubBoardIndex == _ANY_SUB_BOARD:
+            return None
+        return divmod(self._nextSubBoardIndex, SUB_BOARD_SIZE)
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))),
+                    (lambda boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < BOARD_SIZE)),
+                    (lambda boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < BOARD_SIZE)) )
+    def placePlayerMarkerOnBoardAtPosition(self, playerNumber, boardXPosition, boardYPosition):
+        '''
+        DESCRIPTION:
+            Makes a move for the player whose turn it is, updating the sub board and the meta board
+
+        PARAMETERS:
+            playerNumber: an integer which is 1 for 'player 1' and 2 for 'player 2'
+            boardXPosition: a board coordinate in the x direction between 0 and 8 as an integer
+            boardYPosition: a board coordinate in the y direction between 0 and 8 as an integer
+
+        RETURNS:
+            (valid arguement)
+                None
+            (invalid arguement)
+                a PreconditionError is thrown, also when it is not the player's turn, or the move is not
+                one of the legal moves
+        '''
+        move = _POSITION_MOVES[boardXPosition][boardYPosition]
+        if (playerNumber != self._playerToMove) or (move not in self._get_legal_move_numbers()):
+            raise PreconditionError()
+        self._play_move(move)
+    #END
+
+    def undoMove(self):
+        '''
+        DESCRIPTION:
+            Takes back the last move, restoring the sub board and meta board before it, in constant time
+
+        RETURNS:
+            A tuple (player number, x, y) of the move taken back, or None if there is none
+        '''
+        if not self._moveHistory:
+            return None
+        moverNumber, move = self._undo_move()
+        return (moverNumber,) + _MOVE_POSITIONS[move]
+    #END
+
+    def getMoveHistory(self):
+        '''
+        DESCRIPTION:
+            Retrieves every move which has not been taken back, in the order they were made
+
+        RETURNS:
+            A list of (player number, x, y) tuples
+        '''
+        return [((moveNumber % 2) + 1,) + _MOVE_POSITIONS[historyEntry & 127] for moveNumber, historyEntry in enumerate(self._moveHistory)]
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda boardXPosition: ((isinstance(boardXPosition, int))) and (boardXPosition >= 0) and (boardXPosition < BOARD_SIZE)),
+                    (lambda boardYPosition: ((isinstance(boardYPosition, int))) and (boardYPosition >= 0) and (boardYPosition < BOARD_SIZE)) )
+    def getMarkerAtBoardPosition(self, boardXPosition, boardYPosition):
+        '''
+        DESCRIPTION:
+            Retrieves the token value at a given board position
+
+        PARAMETERS:
+            boardXPosition: a board coordinate in the x direction between 0 and 8 as an integer
+            boardYPosition: a board coordinate in the y direction between 0 and 8 as an integer
+
+        RETURNS:
+            (valid arguement)
+                Integer: Board.EMPTY_VALUE, or Board.PLAYER_TOKEN_VALUE[0], or Board.PLAYER_TOKEN_VALUE[1]
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        subBoardIndex, cell = divmod(_POSITION_MOVES[boardXPosition][boardYPosition], _NUMBER_OF_CELLS)
+        for playerIndex in range(2):
+            if self._playerMasks[playerIndex][subBoardIndex] & (1 << cell):
+                return Board.PLAYER_TOKEN_VALUE[playerIndex]
+        return Board.EMPTY_VALUE
+    #END
+
+    def getLegalMoves(self):
+        '''
+        DESCRIPTION:
+            Lists the positions the player to move may play
+
+        RETURNS:
+            A list of (x, y) board position tuples, which is empty when the game is over
+        '''
+        return [_MOVE_POSITIONS[move] for move in self._get_legal_move_numbers()]
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda metaXPosition: ((isinstance(metaXPosition, int))) and (metaXPosition >= 0) and (metaXPosition < SUB_BOARD_SIZE)),
+                    (lambda metaYPosition: ((isinstance(metaYPosition, int))) and (metaYPosition >= 0) and (metaYPosition < SUB_BOARD_SIZE)) )
+    def getSubBoard(self, metaXPosition, metaYPosition):
+        '''
+        DESCRIPTION:
+            Creates a Board holding the markers of one sub board
+
+        PARAMETERS:
+            metaXPosition: the meta board coordinate of the sub board in the x direction between 0 and 2
+            metaYPosition: the meta board coordinate of the sub board in the y direction between 0 and 2
+
+        RETURNS:
+            (valid arguement)
+                A Board Object, which is not changed by later moves
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        subBoardIndex = metaXPosition * SUB_BOARD_SIZE + metaYPosition
+        subBoard = Board()
+        for playerIndex in range(2):
+            for cell in _MASK_CELLS[self._playerMasks[playerIndex][subBoardIndex]]:
+                subBoard.placePlayerMarkerOnBoardAtPosition(playerIndex + 1, *divmod(cell, SUB_BOARD_SIZE))
+        return subBoard
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda metaXPosition: ((isinstance(metaXPosition, int))) and (metaXPosition >= 0) and (metaXPosition < SUB_BOARD_SIZE)),
+                    (lambda metaYPosition: ((isinstance(metaYPosition, int))) and (metaYPosition >= 0) and (metaYPosition < SUB_BOARD_SIZE)) )
+    def getSubBoardWinner(self, metaXPosition, metaYPosition):
+        '''
+        DESCRIPTION:
+            Retrieves the player who won a sub board, in constant time
+
+        PARAMETERS:
+            metaXPosition: the meta board coordinate of the sub board in the x direction between 0 and 2
+            metaYPosition: the meta board coordinate of the sub board in the y direction between 0 and 2
+
+        RETURNS:
+            (valid arguement)
+                Integer: 1 for 'player 1', 2 for 'player 2', or None if the sub board is not won
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        subBoardBit = 1 << (metaXPosition * SUB_BOARD_SIZE + metaYPosition)
+        for playerIndex in range(2):
+            if self._wonMasks[playerIndex] & subBoardBit:
+                return playerIndex + 1
+        return None
+    #END
+
+    def getMetaBoard(self):
+        '''
+        DESCRIPTION:
+            Creates a Board holding a marker for each sub board won, at the position of the sub board
+
+        RETURNS:
+            A Board Object, which is not changed by later moves
+        '''
+        metaBoard = Board()
+        for playerIndex in range(2):
+            for subBoardIndex in _MASK_CELLS[self._wonMasks[playerIndex]]:
+                metaBoard.placePlayerMarkerOnBoardAtPosition(playerIndex + 1, *divmod(subBoardIndex, SUB_BOARD_SIZE))
+        return metaBoard
+    #END
+
+    def winner(self):
+        '''
+        DESCRIPTION:
+            Retrieves the player who won a line of sub boards, in constant time
+
+        RETURNS:
+            Integer: 1 for 'player 1', 2 for 'player 2', or None if no player has won
+        '''
+        return self._winningPlayerNumber
+    #END
+
+    def isDraw(self):
+        '''
+        DESCRIPTION:
+            Checks whether every sub board is closed without either player winning, in constant time
+
+        RETURNS:
+            Boolean: True if the game is drawn
+        '''
+        return (self._winningPlayerNumber is None) and (self._closedMask == _FULL_MASK)
+    #END
+
+    def isGameOver(self):
+        '''
+        DESCRIPTION:
+            Checks whether the game is either won or drawn, in constant time
+
+        RETURNS:
+            Boolean: True if no more moves can be played
+        '''
+        return (self._winningPlayerNumber is not None) or (self._closedMask == _FULL_MASK)
+    #END
+
+    def getBoardAsString(self):
+        '''
+        DESCRIPTION:
+             Retrieves the current board state as a printable string, one line for each row of positions,
+             with the sub boards separated by '|' and '-' and empty positions shown as '.'
+
+        RETURNS:
+            A string which represents the current board state
+        '''
+        cellSymbols = (".", Board.PLAYER_ONE_SYMBOL, Board.PLAYER_TWO_SYMBOL)
+        rowStrings = []
+        for boardXPosition in range(BOARD_SIZE):
+            if (boardXPosition > 0) and (boardXPosition % SUB_BOARD_SIZE == 0):
+                rowStrings.append("+".join(["-" * SUB_BOARD_SIZE] * SUB_BOARD_SIZE))
+            rowSymbols = [cellSymbols[self.getMarkerAtBoardPosition(boardXPosition, boardYPosition)] for boardYPosition in range(BOARD_SIZE)]
+            rowStrings.append("|".join("".join(rowSymbols[boardYPosition:boardYPosition + SUB_BOARD_SIZE])
+                                       for boardYPosition in range(0, BOARD_SIZE, SUB_BOARD_SIZE)))
+        return "\n".join(rowStrings)
+    #END
+
+class UltimateEngine:
+    """ A Monte Carlo Tree Search Move Engine For Ultimate Tic Tac Toe """
+
+    DEFAULT_TIME_LIMIT = 0.5
+    DEFAULT_EXPLORATION_CONSTANT = math.sqrt(2)
+
+    # The search rate a single process should reach from the empty board, checked by 'ultimate_board.py -search'
+    TARGET_NODES_PER_SECOND = 250000
+
+    @preconditions( (lambda self: True),
+                    (lambda timeLimit: ((isinstance(timeLimit, (int, float)))) and (timeLimit > 0)),
+                    (lambda numberOfNodes: ((isinstance(numberOfNodes, int))) and (numberOfNodes >= 1)),
+                    (lambda explorationConstant: ((isinstance(explorationConstant, (int, float)))) and (explorationConstant >= 0)),
+                    (lambda seed: isinstance(seed, int)) )
+    def __init__(self, timeLimit=None, numberOfNodes=None, explorationConstant=DEFAULT_EXPLORATION_CONSTANT, seed=None):
+        '''
+        DESCRIPTION:
+            Constructs a Monte Carlo tree search engine, which grows a search tree by upper confidence
+            bounds (UCT) and plays each new position out with random moves, making and taking back moves
+            on one board rather than copying it
+
+        PARAMETERS:
+            timeLimit: (optional) the number of seconds a move may take. Defaults to
+                       UltimateEngine.DEFAULT_TIME_LIMIT when no number of nodes is given
+            numberOfNodes: (optional) the number of nodes (positions played through) each move may search,
+                           which gives a search of the same size on any machine. A search stops at whichever
+                           of the time limit and nodes comes first, after the playout which reaches them
+            explorationConstant: (optional) how strongly the search tries moves with few visits
+            seed: (optional) an integer seed for the playouts, which makes a search of a number of nodes
+                  repeatable
+
+        RETURNS:
+            (valid arguement)
+                An UltimateEngine Object
+            (invalid arguement)
+                a PreconditionError is thrown
+        '''
+        if (timeLimit is None) and (numberOfNodes is None):
+            timeLimit = UltimateEngine.DEFAULT_TIME_LIMIT
+        self._timeLimit = timeLimit
+        self._numberOfNodes = numberOfNodes
+        self._explorationConstant = explorationConstant
+        self._seed = seed
+        self._lastSearchStatistics = None
+    #END
+
+    def _search_tree(self, board, randomNumber):
+        # Grows a search tree from the board, which is given back unchanged, and gives the root node with
+        # the number of iterations and nodes of the search
+        deadline = None if self._timeLimit is None else time.time() + self._timeLimit
+        maximumNumberOfNodes = self._numberOfNodes or sys.maxint
+        explorationConstant = self._explorationConstant
+        rootNode = SearchNode(None, 3 - board._playerToMove, list(board._get_legal_move_numbers()))
+        numberOfNodes = 0
+        iteration = 0
+        while (numberOfNodes < maximumNumberOfNodes) and ((deadline is None) or (time.time() < deadline)):
+            iteration += 1
+
+            # Select down the tree through fully expanded positions, then expand one untried move
+            node = rootNode
+            searchPath = [rootNode]
+            while (not node.untriedMoves) and node.children:
+                node = selectChild(node, explorationConstant)
+                board._play_move(node.move)
+                searchPath += [node]
+            if node.untriedMoves:
+                move = takeRandomMove(node.untriedMoves, randomNumber())
+                board._play_move(move)
+                node = SearchNode(move, 3 - board._playerToMove, list(board._get_legal_move_numbers()))
+                searchPath[-1].children += [node]
+                searchPath += [node]
+            numberOfNodes += len(searchPath) - 1
+
+            # Play out a copy of the masks, then take back the moves down the tree
+            winningPlayerNumber = board._winningPlayerNumber or 0
+            if not board.isGameOver():
+                winningPlayerNumber, numberOfPlayoutMoves = _play_out( (list(board._playerMasks[0]), list(board._playerMasks[1])),
+                                                                       list(board._wonMasks), board._closedMask,
+                                                                       board._nextSubBoardIndex, board._playerToMove, randomNumber )
+                numberOfNodes += numberOfPlayoutMoves
+            for _ in range(len(searchPath) - 1):
+                board._undo_move()
+
+            for node in searchPath:
+                node.visits += 1
+                if winningPlayerNumber == 0:
+                    node.wins += 0.5
+                elif winningPlayerNumber == node.playerJustMoved:
+                    node.wins += 1.0
+        return rootNode, iteration, numberOfNodes
+    #END
+
+    @preconditions( (lambda self: True),
+                    (lambda board: hasattr(board, "getNextSubBoard") and hasattr(board, "_play_move")),
+                    (lambda playerNumber: ((isinstance(playerNumber, int))) and ((playerNumber == 1) or (playerNumber == 2))) )
+    def getBestMove(self, board, playerNumber):
+        '''
+        DESCRIPTION:
+            Searches for the best move in a board position for the player whose turn it is
+
+        PARAMETERS:
+            board: an UltimateBoard, which is not changed
+            playerNumber: the player whose turn it is, 1 for 'player 1' and 2 for 'player 2'
+
+        RETURNS:
+            (valid arguement)
+                An (x, y) board position tuple, or None if the game is already over
+            (invalid arguement)
+                a PreconditionError is thrown, also when it is not the player's turn
+        '''
+        if playerNumber != board.getPlayerToMove():
+            raise PreconditionError()
+        self._lastSearchStatistics = { "iterations": 0, "nodes": 0, "score": 0.0, "seconds": 0.0, "nodesPerSecond": 0.0 }
+        if board.isGameOver():
+            return None
+
+        startTime = time.time()
+        rootNode, numberOfIterations, numberOfNodes = self._search_tree(board.copyBoard(), random.Random(self._seed).random)
+        bestChild = max(sorted(rootNode.children, key=(lambda child: child.move)), key=(lambda child: child.visits))
+        searchSeconds = max(time.time() - startTime, 1e-9)
+        self._lastSearchStatistics = { "iterations": numberOfIterations,
+                                       "nodes": numberOfNodes,
+                                       "score": bestChild.wins / bestChild.visits,
+                                       "seconds": searchSeconds,
+                                       "nodesPerSecond": numberOfNodes / searchSeconds }
+        return _MOVE_POSITIONS[bestChild.move]
+    #END
+
+    def getLastSearchStatistics(self):
+        '''
+        DESCRIPTION:
+            Retrieves statistics of the last search made by getBestMove
+
+        RETURNS:
+            A dictionary with the number of "iterations" (playouts) and "nodes" (positions played through),
+            the "score" of the chosen move (the fraction of its playouts won, a draw counting half), the
+            "seconds" taken and the "nodesPerSecond", or None if no search has been made
+        '''
+        return self._lastSearchStatistics
+    #END
+
+#------------------------------------------------------------------------------------------------------
+# TESTING DRIVER
+#------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    # Check corret length of command line arguement string
+    if not ((len(sys.argv) == 2) or ((len(sys.argv) == 3) and (sys.argv[1] == '-search'))):
+        print "Test Bench: Not Correct Number Testing Arguements\n"
+        sys.exit(0)
+
+    # Search the empty board, and report the search rate against the target
+    if sys.argv[1] == '-search':
+        timeLimit = float(sys.argv[2]) if len(sys.argv) == 3 else UltimateEngine.DEFAULT_TIME_LIMIT
+        engine = UltimateEngine(timeLimit)
+        bestMove = engine.getBestMove(UltimateBoard(), 1)
+        searchStatistics = engine.getLastSearchStatistics()
+        print "Ultimate board: move {} after {} iterations in {:.2f} s".format(bestMove, searchStatistics["iterations"], searchStatistics["seconds"])
+        print "    {:.0f} nodes/s (target {}), score {:.3f}".format(
+            searchStatistics["nodesPerSecond"], UltimateEngine.TARGET_NODES_PER_SECOND, searchStatistics["score"])
+        sys.exit(0 if searchStatistics["nodesPerSecond"] >= UltimateEngine.TARGET_NODES_PER_SECOND else 1)
+
+    # The tests of this module are in test_ultimate_board.py, so that only running them loads them
+    import os
+    import subprocess
+    testModuleFileName = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_ultimate_board.py")
+    sys.exit(subprocess.call([sys.executable, testModuleFileName] + sys.argv[1:]))
+
+#END